@@ -0,0 +1,104 @@
+"""
+This script measures the throughput of the action sources against sampling the actions in the loop.
+
+Every step draws the actions of all environments and copies them into an action buffer, like the action manager of
+an environment does. The sources are:
+
+* ``randn_like``: ``torch.randn_like`` every step, like ``creating_a_manager_based_environment.py`` did,
+* ``stream``: :class:`StreamActionSource` with random actions generated ``--horizon`` steps at a time,
+* ``replay``: :class:`ReplayActionSource` over ``--horizon`` recorded steps,
+* ``policy_grad``: the MLP policy called directly, with autograd recording,
+* ``policy``: :class:`PolicyActionSource` without capture (under ``torch.inference_mode``),
+* ``policy_compile``: :class:`PolicyActionSource` with :func:`torch.compile`,
+* ``policy_cuda_graph``: :class:`PolicyActionSource` with a CUDA graph (eager fallback on the CPU).
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_action_sources.py --num_envs 4096 --device cuda:0
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import torch
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.action_sources import (  # noqa: E402
+    PolicyActionSource,
+    ReplayActionSource,
+    StreamActionSource,
+    mlp_policy,
+)
+
+SOURCES = ("randn_like", "stream", "replay", "policy_grad", "policy", "policy_compile", "policy_cuda_graph")
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Measure the throughput of the action sources.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments.")
+parser.add_argument("--obs_dim", type=int, default=48, help="Number of observations per environment.")
+parser.add_argument("--action_dim", type=int, default=12, help="Number of actions per environment.")
+parser.add_argument("--horizon", type=int, default=256, help="Steps of the random stream and the replay.")
+parser.add_argument("--steps", type=int, default=1000, help="Number of measured steps.")
+parser.add_argument("--sources", type=str, nargs="+", default=list(SOURCES), choices=SOURCES, help="Sources.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run on.")
+args_cli = parser.parse_args()
+
+
+def synchronize():
+    if torch.device(args_cli.device).type == "cuda":
+        torch.cuda.synchronize()
+
+
+def make_source(name: str, policy: torch.nn.Module):
+    """Returns a function that draws the actions of one step."""
+    device = args_cli.device
+    num_envs, action_dim = args_cli.num_envs, args_cli.action_dim
+    if name == "randn_like":
+        template = torch.zeros(num_envs, action_dim, device=device)
+        return lambda obs: torch.randn_like(template)
+    if name == "stream":
+        return StreamActionSource.random(num_envs, action_dim, horizon=args_cli.horizon, device=device, seed=0).act
+    if name == "replay":
+        return ReplayActionSource(torch.randn(args_cli.horizon, num_envs, action_dim, device=device)).act
+    if name == "policy_grad":
+        return policy
+    capture = {"policy": "none", "policy_compile": "compile", "policy_cuda_graph": "cuda_graph"}[name]
+    return PolicyActionSource(policy, capture=capture, device=device).act
+
+
+def main():
+    """Main function."""
+    device = args_cli.device
+    obs = torch.randn(args_cli.num_envs, args_cli.obs_dim, device=device)
+    action_buffer = torch.zeros(args_cli.num_envs, args_cli.action_dim, device=device)
+    policy = mlp_policy(args_cli.obs_dim, args_cli.action_dim).to(device)
+
+    print(f"{'source':>18} | {'first [ms]':>10} | {'step [ms]':>9} | {'actions/s':>10}")
+    for name in args_cli.sources:
+        act = make_source(name, policy)
+        # the first call includes the capture of the policy
+        synchronize()
+        start = time.perf_counter()
+        action_buffer.copy_(act(obs))
+        synchronize()
+        t_first = time.perf_counter() - start
+        for _ in range(10):
+            action_buffer.copy_(act(obs))
+        synchronize()
+        start = time.perf_counter()
+        for _ in range(args_cli.steps):
+            action_buffer.copy_(act(obs))
+        synchronize()
+        t_step = (time.perf_counter() - start) / args_cli.steps
+        rate = args_cli.num_envs / t_step
+        print(f"{name:>18} | {t_first * 1e3:>10.1f} | {t_step * 1e3:>9.4f} | {rate:>10.3g}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
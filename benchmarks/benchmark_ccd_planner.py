@@ -0,0 +1,133 @@
+"""
+This script compares the step cost of global and selective continuous collision detection (CCD).
+
+The scene holds copies of the teter-toter scene: a base, a seat, a cube dropped from 1.9 m and a cube dropped from
+300.9 m. :func:`plan_ccd` flags only the high drop for CCD. Every CCD mode runs in its own process (one simulation
+app per mode), and the script reports the mean time of a physics step:
+
+* ``global``: CCD for every body, like ``PhysxCfg(enable_ccd=True)`` on all bodies,
+* ``selective``: CCD for the bodies that the planner flags,
+* ``none``: no CCD (the high drop tunnels through the seat).
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p benchmarks/benchmark_ccd_planner.py --num_copies 256 --steps 500
+
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.ccd_planner import CCD_MODES, apply_ccd, format_report, plan_ccd  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Compare the step cost of global and selective CCD.")
+parser.add_argument("--num_copies", type=int, default=256, help="Number of copies of the teter-toter scene.")
+parser.add_argument("--steps", type=int, default=500, help="Number of measured physics steps.")
+parser.add_argument("--warmup_steps", type=int, default=20, help="Number of unmeasured physics steps.")
+parser.add_argument("--modes", type=str, nargs="+", default=list(CCD_MODES), choices=CCD_MODES, help="CCD modes.")
+parser.add_argument("--device", type=str, default="cuda:0", help="Simulation device.")
+parser.add_argument("--child_mode", type=str, default=None, help=argparse.SUPPRESS)
+
+# (name, size, initial position) of the bodies of one copy
+BODIES = [
+    ("base", (0.5, 0.3, 0.6), (0.0, 0.0, 0.0)),
+    ("seat", (0.4, 3.8, 0.2), (0.0, 0.0, 0.9)),
+    ("right_cube", (0.4, 0.8, 0.2), (0.0, 1.4, 1.9)),
+    ("left_cube", (0.4, 0.8, 0.2), (0.0, -1.4, 300.9)),
+]
+
+
+def run_mode(args_cli):
+    """Builds the scene with one CCD mode, measures the physics steps and prints the result."""
+    from isaaclab.app import AppLauncher
+
+    simulation_app = AppLauncher(headless=True, device=args_cli.device).app
+
+    import torch
+
+    import isaacsim.core.utils.prims as prim_utils
+
+    import isaaclab.sim as sim_utils
+    from isaaclab.assets import RigidObject, RigidObjectCfg
+
+    physx = sim_utils.PhysxCfg(enable_ccd=args_cli.child_mode != "none")
+    sim = sim_utils.SimulationContext(sim_utils.SimulationCfg(device=args_cli.device, physx=physx))
+    cfg_ground = sim_utils.GroundPlaneCfg()
+    cfg_ground.func("/World/defaultGroundPlane", cfg_ground)
+    for copy_id in range(args_cli.num_copies):
+        prim_utils.create_prim(f"/World/Copy{copy_id}", "Xform", translation=(5.0 * copy_id, 0.0, 0.0))
+
+    objects = {}
+    object_cfgs = {}
+    for name, size, pos in BODIES:
+        object_cfgs[name] = RigidObjectCfg(
+            prim_path=f"/World/Copy.*/{name}",
+            spawn=sim_utils.CuboidCfg(
+                size=size,
+                rigid_props=sim_utils.RigidBodyPropertiesCfg(),
+                mass_props=sim_utils.MassPropertiesCfg(mass=1.0),
+                collision_props=sim_utils.CollisionPropertiesCfg(),
+            ),
+            init_state=RigidObjectCfg.InitialStateCfg(pos=pos),
+        )
+        objects[name] = RigidObject(cfg=object_cfgs[name])
+    plans = plan_ccd(object_cfgs, sim.get_physics_dt())
+    num_ccd_bodies = 0
+    for plan in plans.values():
+        if args_cli.child_mode == "global" or (args_cli.child_mode == "selective" and plan.enable_ccd):
+            num_ccd_bodies += apply_ccd(plan.prim_path)
+
+    def synchronize():
+        if torch.device(args_cli.device).type == "cuda":
+            torch.cuda.synchronize()
+
+    sim.reset()
+    for _ in range(args_cli.warmup_steps):
+        sim.step(render=False)
+    synchronize()
+    start = time.perf_counter()
+    for _ in range(args_cli.steps):
+        sim.step(render=False)
+    synchronize()
+    step_time = (time.perf_counter() - start) / args_cli.steps
+    result = {"mode": args_cli.child_mode, "ccd_bodies": num_ccd_bodies, "step_ms": step_time * 1e3}
+    if args_cli.child_mode == "selective":
+        result["report"] = format_report(plans, sim.get_physics_dt())
+    # note: closing the app can end the process, so the result is printed first.
+    print("RESULT " + json.dumps(result), flush=True)
+    simulation_app.close()
+
+
+def main():
+    """Main function."""
+    args_cli = parser.parse_args()
+    if args_cli.child_mode is not None:
+        run_mode(args_cli)
+        return
+
+    results = []
+    for mode in args_cli.modes:
+        command = [sys.executable, __file__, *sys.argv[1:], "--child_mode", mode]
+        output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+        line = next(line for line in output.splitlines() if line.startswith("RESULT "))
+        results.append(json.loads(line[len("RESULT ") :]))
+
+    for result in results:
+        if "report" in result:
+            print(result["report"])
+    print(f"{'mode':>10} | {'ccd bodies':>10} | {'step [ms]':>9}")
+    for result in results:
+        print(f"{result['mode']:>10} | {result['ccd_bodies']:>10} | {result['step_ms']:>9.3f}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
@@ -0,0 +1,161 @@
+"""
+This script measures the cost of the reset events of the cartpole environment and checks their determinism.
+
+The cartpole resets two joints with ``reset_joints_by_offset``. Three ways of applying the events are compared on
+tensors of the shape of the joint state (the writes stand in for ``write_joint_state_to_sim``):
+
+* ``per_term``: one term per joint, each drawing its position and velocity offsets from the global random state,
+  clipping and writing the joint state, like two ``reset_joints_by_offset`` terms,
+* ``fused_global``: one draw from the global random state and one write for both joints, which separates the gain
+  of the fusion from the cost of the counter-based generator,
+* ``fused``: :class:`UniformRanges` with per-environment streams of :class:`EnvRandom`, one draw and one write for
+  both joints.
+
+The script also checks that the fused draw gives bit-identical values when the environments are reset in random
+subsets or split over shards.
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_env_rng.py --num_envs 1024 4096 16384 65536
+
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+import torch
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.env_rng import EnvRandom, UniformRanges  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Measure the cost and check the determinism of the reset events.")
+parser.add_argument(
+    "--num_envs", type=int, nargs="+", default=[1024, 4096, 16384, 65536], help="Numbers of environments."
+)
+parser.add_argument("--resets", type=int, default=200, help="Number of measured resets of all environments.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run on.")
+args_cli = parser.parse_args()
+
+# (joint id, position range, velocity range) of the reset terms of the cartpole
+TERMS = [
+    (0, (-1.0, 1.0), (-0.1, 0.1)),
+    (1, (-0.125 * math.pi, 0.125 * math.pi), (-0.01 * math.pi, 0.01 * math.pi)),
+]
+
+
+def synchronize():
+    if torch.device(args_cli.device).type == "cuda":
+        torch.cuda.synchronize()
+
+
+def measure(reset_fn, env_ids: torch.Tensor) -> float:
+    """Returns the time per call of a reset function."""
+    for _ in range(10):
+        reset_fn(env_ids)
+    synchronize()
+    start = time.perf_counter()
+    for _ in range(args_cli.resets):
+        reset_fn(env_ids)
+    synchronize()
+    return (time.perf_counter() - start) / args_cli.resets
+
+
+def check_determinism(num_envs: int) -> bool:
+    """Resets all environments three times, in one batch, in random subsets and over two shards."""
+    ranges = UniformRanges({"offsets": ([-1.0] * 4, [1.0] * 4)}, device=args_cli.device)
+    rng = EnvRandom(num_envs, seed=42, device=args_cli.device)
+    reference = torch.stack([ranges.sample(rng, None) for _ in range(3)])
+
+    generator = torch.Generator().manual_seed(0)
+    rng = EnvRandom(num_envs, seed=42, device=args_cli.device)
+    subsets = torch.empty_like(reference)
+    for reset_id in range(3):
+        order = torch.randperm(num_envs, generator=generator).to(args_cli.device)
+        for env_ids in order.chunk(7):
+            subsets[reset_id, env_ids] = ranges.sample(rng, env_ids)
+
+    half = num_envs // 2
+    shards = [
+        EnvRandom(half, seed=42, device=args_cli.device),
+        EnvRandom(num_envs - half, seed=42, device=args_cli.device, env_offset=half),
+    ]
+    sharded = torch.stack([torch.cat([ranges.sample(shard, None) for shard in shards]) for _ in range(3)])
+    return torch.equal(reference, subsets) and torch.equal(reference, sharded)
+
+
+def run(num_envs: int) -> tuple[float, float, float]:
+    """Returns the time per reset of all environments of the three ways of applying the events."""
+    device = args_cli.device
+    num_joints = len(TERMS)
+    default_pos = torch.zeros(num_envs, num_joints, device=device)
+    default_vel = torch.zeros(num_envs, num_joints, device=device)
+    pos_limits = torch.tensor([[-4.0, 4.0], [-math.pi, math.pi]], device=device).expand(num_envs, -1, -1)
+    vel_limits = torch.full((num_envs, num_joints), 10.0, device=device)
+    joint_pos = torch.zeros(num_envs, num_joints, device=device)
+    joint_vel = torch.zeros(num_envs, num_joints, device=device)
+
+    def per_term(env_ids):
+        for joint_id, position_range, velocity_range in TERMS:
+            joint_ids = torch.tensor([joint_id], device=device)
+            rows = env_ids[:, None]
+            pos = default_pos[rows, joint_ids].clone()
+            vel = default_vel[rows, joint_ids].clone()
+            pos += torch.rand(pos.shape, device=device) * (position_range[1] - position_range[0]) + position_range[0]
+            vel += torch.rand(vel.shape, device=device) * (velocity_range[1] - velocity_range[0]) + velocity_range[0]
+            limits = pos_limits[rows, joint_ids]
+            pos = pos.clamp_(limits[..., 0], limits[..., 1])
+            vel = vel.clamp_(-vel_limits[rows, joint_ids], vel_limits[rows, joint_ids])
+            joint_pos[rows, joint_ids] = pos
+            joint_vel[rows, joint_ids] = vel
+
+    ranges = UniformRanges(
+        {
+            "position": ([t[1][0] for t in TERMS], [t[1][1] for t in TERMS]),
+            "velocity": ([t[2][0] for t in TERMS], [t[2][1] for t in TERMS]),
+        },
+        device=device,
+    )
+    rng = EnvRandom(num_envs, seed=42, device=device)
+
+    def fused(env_ids, global_state: bool = False):
+        if global_state:
+            values = torch.rand(len(env_ids), ranges.num_values, device=device)
+            offsets = torch.addcmul(ranges.lower, values, ranges.width)
+        else:
+            offsets = ranges.sample(rng, env_ids)
+        pos = default_pos[env_ids] + offsets[:, ranges.slices["position"]]
+        vel = default_vel[env_ids] + offsets[:, ranges.slices["velocity"]]
+        limits = pos_limits[env_ids]
+        pos = pos.clamp_(limits[..., 0], limits[..., 1])
+        vel = vel.clamp_(-vel_limits[env_ids], vel_limits[env_ids])
+        joint_pos[env_ids] = pos
+        joint_vel[env_ids] = vel
+
+    env_ids = torch.arange(num_envs, device=device)
+    t_fused_global = measure(lambda ids: fused(ids, global_state=True), env_ids)
+    return measure(per_term, env_ids), t_fused_global, measure(fused, env_ids)
+
+
+def main():
+    """Main function."""
+    print(
+        f"{'envs':>6} | {'per term [us]':>13} | {'fused global [us]':>17} | {'fused [us]':>10} | {'deterministic':>13}"
+    )
+    for num_envs in args_cli.num_envs:
+        t_per_term, t_fused_global, t_fused = run(num_envs)
+        deterministic = check_determinism(num_envs)
+        print(
+            f"{num_envs:>6} | {t_per_term * 1e6:>13.1f} | {t_fused_global * 1e6:>17.1f} | {t_fused * 1e6:>10.1f} |"
+            f" {str(deterministic):>13}"
+        )
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
@@ -0,0 +1,146 @@
+"""
+This script benchmarks the vectorized flat-patch search against rejection sampling on rough heightfields.
+
+The rough-terrain grid has 10 x 20 sub-terrains. Enough patches are requested per sub-terrain to give every
+environment its own patch, which is what spawning 2048 environments on flat patches requires.
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_flat_patches.py --num_envs 2048 --device cpu
+
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+import torch
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.flat_patches import find_flat_patches_hf  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark flat-patch sampling over heightfields.")
+parser.add_argument("--num_envs", type=int, default=2048, help="Number of environments that need a patch.")
+parser.add_argument("--num_rows", type=int, default=10, help="Number of sub-terrain rows.")
+parser.add_argument("--num_cols", type=int, default=20, help="Number of sub-terrain columns.")
+parser.add_argument("--size", type=float, default=8.0, help="Side length of a sub-terrain (in m).")
+parser.add_argument("--horizontal_scale", type=float, default=0.1, help="Heightfield resolution (in m).")
+parser.add_argument("--patch_radius", type=float, default=0.5, help="Radius of a flat patch (in m).")
+parser.add_argument("--max_height_diff", type=float, default=0.05, help="Maximum height difference in a patch.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run on.")
+parser.add_argument("--repeats", type=int, default=3, help="Number of timed repetitions.")
+parser.add_argument(
+    "--flat_fractions",
+    type=float,
+    nargs="+",
+    default=[0.5, 0.1, 0.04],
+    help="Fractions of each heightfield covered by flat plateaus.",
+)
+args_cli = parser.parse_args()
+
+
+def make_heightfields(
+    num_fields: int, num_points: int, flat_fraction: float, generator: torch.Generator
+) -> torch.Tensor:
+    """Creates rough heightfields with a flat plateau, similar to the random-uniform and box sub-terrains."""
+    # random bumps of up to 10 cm
+    heights = 0.1 * torch.rand(num_fields, num_points, num_points, generator=generator)
+    # a flat plateau covering a fraction of each field
+    plateau = torch.zeros(num_fields, num_points, num_points)
+    side = int(round(num_points * math.sqrt(flat_fraction)))
+    start = (num_points - side) // 2
+    plateau[:, start : start + side, start : start + side] = 1.0
+    return torch.where(plateau > 0, torch.full_like(heights, 0.2), heights).to(args_cli.device)
+
+
+def rejection_sampling(
+    heights: torch.Tensor, num_patches: int, radius: float, max_height_diff: float, max_iterations: int = 10000
+) -> torch.Tensor:
+    """Reference: rejection-samples patch centers per heightfield, checking a ring of points around each."""
+    num_fields, num_x, num_y = heights.shape
+    reach = int(math.ceil(radius))
+    # points on rings around the center, as sampled by the ray-cast version
+    angles = torch.linspace(0.0, 2.0 * math.pi, 10, device=heights.device)[:-1]
+    rings = [torch.zeros(1, 2, device=heights.device)]
+    for r in torch.linspace(0.0, radius, 3, device=heights.device)[1:]:
+        rings.append(torch.stack([r * torch.cos(angles), r * torch.sin(angles)], dim=-1))
+    offsets = torch.cat(rings).round().long()
+    patches = torch.zeros(num_fields, num_patches, 2, dtype=torch.long, device=heights.device)
+    for field_id in range(num_fields):
+        points = torch.stack(
+            [
+                torch.randint(reach, num_x - reach, (num_patches,), device=heights.device),
+                torch.randint(reach, num_y - reach, (num_patches,), device=heights.device),
+            ],
+            dim=-1,
+        )
+        invalid = torch.ones(num_patches, dtype=torch.bool, device=heights.device)
+        for _ in range(max_iterations):
+            num_invalid = int(invalid.sum())
+            if num_invalid == 0:
+                break
+            points[invalid, 0] = torch.randint(reach, num_x - reach, (num_invalid,), device=heights.device)
+            points[invalid, 1] = torch.randint(reach, num_y - reach, (num_invalid,), device=heights.device)
+            samples = points.unsqueeze(1) + offsets.unsqueeze(0)
+            z = heights[field_id, samples[..., 0], samples[..., 1]]
+            invalid = (z.max(dim=1).values - z.min(dim=1).values) > max_height_diff
+        patches[field_id] = points
+    return patches
+
+
+def best_of(fn, repeats: int) -> float:
+    """Returns the fastest wall time of ``repeats`` calls in seconds."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        if args_cli.device.startswith("cuda"):
+            torch.cuda.synchronize()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Main function."""
+    generator = torch.Generator().manual_seed(0)
+    num_fields = args_cli.num_rows * args_cli.num_cols
+    num_patches = math.ceil(args_cli.num_envs / num_fields)
+    num_points = int(round(args_cli.size / args_cli.horizontal_scale)) + 1
+    origins = torch.zeros(num_fields, 3, device=args_cli.device)
+    radius = args_cli.patch_radius / args_cli.horizontal_scale
+    print(
+        f"[INFO]: {num_fields} heightfields of {num_points} x {num_points} points, {num_patches} patches each"
+        f" ({num_fields * num_patches} total for {args_cli.num_envs} envs)."
+    )
+
+    print(f"{'flat fraction':>14} | {'rejection [ms]':>15} | {'vectorized [ms]':>16} | {'speed-up':>9}")
+    for flat_fraction in args_cli.flat_fractions:
+        heights = make_heightfields(num_fields, num_points, flat_fraction, generator)
+        t_vectorized = best_of(
+            lambda: find_flat_patches_hf(
+                heights,
+                args_cli.horizontal_scale,
+                origins,
+                num_patches=num_patches,
+                patch_radius=args_cli.patch_radius,
+                max_height_diff=args_cli.max_height_diff,
+            ),
+            args_cli.repeats,
+        )
+        t_rejection = best_of(
+            lambda: rejection_sampling(heights, num_patches, radius, args_cli.max_height_diff), args_cli.repeats
+        )
+        print(
+            f"{flat_fraction:>14.2f} | {t_rejection * 1e3:>15.2f} | {t_vectorized * 1e3:>16.2f} |"
+            f" {t_rejection / t_vectorized:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
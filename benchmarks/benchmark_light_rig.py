@@ -0,0 +1,189 @@
+"""
+This script measures the placement, spawning and re-randomization of procedural light rigs against one light at a
+time, the style of ``light_coloring.py``.
+
+The generated rig has ``--num_lights`` cylinder lights on rings of 64 lights. The script always measures the
+placement: one :func:`quaternion_from_degrees` call and one pose per light against :func:`compile_light_rig`, which
+places all lights in one vectorized pass. With ``--spawn``, it also spawns the lights in both styles, each in its own
+process (one simulation app per style), and reports the time to spawn the lights and to re-draw their colors and
+intensities:
+
+* ``per_light``: one configuration and one spawn call per light, and one attribute write per value,
+* ``rig``: :func:`spawn_light_rig` and :meth:`LightRig.randomize`.
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_light_rig.py --num_lights 64 512 4096
+    ./isaaclab.sh -p benchmarks/benchmark_light_rig.py --num_lights 512 --spawn
+
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+# make the shared helpers at the repository root and the lighting helpers importable
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "robot_import", "basic_tutorials", "lighting"))
+
+from utils.light_rig import compile_light_rig  # noqa: E402
+from utils.quat import quaternion_from_degrees  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Measure procedural light rigs against one light at a time.")
+parser.add_argument("--num_lights", type=int, nargs="+", default=[64, 512, 4096], help="Numbers of lights.")
+parser.add_argument("--repeats", type=int, default=5, help="Number of timed repetitions of the placement.")
+parser.add_argument("--randomizations", type=int, default=20, help="Number of timed re-randomizations.")
+parser.add_argument("--spawn", action="store_true", default=False, help="Also spawn the lights (needs Isaac Sim).")
+parser.add_argument("--child_style", type=str, default=None, help=argparse.SUPPRESS)
+parser.add_argument("--child_lights", type=int, default=None, help=argparse.SUPPRESS)
+
+RING_SIZE = 64
+"""Number of lights per ring."""
+
+
+def make_rig(num_lights: int) -> dict:
+    """Returns the contents of a rig file with the lights on stacked rings."""
+    template = {
+        "type": "cylinder",
+        "intensity": 2000.0,
+        "length": 0.5,
+        "intensity_range": [500.0, 4000.0],
+        "color_range": [[0.1, 0.1, 0.1], [1.0, 1.0, 1.0]],
+    }
+    rings = []
+    for ring_id in range(0, num_lights, RING_SIZE):
+        count = min(RING_SIZE, num_lights - ring_id)
+        rings.append({"template": "bar", "count": count, "radius": 4.0, "center": [0.0, 0.0, 0.1 * ring_id]})
+    return {"templates": {"bar": template}, "rings": rings}
+
+
+def place_per_light(data: dict) -> list[tuple]:
+    """Reference implementation: one pose and one quaternion conversion per light."""
+    poses = []
+    for ring in data["rings"]:
+        for i in range(ring["count"]):
+            angle = 360.0 * i / ring["count"]
+            x = ring["center"][0] + ring["radius"] * np.cos(np.deg2rad(angle))
+            y = ring["center"][1] + ring["radius"] * np.sin(np.deg2rad(angle))
+            poses.append(((x, y, ring["center"][2]), quaternion_from_degrees(0.0, 0.0, angle)))
+    return poses
+
+
+def best_of(fn, repeats: int) -> float:
+    """Returns the fastest wall time of ``repeats`` calls in seconds."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def spawn_child(args_cli):
+    """Spawns the lights in one style, measures the spawn and the re-randomization and prints the result."""
+    from isaaclab.app import AppLauncher
+
+    simulation_app = AppLauncher(headless=True).app
+
+    import isaacsim.core.utils.prims as prim_utils
+
+    import isaaclab.sim as sim_utils
+
+    from utils.light_rig import spawn_light_rig, template_light_cfg
+
+    sim = sim_utils.SimulationContext(sim_utils.SimulationCfg())
+    rig = compile_light_rig(make_rig(args_cli.child_lights))
+    group = rig.groups["bar"]
+    generator = np.random.default_rng(0)
+    start = time.perf_counter()
+    if args_cli.child_style == "rig":
+        lights = spawn_light_rig(rig)
+    else:
+        # the style of the tutorials: one configuration and one spawn per light
+        prim_utils.create_prim("/World/LightRig", "Xform")
+        lights = []
+        for i, (pos, rot) in enumerate(zip(group.positions.tolist(), group.orientations.tolist())):
+            cfg = template_light_cfg(group.template)
+            cfg.func(f"/World/LightRig/bar_{i}", cfg, translation=tuple(pos), orientation=tuple(rot))
+            lights.append(prim_utils.get_prim_at_path(f"/World/LightRig/bar_{i}"))
+    spawn_time = time.perf_counter() - start
+
+    lower = np.array([[0.1, 0.1, 0.1, 500.0]])
+    upper = np.array([[1.0, 1.0, 1.0, 4000.0]])
+    start = time.perf_counter()
+    for _ in range(args_cli.randomizations):
+        if args_cli.child_style == "rig":
+            lights.randomize(generator)
+        else:
+            for prim in lights:
+                values = (lower + generator.random(lower.shape) * (upper - lower))[0].tolist()
+                prim.GetAttribute("inputs:color").Set(tuple(values[:3]))
+                prim.GetAttribute("inputs:intensity").Set(values[3])
+    randomize_time = (time.perf_counter() - start) / args_cli.randomizations
+    sim.reset()
+    result = {
+        "style": args_cli.child_style,
+        "lights": len(lights),
+        "spawn_s": spawn_time,
+        "randomize_s": randomize_time,
+    }
+    # note: closing the app can end the process, so the result is printed first.
+    print("RESULT " + json.dumps(result), flush=True)
+    simulation_app.close()
+
+
+def main():
+    """Main function."""
+    args_cli = parser.parse_args()
+    if args_cli.child_style is not None:
+        spawn_child(args_cli)
+        return
+
+    print(f"{'lights':>7} | {'per light [ms]':>14} | {'rig [ms]':>8} | {'speed-up':>9}")
+    for num_lights in args_cli.num_lights:
+        data = make_rig(num_lights)
+        # sanity check: both placements agree
+        reference = place_per_light(data)
+        group = compile_light_rig(data).groups["bar"]
+        assert np.allclose([pos for pos, _ in reference], group.positions)
+        assert np.allclose([rot for _, rot in reference], group.orientations, atol=1e-9)
+        t_per_light = best_of(lambda: place_per_light(data), args_cli.repeats)
+        t_rig = best_of(lambda: compile_light_rig(data), args_cli.repeats)
+        print(f"{num_lights:>7} | {t_per_light * 1e3:>14.3f} | {t_rig * 1e3:>8.3f} | {t_per_light / t_rig:>8.1f}x")
+
+    if not args_cli.spawn:
+        return
+    results = []
+    for num_lights in args_cli.num_lights:
+        for style in ("per_light", "rig"):
+            command = [
+                sys.executable,
+                __file__,
+                *sys.argv[1:],
+                "--child_style",
+                style,
+                "--child_lights",
+                str(num_lights),
+            ]
+            output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+            line = next(line for line in output.splitlines() if line.startswith("RESULT "))
+            results.append(json.loads(line[len("RESULT ") :]))
+
+    print(f"{'style':>10} | {'lights':>6} | {'spawn [s]':>9} | {'randomize [ms]':>14}")
+    for result in results:
+        print(
+            f"{result['style']:>10} | {result['lights']:>6} | {result['spawn_s']:>9.3f} |"
+            f" {result['randomize_s'] * 1e3:>14.3f}"
+        )
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
@@ -0,0 +1,131 @@
+"""
+This script predicts the largest number of environments that fits a memory budget from a few small probe runs.
+
+Every probe runs an entry-point script in its own process with ``--num_envs n --num_steps 1 --memory_json``, so
+each run starts from an empty device. The script fits the fixed and the per-env bytes of the reports
+(:func:`fit_scaling`) and prints the probes, the fit and the prediction as a table, and optionally as JSON. The
+budget defaults to the memory of the device of the probes.
+
+Without ``--reports``, the probes need Isaac Sim. With ``--reports``, the script fits existing memory reports.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p benchmarks/benchmark_memory_scaling.py --script manager_based_env --num_envs 64 256 1024
+    python benchmarks/benchmark_memory_scaling.py --reports /tmp/memory_*.json --budget_gb 24 --output fit.json
+
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+# make the shared helpers at the repository root importable
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from lab_utils.memory_accounting import MemoryReport, fit_scaling  # noqa: E402
+
+# the entry points that accept --num_envs and the memory arguments
+SCRIPTS = {
+    "manager_based_env": "creating_a_manager_based_environment.py",
+    "procedural_terrain": "robot_import/procedural_terrain.py",
+}
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Predict the largest number of environments that fits a memory budget.")
+parser.add_argument("--script", type=str, default="manager_based_env", choices=list(SCRIPTS), help="Probed script.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[64, 256, 1024], help="Numbers of environments.")
+parser.add_argument("--device", type=str, default="cuda:0", help="Device of the probe runs.")
+parser.add_argument("--reports", type=str, nargs="+", default=None, help="Fit these memory reports instead of probing.")
+parser.add_argument("--budget_gb", type=float, default=None, help="Memory budget. Defaults to the device memory.")
+parser.add_argument("--headroom", type=float, default=0.1, help="Fraction of the budget kept free.")
+parser.add_argument(
+    "--measure",
+    type=str,
+    default="used",
+    choices=["used", "buffers"],
+    help="Fit the memory used by the process or only the accounted buffers.",
+)
+parser.add_argument("--output", type=str, default=None, help="Write the probes, the fit and the prediction here.")
+args_cli = parser.parse_args()
+
+
+def probe(num_envs: int, tmp_dir: str) -> MemoryReport:
+    """Runs the script with a number of environments and returns its memory report."""
+    path = os.path.join(tmp_dir, f"memory_{num_envs}.json")
+    command = [
+        sys.executable,
+        os.path.join(ROOT, SCRIPTS[args_cli.script]),
+        "--headless",
+        "--device",
+        args_cli.device,
+        "--num_envs",
+        str(num_envs),
+        "--num_steps",
+        "1",
+        "--memory_json",
+        path,
+    ]
+    subprocess.run(command, cwd=ROOT, capture_output=True, text=True, check=True)
+    with open(path) as f:
+        return MemoryReport.from_dict(json.load(f))
+
+
+def main():
+    """Main function."""
+    if args_cli.reports is not None:
+        reports = []
+        for path in args_cli.reports:
+            with open(path) as f:
+                reports.append(MemoryReport.from_dict(json.load(f)))
+    else:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            reports = [probe(num_envs, tmp_dir) for num_envs in args_cli.num_envs]
+    reports.sort(key=lambda report: report.num_envs)
+    fit = fit_scaling(reports, measure=args_cli.measure)
+
+    if args_cli.budget_gb is not None:
+        budget = args_cli.budget_gb * 2**30
+    elif reports[-1].total_bytes is not None:
+        budget = reports[-1].total_bytes
+    else:
+        raise SystemExit("[ERROR]: The probes ran on the CPU. Set the memory budget with --budget_gb.")
+    max_num_envs = fit.max_num_envs(budget, headroom=args_cli.headroom)
+
+    print(f"{'envs':>7} | {'used [MB]':>10} | {'buffers [MB]':>12} | {'per env [B]':>11} | {'fit [MB]':>9}")
+    for report in reports:
+        print(
+            f"{report.num_envs:>7} | {report.used_bytes / 2**20:>10.1f} | {report.buffer_bytes / 2**20:>12.1f} |"
+            f" {report.per_env_bytes:>11.1f} | {fit.predict(report.num_envs) / 2**20:>9.1f}"
+        )
+    print(
+        f"[INFO]: Fit of the {args_cli.measure} bytes: {fit.fixed_bytes / 2**20:.1f} MB fixed +"
+        f" {fit.per_env_bytes / 2**10:.2f} KB per environment (largest error {fit.max_relative_error:.1%})."
+    )
+    print(
+        f"[INFO]: Largest num_envs for {budget / 2**30:.2f} GB with {args_cli.headroom:.0%} headroom: {max_num_envs}"
+    )
+    if args_cli.output is not None:
+        result = {
+            "script": args_cli.script if args_cli.reports is None else None,
+            "measure": args_cli.measure,
+            "budget_bytes": budget,
+            "headroom": args_cli.headroom,
+            "fixed_bytes": fit.fixed_bytes,
+            "per_env_bytes": fit.per_env_bytes,
+            "max_relative_error": fit.max_relative_error,
+            "max_num_envs": max_num_envs,
+            "probes": [
+                {"num_envs": r.num_envs, "used_bytes": r.used_bytes, "buffer_bytes": r.buffer_bytes} for r in reports
+            ],
+        }
+        with open(args_cli.output, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
@@ -0,0 +1,111 @@
+"""
+This script measures the cost of assembling the observations of all environments.
+
+The observation group has the terms of a locomotion policy (48 observations): base velocities, projected gravity,
+commands, relative joint positions and velocities and the last actions. Two ways of assembling it are compared:
+
+* ``concatenate``: every term is computed into a new tensor (the observation manager clones the direct reads) and
+  the terms are concatenated, like an observation group with ``concatenate_terms = True``. With a history, the
+  frames are kept in a deque and concatenated as well,
+* ``packed``: :class:`ObservationPacker`, the terms write into their slices of a preallocated buffer.
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_obs_buffer.py --num_envs 16 1024 65536 --history_length 1 3
+
+"""
+
+import argparse
+import collections
+import os
+import sys
+import time
+
+import torch
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.obs_buffer import ObservationPacker  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Measure the cost of assembling observations.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[16, 1024, 65536], help="Numbers of environments.")
+parser.add_argument("--history_length", type=int, nargs="+", default=[1, 3], help="Numbers of stacked frames.")
+parser.add_argument("--steps", type=int, default=500, help="Number of measured steps.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run on.")
+args_cli = parser.parse_args()
+
+# (name, dim) of the terms; "rel" terms subtract a default, the others read a state buffer
+TERMS = [
+    ("base_lin_vel", 3),
+    ("base_ang_vel", 3),
+    ("projected_gravity", 3),
+    ("velocity_commands", 3),
+    ("joint_pos_rel", 12),
+    ("joint_vel_rel", 12),
+    ("last_action", 12),
+]
+
+
+def synchronize():
+    if torch.device(args_cli.device).type == "cuda":
+        torch.cuda.synchronize()
+
+
+def measure(step_fn) -> float:
+    """Returns the time per call of a step function."""
+    for _ in range(10):
+        step_fn()
+    synchronize()
+    start = time.perf_counter()
+    for _ in range(args_cli.steps):
+        step_fn()
+    synchronize()
+    return (time.perf_counter() - start) / args_cli.steps
+
+
+def run(num_envs: int, history_length: int) -> tuple[float, float]:
+    """Returns the time per step of both ways of assembling the observations."""
+    state = {name: torch.randn(num_envs, dim, device=args_cli.device) for name, dim in TERMS}
+    default = {name: torch.randn(num_envs, dim, device=args_cli.device) for name, dim in TERMS if "rel" in name}
+
+    frames = collections.deque(maxlen=history_length)
+
+    def concatenate():
+        terms = [state[name] - default[name] if name in default else state[name].clone() for name, _ in TERMS]
+        frames.append(torch.cat(terms, dim=-1))
+        while len(frames) < history_length:
+            frames.append(frames[-1])
+        return torch.cat(list(frames), dim=-1) if history_length > 1 else frames[-1]
+
+    packer = ObservationPacker(dict(TERMS), num_envs, history_length=history_length, device=args_cli.device)
+    writes = [(name, packer.slices[name]) for name, _ in TERMS]
+
+    def packed():
+        for name, _ in writes:
+            if name in default:
+                torch.sub(state[name], default[name], out=packer.term(name))
+            else:
+                packer.term(name).copy_(state[name])
+        return packer.advance()
+
+    assert torch.equal(concatenate(), packed())
+    return measure(concatenate), measure(packed)
+
+
+def main():
+    """Main function."""
+    print(f"{'envs':>6} | {'history':>7} | {'concatenate [us]':>16} | {'packed [us]':>11} | {'speed-up':>8}")
+    for history_length in args_cli.history_length:
+        for num_envs in args_cli.num_envs:
+            t_cat, t_packed = run(num_envs, history_length)
+            print(
+                f"{num_envs:>6} | {history_length:>7} | {t_cat * 1e6:>16.1f} | {t_packed * 1e6:>11.1f} |"
+                f" {t_cat / t_packed:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
@@ -0,0 +1,79 @@
+"""
+This script benchmarks the batched Euler-to-quaternion conversion against the previous scipy-per-call path.
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_quat.py --num_poses 10 1000 100000
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from scipy.spatial.transform import Rotation as R
+
+# make the lighting helpers importable
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "robot_import", "basic_tutorials", "lighting"))
+
+from utils.quat import quat_from_euler_xyz, quaternion_from_degrees  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark batched Euler to quaternion conversion.")
+parser.add_argument("--num_poses", type=int, nargs="+", default=[10, 1000, 100000], help="Batch sizes to time.")
+parser.add_argument("--repeats", type=int, default=5, help="Number of timed repetitions per batch size.")
+parser.add_argument("--device", type=str, default=None, help="Also time the torch path on this device (e.g. cuda).")
+args_cli = parser.parse_args()
+
+
+def scipy_per_call(roll: float, pitch: float, yaw: float) -> tuple:
+    """Reference implementation: one scipy rotation per pose, as the lighting scripts used to do."""
+    quaternion = R.from_euler("xyz", [roll, pitch, yaw], degrees=True).as_quat()
+    quaternion_wxyz = np.concatenate(([quaternion[-1]], quaternion[:-1]))
+    return tuple(np.around(tuple(quaternion_wxyz), decimals=10))
+
+
+def best_of(fn, repeats: int) -> float:
+    """Returns the fastest wall time of ``repeats`` calls in seconds."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Main function."""
+    rng = np.random.default_rng(0)
+    print(f"{'poses':>10} | {'scipy/call [ms]':>16} | {'numpy batch [ms]':>16} | {'speed-up':>9}")
+    for num_poses in args_cli.num_poses:
+        euler = rng.uniform(-180.0, 180.0, size=(num_poses, 3))
+        # sanity check: both paths agree
+        reference = np.array([scipy_per_call(*angles) for angles in euler[:16]])
+        batched = quaternion_from_degrees(euler[:16, 0], euler[:16, 1], euler[:16, 2])
+        assert np.allclose(reference, batched, atol=1e-9)
+        # the per-call baseline is slow, so time it once on large batches
+        t_scipy = best_of(lambda: [scipy_per_call(*angles) for angles in euler], 1 if num_poses > 10000 else 3)
+        t_batch = best_of(lambda: quat_from_euler_xyz(euler, degrees=True), args_cli.repeats)
+        print(f"{num_poses:>10} | {t_scipy * 1e3:>16.3f} | {t_batch * 1e3:>16.3f} | {t_scipy / t_batch:>8.1f}x")
+        if args_cli.device is not None:
+            import torch
+
+            euler_t = torch.as_tensor(euler, dtype=torch.float32, device=args_cli.device)
+
+            def torch_batch():
+                quat_from_euler_xyz(euler_t, degrees=True)
+                if euler_t.is_cuda:
+                    torch.cuda.synchronize()
+
+            torch_batch()
+            t_torch = best_of(torch_batch, args_cli.repeats)
+            print(f"{'':>10} | {'torch (' + args_cli.device + ')':>16} | {t_torch * 1e3:>16.3f} |")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
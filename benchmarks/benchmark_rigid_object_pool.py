@@ -0,0 +1,122 @@
+"""
+This script benchmarks a heterogeneous rigid-object pool against one rigid object per shape type.
+
+Both variants hold the same instances, split evenly over 3 or 30 shape types (spheres and boxes of different sizes),
+on the pure-torch physics stand-in. Every step resets a tenth of the instances, writes the data, steps the physics,
+updates the buffers and reads the positions of all instances. With one object per type, every operation is issued
+per type; the pool issues each operation once for all types.
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_rigid_object_pool.py --num_instances 30000 --num_types 3 30
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import torch
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.rigid_object_pool import RigidObjectPool  # noqa: E402
+from lab_utils.torch_physics import TorchRigidObject, TorchSimulationContext  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark a heterogeneous rigid-object pool against per-type objects.")
+parser.add_argument("--num_instances", type=int, default=30000, help="Number of instances over all types.")
+parser.add_argument("--num_types", type=int, nargs="+", default=[3, 30], help="Numbers of shape types.")
+parser.add_argument("--steps", type=int, default=200, help="Number of measured steps.")
+parser.add_argument("--reset_interval", type=int, default=10, help="Every instance is reset every n steps.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run on.")
+args_cli = parser.parse_args()
+
+
+def shape(type_id: int) -> tuple[float, tuple[float, float, float]]:
+    """Returns the radius and half extents of a type: even types are spheres, odd types are boxes."""
+    size = 0.05 + 0.01 * type_id
+    if type_id % 2 == 0:
+        return size, (0.0, 0.0, 0.0)
+    return 0.0, (size, 0.5 * size, 0.75 * size)
+
+
+def synchronize():
+    if torch.device(args_cli.device).type == "cuda":
+        torch.cuda.synchronize()
+
+
+def run_per_type(num_types: int) -> float:
+    """One rigid object per type; returns the time per step."""
+    sim = TorchSimulationContext(dt=0.01, device=args_cli.device)
+    count = args_cli.num_instances // num_types
+    objects = []
+    for type_id in range(num_types):
+        radius, half_extents = shape(type_id)
+        objects.append(TorchRigidObject(sim, count, pos=(0.0, 0.0, 0.5), radius=radius, half_extents=half_extents))
+    sim.reset()
+    default_states = [obj.data.default_root_state.clone() for obj in objects]
+    start = None
+    for step in range(args_cli.steps + 10):
+        if step == 10:
+            synchronize()
+            start = time.perf_counter()
+        for obj, default_state in zip(objects, default_states):
+            ids = torch.arange(step % args_cli.reset_interval, count, args_cli.reset_interval, device=args_cli.device)
+            obj.write_root_state_to_sim(default_state[ids], env_ids=ids)
+            obj.reset(ids)
+            obj.write_data_to_sim()
+        sim.step(render=False)
+        for obj in objects:
+            obj.update(sim.get_physics_dt())
+        positions = torch.cat([obj.data.root_state_w[:, :3] for obj in objects])
+    positions.sum().item()
+    synchronize()
+    return (time.perf_counter() - start) / args_cli.steps
+
+
+def run_pool(num_types: int) -> float:
+    """One pool over all types; returns the time per step."""
+    sim = TorchSimulationContext(dt=0.01, device=args_cli.device)
+    num_instances = args_cli.num_instances // num_types * num_types
+    type_ids = torch.arange(num_instances, device=args_cli.device) % num_types
+    shapes = [shape(type_id) for type_id in range(num_types)]
+    radius = torch.tensor([s[0] for s in shapes], device=args_cli.device)[type_ids]
+    half_extents = torch.tensor([s[1] for s in shapes], device=args_cli.device)[type_ids]
+    asset = TorchRigidObject(sim, num_instances, pos=(0.0, 0.0, 0.5), radius=radius, half_extents=half_extents)
+    pool = RigidObjectPool(asset, [f"type_{i}" for i in range(num_types)], type_ids)
+    sim.reset()
+    default_state = asset.data.default_root_state.clone()
+    start = None
+    for step in range(args_cli.steps + 10):
+        if step == 10:
+            synchronize()
+            start = time.perf_counter()
+        ids = torch.arange(
+            step % args_cli.reset_interval, num_instances, args_cli.reset_interval, device=args_cli.device
+        )
+        pool.write_root_state(default_state[ids], env_ids=ids)
+        pool.reset(ids)
+        pool.write_data_to_sim()
+        sim.step(render=False)
+        pool.update(sim.get_physics_dt())
+        positions = pool.root_state_w[:, :3]
+    positions.sum().item()
+    synchronize()
+    return (time.perf_counter() - start) / args_cli.steps
+
+
+def main():
+    """Main function."""
+    print(f"{'types':>6} | {'per type [ms]':>13} | {'pool [ms]':>9} | {'speed-up':>8}")
+    for num_types in args_cli.num_types:
+        t_per_type = run_per_type(num_types)
+        t_pool = run_pool(num_types)
+        print(f"{num_types:>6} | {t_per_type * 1e3:>13.3f} | {t_pool * 1e3:>9.3f} | {t_per_type / t_pool:>7.2f}x")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
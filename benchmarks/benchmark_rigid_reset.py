@@ -0,0 +1,157 @@
+"""
+This script micro-benchmarks resetting rigid-object root states.
+
+It compares the clone-based reset of the rigid-object tutorial with :class:`RootStateResetter` and reports the number
+of tensor allocations and the wall time per reset. The ``script loop`` row times the reset path of
+``interacting_with_a_rigid_object.py`` per loop step: the episode bookkeeping of every step and a reset of all
+instances every ``max_episode_length`` steps, averaged over whole episodes. Its allocations are those of a step
+without a reset. The simulation writes are replaced by a sink that only records the
+call, so the numbers isolate the cost of preparing the states. The few bytes the resetter still allocates are the
+scalar tensors torch wraps Python floats in.
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_rigid_reset.py --num_instances 1 1000 16000 --device cpu
+
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+import torch
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.rigid_reset import RootStateResetter  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Micro-benchmark rigid-object root-state resets.")
+parser.add_argument("--num_instances", type=int, nargs="+", default=[1, 1000, 16000], help="Instance counts.")
+parser.add_argument("--reset_fraction", type=float, default=0.1, help="Fraction of instances in a partial reset.")
+parser.add_argument("--iterations", type=int, default=200, help="Number of timed resets.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run on.")
+args_cli = parser.parse_args()
+
+
+class _RigidObjectData:
+    def __init__(self, num_instances: int, device: str):
+        self.default_root_state = torch.zeros(num_instances, 13, device=device)
+        self.default_root_state[:, 3] = 1.0
+
+
+class SinkRigidObject:
+    """Rigid object whose simulation writes are no-ops."""
+
+    def __init__(self, num_instances: int, device: str):
+        self.num_instances = num_instances
+        self.device = device
+        self.data = _RigidObjectData(num_instances, device)
+
+    def write_root_pose_to_sim(self, root_pose: torch.Tensor, env_ids: torch.Tensor | None = None):
+        pass
+
+    def write_root_velocity_to_sim(self, root_velocity: torch.Tensor, env_ids: torch.Tensor | None = None):
+        pass
+
+    def write_root_state_to_sim(self, root_state: torch.Tensor, env_ids: torch.Tensor | None = None):
+        pass
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        pass
+
+
+def sample_cylinder(radius: float, h_range: tuple[float, float], size: int, device: str) -> torch.Tensor:
+    """Samples points in a cylinder, allocating like :func:`isaaclab.utils.math.sample_cylinder`."""
+    r = torch.empty(size, device=device).uniform_(0.0, radius)
+    theta = torch.empty(size, device=device).uniform_(-math.pi, math.pi)
+    z = torch.empty(size, device=device).uniform_(*h_range)
+    return torch.stack([r * torch.cos(theta), r * torch.sin(theta), z], dim=-1)
+
+
+def clone_reset(asset: SinkRigidObject, origins: torch.Tensor):
+    """The reset of the rigid-object tutorial."""
+    root_state = asset.data.default_root_state.clone()
+    root_state[:, :3] += origins
+    root_state[:, :3] += sample_cylinder(0.1, (0.25, 0.5), asset.num_instances, asset.device)
+    asset.write_root_pose_to_sim(root_state[:, :7])
+    asset.write_root_velocity_to_sim(root_state[:, 7:])
+    asset.reset()
+
+
+def script_loop(resetter: RootStateResetter):
+    """Returns one loop step of the reset path of ``interacting_with_a_rigid_object.py``."""
+    total_steps = 0
+
+    def step():
+        nonlocal total_steps
+        # all instances share the reset schedule, which the host knows
+        if total_steps % resetter.max_episode_length == 0:
+            resetter.reset()
+        resetter.step()
+        total_steps += 1
+
+    return step
+
+
+def count_allocations(fn) -> int:
+    """Counts the tensor allocations of a single call."""
+    activities = [torch.profiler.ProfilerActivity.CPU]
+    if args_cli.device.startswith("cuda"):
+        activities.append(torch.profiler.ProfilerActivity.CUDA)
+    with torch.profiler.profile(activities=activities, profile_memory=True) as prof:
+        fn()
+    # allocations are attributed to the innermost event that makes them: an operator or a bare "[memory]" event
+    allocations = 0
+    for event in prof.events():
+        size = getattr(event, "self_cpu_memory_usage", 0) + getattr(event, "self_device_memory_usage", 0)
+        allocations += size > 0
+    return allocations
+
+
+def time_per_call(fn, iterations: int) -> float:
+    """Returns the mean wall time of a call in microseconds."""
+    fn()
+    if args_cli.device.startswith("cuda"):
+        torch.cuda.synchronize()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    if args_cli.device.startswith("cuda"):
+        torch.cuda.synchronize()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    """Main function."""
+    print(f"{'instances':>10} | {'method':>18} | {'allocations':>11} | {'time [us]':>10}")
+    for num_instances in args_cli.num_instances:
+        asset = SinkRigidObject(num_instances, args_cli.device)
+        origins = torch.rand(num_instances, 3, device=args_cli.device)
+        resetter = RootStateResetter(asset, origins)
+        num_partial = max(1, int(args_cli.reset_fraction * num_instances))
+        partial_ids = torch.randperm(num_instances, device=args_cli.device)[:num_partial]
+        loop_resetter = RootStateResetter(asset, origins)
+        methods = {
+            "clone (all)": lambda: clone_reset(asset, origins),
+            "resetter (all)": lambda: resetter.reset(),
+            f"resetter ({num_partial})": lambda: resetter.reset(partial_ids),
+            "script loop": script_loop(loop_resetter),
+        }
+        # the loop is timed over whole episodes, so every reset is included once per episode
+        episode = loop_resetter.max_episode_length
+        loop_iterations = math.ceil(args_cli.iterations / episode) * episode
+        for name, fn in methods.items():
+            fn()
+            allocations = count_allocations(fn)
+            iterations = loop_iterations if name == "script loop" else args_cli.iterations
+            elapsed = time_per_call(fn, iterations)
+            print(f"{num_instances:>10} | {name:>18} | {allocations:>11} | {elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
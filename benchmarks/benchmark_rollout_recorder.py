@@ -0,0 +1,89 @@
+"""
+This script benchmarks recording rollouts to disk and reading minibatches back.
+
+It compares saving every step with :func:`torch.save` against :class:`RolloutRecorder`, and measures how fast
+:class:`RolloutReader` samples random minibatches from the memory-mapped recording. The recorded tensors have the
+sizes of the cartpole environment: 4 observations, 1 action and a reset flag per environment.
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_rollout_recorder.py --num_envs 4096 --steps 500
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import torch
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.rollout_recorder import RolloutReader, RolloutRecorder  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark rollout recording and minibatch reading.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of environments.")
+parser.add_argument("--steps", type=int, default=500, help="Number of recorded steps.")
+parser.add_argument("--chunk_size", type=int, default=128, help="Steps per recorded chunk.")
+parser.add_argument("--batch_size", type=int, default=4096, help="Transitions per sampled minibatch.")
+parser.add_argument("--num_batches", type=int, default=200, help="Number of sampled minibatches.")
+parser.add_argument("--device", type=str, default="cpu", help="Device of the recorded tensors.")
+args_cli = parser.parse_args()
+
+
+def make_step(num_envs: int) -> dict[str, torch.Tensor]:
+    return {
+        "obs": torch.randn(num_envs, 4, device=args_cli.device),
+        "action": torch.randn(num_envs, 1, device=args_cli.device),
+        "reset": torch.zeros(num_envs, dtype=torch.bool, device=args_cli.device),
+    }
+
+
+def main():
+    """Main function."""
+    step = make_step(args_cli.num_envs)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # baseline: one file per step
+        start = time.perf_counter()
+        for step_id in range(args_cli.steps):
+            torch.save(step, os.path.join(tmp_dir, f"step_{step_id}.pt"))
+        t_save = time.perf_counter() - start
+
+        # recorder: the loop only stages the tensors
+        columns = {"obs": ((4,), torch.float32), "action": ((1,), torch.float32), "reset": ((), torch.bool)}
+        path = os.path.join(tmp_dir, "recording")
+        recorder = RolloutRecorder(
+            path, columns, args_cli.num_envs, chunk_size=args_cli.chunk_size, device=args_cli.device
+        )
+        start = time.perf_counter()
+        for _ in range(args_cli.steps):
+            recorder.record(**step)
+        t_loop = time.perf_counter() - start
+        recorder.close()
+        t_record = time.perf_counter() - start
+
+        # reader: random minibatches from the mapping
+        reader = RolloutReader(path)
+        generator = torch.Generator().manual_seed(0)
+        start = time.perf_counter()
+        for _ in range(args_cli.num_batches):
+            reader.sample(args_cli.batch_size, generator=generator)
+        t_sample = time.perf_counter() - start
+
+    print(f"{'method':>28} | {'per step [ms]':>13}")
+    print(f"{'torch.save per step':>28} | {t_save / args_cli.steps * 1e3:>13.3f}")
+    print(f"{'recorder (loop)':>28} | {t_loop / args_cli.steps * 1e3:>13.3f}")
+    print(f"{'recorder (incl. flush)':>28} | {t_record / args_cli.steps * 1e3:>13.3f}")
+    print(
+        f"[INFO]: Sampled {args_cli.num_batches * args_cli.batch_size / t_sample:.0f} transitions/s from"
+        f" {len(reader)} recorded transitions."
+    )
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
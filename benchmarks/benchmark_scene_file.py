@@ -0,0 +1,159 @@
+"""
+This script measures the start-up time of scenes described by a scene file against the imperative style.
+
+The generated scene has ``--num_objects`` cuboids, cones and spheres built from ``--num_templates`` templates. The
+script always measures loading the scene file: the first load parses, validates and compiles it, and later loads
+hit the cache. With ``--spawn``, it also spawns the scene in both styles, each in its own process (one simulation
+app per style), and reports the time to spawn the scene and to start the simulation (``sim.reset()``):
+
+* ``imperative``: one ``RigidObjectCfg`` and one :class:`RigidObject` per object, like the tutorial scripts,
+* ``scene_file``: :func:`spawn_scene`, one :class:`RigidObject` per template with cloned bodies.
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_scene_file.py --num_objects 1000
+    ./isaaclab.sh -p benchmarks/benchmark_scene_file.py --num_objects 1000 --spawn
+
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.scene_file import compile_scene, load_scene  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Measure the start-up time of scene files against imperative scenes.")
+parser.add_argument("--num_objects", type=int, default=1000, help="Number of objects in the scene.")
+parser.add_argument("--num_templates", type=int, default=6, help="Number of distinct object templates.")
+parser.add_argument("--loads", type=int, default=100, help="Number of cached loads to average.")
+parser.add_argument("--spawn", action="store_true", default=False, help="Also spawn the scene (needs Isaac Sim).")
+parser.add_argument("--device", type=str, default="cuda:0", help="Simulation device.")
+parser.add_argument("--child_style", type=str, default=None, help=argparse.SUPPRESS)
+parser.add_argument("--child_scene", type=str, default=None, help=argparse.SUPPRESS)
+
+
+def make_scene(num_objects: int, num_templates: int) -> dict:
+    """Returns the contents of a scene file with objects on a grid."""
+    shapes = [
+        {"shape": "cuboid", "size": [0.2, 0.2, 0.2]},
+        {"shape": "cone", "radius": 0.1, "height": 0.2},
+        {"shape": "sphere", "radius": 0.1},
+    ]
+    templates = {}
+    for template_id in range(num_templates):
+        templates[f"t{template_id}"] = {
+            **shapes[template_id % len(shapes)],
+            "mass": 1.0 + template_id,
+            "color": [template_id / num_templates, 0.5, 0.5],
+        }
+    side = int(num_objects**0.5) + 1
+    objects = [
+        {
+            "name": f"object_{i}",
+            "template": f"t{i % num_templates}",
+            "pos": [0.5 * (i % side), 0.5 * (i // side), 0.5],
+        }
+        for i in range(num_objects)
+    ]
+    lights = [{"type": "dome", "intensity": 2000.0}]
+    return {"ground": True, "lights": lights, "templates": templates, "objects": objects}
+
+
+def spawn_child(args_cli):
+    """Spawns the scene in one style, measures the start-up and prints the result."""
+    from isaaclab.app import AppLauncher
+
+    simulation_app = AppLauncher(headless=True, device=args_cli.device).app
+
+    import isaacsim.core.utils.prims as prim_utils
+
+    import isaaclab.sim as sim_utils
+    from isaaclab.assets import RigidObject, RigidObjectCfg
+
+    from lab_utils.scene_file import spawn_scene, template_spawn_cfg
+
+    sim = sim_utils.SimulationContext(sim_utils.SimulationCfg(device=args_cli.device))
+    scene = load_scene(args_cli.child_scene)
+    start = time.perf_counter()
+    if args_cli.child_style == "scene_file":
+        entities = spawn_scene(scene)
+    else:
+        # the imperative style of the tutorials: one configuration and one spawn per object
+        cfg_ground = sim_utils.GroundPlaneCfg()
+        cfg_ground.func("/World/defaultGroundPlane", cfg_ground)
+        cfg_light = sim_utils.DomeLightCfg(intensity=2000.0)
+        cfg_light.func("/World/Light", cfg_light)
+        entities = {}
+        for group in scene.groups.values():
+            for name, pos in zip(group.instance_names, group.positions):
+                prim_utils.create_prim(f"/World/{name}", "Xform", translation=pos)
+                cfg = RigidObjectCfg(
+                    prim_path=f"/World/{name}/body",
+                    spawn=template_spawn_cfg(group.template),
+                    init_state=RigidObjectCfg.InitialStateCfg(),
+                )
+                entities[name] = RigidObject(cfg=cfg)
+    spawn_time = time.perf_counter() - start
+    start = time.perf_counter()
+    sim.reset()
+    reset_time = time.perf_counter() - start
+    result = {"style": args_cli.child_style, "assets": len(entities), "spawn_s": spawn_time, "reset_s": reset_time}
+    # note: closing the app can end the process, so the result is printed first.
+    print("RESULT " + json.dumps(result), flush=True)
+    simulation_app.close()
+
+
+def main():
+    """Main function."""
+    args_cli = parser.parse_args()
+    if args_cli.child_style is not None:
+        spawn_child(args_cli)
+        return
+
+    data = make_scene(args_cli.num_objects, args_cli.num_templates)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "scene.json")
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+        start = time.perf_counter()
+        compile_scene(data)
+        t_compile = time.perf_counter() - start
+        start = time.perf_counter()
+        scene = load_scene(path)
+        t_cold = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(args_cli.loads):
+            load_scene(path)
+        t_cached = (time.perf_counter() - start) / args_cli.loads
+        print(f"[INFO]: {scene.num_objects} objects in {len(scene.groups)} groups.")
+        print(f"{'load':>22} | {'time [ms]':>9}")
+        print(f"{'validate + compile':>22} | {t_compile * 1e3:>9.3f}")
+        print(f"{'first load (+ parse)':>22} | {t_cold * 1e3:>9.3f}")
+        print(f"{'cached load':>22} | {t_cached * 1e3:>9.3f}")
+
+        if not args_cli.spawn:
+            return
+        results = []
+        for style in ("imperative", "scene_file"):
+            command = [sys.executable, __file__, *sys.argv[1:], "--child_style", style, "--child_scene", path]
+            output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+            line = next(line for line in output.splitlines() if line.startswith("RESULT "))
+            results.append(json.loads(line[len("RESULT ") :]))
+
+    print(f"{'style':>12} | {'assets':>6} | {'spawn [s]':>9} | {'reset [s]':>9}")
+    for result in results:
+        print(f"{result['style']:>12} | {result['assets']:>6} | {result['spawn_s']:>9.3f} | {result['reset_s']:>9.3f}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
@@ -0,0 +1,74 @@
+"""
+This script measures the scaling of the sharded environment runner with the number of worker processes.
+
+For every worker count, the total number of environments is split across the workers, which exchange actions and
+observations with this process through shared memory. The reported throughput is in env-steps/s summed over all
+environments.
+
+The cartpole environment launches one headless simulation app per worker. The torch environment runs the
+pure-torch physics stand-in and needs neither Isaac Sim nor a GPU.
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_sharded_env.py --env torch --num_envs 16384 --workers 1 2 4 8
+    ./isaaclab.sh -p benchmarks/benchmark_sharded_env.py --env cartpole --num_envs 4096 --workers 1 2 4
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import torch
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.sharded_env import ShardedVecEnv  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the sharded environment runner against the worker count.")
+parser.add_argument("--env", type=str, default="torch", choices=["torch", "cartpole"], help="Environment to run.")
+parser.add_argument("--num_envs", type=int, default=16384, help="Total number of environments.")
+parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to measure.")
+parser.add_argument("--steps", type=int, default=200, help="Number of measured env steps.")
+parser.add_argument("--warmup_steps", type=int, default=20, help="Number of unmeasured env steps.")
+parser.add_argument("--device", type=str, default="cuda:0", help="Simulation device of the cartpole workers.")
+
+
+def main():
+    """Main function."""
+    args_cli = parser.parse_args()
+    if args_cli.env == "torch":
+        factory, factory_kwargs, app_kwargs = "lab_utils.torch_physics:make_torch_env", {}, None
+    else:
+        factory = "lab_utils.cartpole_env_cfg:make_cartpole_env"
+        factory_kwargs = {"device": args_cli.device}
+        app_kwargs = {"headless": True, "device": args_cli.device}
+
+    print(f"{'workers':>8} | {'setup [s]':>9} | {'env-steps/s':>12} | {'scaling':>8}")
+    baseline = None
+    for num_workers in args_cli.workers:
+        start = time.perf_counter()
+        env = ShardedVecEnv(
+            factory, args_cli.num_envs, num_workers, factory_kwargs=factory_kwargs, app_kwargs=app_kwargs
+        )
+        setup_time = time.perf_counter() - start
+        with env:
+            env.reset()
+            actions = torch.zeros(env.num_envs, env.action_dim)
+            for _ in range(args_cli.warmup_steps):
+                env.step(actions.normal_())
+            start = time.perf_counter()
+            for _ in range(args_cli.steps):
+                env.step(actions.normal_())
+            elapsed = time.perf_counter() - start
+        throughput = args_cli.steps * args_cli.num_envs / elapsed
+        baseline = baseline or throughput
+        print(f"{num_workers:>8} | {setup_time:>9.2f} | {throughput:>12.0f} | {throughput / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
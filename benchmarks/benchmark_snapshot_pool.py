@@ -0,0 +1,77 @@
+"""
+This script measures the steps wasted on settling after resets, with and without a snapshot pool.
+
+The rigid-object loop runs on the pure-torch physics stand-in: cones are reset above their origins and fall to the
+ground. A step of an instance is useful once the cone is at rest and wasted while it is still falling or
+bouncing. With a :class:`SnapshotPool`, the resetter captures settled states and later resets restore them, so
+the settling phase is skipped.
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_snapshot_pool.py --num_instances 4096 --steps 2000 --max_episode_length 100
+
+"""
+
+import argparse
+import os
+import sys
+
+import torch
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.rigid_reset import RootStateResetter  # noqa: E402
+from lab_utils.snapshot_pool import EVICTION_POLICIES, SnapshotPool, settled_mask  # noqa: E402
+from lab_utils.torch_physics import TorchRigidObject, TorchSimulationContext  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Measure wasted settling steps with and without a snapshot pool.")
+parser.add_argument("--num_instances", type=int, default=4096, help="Number of cone instances.")
+parser.add_argument("--steps", type=int, default=2000, help="Number of simulated steps.")
+parser.add_argument("--max_episode_length", type=int, default=100, help="Steps between the resets of an instance.")
+parser.add_argument("--pool_size", type=int, default=1024, help="Capacity of the snapshot pool.")
+parser.add_argument("--eviction", type=str, default="reservoir", choices=EVICTION_POLICIES, help="Eviction policy.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run on.")
+args_cli = parser.parse_args()
+
+
+def run(snapshot_pool: SnapshotPool | None) -> tuple[int, int, int]:
+    """Runs the loop and returns the wasted steps, the useful steps and the resets from the pool."""
+    sim = TorchSimulationContext(dt=0.01, device=args_cli.device)
+    cone_object = TorchRigidObject(sim, args_cli.num_instances, radius=0.1, restitution=0.3)
+    origins = torch.zeros(args_cli.num_instances, 3, device=args_cli.device)
+    origins[:, 0] = torch.arange(args_cli.num_instances, device=args_cli.device, dtype=torch.float)
+    sim.reset()
+    resetter = RootStateResetter(
+        cone_object, origins, max_episode_length=args_cli.max_episode_length, snapshot_pool=snapshot_pool
+    )
+    # stagger the episodes so that the resets are spread over the steps
+    resetter.episode_length.copy_(
+        torch.randint(args_cli.max_episode_length, (args_cli.num_instances,), device=args_cli.device)
+    )
+    resetter.reset_mask.fill_(True)
+    useful = torch.zeros((), dtype=torch.long, device=args_cli.device)
+    for _ in range(args_cli.steps):
+        if resetter.reset_mask.any():
+            resetter.reset(resetter.due_env_ids())
+        sim.step()
+        cone_object.update(sim.get_physics_dt())
+        resetter.step()
+        useful += settled_mask(cone_object.data.root_state_w).sum()
+    total = args_cli.steps * args_cli.num_instances
+    return total - int(useful), int(useful), resetter.num_pool_resets
+
+
+def main():
+    """Main function."""
+    pool = SnapshotPool({"root_state": (13,)}, args_cli.pool_size, eviction=args_cli.eviction, device=args_cli.device)
+    print(f"{'method':>16} | {'wasted':>10} | {'useful':>10} | {'wasted/useful':>13} | {'pool resets':>11}")
+    for name, snapshot_pool in (("default reset", None), ("snapshot pool", pool)):
+        wasted, useful, pool_resets = run(snapshot_pool)
+        print(f"{name:>16} | {wasted:>10} | {useful:>10} | {wasted / max(useful, 1):>13.3f} | {pool_resets:>11}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
@@ -0,0 +1,101 @@
+"""
+This script benchmarks the non-overlapping spawn sampler for 1k to 100k objects.
+
+Every environment holds the same mix of cones, spheres and cuboids (the footprints of the rigid-object tutorial),
+and the number of environments grows with the total number of objects. For every size, the script reports the
+sampling time, the number of rounds and the fraction of placed objects, and verifies that no two placed footprints
+overlap. For small sizes, it compares against the same dart throwing with an all-pairs overlap check.
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_spawn_sampler.py --num_objects 1000 10000 100000 --objects_per_env 64
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import torch
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.spawn_sampler import SpawnSampler  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark the non-overlapping spawn sampler.")
+parser.add_argument("--num_objects", type=int, nargs="+", default=[1000, 10000, 100000], help="Total object counts.")
+parser.add_argument("--objects_per_env", type=int, default=64, help="Number of objects per environment.")
+parser.add_argument("--half_extent", type=float, default=1.5, help="Half size of the area per environment (in m).")
+parser.add_argument("--pairwise_limit", type=int, default=10000, help="Largest size for the all-pairs baseline.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run on.")
+args_cli = parser.parse_args()
+
+# footprint radii of the tutorial shapes: cone (r=0.1), sphere (r=0.1), cuboid (0.1 x 0.1 m)
+SHAPE_RADII = [0.1, 0.1, 0.5 * 0.1 * 2**0.5]
+
+
+def sample_pairwise(radii: torch.Tensor, num_envs: int, max_rounds: int = 64) -> tuple[torch.Tensor, torch.Tensor]:
+    """Baseline: the same dart throwing, with an all-pairs overlap check per environment."""
+    num_objects = len(radii)
+    pos = torch.zeros(num_envs, num_objects, 2, device=args_cli.device)
+    placed = torch.zeros(num_envs, num_objects, dtype=torch.bool, device=args_cli.device)
+    index = torch.arange(num_objects, device=args_cli.device)
+    for _ in range(max_rounds):
+        if placed.all():
+            break
+        cand = (2.0 * torch.rand_like(pos) - 1.0) * (args_cli.half_extent - radii.unsqueeze(-1))
+        # placed objects take the place of the candidates; earlier candidates win
+        entries = torch.where(placed.unsqueeze(-1), pos, cand)
+        dist = torch.cdist(cand, entries, compute_mode="donot_use_mm_for_euclid_dist")
+        overlap = dist < radii.unsqueeze(1) + radii.unsqueeze(0)
+        overlap &= placed.unsqueeze(1) | (index.unsqueeze(1) > index.unsqueeze(0))
+        overlap &= index.unsqueeze(1) != index.unsqueeze(0)
+        accepted = ~placed & ~overlap.any(dim=-1)
+        pos[accepted] = cand[accepted]
+        placed |= accepted
+    return pos, placed
+
+
+def count_overlaps(radii: torch.Tensor, pos: torch.Tensor, placed: torch.Tensor, max_envs: int = 256) -> int:
+    """Counts the overlapping pairs of placed footprints in the first environments."""
+    pos, placed = pos[:max_envs], placed[:max_envs]
+    dist = torch.cdist(pos, pos, compute_mode="donot_use_mm_for_euclid_dist")
+    overlap = dist < (radii.unsqueeze(1) + radii.unsqueeze(0)) - 1e-6
+    overlap &= placed.unsqueeze(1) & placed.unsqueeze(2)
+    overlap &= ~torch.eye(len(radii), dtype=torch.bool, device=pos.device)
+    return int(overlap.sum().item()) // 2
+
+
+def main():
+    """Main function."""
+    radii = torch.tensor(SHAPE_RADII, device=args_cli.device).repeat(args_cli.objects_per_env // len(SHAPE_RADII) + 1)
+    radii = radii[: args_cli.objects_per_env]
+    sampler = SpawnSampler(radii, args_cli.half_extent, device=args_cli.device)
+
+    header = f"{'objects':>8} | {'envs':>6} | {'method':>9} | {'time [ms]':>10} | {'rounds':>6} | {'placed':>7}"
+    print(f"{header} | overlaps")
+    for num_objects in args_cli.num_objects:
+        num_envs = max(1, num_objects // args_cli.objects_per_env)
+        start = time.perf_counter()
+        pos, placed = sampler.sample(num_envs)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{num_envs * args_cli.objects_per_env:>8} | {num_envs:>6} | {'grid':>9} | {elapsed * 1e3:>10.1f} |"
+            f" {sampler.num_rounds:>6} | {placed.float().mean().item():>7.1%} | {count_overlaps(radii, pos, placed)}"
+        )
+        if num_objects <= args_cli.pairwise_limit:
+            start = time.perf_counter()
+            pos, placed = sample_pairwise(radii, num_envs)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{num_envs * args_cli.objects_per_env:>8} | {num_envs:>6} | {'pairwise':>9} | {elapsed * 1e3:>10.1f} |"
+                f" {'-':>6} | {placed.float().mean().item():>7.1%} | {count_overlaps(radii, pos, placed)}"
+            )
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
@@ -0,0 +1,96 @@
+"""
+This script measures how fast the entry-point scripts reject or accept their arguments without starting the app.
+
+Every script runs in its own process with ``--help`` and with ``--dry_run --startup_report``, and the script reports
+the wall time of the process together with the start-up breakdown of the dry run. Both modes end before the app
+boots, so the times are the cost of the interpreter, the argument parsing and the validation.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p benchmarks/benchmark_startup.py --runs 5
+
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# the entry points with arguments that make their dry run meaningful
+SCRIPTS = {
+    "procedural_terrain": ("robot_import/procedural_terrain.py", []),
+    "light_coloring": (
+        "robot_import/basic_tutorials/lighting/light_coloring.py",
+        ["--light_rig", "scenes/light_rig.toml"],
+    ),
+    "attatch_light_to_prim": (
+        "robot_import/basic_tutorials/lighting/attatch_light_to_prim.py",
+        ["--light_rig", "scenes/cone_lights.toml"],
+    ),
+    "teter_toter2": ("robot_import/basic_tutorials/prims/teter_toter2.py", ["--scene_file", "scenes/teter_toter.toml"]),
+    "interacting": ("interacting_with_a_rigid_object.py", []),
+    "manager_based_env": ("creating_a_manager_based_environment.py", []),
+}
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Measure the start-up time of the entry points without the app.")
+parser.add_argument("--runs", type=int, default=5, help="Number of runs per script and mode.")
+parser.add_argument("--scripts", type=str, nargs="+", default=list(SCRIPTS), choices=list(SCRIPTS), help="Scripts.")
+args_cli = parser.parse_args()
+
+
+def run(path: str, arguments: list[str]) -> tuple[float | None, str]:
+    """Returns the best wall time over the runs and the output of the last run.
+
+    The time is None when a run failed, since the process ended before the measured work was done. The output is
+    then the error output of the failed run.
+    """
+    best = float("inf")
+    output = ""
+    for _ in range(args_cli.runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, os.path.join(ROOT, path), *arguments], cwd=ROOT, capture_output=True, text=True
+        )
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            return None, result.stderr
+        best = min(best, elapsed)
+        output = result.stdout
+    return best, output
+
+
+def format_time(t: float | None, width: int) -> str:
+    """Formats a wall time for the table, or marks the failed runs."""
+    return f"{'failed':>{width}}" if t is None else f"{t:>{width}.3f}"
+
+
+def main():
+    """Main function."""
+    results = []
+    for name in args_cli.scripts:
+        path, arguments = SCRIPTS[name]
+        t_help, help_output = run(path, ["--help"])
+        t_dry_run, output = run(path, [*arguments, "--dry_run", "--startup_report"])
+        results.append((name, t_help, t_dry_run))
+        print(f"[INFO]: {name}:")
+        if t_help is None:
+            print(f"[ERROR]: --help failed:\n{help_output.rstrip()}")
+        if t_dry_run is None:
+            print("[ERROR]: --dry_run failed:")
+        print(output.rstrip())
+
+    print(f"{'script':>22} | {'--help [s]':>10} | {'--dry_run [s]':>13}")
+    for name, t_help, t_dry_run in results:
+        print(f"{name:>22} | {format_time(t_help, 10)} | {format_time(t_dry_run, 13)}")
+    failed = [name for name, t_help, t_dry_run in results if t_help is None or t_dry_run is None]
+    if failed:
+        raise SystemExit(f"[ERROR]: The start-up runs of {failed} failed. Their times are not reported.")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
@@ -0,0 +1,120 @@
+"""
+This script benchmarks the per-step cost of consuming the state of a step loop on the host.
+
+A fake step updates the root states of ``--num_envs`` objects, and a consumer serializes every ``--every``-th state
+to JSON. Three ways of consuming the state are compared:
+
+* ``sync``: copy the state to the host and serialize it inside the loop, like reading ``root_state_w`` for output,
+* ``drop``: publish it to a :class:`StateStream` that drops new frames under backpressure, and serialize it in a
+  consumer thread,
+* ``coalesce``: the same with a stream that coalesces frames under backpressure.
+
+The script reports the time per step and how many frames the consumer received. On the CPU, the copy of the stream
+runs in its thread; on a GPU, the copy runs on a side stream and ``sync`` also waits for the device.
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_state_stream.py --num_envs 4096 --device cuda:0
+
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+import torch
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.state_stream import StateStream  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark synchronous state reads against the state stream.")
+parser.add_argument("--steps", type=int, default=2000, help="Number of loop steps.")
+parser.add_argument("--num_envs", type=int, default=4096, help="Number of objects of the simulated state.")
+parser.add_argument("--every", type=int, default=1, help="Consume the state every n steps.")
+parser.add_argument("--buffers", type=int, default=4, help="Number of buffers of the stream.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run on.")
+args_cli = parser.parse_args()
+
+
+def synchronize():
+    if torch.device(args_cli.device).type == "cuda":
+        torch.cuda.synchronize()
+
+
+def fake_step(state: torch.Tensor) -> torch.Tensor:
+    """Stands in for a simulation step."""
+    return state.mul_(0.999).add_(0.001)
+
+
+def consume(values: torch.Tensor) -> int:
+    """Stands in for a logger: serializes the state."""
+    return len(json.dumps(values.tolist()))
+
+
+def run_sync(state: torch.Tensor) -> tuple[float, int]:
+    """Returns the time per step and the number of consumed frames of the synchronous reads."""
+    num_frames = 0
+    synchronize()
+    start = time.perf_counter()
+    for step in range(args_cli.steps):
+        fake_step(state)
+        if step % args_cli.every == 0:
+            consume(state.to("cpu", copy=True))
+            num_frames += 1
+    synchronize()
+    return (time.perf_counter() - start) / args_cli.steps, num_frames
+
+
+def run_stream(state: torch.Tensor, backpressure: str) -> tuple[float, int, StateStream]:
+    """Returns the time per step, the number of consumed frames and the stream."""
+    stream = StateStream(
+        {"root_state_w": (tuple(state.shape), state.dtype)},
+        num_buffers=args_cli.buffers,
+        backpressure=backpressure,
+        device=args_cli.device,
+    )
+    num_frames = [0]
+
+    def consumer():
+        for frame in stream:
+            consume(frame.values["root_state_w"])
+            num_frames[0] += 1
+
+    thread = threading.Thread(target=consumer, daemon=True)
+    thread.start()
+    synchronize()
+    start = time.perf_counter()
+    for step in range(args_cli.steps):
+        fake_step(state)
+        if step % args_cli.every == 0:
+            stream.publish(step, root_state_w=state)
+    synchronize()
+    t_step = (time.perf_counter() - start) / args_cli.steps
+    stream.close()
+    thread.join()
+    return t_step, num_frames[0], stream
+
+
+def main():
+    """Main function."""
+    state = torch.rand(args_cli.num_envs, 13, device=args_cli.device)
+    t_sync, frames_sync = run_sync(state)
+    print(f"{'mode':>9} | {'step [us]':>9} | {'speed-up':>8} | {'consumed':>8} | {'dropped':>7} | {'coalesced':>9}")
+    print(f"{'sync':>9} | {t_sync * 1e6:>9.1f} | {1.0:>7.2f}x | {frames_sync:>8} | {0:>7} | {0:>9}")
+    for backpressure in ("drop", "coalesce"):
+        t_step, num_frames, stream = run_stream(state, backpressure)
+        print(
+            f"{backpressure:>9} | {t_step * 1e6:>9.1f} | {t_sync / t_step:>7.2f}x | {num_frames:>8} |"
+            f" {stream.num_dropped:>7} | {stream.num_coalesced:>9}"
+        )
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
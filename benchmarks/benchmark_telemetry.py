@@ -0,0 +1,76 @@
+"""
+This script benchmarks the per-step cost of logging inside a step loop.
+
+It compares formatting a value with ``.item()`` and writing it to a file on every step with pushing the value to a
+:class:`TelemetrySink`, which aggregates windows in a background thread. On a GPU, the ``.item()`` call also
+synchronizes the device with the host on every step.
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_telemetry.py --steps 20000 --device cuda:0
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import torch
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.telemetry import JsonlWriter, TelemetrySink  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark per-step logging against the asynchronous telemetry.")
+parser.add_argument("--steps", type=int, default=20000, help="Number of loop steps.")
+parser.add_argument("--num_envs", type=int, default=1024, help="Number of environments of the simulated state.")
+parser.add_argument("--window", type=int, default=50, help="Telemetry window.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run on.")
+args_cli = parser.parse_args()
+
+
+def fake_step(state: torch.Tensor) -> torch.Tensor:
+    """Stands in for an environment step."""
+    return state.mul_(0.999).add_(0.001)
+
+
+def main():
+    """Main function."""
+    state = torch.rand(args_cli.num_envs, 4, device=args_cli.device)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # baseline: sync and write on every step
+        with open(os.path.join(tmp_dir, "print.log"), "w") as log:
+            start = time.perf_counter()
+            for _ in range(args_cli.steps):
+                obs = fake_step(state)
+                log.write(f"[Env 0]: Pole joint: {obs[0][1].item()}\n")
+            t_print = time.perf_counter() - start
+
+        # telemetry: device copy per step, host work in the background
+        writer = JsonlWriter(os.path.join(tmp_dir, "telemetry.jsonl"))
+        sink = TelemetrySink({"pole_joint": ()}, window=args_cli.window, writers=[writer], device=args_cli.device)
+        start = time.perf_counter()
+        for _ in range(args_cli.steps):
+            obs = fake_step(state)
+            sink.push("pole_joint", obs[0, 1])
+            sink.step()
+        if args_cli.device.startswith("cuda"):
+            torch.cuda.synchronize()
+        t_loop = time.perf_counter() - start
+        sink.close()
+        t_sink = time.perf_counter() - start
+
+    print(f"{'method':>24} | {'per step [us]':>13}")
+    print(f"{'print + .item()':>24} | {t_print / args_cli.steps * 1e6:>13.2f}")
+    print(f"{'telemetry (loop)':>24} | {t_loop / args_cli.steps * 1e6:>13.2f}")
+    print(f"{'telemetry (incl. flush)':>24} | {t_sink / args_cli.steps * 1e6:>13.2f}")
+    print(f"[INFO]: Dropped telemetry windows: {sink.num_dropped}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
@@ -0,0 +1,98 @@
+"""
+This script benchmarks bulk curriculum updates of the terrain levels and origins.
+
+A terrain grid with the layout of ``ROUGH_TERRAINS_CFG`` (10 levels, 20 sub-terrain types) and flat patches on every
+tile is shared by all environments. Every update promotes and demotes a random half of the environments from a
+random success metric and recomputes their origins. The vectorized :class:`TerrainCurriculum` is compared against a
+Python loop over the environments, which is measured on a subset and extrapolated per environment.
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_terrain_curriculum.py --num_envs 1000 10000 100000
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import torch
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.terrain_curriculum import TerrainCurriculum  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark bulk terrain-curriculum updates.")
+parser.add_argument("--num_envs", type=int, nargs="+", default=[1000, 10000, 100000], help="Environment counts.")
+parser.add_argument("--num_levels", type=int, default=10, help="Number of terrain levels (rows).")
+parser.add_argument("--num_types", type=int, default=20, help="Number of sub-terrain types (columns).")
+parser.add_argument("--num_patches", type=int, default=10, help="Number of flat patches per tile.")
+parser.add_argument("--updates", type=int, default=100, help="Number of measured updates.")
+parser.add_argument("--loop_envs", type=int, default=1000, help="Environments updated by the Python-loop baseline.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run on.")
+args_cli = parser.parse_args()
+
+
+def loop_update(curriculum: TerrainCurriculum, env_ids: list[int], success: list[float]):
+    """Baseline: the same promotion, demotion and origin update with a Python loop over the environments."""
+    for env_id, value in zip(env_ids, success):
+        level = int(curriculum.levels[env_id]) + (value > 0.8) - (value < 0.5)
+        if level >= curriculum.num_levels:
+            level = int(torch.randint(curriculum.num_levels, (1,)))
+        level = max(level, 0)
+        curriculum.levels[env_id] = level
+        patch_id = int(torch.randint(curriculum.flat_patches.shape[2], (1,)))
+        curriculum.env_origins[env_id] = curriculum.flat_patches[level, int(curriculum.types[env_id]), patch_id]
+
+
+def synchronize():
+    if torch.device(args_cli.device).type == "cuda":
+        torch.cuda.synchronize()
+
+
+def main():
+    """Main function."""
+    terrain_origins = torch.rand(args_cli.num_levels, args_cli.num_types, 3, device=args_cli.device) * 100.0
+    flat_patches = terrain_origins.unsqueeze(2) + torch.rand(
+        args_cli.num_levels, args_cli.num_types, args_cli.num_patches, 3, device=args_cli.device
+    )
+
+    print(f"{'envs':>7} | {'vectorized [ms]':>15} | {'histogram [ms]':>14} | {'loop [ms]':>10} | {'speed-up':>8}")
+    for num_envs in args_cli.num_envs:
+        curriculum = TerrainCurriculum(terrain_origins, num_envs, max_init_level=5, flat_patches=flat_patches)
+        all_ids = torch.arange(num_envs, device=args_cli.device)
+
+        # vectorized: a random half of the environments finish their episode per update
+        synchronize()
+        start = time.perf_counter()
+        for _ in range(args_cli.updates):
+            env_ids = all_ids[torch.rand(num_envs, device=args_cli.device) < 0.5]
+            curriculum.update_from_success(env_ids, torch.rand(len(env_ids), device=args_cli.device))
+        synchronize()
+        t_update = (time.perf_counter() - start) / args_cli.updates
+
+        start = time.perf_counter()
+        for _ in range(args_cli.updates):
+            curriculum.level_histogram(per_type=True)
+        synchronize()
+        t_histogram = (time.perf_counter() - start) / args_cli.updates
+
+        # loop baseline on a subset, extrapolated to half of the environments
+        num_loop = min(args_cli.loop_envs, num_envs // 2)
+        start = time.perf_counter()
+        loop_update(curriculum, list(range(num_loop)), torch.rand(num_loop).tolist())
+        t_loop = (time.perf_counter() - start) / num_loop * (num_envs // 2)
+
+        print(
+            f"{num_envs:>7} | {t_update * 1e3:>15.3f} | {t_histogram * 1e3:>14.3f} | {t_loop * 1e3:>10.1f} |"
+            f" {t_loop / t_update:>7.0f}x"
+        )
+        print(f"        levels: {curriculum.level_histogram().tolist()}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
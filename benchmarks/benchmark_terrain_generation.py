@@ -0,0 +1,83 @@
+"""
+This script benchmarks the parallel sub-terrain generation on the rough-terrain configuration.
+
+It generates the same terrain with an increasing number of workers, reports the wall time and speed-up over the
+single-worker path, and checks that every run produces the same mesh.
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p benchmarks/benchmark_terrain_generation.py --headless --workers 1 2 4 8 --use_curriculum
+
+"""
+
+"""Launch Isaac Sim Simulator first."""
+
+import argparse
+import os
+import sys
+
+from isaaclab.app import AppLauncher
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Benchmark parallel sub-terrain generation.")
+parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Worker counts to time.")
+parser.add_argument("--use_curriculum", action="store_true", default=False, help="Generate a curriculum grid.")
+parser.add_argument("--flat_patches", action="store_true", default=False, help="Also sample flat patches.")
+parser.add_argument("--seed", type=int, default=0, help="Seed for the terrain generation.")
+# append AppLauncher cli args
+AppLauncher.add_app_launcher_args(parser)
+# parse the arguments
+args_cli = parser.parse_args()
+
+# launch omniverse app
+app_launcher = AppLauncher(args_cli)
+simulation_app = app_launcher.app
+
+"""Rest everything follows."""
+
+import time
+
+import numpy as np
+
+from isaaclab.terrains import FlatPatchSamplingCfg
+
+from isaaclab.terrains.config.rough import ROUGH_TERRAINS_CFG  # isort:skip
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.terrain_parallel import ParallelTerrainGenerator  # noqa: E402
+
+
+def main():
+    """Main function."""
+    terrain_gen_cfg = ROUGH_TERRAINS_CFG.replace(curriculum=args_cli.use_curriculum, seed=args_cli.seed)
+    if args_cli.flat_patches:
+        for sub_terrain_name, sub_terrain_cfg in terrain_gen_cfg.sub_terrains.items():
+            sub_terrain_cfg.flat_patch_sampling = {
+                sub_terrain_name: FlatPatchSamplingCfg(num_patches=10, patch_radius=0.5, max_height_diff=0.05)
+            }
+    num_tiles = terrain_gen_cfg.num_rows * terrain_gen_cfg.num_cols
+    print(f"[INFO]: Generating {num_tiles} tiles ({terrain_gen_cfg.num_rows} x {terrain_gen_cfg.num_cols}).")
+
+    reference_vertices = None
+    serial_time = None
+    print(f"{'workers':>8} | {'time [s]':>9} | {'speed-up':>9} | {'identical':>9}")
+    for num_workers in args_cli.workers:
+        generator_class = ParallelTerrainGenerator.bind(num_workers=num_workers)
+        start = time.perf_counter()
+        generator = generator_class(cfg=terrain_gen_cfg.copy(), device="cpu")
+        elapsed = time.perf_counter() - start
+        vertices = np.asarray(generator.terrain_mesh.vertices)
+        if reference_vertices is None:
+            reference_vertices = vertices
+            serial_time = elapsed
+        identical = np.array_equal(vertices, reference_vertices)
+        print(f"{num_workers:>8} | {elapsed:>9.2f} | {serial_time / elapsed:>8.2f}x | {str(identical):>9}")
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
+    # close sim app
+    simulation_app.close()
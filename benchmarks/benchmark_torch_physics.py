@@ -0,0 +1,90 @@
+"""
+This script runs the loops of the rigid-object and teter-toter scripts on the pure-torch physics stand-in.
+
+It needs neither Isaac Sim nor a GPU. The scenes are rebuilt with :class:`TorchRigidObject`, and the loops are the
+ones the scripts run (:mod:`lab_utils.sim_loops`), including the snapshot pool, the telemetry and the state stream
+of the rigid-object loop. :class:`Runner` drives the fixed-length loop and reports the throughput, and the shared
+profiler reports the per-phase timings.
+
+.. code-block:: bash
+
+    python benchmarks/benchmark_torch_physics.py --scene rigid_object --num_instances 10000 --num_steps 1000
+    python benchmarks/benchmark_torch_physics.py --scene teter_toter --num_instances 10000 --profile
+
+"""
+
+import argparse
+import os
+import sys
+
+import torch
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from lab_utils.profiling import add_profiling_args, configure_from_args, profiler  # noqa: E402
+from lab_utils.runner import Runner, add_runner_args  # noqa: E402
+from lab_utils.sim_loops import (  # noqa: E402
+    add_rigid_object_loop_args,
+    run_rigid_object_loop,
+    run_step_loop,
+    validate_rigid_object_loop_args,
+)
+from lab_utils.torch_physics import HeadlessApp, TorchRigidObject, TorchSimulationContext  # noqa: E402
+
+# add argparse arguments
+parser = argparse.ArgumentParser(description="Run the script loops on the pure-torch physics stand-in.")
+parser.add_argument(
+    "--scene", type=str, default="rigid_object", choices=["rigid_object", "teter_toter"], help="Scene to run."
+)
+parser.add_argument("--num_instances", type=int, default=10000, help="Number of instances of every body.")
+parser.add_argument("--device", type=str, default="cpu", help="Device to run on.")
+add_rigid_object_loop_args(parser)
+add_profiling_args(parser)
+add_runner_args(parser)
+parser.set_defaults(num_steps=1000, warmup_steps=50)
+args_cli = parser.parse_args()
+validate_rigid_object_loop_args(args_cli)
+configure_from_args(args_cli)
+
+
+def run_rigid_object(sim: TorchSimulationContext, runner: Runner):
+    """The loop of ``interacting_with_a_rigid_object.py``: cones on a grid of origins, reset every 250 steps."""
+    num_instances = args_cli.num_instances
+    side = int(num_instances**0.5) + 1
+    grid = torch.stack(torch.meshgrid(torch.arange(side), torch.arange(side), indexing="ij"), dim=-1)
+    grid = grid.reshape(-1, 2)[:num_instances]
+    origins = torch.zeros(num_instances, 3, device=sim.device)
+    origins[:, :2] = 0.5 * grid.to(sim.device)
+    cone_object = TorchRigidObject(sim, num_instances, radius=0.1)
+    sim.reset()
+    run_rigid_object_loop(sim, cone_object, origins, runner, args_cli)
+
+
+def run_teter_toter(sim: TorchSimulationContext, runner: Runner):
+    """The loop of ``teter_toter2.py``: a base, a seat and two cubes dropped onto it."""
+    num_instances = args_cli.num_instances
+    # the bodies register with the simulation context, which integrates them in its step
+    TorchRigidObject(sim, num_instances, half_extents=(0.25, 0.15, 0.3))  # base
+    TorchRigidObject(sim, num_instances, pos=(0.0, 0.0, 0.9), half_extents=(0.2, 1.9, 0.1))  # seat
+    TorchRigidObject(sim, num_instances, pos=(0.0, 1.4, 1.9), half_extents=(0.2, 0.4, 0.1))  # right cube
+    TorchRigidObject(sim, num_instances, pos=(0.0, -1.4, 300.9), half_extents=(0.2, 0.4, 0.1))  # left cube
+    sim.reset()
+    run_step_loop(sim, runner)
+
+
+def main():
+    """Main function."""
+    runner = Runner.from_args(args_cli, HeadlessApp(), num_envs=args_cli.num_instances, device=args_cli.device)
+    sim = TorchSimulationContext(dt=0.01, device=args_cli.device)
+    if args_cli.scene == "rigid_object":
+        run_rigid_object(sim, runner)
+    else:
+        run_teter_toter(sim, runner)
+    runner.report()
+    profiler.finish()
+
+
+if __name__ == "__main__":
+    # run the main function
+    main()
@@ -11,6 +11,14 @@ scene, action, observation and event managers to create an environment.
 
     ./isaaclab.sh -p scripts/tutorials/03_envs/create_cartpole_base_env.py --num_envs 32
 
+    # Print the persistent buffers and write them for the num_envs predictor of benchmarks/benchmark_memory_scaling.py
+    ./isaaclab.sh -p scripts/tutorials/03_envs/create_cartpole_base_env.py --headless --num_envs 256 --num_steps 1 \\
+        --memory_report --memory_json /tmp/memory_256.json
+
+    # Check the arguments and the action recording without starting the app
+    ./isaaclab.sh -p scripts/tutorials/03_envs/create_cartpole_base_env.py --action_source replay \\
+        --action_recording /tmp/rollout --dry_run
+
 """
 
 """Launch Isaac Sim Simulator first."""
@@ -18,121 +26,85 @@ scene, action, observation and event managers to create an environment.
 
 import argparse
 
-from isaaclab.app import AppLauncher
+from lab_utils.action_sources import add_action_source_args, make_action_source, validate_action_source_args
+from lab_utils.launcher import Launcher
+from lab_utils.memory_accounting import add_memory_args
+from lab_utils.profiling import add_profiling_args, configure_from_args, profiler
+from lab_utils.runner import Runner, add_runner_args, validate_runner_args
+from lab_utils.telemetry import add_telemetry_args, make_sink
 
 # add argparse arguments
 parser = argparse.ArgumentParser(description="Tutorial on creating a cartpole base environment.")
 parser.add_argument("--num_envs", type=int, default=16, help="Number of environments to spawn.")
-
-# append AppLauncher cli args
-AppLauncher.add_app_launcher_args(parser)
-# parse the arguments
-args_cli = parser.parse_args()
+parser.add_argument(
+    "--record_dir", type=str, default=None, help="Record observations, actions and reset flags into this directory."
+)
+parser.add_argument("--record_chunk", type=int, default=256, help="Number of steps per recorded chunk.")
+parser.add_argument(
+    "--obs_history",
+    type=int,
+    default=0,
+    help="Pack the policy observations of the last n steps into a preallocated buffer for the actions. 0 disables.",
+)
+parser.add_argument(
+    "--event_seed",
+    type=int,
+    default=None,
+    help="Draw the randomization events from per-environment random streams with this seed.",
+)
+parser.add_argument(
+    "--snapshot_pool", type=int, default=0, help="Capacity of the pool of settled joint states to reset from (0 off)."
+)
+parser.add_argument(
+    "--snapshot_eviction",
+    type=str,
+    default="fifo",
+    choices=["fifo", "random", "reservoir"],
+    help="Which snapshots a full pool replaces.",
+)
+add_telemetry_args(parser)
+add_profiling_args(parser)
+add_runner_args(parser)
+add_action_source_args(parser)
+add_memory_args(parser)
+
+
+def validate_args(args):
+    """Checks the arguments and the action source files before the app is started."""
+    validate_runner_args(args)
+    validate_action_source_args(args, num_envs=args.num_envs)
+    if args.num_envs < 1 or args.record_chunk < 1:
+        raise ValueError(
+            f"The number of environments and the record chunk must be at least 1. Received: {args.num_envs},"
+            f" {args.record_chunk}."
+        )
+    if args.obs_history < 0:
+        raise ValueError(f"The observation history must not be negative. Received: {args.obs_history}.")
+    if args.snapshot_pool < 0:
+        raise ValueError(f"The snapshot pool capacity must not be negative. Received: {args.snapshot_pool}.")
+
+
+# append the launcher and AppLauncher cli args
+launcher = Launcher(parser)
+# parse and validate the arguments before starting the app (exits here with --dry_run)
+args_cli = launcher.parse_args(validate=validate_args)
+configure_from_args(args_cli)
 
 # launch omniverse app
-app_launcher = AppLauncher(args_cli)
-simulation_app = app_launcher.app
+simulation_app = launcher.launch()
 
 """Rest everything follows."""
 
-import math
-import torch
-
-import isaaclab.envs.mdp as mdp
-from isaaclab.envs import ManagerBasedEnv, ManagerBasedEnvCfg
-from isaaclab.managers import EventTermCfg as EventTerm
-from isaaclab.managers import ObservationGroupCfg as ObsGroup
-from isaaclab.managers import ObservationTermCfg as ObsTerm
-from isaaclab.managers import SceneEntityCfg
-from isaaclab.utils import configclass
-
-from isaaclab_tasks.manager_based.classic.cartpole.cartpole_env_cfg import CartpoleSceneCfg
-
-
-@configclass
-class ActionsCfg:
-    """Action specifications for the environment."""
-
-    joint_efforts = mdp.JointEffortActionCfg(asset_name="robot", joint_names=["slider_to_cart"], scale=5.0)
-
-
-@configclass
-class ObservationsCfg:
-    """Observation specifications for the environment."""
-
-    @configclass
-    class PolicyCfg(ObsGroup):
-        """Observations for policy group."""
-
-        # observation terms (order preserved)
-        joint_pos_rel = ObsTerm(func=mdp.joint_pos_rel)
-        joint_vel_rel = ObsTerm(func=mdp.joint_vel_rel)
-
-        def __post_init__(self) -> None:
-            self.enable_corruption = False
-            self.concatenate_terms = True
+with launcher.phase("imports"):
+    import torch
 
-    # observation groups
-    policy: PolicyCfg = PolicyCfg()
+    from isaaclab.envs import ManagerBasedEnv
 
-
-@configclass
-class EventCfg:
-    """Configuration for events."""
-
-    # on startup
-    add_pole_mass = EventTerm(
-        func=mdp.randomize_rigid_body_mass,
-        mode="startup",
-        params={
-            "asset_cfg": SceneEntityCfg("robot", body_names=["pole"]),
-            "mass_distribution_params": (0.1, 0.5),
-            "operation": "add",
-        },
-    )
-
-    # on reset
-    reset_cart_position = EventTerm(
-        func=mdp.reset_joints_by_offset,
-        mode="reset",
-        params={
-            "asset_cfg": SceneEntityCfg("robot", joint_names=["slider_to_cart"]),
-            "position_range": (-1.0, 1.0),
-            "velocity_range": (-0.1, 0.1),
-        },
-    )
-
-    reset_pole_position = EventTerm(
-        func=mdp.reset_joints_by_offset,
-        mode="reset",
-        params={
-            "asset_cfg": SceneEntityCfg("robot", joint_names=["cart_to_pole"]),
-            "position_range": (-0.125 * math.pi, 0.125 * math.pi),
-            "velocity_range": (-0.01 * math.pi, 0.01 * math.pi),
-        },
-    )
-
-
-@configclass
-class CartpoleEnvCfg(ManagerBasedEnvCfg):
-    """Configuration for the cartpole environment."""
-
-    # Scene settings
-    scene = CartpoleSceneCfg(num_envs=1024, env_spacing=2.5)
-    # Basic settings
-    observations = ObservationsCfg()
-    actions = ActionsCfg()
-    events = EventCfg()
-
-    def __post_init__(self):
-        """Post initialization."""
-        # viewer settings
-        self.viewer.eye = [4.5, 0.0, 6.0]
-        self.viewer.lookat = [0.0, 0.0, 2.0]
-        # step settings
-        self.decimation = 4  # env step every 4 sim steps: 200Hz / 4 = 50Hz
-        # simulation settings
-        self.sim.dt = 0.005  # sim step every 5ms: 200Hz
+    from lab_utils.cartpole_env_cfg import CartpoleEnvCfg, add_snapshot_events, make_seeded_events
+    from lab_utils.memory_accounting import env_memory_report, write_report
+    from lab_utils.obs_buffer import ObservationPacker
+    from lab_utils.rollout_recorder import RolloutRecorder
+launcher.report()
 
 
 def main():
@@ -140,30 +112,103 @@ def main():
     # parse the arguments
     env_cfg = CartpoleEnvCfg()
     env_cfg.scene.num_envs = args_cli.num_envs
+    # deterministic events: the values of every environment do not depend on which environments are reset together
+    if args_cli.event_seed is not None:
+        env_cfg.events = make_seeded_events(args_cli.event_seed)
+    # settled joint states are captured into a pool, and later resets restore them instead of the default states
+    if args_cli.snapshot_pool > 0:
+        add_snapshot_events(
+            env_cfg.events, args_cli.snapshot_pool, eviction=args_cli.snapshot_eviction, device=args_cli.device
+        )
+    # the packer replaces the concatenation of the policy group: the manager returns the terms and the packer
+    #   copies them into its preallocated history, so every term is computed once
+    if args_cli.obs_history > 0:
+        env_cfg.observations.policy.concatenate_terms = False
+    # render every n-th physics step; an env step spans `decimation` physics steps
+    env_cfg.sim.render_interval = args_cli.render_interval
+    runner = Runner.from_args(
+        args_cli, simulation_app, decimation=env_cfg.decimation, num_envs=args_cli.num_envs, device=args_cli.device
+    )
     # setup base environment
-    env = ManagerBasedEnv(cfg=env_cfg)
+    with profiler.phase("env.setup"):
+        env = ManagerBasedEnv(cfg=env_cfg)
+    # persistent buffers of the scene, the assets and the managers, and the memory used on the device
+    if args_cli.memory_report or args_cli.memory_json is not None:
+        write_report(args_cli, env_memory_report(env))
+    # asynchronous telemetry: aggregates the pole joint of env 0 without syncing the device in the loop
+    telemetry = make_sink(args_cli, {"env0/pole_joint": ()}, device=env.device)
+    # observations of the actions: the policy group, or its packed history without per-step allocations
+    packer = None
+    if args_cli.obs_history > 0:
+        packer = ObservationPacker.from_observation_group(env, "policy", history_length=args_cli.obs_history)
+        obs_dim = packer.stacked_dim
+    else:
+        obs_dim = env.observation_manager.group_obs_dim["policy"][0]
+    # actions: pregenerated random actions by default, or a policy, a recorded stream or a replay
+    action_source = make_action_source(
+        args_cli, env.num_envs, env.action_manager.total_action_dim, obs_dim=obs_dim, device=env.device
+    )
+    # rollout recording: the step loop only copies to pinned host memory, a thread appends the chunks to disk
+    recorder = None
+    if args_cli.record_dir is not None:
+        columns = {
+            "obs": ((obs_dim,), torch.float32),
+            "action": ((env.action_manager.total_action_dim,), torch.float32),
+            "reset": ((), torch.bool),
+        }
+        recorder = RolloutRecorder(
+            args_cli.record_dir, columns, env.num_envs, chunk_size=args_cli.record_chunk, device=env.device
+        )
+        reset_flags = {
+            True: torch.ones(env.num_envs, dtype=torch.bool, device=env.device),
+            False: torch.zeros(env.num_envs, dtype=torch.bool, device=env.device),
+        }
 
     # simulate physics
     count = 0
-    while simulation_app.is_running():
+    while runner.running():
         with torch.inference_mode():
             # reset
-            if count % 300 == 0:
+            is_reset = count % 300 == 0
+            if is_reset:
                 count = 0
-                env.reset()
+                with profiler.phase("env.reset"):
+                    obs, _ = env.reset()
+                action_source.reset()
+                if packer is not None:
+                    packer.reset()
                 print("-" * 80)
                 print("[INFO]: Resetting environment...")
-            # sample random actions
-            joint_efforts = torch.randn_like(env.action_manager.action)
+            # draw the actions of all environments
+            with profiler.phase("env.act"):
+                policy_obs = obs["policy"] if packer is None else packer.pack(obs["policy"])
+                joint_efforts = action_source.act(policy_obs)
+            # record the observation the actions were drawn from with the actions, before the step replaces it
+            if recorder is not None:
+                recorder.record(obs=policy_obs, action=joint_efforts, reset=reset_flags[is_reset])
             # step the environment
-            obs, _ = env.step(joint_efforts)
-            # print current orientation of pole
-            print("[Env 0]: Pole joint: ", obs["policy"][0][1].item())
+            with profiler.phase("env.step"):
+                obs, _ = env.step(joint_efforts)
+            # record current orientation of pole
+            if telemetry is not None:
+                joint_pos_rel = obs["policy"] if packer is None else obs["policy"]["joint_pos_rel"]
+                telemetry.push("env0/pole_joint", joint_pos_rel[0, 1])
+                telemetry.step()
             # update counter
             count += 1
 
-    # close the environment
+    # flush the telemetry and close the environment
+    if telemetry is not None:
+        telemetry.close()
+    if recorder is not None:
+        recorder.close()
+        print(f"[INFO]: Recorded {recorder.num_steps} steps to: {args_cli.record_dir}")
+    if args_cli.snapshot_pool > 0:
+        pool = env.event_manager.get_term_cfg("reset_from_pool").params["pool"]
+        print(f"[INFO]: The snapshot pool holds {len(pool)} of {pool.num_added} captured joint states.")
     env.close()
+    runner.report()
+    profiler.finish()
 
 
 if __name__ == "__main__":
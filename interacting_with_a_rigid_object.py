@@ -2,32 +2,57 @@
 
 import argparse
 
-from isaaclab.app import AppLauncher
+from lab_utils.launcher import Launcher
+from lab_utils.profiling import add_profiling_args, configure_from_args, profiler
+from lab_utils.runner import Runner, add_runner_args, validate_runner_args
+from lab_utils.sim_loops import add_rigid_object_loop_args, run_rigid_object_loop, validate_rigid_object_loop_args
 
 # add argparse arguments
 parser = argparse.ArgumentParser(description="Tutorial on spawning and interacting with a rigid object.")
+parser.add_argument(
+    "--pooled_objects",
+    action="store_true",
+    default=False,
+    help="Spawn a cone, a sphere and a cuboid in turn over the origins as one pooled rigid object.",
+)
+add_rigid_object_loop_args(parser)
+add_profiling_args(parser)
+add_runner_args(parser)
 
-# append AppLauncher cli args
-AppLauncher.add_app_launcher_args(parser)
 
-# parse the arguments
-args_cli = parser.parse_args()
+def validate_args(args):
+    """Checks the arguments before the app is started."""
+    validate_runner_args(args)
+    validate_rigid_object_loop_args(args)
+
+
+# append the launcher and AppLauncher cli args
+launcher = Launcher(parser)
+
+# parse and validate the arguments before starting the app (exits here with --dry_run)
+args_cli = launcher.parse_args(validate=validate_args)
+configure_from_args(args_cli)
 
 #launch omniverse app
-app_launcher = AppLauncher(args_cli)
-simulation_app = app_launcher.app
+simulation_app = launcher.launch()
 
 """Rest of program"""
 
-import torch 
+with launcher.phase("imports"):
+    import torch
 
-import isaacsim.core.utils.prims as prim_utils
+    import isaacsim.core.utils.prims as prim_utils
 
-import isaaclab.sim as sim_utils
-import isaaclab.utils.math as math_utils
-from isaaclab.assets import RigidObject, RigidObjectCfg
-from isaaclab.sim import SimulationContext
+    import isaaclab.sim as sim_utils
+    from isaaclab.assets import RigidObject, RigidObjectCfg
+    from isaaclab.sim import SimulationContext
 
+    from lab_utils.rigid_object_pool import RigidObjectPool, pool_spawn_cfg
+    from lab_utils.spawn_sampler import SpawnSampler, footprint_radius
+launcher.report()
+
+
+@profiler.profiled("design_scene")
 def design_scene():
     # Ground plane
     cfg_ground = sim_utils.GroundPlaneCfg()
@@ -65,7 +90,6 @@ def design_scene():
         ),
         init_state=RigidObjectCfg.InitialStateCfg(),
     )
-    cone_object = RigidObject(cfg=cone_cfg)
 
 
     sphere_cfg = RigidObjectCfg(
@@ -79,7 +103,6 @@ def design_scene():
         ),
         init_state=RigidObjectCfg.InitialStateCfg(),
     )
-    sphere_object = RigidObject(cfg=sphere_cfg)
 
 
     cuboid_cfg = RigidObjectCfg(
@@ -93,6 +116,25 @@ def design_scene():
         ),
         init_state=RigidObjectCfg.InitialStateCfg(),
     )
+
+    if args_cli.pooled_objects:
+        # one rigid object holds all shapes, assigned in turn over the origins
+        pool_cfg = RigidObjectCfg(
+            prim_path="/World/Origin.*/Object",
+            spawn=pool_spawn_cfg([cone_cfg.spawn, sphere_cfg.spawn, cuboid_cfg.spawn]),
+            init_state=RigidObjectCfg.InitialStateCfg(),
+        )
+        return {"objects": RigidObject(cfg=pool_cfg)}, origins
+    cone_object = RigidObject(cfg=cone_cfg)
+
+    # place the sphere and the cuboid without overlapping each other or the areas the cones are reset in
+    # (cone radius plus the 0.1 m radius of the reset offsets)
+    sampler = SpawnSampler([footprint_radius(sphere_cfg.spawn), footprint_radius(cuboid_cfg.spawn)], half_extent=0.75)
+    spawn_xy, placed = sampler.sample(1, obstacles=torch.tensor(origins)[:, :2], obstacle_radii=[0.2] * len(origins))
+    for cfg_object, xy, ok, height in zip((sphere_cfg, cuboid_cfg), spawn_xy[0], placed[0], (0.1, 0.05)):
+        if ok:
+            cfg_object.init_state.pos = (xy[0].item(), xy[1].item(), height)
+    sphere_object = RigidObject(cfg=sphere_cfg)
     cuboid_object = RigidObject(cfg=cuboid_cfg)
 
 
@@ -101,55 +143,31 @@ def design_scene():
     scene_entities = {"cone": cone_object, "sphere": sphere_object, "cuboid":cuboid_object}
     return scene_entities, origins
 
-def run_simulator(sim: sim_utils.SimulationContext, entities: dict[str, RigidObject], origins: torch.Tensor):
+def run_simulator(
+    sim: sim_utils.SimulationContext, entities: dict[str, RigidObject], origins: torch.Tensor, runner: Runner
+):
     """Runs the simulation loop."""
     # Extract scene entities
     # note: we only do this here for readability. In general, it is better to access the entities directly from
     #   the dictionary. This dictionary is replaced by the InteractiveScene class in the next tutorial.
-    cone_object = entities["cone"]
-    # Define simulation stepping
-    sim_dt = sim.get_physics_dt()
-    sim_time = 0.0
-    count = 0
-    # Simulate physics
-    while simulation_app.is_running():
-        # reset
-        if count % 250 == 0:
-            # reset counters
-            sim_time = 0.0
-            count = 0
-            # reset root state
-            root_state = cone_object.data.default_root_state.clone()
-            # sample a random position on a cylinder around the origins
-            root_state[:, :3] += origins
-            root_state[:, :3] += math_utils.sample_cylinder(
-                radius=0.1, h_range=(0.25, 0.5), size=cone_object.num_instances, device=cone_object.device
-            )
-            # write root state to simulation
-            cone_object.write_root_pose_to_sim(root_state[:, :7])
-            cone_object.write_root_velocity_to_sim(root_state[:, 7:])
-            # reset buffers
-            cone_object.reset()
-            print("----------------------------------------")
-            print("[INFO]: Resetting object state...")
-        # apply sim data
-        cone_object.write_data_to_sim()
-        # perform step
-        sim.step()
-        # update sim-time
-        sim_time += sim_dt
-        count += 1
-        # update buffers
-        cone_object.update(sim_dt)
-        # print the root position
-        if count % 50 == 0:
-            print(f"Root position (in world): {cone_object.data.root_state_w[:, :3]}")
+    if "objects" in entities:
+        # the pool is reset, written and updated with single calls for all shapes
+        # note: the instances of the rigid object are only known once the simulation has started.
+        pool = RigidObjectPool(entities["objects"], ["cone", "sphere", "cuboid"])
+        print(f"[INFO]: Pooled objects per type: {dict(zip(pool.type_names, pool.counts.tolist()))}")
+        rigid_object = pool.asset
+    else:
+        rigid_object = entities["cone"]
+    # the loop is shared with the torch physics stand-in of benchmarks/benchmark_torch_physics.py
+    run_rigid_object_loop(sim, rigid_object, origins, runner, args_cli)
 
 
 
 #main
 def main():
     """Main function."""
+    # Fixed-length loop with throughput report (runs until the app is closed by default)
+    runner = Runner.from_args(args_cli, simulation_app, device=args_cli.device)
     # Load kit helper
     sim_cfg = sim_utils.SimulationCfg(device=args_cli.device)
     sim = SimulationContext(sim_cfg)
@@ -161,12 +179,17 @@ def main():
     scene_entities, scene_origins = design_scene()
 
     scene_origins = torch.tensor(scene_origins, device=sim.device)
+    # every origin holds one cone instance, which counts as one environment
+    runner.num_envs = len(scene_origins)
     # Play the simulator
-    sim.reset()
+    with profiler.phase("sim.reset"):
+        sim.reset()
     # Now we are ready!
     print("[INFO]: Setup complete...")
     # Run the simulator
-    run_simulator(sim, scene_entities, scene_origins)
+    run_simulator(sim, scene_entities, scene_origins, runner)
+    runner.report()
+    profiler.finish()
 
 
 
@@ -0,0 +1,454 @@
+"""Action sources for the environment step loop.
+
+Sampling the actions with ``torch.randn_like`` inside the loop issues one allocation and one kernel per step, and a
+policy called from the loop runs with autograd bookkeeping unless the caller remembers to disable it. The sources of
+this module produce the actions of all environments for one step with :meth:`ActionSource.act`:
+
+* :class:`StreamActionSource`: random or recorded actions served from a preallocated device buffer. Random streams
+  are generated a block of steps at a time into the same buffer, so a step only returns a view.
+* :class:`PolicyActionSource`: one batched forward pass of a policy per step under :func:`torch.inference_mode`,
+  optionally captured with :func:`torch.compile` or a CUDA graph. Captures that are not available on the device
+  fall back to the eager forward pass.
+* :class:`ReplayActionSource`: a deterministic replay of recorded actions with one cursor per environment. The cursors
+  keep moving across resets, and with the recorded reset flags a reset environment skips to its next recorded
+  episode.
+
+.. code-block:: python
+
+    source = StreamActionSource.random(num_envs, action_dim, device=env.device, seed=0)
+    obs, _ = env.reset()
+    while running:
+        obs, _ = env.step(source.act(obs["policy"]))
+
+The returned actions are views of internal buffers and are only valid until the next call to :meth:`act`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+
+from lab_utils.launcher import lazy_import
+from lab_utils.rollout_recorder import INDEX_FILE, RolloutReader
+
+# note: imported on first use, so that the script can parse its arguments before paying for the import
+torch = lazy_import("torch")
+
+ACTION_SOURCES = ("random", "stream", "policy", "replay")
+"""Names of the action sources that :func:`make_action_source` builds."""
+
+CAPTURE_MODES = ("none", "compile", "cuda_graph")
+"""Capture modes of the forward pass of :class:`PolicyActionSource`."""
+
+
+def add_action_source_args(parser: argparse.ArgumentParser):
+    """Adds the action source arguments to a parser.
+
+    Args:
+        parser: The parser to extend.
+    """
+    group = parser.add_argument_group("actions", description="Arguments for the source of the actions.")
+    group.add_argument(
+        "--action_source",
+        type=str,
+        default="random",
+        choices=ACTION_SOURCES,
+        help="Source of the actions: pregenerated random actions, a recorded stream, a policy or a replay.",
+    )
+    group.add_argument(
+        "--action_recording", type=str, default=None, help="Recording directory of the stream and replay sources."
+    )
+    group.add_argument("--action_horizon", type=int, default=256, help="Steps of random actions generated at once.")
+    group.add_argument("--action_seed", type=int, default=None, help="Seed of the random actions.")
+    group.add_argument(
+        "--policy_checkpoint",
+        type=str,
+        default=None,
+        help="TorchScript policy of the policy source. Defaults to a randomly initialized MLP.",
+    )
+    group.add_argument(
+        "--policy_capture", type=str, default="none", choices=CAPTURE_MODES, help="Capture of the policy forward pass."
+    )
+
+
+def validate_action_source_args(args: argparse.Namespace, num_envs: int | None = None, action_dim: int | None = None):
+    """Checks the arguments added by :func:`add_action_source_args` without creating a source.
+
+    Args:
+        args: The parsed arguments.
+        num_envs: The number of environments that the recording must match. Defaults to None (not checked).
+        action_dim: The number of actions that the recording must match. Defaults to None (not checked).
+
+    Raises:
+        ValueError: When the stream or replay source has no recording, the recording does not match the environments
+            or the horizon is smaller than one.
+        FileNotFoundError: When the recording or the policy checkpoint does not exist.
+    """
+    if args.action_horizon < 1:
+        raise ValueError(f"The action horizon must be at least 1. Received: {args.action_horizon}.")
+    if args.action_source in ("stream", "replay"):
+        if args.action_recording is None:
+            raise ValueError(f"The '{args.action_source}' action source needs --action_recording. Received: None.")
+        if not os.path.isfile(os.path.join(args.action_recording, INDEX_FILE)):
+            raise FileNotFoundError(f"No recording found at: {args.action_recording}.")
+        _check_recording(args.action_recording, "action", num_envs, action_dim)
+    if args.action_source == "policy" and args.policy_checkpoint is not None:
+        if not os.path.isfile(args.policy_checkpoint):
+            raise FileNotFoundError(f"Policy checkpoint not found: {args.policy_checkpoint}.")
+
+
+def make_action_source(
+    args: argparse.Namespace, num_envs: int, action_dim: int, obs_dim: int = 0, device: str = "cpu"
+) -> ActionSource:
+    """Creates an action source from the arguments added by :func:`add_action_source_args`.
+
+    Args:
+        args: The parsed arguments.
+        num_envs: The number of environments.
+        action_dim: The number of actions per environment.
+        obs_dim: The number of observations per environment, used by the default policy. Defaults to 0.
+        device: The device of the actions. Defaults to "cpu".
+
+    Raises:
+        ValueError: When the stream or replay source has no recording, or the recording does not match the number of
+            environments or actions.
+    """
+    if args.action_source == "random":
+        return StreamActionSource.random(
+            num_envs, action_dim, horizon=args.action_horizon, device=device, seed=args.action_seed
+        )
+    if args.action_source == "policy":
+        if args.policy_checkpoint is not None:
+            policy = torch.jit.load(args.policy_checkpoint, map_location=device)
+        else:
+            policy = mlp_policy(obs_dim, action_dim)
+        return PolicyActionSource(policy, capture=args.policy_capture, device=device)
+    if args.action_recording is None:
+        raise ValueError(f"The '{args.action_source}' action source needs --action_recording. Received: None.")
+    _check_recording(args.action_recording, "action", num_envs, action_dim)
+    if args.action_source == "stream":
+        return StreamActionSource.from_recording(args.action_recording, device=device)
+    return ReplayActionSource.from_recording(args.action_recording, device=device)
+
+
+def mlp_policy(obs_dim: int, action_dim: int, hidden_dims: tuple[int, ...] = (256, 128, 64)) -> torch.nn.Module:
+    """Returns a randomly initialized MLP policy with ELU activations, the shape of the usual locomotion policies.
+
+    Args:
+        obs_dim: The number of observations per environment.
+        action_dim: The number of actions per environment.
+        hidden_dims: The widths of the hidden layers. Defaults to (256, 128, 64).
+    """
+    layers = []
+    for in_dim, out_dim in zip((obs_dim, *hidden_dims), hidden_dims):
+        layers += [torch.nn.Linear(in_dim, out_dim), torch.nn.ELU()]
+    layers.append(torch.nn.Linear(hidden_dims[-1] if hidden_dims else obs_dim, action_dim))
+    return torch.nn.Sequential(*layers)
+
+
+class ActionSource:
+    """Base class of the sources that produce the actions of all environments for one step."""
+
+    def act(self, obs: torch.Tensor | None = None) -> torch.Tensor:
+        """Returns the actions of the next step. Shape is (num_envs, action_dim).
+
+        Args:
+            obs: The observations of the current step. Shape is (num_envs, obs_dim). Only used by policies.
+        """
+        raise NotImplementedError
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        """Resets the state of the selected environments. Defaults to None (all environments)."""
+
+
+class StreamActionSource(ActionSource):
+    """Random or recorded actions served from a preallocated device buffer."""
+
+    def __init__(self, actions: torch.Tensor, generator: torch.Generator | None = None, scale: float = 1.0):
+        """Initializes the stream over a buffer of actions.
+
+        Args:
+            actions: The buffer of actions. Shape is (horizon, num_envs, action_dim). A recorded stream is served in
+                a loop; with a generator, the buffer is refilled with new random actions once it is used up.
+            generator: The generator of a random stream. Defaults to None (the buffer is recorded).
+            scale: The standard deviation of the random actions. Defaults to 1.0.
+
+        Raises:
+            ValueError: When the buffer does not have three dimensions or is empty.
+        """
+        if actions.dim() != 3 or len(actions) == 0:
+            raise ValueError(
+                f"Expected non-empty actions of shape (steps, num_envs, action_dim). Received: {tuple(actions.shape)}."
+            )
+        self.actions = actions
+        self.generator = generator
+        self.scale = scale
+        self.step = 0
+        if generator is not None:
+            self._refill()
+
+    @classmethod
+    def random(
+        cls,
+        num_envs: int,
+        action_dim: int,
+        horizon: int = 256,
+        scale: float = 1.0,
+        device: str = "cpu",
+        seed: int | None = None,
+    ) -> StreamActionSource:
+        """Creates a stream of normally distributed actions, generated ``horizon`` steps at a time.
+
+        Args:
+            num_envs: The number of environments.
+            action_dim: The number of actions per environment.
+            horizon: The number of steps generated at once. Defaults to 256.
+            scale: The standard deviation of the actions. Defaults to 1.0.
+            device: The device of the actions. Defaults to "cpu".
+            seed: The seed of the generator. Defaults to None, in which case a random seed is used.
+        """
+        generator = torch.Generator(device=device)
+        if seed is None:
+            generator.seed()
+        else:
+            generator.manual_seed(seed)
+        return cls(torch.empty(horizon, num_envs, action_dim, device=device), generator=generator, scale=scale)
+
+    @classmethod
+    def from_recording(cls, path: str, column: str = "action", device: str = "cpu") -> StreamActionSource:
+        """Creates a looping stream of the actions of a recording of :class:`RolloutRecorder`.
+
+        Args:
+            path: The directory of the recording.
+            column: The column of the actions. Defaults to "action".
+            device: The device of the actions. Defaults to "cpu".
+        """
+        return cls(_load_actions(path, column, device))
+
+    @property
+    def horizon(self) -> int:
+        """Number of steps in the buffer."""
+        return len(self.actions)
+
+    def act(self, obs: torch.Tensor | None = None) -> torch.Tensor:
+        if self.step == self.horizon:
+            if self.generator is not None:
+                self._refill()
+            self.step = 0
+        actions = self.actions[self.step]
+        self.step += 1
+        return actions
+
+    def _refill(self):
+        """Generates the next block of random actions in place, with one kernel for all steps."""
+        self.actions.normal_(0.0, self.scale, generator=self.generator)
+
+
+class PolicyActionSource(ActionSource):
+    """One batched forward pass of a policy per step, optionally captured with torch.compile or a CUDA graph."""
+
+    def __init__(self, policy: torch.nn.Module, capture: str = "none", device: str = "cpu"):
+        """Initializes the policy source.
+
+        The capture happens on the first call to :meth:`act`, once the shape of the observations is known.
+
+        Args:
+            policy: The policy that maps the observations of all environments to their actions.
+            capture: The capture of the forward pass (see :data:`CAPTURE_MODES`). Defaults to "none".
+            device: The device of the policy. Defaults to "cpu".
+
+        Raises:
+            ValueError: When the capture mode is unknown.
+        """
+        if capture not in CAPTURE_MODES:
+            raise ValueError(f"The capture mode must be one of {CAPTURE_MODES}. Received: {capture}.")
+        self.device = torch.device(device)
+        self.policy = policy.to(self.device).eval()
+        self.capture = capture
+        self._forward = None
+        self._graph: torch.cuda.CUDAGraph | None = None
+        self._static_obs: torch.Tensor | None = None
+        self._static_actions: torch.Tensor | None = None
+
+    @property
+    def active_capture(self) -> str:
+        """The capture in use after the first call to :meth:`act`, which differs from the requested one after a
+        fallback to the eager forward pass."""
+        if self._graph is not None:
+            return "cuda_graph"
+        return "compile" if self._forward is not None and self._forward is not self.policy else "none"
+
+    def act(self, obs: torch.Tensor | None = None) -> torch.Tensor:
+        with torch.inference_mode():
+            if self._forward is None:
+                self._setup(obs)
+            if self._graph is not None:
+                self._static_obs.copy_(obs)
+                self._graph.replay()
+                return self._static_actions
+            return self._forward(obs)
+
+    def _setup(self, obs: torch.Tensor):
+        """Captures the forward pass for the observations, falling back to the eager forward pass."""
+        self._forward = self.policy
+        if self.capture == "cuda_graph":
+            if self.device.type == "cuda":
+                self._capture_cuda_graph(obs)
+            else:
+                print(f"[WARN]: CUDA graphs need a CUDA device, running the policy eagerly on: {self.device}.")
+        elif self.capture == "compile":
+            compiled = torch.compile(self.policy, mode="reduce-overhead" if self.device.type == "cuda" else None)
+            try:
+                # note: compilation is lazy, so a failure only shows on the first forward pass.
+                compiled(obs)
+                self._forward = compiled
+            except Exception as e:
+                print(f"[WARN]: torch.compile failed, running the policy eagerly: {e}")
+
+    def _capture_cuda_graph(self, obs: torch.Tensor):
+        """Records the forward pass into a CUDA graph over static observation and action buffers."""
+        self._static_obs = obs.clone()
+        # warm up on a side stream, so that lazy initializations are not recorded
+        stream = torch.cuda.Stream(device=self.device)
+        stream.wait_stream(torch.cuda.current_stream(self.device))
+        with torch.cuda.stream(stream):
+            for _ in range(3):
+                self.policy(self._static_obs)
+        torch.cuda.current_stream(self.device).wait_stream(stream)
+        self._graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(self._graph):
+            self._static_actions = self.policy(self._static_obs)
+
+
+class ReplayActionSource(ActionSource):
+    """Deterministic replay of recorded actions with one cursor per environment.
+
+    The cursors keep moving across resets, so a recording of several episodes is replayed in full. With the reset
+    flags of the recording, :meth:`reset` moves the cursor of every reset environment to the start of its next
+    recorded episode, which keeps the replayed episodes aligned with the episodes of the environment.
+    """
+
+    def __init__(self, actions: torch.Tensor, loop: bool = True, resets: torch.Tensor | None = None):
+        """Initializes the replay.
+
+        Args:
+            actions: The recorded actions. Shape is (num_steps, num_envs, action_dim).
+            loop: Whether an environment at the end of the recording starts over. Otherwise, it repeats the last
+                recorded action. Defaults to True.
+            resets: The recorded reset flags, true on the first step of every episode. Shape is (num_steps, num_envs).
+                Defaults to None, in which case a reset does not move the cursors.
+
+        Raises:
+            ValueError: When the recording does not have three dimensions or is empty, or the reset flags do not
+                match the actions.
+        """
+        if actions.dim() != 3 or len(actions) == 0:
+            raise ValueError(
+                f"Expected non-empty actions of shape (steps, num_envs, action_dim). Received: {tuple(actions.shape)}."
+            )
+        if resets is not None and tuple(resets.shape) != tuple(actions.shape[:2]):
+            raise ValueError(
+                f"Expected reset flags of shape {tuple(actions.shape[:2])}. Received: {tuple(resets.shape)}."
+            )
+        self.actions = actions.contiguous()
+        self.loop = loop
+        num_envs = actions.shape[1]
+        self.cursors = torch.zeros(num_envs, dtype=torch.long, device=actions.device)
+        """The next replayed step of every environment. Shape is (num_envs,)."""
+        # rows of the flattened recording: step * num_envs + env_id
+        self._flat = self.actions.view(-1, actions.shape[-1])
+        self._env_ids = torch.arange(num_envs, device=actions.device)
+        self._rows = torch.empty_like(self._env_ids)
+        self._out = torch.empty_like(self.actions[0])
+        self._skips = None if resets is None else self._episode_skips(resets.to(actions.device, dtype=torch.bool))
+
+    @classmethod
+    def from_recording(cls, path: str, column: str = "action", device: str = "cpu", loop: bool = True):
+        """Creates a replay of the actions of a recording of :class:`RolloutRecorder`.
+
+        The reset flags are taken from the "reset" column when the recording has one.
+
+        Args:
+            path: The directory of the recording.
+            column: The column of the actions. Defaults to "action".
+            device: The device of the actions. Defaults to "cpu".
+            loop: Whether an environment at the end of the recording starts over. Defaults to True.
+        """
+        reader = RolloutReader(path)
+        resets = reader["reset"].to(device) if "reset" in reader.columns else None
+        return cls(_load_actions(path, column, device), loop=loop, resets=resets)
+
+    @property
+    def num_steps(self) -> int:
+        """Number of recorded steps."""
+        return len(self.actions)
+
+    def act(self, obs: torch.Tensor | None = None) -> torch.Tensor:
+        self._wrap_cursors(self._rows)
+        self._rows.mul_(len(self._env_ids)).add_(self._env_ids)
+        torch.index_select(self._flat, 0, self._rows, out=self._out)
+        self.cursors += 1
+        return self._out
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        if self._skips is None:
+            return
+        # note: the skips are gathered on the device, so a reset does not wait for the device.
+        steps = self._wrap_cursors(torch.empty_like(self.cursors))
+        if env_ids is None:
+            self.cursors += self._skips[steps, self._env_ids]
+        else:
+            env_ids = torch.as_tensor(env_ids, device=self.cursors.device)
+            self.cursors[env_ids] += self._skips[steps[env_ids], env_ids]
+
+    """
+    Internal helpers.
+    """
+
+    def _wrap_cursors(self, out: torch.Tensor) -> torch.Tensor:
+        """Writes the recorded step of every cursor to ``out``: wrapped when looping, otherwise held at the end."""
+        if self.loop:
+            return torch.remainder(self.cursors, self.num_steps, out=out)
+        return torch.clamp(self.cursors, max=self.num_steps - 1, out=out)
+
+    def _episode_skips(self, resets: torch.Tensor) -> torch.Tensor:
+        """Returns the number of steps from every recorded step to the next recorded episode start of the
+        environment, 0 on the episode starts. Shape is (num_steps, num_envs).
+
+        When looping, the steps after the last episode start skip to the first episode start of the next pass.
+        Otherwise, and for environments without any recorded episode start, they do not skip.
+        """
+        num_steps = len(resets)
+        steps = torch.arange(num_steps, device=resets.device).unsqueeze(1).expand_as(resets)
+        never = torch.full_like(steps, 2 * num_steps)
+        # the next start of every step: a reverse running minimum over the start steps
+        starts = torch.where(resets, steps, never)
+        next_starts = starts.flip(0).cummin(0).values.flip(0)
+        if self.loop:
+            next_starts = torch.where(next_starts == never, next_starts[0] + num_steps, next_starts)
+        return torch.where(next_starts >= never, steps, next_starts) - steps
+
+
+def _check_recording(path: str, column: str, num_envs: int | None, action_dim: int | None):
+    """Checks the number of environments and actions of a recording against its index.
+
+    Raises:
+        ValueError: When the recording has no such column or does not match the environments.
+    """
+    with open(os.path.join(path, INDEX_FILE)) as f:
+        index = json.load(f)
+    if column not in index["columns"]:
+        raise ValueError(f"The recording at {path} has no '{column}' column. Received: {list(index['columns'])}.")
+    if num_envs is not None and index["num_envs"] != num_envs:
+        raise ValueError(f"The recording at {path} must have {num_envs} environments. Received: {index['num_envs']}.")
+    recorded_dim = math.prod(index["columns"][column]["shape"])
+    if action_dim is not None and recorded_dim != action_dim:
+        raise ValueError(f"The recording at {path} must have {action_dim} actions. Received: {recorded_dim}.")
+
+
+def _load_actions(path: str, column: str, device: str) -> torch.Tensor:
+    """Copies the actions of a recording to the device. Shape is (num_steps, num_envs, action_dim)."""
+    actions = RolloutReader(path)[column]
+    return actions.reshape(actions.shape[0], actions.shape[1], -1).to(device=device, dtype=torch.float32)
@@ -0,0 +1,238 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Configuration of the cartpole base environment of ``creating_a_manager_based_environment.py``.
+
+The configuration lives in its own module so that the script and the workers of
+:class:`lab_utils.sharded_env.ShardedVecEnv` build the same environment.
+
+.. note::
+
+    The module imports Isaac Lab, so it can only be imported after the simulation app is launched.
+"""
+
+import math
+
+import isaaclab.envs.mdp as mdp
+from isaaclab.envs import ManagerBasedEnv, ManagerBasedEnvCfg
+from isaaclab.managers import EventTermCfg as EventTerm
+from isaaclab.managers import ObservationGroupCfg as ObsGroup
+from isaaclab.managers import ObservationTermCfg as ObsTerm
+from isaaclab.managers import SceneEntityCfg
+from isaaclab.utils import configclass
+
+from isaaclab_tasks.manager_based.classic.cartpole.cartpole_env_cfg import CartpoleSceneCfg
+
+from lab_utils.rng_events import randomize_rigid_body_mass_seeded, reset_joints_by_offset_fused
+from lab_utils.snapshot_pool import SnapshotPool, capture_joints_to_pool, reset_joints_from_pool
+
+
+@configclass
+class ActionsCfg:
+    """Action specifications for the environment."""
+
+    joint_efforts = mdp.JointEffortActionCfg(asset_name="robot", joint_names=["slider_to_cart"], scale=5.0)
+
+
+@configclass
+class ObservationsCfg:
+    """Observation specifications for the environment."""
+
+    @configclass
+    class PolicyCfg(ObsGroup):
+        """Observations for policy group."""
+
+        # observation terms (order preserved)
+        joint_pos_rel = ObsTerm(func=mdp.joint_pos_rel)
+        joint_vel_rel = ObsTerm(func=mdp.joint_vel_rel)
+
+        def __post_init__(self) -> None:
+            self.enable_corruption = False
+            self.concatenate_terms = True
+
+    # observation groups
+    policy: PolicyCfg = PolicyCfg()
+
+
+@configclass
+class EventCfg:
+    """Configuration for events."""
+
+    # on startup
+    add_pole_mass = EventTerm(
+        func=mdp.randomize_rigid_body_mass,
+        mode="startup",
+        params={
+            "asset_cfg": SceneEntityCfg("robot", body_names=["pole"]),
+            "mass_distribution_params": (0.1, 0.5),
+            "operation": "add",
+        },
+    )
+
+    # on reset
+    reset_cart_position = EventTerm(
+        func=mdp.reset_joints_by_offset,
+        mode="reset",
+        params={
+            "asset_cfg": SceneEntityCfg("robot", joint_names=["slider_to_cart"]),
+            "position_range": (-1.0, 1.0),
+            "velocity_range": (-0.1, 0.1),
+        },
+    )
+
+    reset_pole_position = EventTerm(
+        func=mdp.reset_joints_by_offset,
+        mode="reset",
+        params={
+            "asset_cfg": SceneEntityCfg("robot", joint_names=["cart_to_pole"]),
+            "position_range": (-0.125 * math.pi, 0.125 * math.pi),
+            "velocity_range": (-0.01 * math.pi, 0.01 * math.pi),
+        },
+    )
+
+
+@configclass
+class SeededEventCfg:
+    """Configuration for the events of :class:`EventCfg`, drawn from per-environment random streams.
+
+    Both reset terms are fused into one draw and one joint-state write per reset. Set the seed with
+    :func:`make_seeded_events`.
+    """
+
+    # on startup
+    add_pole_mass = EventTerm(
+        func=randomize_rigid_body_mass_seeded,
+        mode="startup",
+        params={
+            "asset_cfg": SceneEntityCfg("robot", body_names=["pole"]),
+            "mass_distribution_params": (0.1, 0.5),
+            "operation": "add",
+            "seed": 0,
+            "env_offset": 0,
+        },
+    )
+
+    # on reset
+    reset_joints = EventTerm(
+        func=reset_joints_by_offset_fused,
+        mode="reset",
+        params={
+            "asset_cfg": SceneEntityCfg("robot"),
+            "joint_offsets": {
+                "slider_to_cart": ((-1.0, 1.0), (-0.1, 0.1)),
+                "cart_to_pole": ((-0.125 * math.pi, 0.125 * math.pi), (-0.01 * math.pi, 0.01 * math.pi)),
+            },
+            "seed": 0,
+            "env_offset": 0,
+        },
+    )
+
+
+def make_seeded_events(seed: int, env_offset: int = 0) -> SeededEventCfg:
+    """Returns the events drawn from per-environment random streams.
+
+    Args:
+        seed: The seed of the random streams.
+        env_offset: The global index of the first environment, for a slice of a sharded environment. Defaults to 0.
+    """
+    events = SeededEventCfg()
+    for term in (events.add_pole_mass, events.reset_joints):
+        term.params["seed"] = seed
+        term.params["env_offset"] = env_offset
+    return events
+
+
+def add_snapshot_events(
+    events: EventCfg | SeededEventCfg,
+    capacity: int,
+    eviction: str = "fifo",
+    device: str = "cuda:0",
+    capture_interval_s: float = 0.5,
+    min_snapshots: int = 1,
+) -> SnapshotPool:
+    """Adds the capture of settled joint states into a snapshot pool and the resets from it to the events.
+
+    The capture runs every ``capture_interval_s`` seconds of every environment. The reset from the pool runs after
+    the other reset terms and overwrites their joint states once the pool holds ``min_snapshots`` snapshots.
+
+    Args:
+        events: The events to extend.
+        capacity: The capacity of the pool.
+        eviction: The eviction policy of the pool. Defaults to "fifo".
+        device: The simulation device. Defaults to "cuda:0".
+        capture_interval_s: The time between two captures of an environment (in s). Defaults to 0.5.
+        min_snapshots: The number of snapshots the pool needs before the resets sample from it. Defaults to 1.
+
+    Returns:
+        The pool. The environment may hold a copy of the configuration, so read the pool of a running environment
+        from ``env.event_manager.get_term_cfg("reset_from_pool").params["pool"]``.
+    """
+    # the cartpole has two joints: slider_to_cart and cart_to_pole
+    pool = SnapshotPool({"joint_pos": (2,), "joint_vel": (2,)}, capacity, eviction=eviction, device=device)
+    events.capture_settled = EventTerm(
+        func=capture_joints_to_pool,
+        mode="interval",
+        interval_range_s=(capture_interval_s, capture_interval_s),
+        params={"pool": pool},
+    )
+    events.reset_from_pool = EventTerm(
+        func=reset_joints_from_pool, mode="reset", params={"pool": pool, "min_snapshots": min_snapshots}
+    )
+    return pool
+
+
+@configclass
+class CartpoleEnvCfg(ManagerBasedEnvCfg):
+    """Configuration for the cartpole environment."""
+
+    # Scene settings
+    scene = CartpoleSceneCfg(num_envs=1024, env_spacing=2.5)
+    # Basic settings
+    observations = ObservationsCfg()
+    actions = ActionsCfg()
+    events = EventCfg()
+
+    def __post_init__(self):
+        """Post initialization."""
+        # viewer settings
+        self.viewer.eye = [4.5, 0.0, 6.0]
+        self.viewer.lookat = [0.0, 0.0, 2.0]
+        # step settings
+        self.decimation = 4  # env step every 4 sim steps: 200Hz / 4 = 50Hz
+        # simulation settings
+        self.sim.dt = 0.005  # sim step every 5ms: 200Hz
+
+
+def make_cartpole_env(
+    num_envs: int,
+    worker_id: int = 0,
+    device: str = "cuda:0",
+    seed: int = 42,
+    event_seed: int | None = None,
+    shard_sizes: list[int] | None = None,
+) -> ManagerBasedEnv:
+    """Creates a cartpole base environment for one slice of a sharded environment.
+
+    Args:
+        num_envs: The number of environments of the slice.
+        worker_id: The index of the slice, added to the seed so that the slices differ. Defaults to 0.
+        device: The simulation device. Defaults to "cuda:0".
+        seed: The base seed. Defaults to 42.
+        event_seed: The seed of the per-environment random streams of the events. Defaults to None, in which case
+            the events draw from the global random state.
+        shard_sizes: The number of environments of every slice (:func:`lab_utils.sharded_env.shard_sizes`), which
+            gives the global index of the first environment of the slice. Defaults to None (a single slice).
+
+    Returns:
+        The environment.
+    """
+    env_cfg = CartpoleEnvCfg()
+    env_cfg.scene.num_envs = num_envs
+    env_cfg.sim.device = device
+    env_cfg.seed = seed + worker_id
+    if event_seed is not None:
+        env_offset = sum(shard_sizes[:worker_id]) if shard_sizes is not None else 0
+        env_cfg.events = make_seeded_events(event_seed, env_offset=env_offset)
+    return ManagerBasedEnv(cfg=env_cfg)
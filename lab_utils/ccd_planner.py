@@ -0,0 +1,165 @@
+"""Selective continuous collision detection (CCD) from the predicted tunneling risk of every body.
+
+With discrete collision detection, a body is only in contact when it overlaps another collider at the end of a
+step. A body that moves further per step than the thickness window of the pair (its own thickness plus the one of
+the other collider) can skip past the other collider without ever overlapping it: it tunnels. Enabling CCD for the
+whole scene prevents this but makes every body pay for the swept collision tests.
+
+:func:`plan_ccd` predicts the worst-case displacement per step of every rigid object from its configuration: the
+object falls freely from its initial height onto the ground, so its speed at impact is ``sqrt(v0^2 + 2 g h)``,
+capped by the maximum linear velocity of its rigid-body properties. A body is at risk when
+``safety * displacement`` exceeds the thickness window with the thinnest other collider of the scene. The plan
+recommends CCD for the bodies at risk and, as the alternative, the number of substeps that would bring the
+displacement back into the window.
+
+:func:`apply_ccd` sets the CCD flag on the rigid bodies of a spawned prim path. PhysX only runs the swept tests for
+bodies with the flag, and only when CCD is enabled for the scene (:attr:`isaaclab.sim.PhysxCfg.enable_ccd`).
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+CCD_MODES = ("selective", "global", "none")
+"""Supported CCD modes: only the bodies at risk, every body, or no body."""
+
+
+@dataclass
+class BodyCcdPlan:
+    """Predicted tunneling risk and CCD recommendation of one rigid object."""
+
+    prim_path: str
+    """Prim path (expression) of the rigid object."""
+
+    thickness: float
+    """Smallest extent of the collision shape (in m)."""
+
+    impact_speed: float
+    """Worst-case speed at impact (in m/s)."""
+
+    displacement: float
+    """Worst-case displacement per step (in m)."""
+
+    window: float
+    """Thickness window with the thinnest other collider (in m)."""
+
+    enable_ccd: bool
+    """Whether the body needs CCD."""
+
+    substeps: int
+    """Number of substeps per step that avoid tunneling without CCD."""
+
+    @property
+    def risk(self) -> float:
+        """Ratio of the displacement per step to the thickness window."""
+        return self.displacement / self.window
+
+
+def body_thickness(spawn_cfg) -> float:
+    """Returns the smallest extent of a shape, the thinnest it can appear in any direction.
+
+    Args:
+        spawn_cfg: The shape configuration, for instance :class:`isaaclab.sim.CuboidCfg`,
+            :class:`isaaclab.sim.SphereCfg` or :class:`isaaclab.sim.ConeCfg`.
+
+    Raises:
+        ValueError: When the configuration has neither a size nor a radius.
+    """
+    if hasattr(spawn_cfg, "size"):
+        return float(min(spawn_cfg.size))
+    if hasattr(spawn_cfg, "radius"):
+        diameter = 2.0 * spawn_cfg.radius
+        return float(min(diameter, spawn_cfg.height)) if hasattr(spawn_cfg, "height") else float(diameter)
+    raise ValueError(f"Cannot compute the thickness of the spawn configuration: {type(spawn_cfg).__name__}.")
+
+
+def plan_ccd(
+    objects: dict[str, object], dt: float, gravity: float = 9.81, safety: float = 2.0
+) -> dict[str, BodyCcdPlan]:
+    """Predicts the tunneling risk of rigid objects and recommends CCD and substeps per object.
+
+    Args:
+        objects: The rigid-object configurations (:class:`isaaclab.assets.RigidObjectCfg`) by name.
+        dt: The physics time-step (in s).
+        gravity: The magnitude of the gravity (in m/s^2). Defaults to 9.81.
+        safety: The factor on the displacement before it is compared to the thickness window. Defaults to 2.0.
+
+    Returns:
+        The plan of every object, by name.
+    """
+    thickness = {name: body_thickness(cfg.spawn) for name, cfg in objects.items()}
+    plans = {}
+    for name, cfg in objects.items():
+        # the thinnest collider this body can hit; the ground plane is a half-space and never the thinnest
+        others = [value for other, value in thickness.items() if other != name]
+        window = thickness[name] + min(others, default=0.0)
+        # free fall from the initial height of the lowest point of the body onto the ground
+        height = max(cfg.init_state.pos[2] - 0.5 * thickness[name], 0.0)
+        initial_speed = math.sqrt(sum(v * v for v in cfg.init_state.lin_vel))
+        speed = math.sqrt(initial_speed**2 + 2.0 * gravity * height)
+        max_speed = getattr(cfg.spawn.rigid_props, "max_linear_velocity", None)
+        if max_speed is not None:
+            speed = min(speed, max_speed)
+        displacement = speed * dt + 0.5 * gravity * dt**2
+        substeps = max(1, math.ceil(safety * displacement / window))
+        plans[name] = BodyCcdPlan(
+            prim_path=cfg.prim_path,
+            thickness=thickness[name],
+            impact_speed=speed,
+            displacement=displacement,
+            window=window,
+            enable_ccd=substeps > 1,
+            substeps=substeps,
+        )
+    return plans
+
+
+def format_report(plans: dict[str, BodyCcdPlan], dt: float) -> str:
+    """Formats the plans as a table with the recommended time-step without CCD.
+
+    Args:
+        plans: The plans by name, see :func:`plan_ccd`.
+        dt: The physics time-step (in s).
+    """
+    lines = [
+        f"{'body':>16} | {'thickness':>9} | {'speed':>7} | {'disp/step':>9} | {'window':>6} | {'risk':>5} | "
+        f"{'substeps':>8} | ccd"
+    ]
+    for name, plan in plans.items():
+        lines.append(
+            f"{name:>16} | {plan.thickness:>9.3f} | {plan.impact_speed:>7.2f} | {plan.displacement:>9.3f} |"
+            f" {plan.window:>6.3f} | {plan.risk:>5.2f} | {plan.substeps:>8} | {'yes' if plan.enable_ccd else 'no'}"
+        )
+    num_ccd = sum(plan.enable_ccd for plan in plans.values())
+    max_substeps = max((plan.substeps for plan in plans.values()), default=1)
+    lines.append(
+        f"CCD for {num_ccd} of {len(plans)} bodies. Without CCD, a time-step of {dt / max_substeps:.5f} s"
+        f" ({max_substeps} substeps) avoids tunneling."
+    )
+    return "\n".join(lines)
+
+
+def apply_ccd(prim_path: str, enable: bool = True) -> int:
+    """Sets the CCD flag of the rigid bodies that match a prim path expression.
+
+    Args:
+        prim_path: The prim path (expression) of the rigid objects, for instance ``"/World/Origin.*/Cube"``.
+        enable: Whether to enable CCD. Defaults to True.
+
+    Returns:
+        The number of updated rigid bodies.
+    """
+    from pxr import PhysxSchema, UsdPhysics
+
+    import isaaclab.sim as sim_utils
+
+    num_bodies = 0
+    for root in sim_utils.find_matching_prims(prim_path):
+        # note: the rigid-body API can sit on the spawned prim or on one of its children
+        for prim in sim_utils.get_all_matching_child_prims(
+            root.GetPath(), predicate=lambda prim: prim.HasAPI(UsdPhysics.RigidBodyAPI)
+        ):
+            PhysxSchema.PhysxRigidBodyAPI.Apply(prim).CreateEnableCCDAttr().Set(enable)
+            num_bodies += 1
+    return num_bodies
@@ -0,0 +1,197 @@
+"""Counter-based random streams per environment.
+
+Randomization terms that draw from the global random state give results that depend on the order of the draws:
+resetting the environments in other subsets, or splitting them over the workers of a sharded environment, changes
+the values every environment receives. :class:`EnvRandom` instead derives every value from a counter-based
+generator, Philox4x32-10 (Salmon et al., "Parallel random numbers: as easy as 1, 2, 3", SC 2011). A block of four
+32-bit values is a pure function of the key (the seed) and a 128-bit counter made of
+
+* the global index of the environment,
+* the number of draws the environment has made in the stream so far,
+* the stream (for instance reset events or startup events),
+* the index of the block within the draw.
+
+So the values of an environment only depend on the seed, its global index and how often it was randomized, and not
+on which other environments are reset with it or on which worker it runs. The generator is evaluated with integer
+tensor operations, so a draw for any subset of environments is one batched computation.
+
+.. code-block:: python
+
+    rng = EnvRandom(num_envs, seed=42, device=device)
+    values = rng.uniform(env_ids, num_values=4, stream=RESET_STREAM)  # (len(env_ids), 4) in [0, 1)
+
+:class:`UniformRanges` fuses the uniform ranges of several randomization terms, so that a reset draws the values of
+all terms with one batched draw.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+import torch
+
+PHILOX_M0 = 0xD2511F53
+PHILOX_M1 = 0xCD9E8D57
+PHILOX_W0 = 0x9E3779B9
+PHILOX_W1 = 0xBB67AE85
+PHILOX_ROUNDS = 10
+_MASK32 = 0xFFFFFFFF
+
+STARTUP_STREAM = 0
+"""Stream of the events at startup."""
+
+RESET_STREAM = 1
+"""Stream of the events at reset."""
+
+
+def philox4x32(counter: torch.Tensor, key: tuple[int, int]) -> torch.Tensor:
+    """Evaluates Philox4x32-10.
+
+    The 32-bit words are held in int64 tensors with values in [0, 2^32). The zero counter with the zero key gives
+    ``(0x6627e8d5, 0xe169c58d, 0xbc57ac4c, 0x9b00dbd8)``, the known-answer vector of the Random123 library.
+
+    Args:
+        counter: The counters. Shape is (N, 4).
+        key: The two 32-bit words of the key.
+
+    Returns:
+        The four random 32-bit words of every counter. Shape is (N, 4).
+    """
+    c0, c1, c2, c3 = counter.unbind(-1)
+    k0, k1 = key
+    for round_id in range(PHILOX_ROUNDS):
+        if round_id > 0:
+            # bump the key
+            k0 = (k0 + PHILOX_W0) & _MASK32
+            k1 = (k1 + PHILOX_W1) & _MASK32
+        # note: the 64-bit products wrap around in int64. The low word is unaffected, and the arithmetic shift of a
+        # wrapped product followed by the mask still gives the high word.
+        product0 = c0 * PHILOX_M0
+        product1 = c2 * PHILOX_M1
+        c0, c1, c2, c3 = (
+            (product1 >> 32).bitwise_and_(_MASK32).bitwise_xor_(c1).bitwise_xor_(k0),
+            product1.bitwise_and_(_MASK32),
+            (product0 >> 32).bitwise_and_(_MASK32).bitwise_xor_(c3).bitwise_xor_(k1),
+            product0.bitwise_and_(_MASK32),
+        )
+    return torch.stack((c0, c1, c2, c3), dim=-1)
+
+
+class EnvRandom:
+    """Random streams per environment, derived from a seed and the global index of every environment."""
+
+    def __init__(self, num_envs: int, seed: int = 0, device: str = "cpu", env_offset: int = 0, num_streams: int = 2):
+        """Initializes the streams.
+
+        Args:
+            num_envs: The number of environments.
+            seed: The seed, a 64-bit integer. Defaults to 0.
+            device: The device of the draws. Defaults to "cpu".
+            env_offset: The global index of the first environment, for instance the number of environments of the
+                earlier workers of a sharded environment. Defaults to 0.
+            num_streams: The number of independent streams. Defaults to 2 (startup and reset events).
+
+        Raises:
+            ValueError: When the seed does not fit into 64 bits.
+        """
+        if not 0 <= seed < 2**64:
+            raise ValueError(f"The seed must be in [0, 2^64). Received: {seed}.")
+        self.num_envs = num_envs
+        self.seed = seed
+        self.device = torch.device(device)
+        self.key = (seed & _MASK32, seed >> 32)
+        self.global_ids = torch.arange(env_offset, env_offset + num_envs, dtype=torch.long, device=self.device)
+        """The global index of every environment. Shape is (num_envs,)."""
+        self.draws = torch.zeros(num_streams, num_envs, dtype=torch.long, device=self.device)
+        """The number of draws per stream and environment. Shape is (num_streams, num_envs)."""
+
+    def bits(self, env_ids: torch.Tensor | None, num_values: int, stream: int = RESET_STREAM) -> torch.Tensor:
+        """Draws random 32-bit words for the selected environments and advances their stream.
+
+        Args:
+            env_ids: The local indices of the environments. Defaults to None (all environments).
+            num_values: The number of words per environment.
+            stream: The stream. Defaults to :data:`RESET_STREAM`.
+
+        Returns:
+            The words, as int64 values in [0, 2^32). Shape is (len(env_ids), num_values).
+        """
+        if env_ids is None:
+            env_ids = torch.arange(self.num_envs, device=self.device)
+        num_blocks = (num_values + 3) // 4
+        draws = self.draws[stream, env_ids]
+        counter = torch.empty(len(env_ids), num_blocks, 4, dtype=torch.long, device=self.device)
+        counter[..., 0] = self.global_ids[env_ids].unsqueeze(1) & _MASK32
+        counter[..., 1] = draws.unsqueeze(1) & _MASK32
+        counter[..., 2] = stream
+        counter[..., 3] = torch.arange(num_blocks, device=self.device)
+        self.draws[stream, env_ids] = draws + 1
+        words = philox4x32(counter.view(-1, 4), self.key)
+        return words.view(len(env_ids), num_blocks * 4)[:, :num_values]
+
+    def uniform(self, env_ids: torch.Tensor | None, num_values: int, stream: int = RESET_STREAM) -> torch.Tensor:
+        """Draws uniform values in [0, 1) for the selected environments and advances their stream.
+
+        Every value has the 24 upper bits of one word, which is the resolution of float32 in [0, 1).
+
+        Args:
+            env_ids: The local indices of the environments. Defaults to None (all environments).
+            num_values: The number of values per environment.
+            stream: The stream. Defaults to :data:`RESET_STREAM`.
+
+        Returns:
+            The values. Shape is (len(env_ids), num_values).
+        """
+        return (self.bits(env_ids, num_values, stream) >> 8).float() * (1.0 / (1 << 24))
+
+    def reset_streams(self, env_ids: torch.Tensor | None = None):
+        """Rewinds all streams of the selected environments to their first draw. Defaults to None (all)."""
+        if env_ids is None:
+            self.draws.zero_()
+        else:
+            self.draws[:, env_ids] = 0
+
+
+class UniformRanges:
+    """Uniform ranges of several randomization terms, drawn with one batched draw."""
+
+    def __init__(self, ranges: Mapping[str, tuple[Sequence[float], Sequence[float]]], device: str = "cpu"):
+        """Initializes the concatenated bounds of the terms.
+
+        Args:
+            ranges: The lower and upper bounds of every term, one bound per value.
+            device: The device of the draws. Defaults to "cpu".
+
+        Raises:
+            ValueError: When the bounds of a term have different lengths.
+        """
+        self.slices: dict[str, slice] = {}
+        lower, upper = [], []
+        for name, (term_lower, term_upper) in ranges.items():
+            if len(term_lower) != len(term_upper):
+                raise ValueError(
+                    f"The bounds of '{name}' must have the same length. Received: {len(term_lower)}, {len(term_upper)}."
+                )
+            self.slices[name] = slice(len(lower), len(lower) + len(term_lower))
+            lower += list(term_lower)
+            upper += list(term_upper)
+        self.lower = torch.tensor(lower, dtype=torch.float, device=device)
+        self.width = torch.tensor(upper, dtype=torch.float, device=device) - self.lower
+
+    @property
+    def num_values(self) -> int:
+        """Number of values per environment over all terms."""
+        return len(self.lower)
+
+    def sample(self, rng: EnvRandom, env_ids: torch.Tensor | None, stream: int = RESET_STREAM) -> torch.Tensor:
+        """Draws the values of all terms for the selected environments.
+
+        Args:
+            rng: The random streams.
+            env_ids: The local indices of the environments. Defaults to None (all environments).
+            stream: The stream. Defaults to :data:`RESET_STREAM`.
+
+        Returns:
+            The values; the values of a term are in the columns of :attr:`slices`. Shape is (len(env_ids), num_values).
+        """
+        return torch.addcmul(self.lower, rng.uniform(env_ids, self.num_values, stream), self.width)
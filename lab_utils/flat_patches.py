@@ -0,0 +1,214 @@
+"""Vectorized flat-patch search over heightfields.
+
+Isaac Lab's :func:`isaaclab.terrains.utils.find_flat_patches` rejection-samples patch centers: it draws random
+points, ray-casts a ring of points around each of them and repeats until enough patches pass the height check. The
+number of iterations is unbounded and grows quickly for rough terrains.
+
+The functions here instead evaluate *every* grid cell as a candidate center at once. The terrain is rasterized into
+a heightfield, the height range (max - min) over a disc around every cell is computed with sliding-window maxima,
+and the patches are drawn uniformly from all cells that pass the checks. The cost is a fixed
+number of tensor operations per batch of sub-terrains and runs on the CPU as well as on the GPU.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+
+import torch
+import torch.nn.functional as F
+
+
+def rasterize_mesh(
+    vertices: torch.Tensor,
+    faces: torch.Tensor,
+    lower: tuple[float, float],
+    shape: tuple[int, int],
+    horizontal_scale: float,
+) -> torch.Tensor:
+    """Rasterizes the upward-facing surface of a triangle mesh into a heightfield.
+
+    Every grid point takes the highest surface height above it, which matches a downward ray-cast. Vertical faces
+    (walls) have no footprint in the xy-plane and are skipped. Grid points that no triangle covers are set to -inf.
+
+    Args:
+        vertices: The mesh vertices. Shape is (num_vertices, 3).
+        faces: The mesh triangles as vertex indices. Shape is (num_faces, 3).
+        lower: The (x, y) coordinates of the grid point (0, 0).
+        shape: The number of grid points along x and y.
+        horizontal_scale: The distance between grid points (in m).
+
+    Returns:
+        The heights at the grid points. Shape is (shape[0], shape[1]).
+    """
+    vertices = torch.as_tensor(vertices, dtype=torch.float)
+    faces = torch.as_tensor(faces, dtype=torch.long, device=vertices.device)
+    device = vertices.device
+    num_x, num_y = shape
+    tri = vertices[faces]
+    # triangle corners in (fractional) grid coordinates
+    gx = (tri[..., 0] - lower[0]) / horizontal_scale
+    gy = (tri[..., 1] - lower[1]) / horizontal_scale
+    # grid points inside the bounding box of each triangle
+    i_min = gx.min(dim=1).values.ceil().clamp(min=0).long()
+    i_max = gx.max(dim=1).values.floor().clamp(max=num_x - 1).long()
+    j_min = gy.min(dim=1).values.ceil().clamp(min=0).long()
+    j_max = gy.max(dim=1).values.floor().clamp(max=num_y - 1).long()
+    span_i = (i_max - i_min + 1).clamp(min=0)
+    span_j = (j_max - j_min + 1).clamp(min=0)
+    # skip triangles without a footprint
+    area = (gx[:, 1] - gx[:, 0]) * (gy[:, 2] - gy[:, 0]) - (gx[:, 2] - gx[:, 0]) * (gy[:, 1] - gy[:, 0])
+    counts = torch.where(area.abs() > 1e-9, span_i * span_j, torch.zeros_like(span_i))
+    # expand into one entry per (triangle, grid point) pair
+    tri_ids = torch.repeat_interleave(torch.arange(len(faces), device=device), counts)
+    offsets = torch.arange(tri_ids.numel(), device=device) - torch.repeat_interleave(counts.cumsum(0) - counts, counts)
+    i = i_min[tri_ids] + offsets // span_j[tri_ids]
+    j = j_min[tri_ids] + offsets % span_j[tri_ids]
+    # barycentric coordinates of the grid points
+    px, py = i.float(), j.float()
+    x0, y0 = gx[tri_ids, 0], gy[tri_ids, 0]
+    x1, y1 = gx[tri_ids, 1], gy[tri_ids, 1]
+    x2, y2 = gx[tri_ids, 2], gy[tri_ids, 2]
+    a = area[tri_ids]
+    w1 = ((px - x0) * (y2 - y0) - (x2 - x0) * (py - y0)) / a
+    w2 = ((x1 - x0) * (py - y0) - (px - x0) * (y1 - y0)) / a
+    w0 = 1.0 - w1 - w2
+    inside = (w0 >= -1e-6) & (w1 >= -1e-6) & (w2 >= -1e-6)
+    z = w0 * tri[tri_ids, 0, 2] + w1 * tri[tri_ids, 1, 2] + w2 * tri[tri_ids, 2, 2]
+    # keep the highest surface per grid point
+    heights = torch.full((num_x * num_y,), -math.inf, device=device)
+    heights.scatter_reduce_(0, (i * num_y + j)[inside], z[inside], reduce="amax")
+    return heights.view(num_x, num_y)
+
+
+def disc_max(heights: torch.Tensor, radius: float) -> torch.Tensor:
+    """Computes the maximum over a disc around every grid point.
+
+    The disc is decomposed into lines along the y-axis. The sliding maximum of every line width is read from a
+    sparse table of power-of-two window maxima (two lookups per width), and the lines are combined by shifting along
+    the x-axis. This takes ``O(radius)`` element-wise tensor operations independent of the grid size. Grid points
+    outside the heightfield are ignored.
+
+    Args:
+        heights: The heightfields. Shape is (num_fields, num_x, num_y).
+        radius: The disc radius in grid points.
+
+    Returns:
+        The maximum height over the disc around every grid point. Shape is (num_fields, num_x, num_y).
+    """
+    num_x, num_y = heights.shape[1:]
+    reach = int(math.floor(radius))
+    # sparse table: levels[p][..., j] is the maximum of the padded heights over [j, j + p)
+    padded = F.pad(heights, (reach, reach), value=-math.inf)
+    levels = {1: padded}
+    width = 1
+    while 2 * width <= 2 * reach + 1:
+        level = levels[width]
+        levels[2 * width] = torch.maximum(level[..., :-width], level[..., width:])
+        width *= 2
+
+    out = torch.full_like(heights, -math.inf)
+    line_max = {}
+    for di in range(-reach, reach + 1):
+        half_width = int(math.floor(math.sqrt(max(radius**2 - di**2, 0.0))))
+        if half_width not in line_max:
+            # the window [j - half_width, j + half_width] is covered by two overlapping power-of-two windows
+            window = 2 * half_width + 1
+            width = 1 << (window.bit_length() - 1)
+            start = reach - half_width
+            level = levels[width]
+            line_max[half_width] = torch.maximum(
+                level[..., start : start + num_y], level[..., start + window - width : start + window - width + num_y]
+            )
+        lines = line_max[half_width]
+        # out[:, i] = max(out[:, i], lines[:, i + di])
+        if di >= 0:
+            torch.maximum(out[:, : num_x - di], lines[:, di:], out=out[:, : num_x - di])
+        else:
+            torch.maximum(out[:, -di:], lines[:, : num_x + di], out=out[:, -di:])
+    return out
+
+
+def find_flat_patches_hf(
+    heights: torch.Tensor,
+    horizontal_scale: float,
+    origins: torch.Tensor,
+    num_patches: int,
+    patch_radius: float | Sequence[float],
+    max_height_diff: float,
+    lower: tuple[float, float] = (0.0, 0.0),
+    x_range: tuple[float, float] = (-1e6, 1e6),
+    y_range: tuple[float, float] = (-1e6, 1e6),
+    z_range: tuple[float, float] = (-1e6, 1e6),
+    generator: torch.Generator | None = None,
+) -> torch.Tensor:
+    """Finds flat patches on a batch of heightfields.
+
+    A grid point is a valid patch center when the whole disc of radius ``patch_radius`` around it lies on the
+    heightfield, the height range over the disc is at most ``max_height_diff`` and the center lies within the
+    given ranges around the sub-terrain origin. The patches are drawn uniformly without replacement from the valid
+    centers of each heightfield.
+
+    The arguments mirror :class:`isaaclab.terrains.FlatPatchSamplingCfg`.
+
+    Args:
+        heights: The heightfields. Shape is (num_fields, num_x, num_y). Uncovered grid points are -inf.
+        horizontal_scale: The distance between grid points (in m).
+        origins: The sub-terrain origins in the heightfield frame. Shape is (num_fields, 3).
+        num_patches: The number of patches to find per heightfield.
+        patch_radius: The radius of the patches (in m). For a sequence of radii, the largest one is checked.
+        max_height_diff: The maximum allowed height difference within a patch (in m).
+        lower: The (x, y) coordinates of the grid point (0, 0). Defaults to (0.0, 0.0).
+        x_range: The range of x-coordinates relative to the origin. Defaults to (-1e6, 1e6).
+        y_range: The range of y-coordinates relative to the origin. Defaults to (-1e6, 1e6).
+        z_range: The range of heights relative to the origin. Defaults to (-1e6, 1e6).
+        generator: The random number generator for drawing the patches. Defaults to None.
+
+    Returns:
+        The patch centers relative to the sub-terrain origins. Shape is (num_fields, num_patches, 3).
+
+    Raises:
+        RuntimeError: When a heightfield has fewer valid centers than requested patches.
+    """
+    num_fields, num_x, num_y = heights.shape
+    device = heights.device
+    origins = torch.as_tensor(origins, dtype=heights.dtype, device=device).view(num_fields, 3)
+    if isinstance(patch_radius, Sequence):
+        patch_radius = max(patch_radius)
+    radius = patch_radius / horizontal_scale
+    reach = int(math.floor(radius))
+
+    # height range over the disc around every grid point
+    # note: min over the disc is computed as -max(-heights). Uncovered points turn into +inf there.
+    height_range = disc_max(heights, radius) + disc_max(-heights, radius)
+    valid = height_range <= max_height_diff
+    # the disc must lie on the heightfield
+    valid[:, :reach] = False
+    valid[:, num_x - reach :] = False
+    valid[:, :, :reach] = False
+    valid[:, :, num_y - reach :] = False
+    # the center must lie within the ranges around the origin
+    x = lower[0] + horizontal_scale * torch.arange(num_x, device=device, dtype=heights.dtype)
+    y = lower[1] + horizontal_scale * torch.arange(num_y, device=device, dtype=heights.dtype)
+    rel_x = x.view(1, -1, 1) - origins[:, 0].view(-1, 1, 1)
+    rel_y = y.view(1, 1, -1) - origins[:, 1].view(-1, 1, 1)
+    rel_z = heights - origins[:, 2].view(-1, 1, 1)
+    valid &= (rel_x >= x_range[0]) & (rel_x <= x_range[1])
+    valid &= (rel_y >= y_range[0]) & (rel_y <= y_range[1])
+    valid &= (rel_z >= z_range[0]) & (rel_z <= z_range[1])
+
+    valid = valid.view(num_fields, -1)
+    num_valid = valid.sum(dim=1)
+    if (num_valid < num_patches).any():
+        field_id = int(torch.nonzero(num_valid < num_patches)[0, 0])
+        raise RuntimeError(
+            f"Failed to find valid patches! Heightfield {field_id} has {int(num_valid[field_id])} valid centers but"
+            f" {num_patches} patches were requested. Please try to relax the flat patch sampling parameters."
+        )
+    # uniform sampling without replacement: the top-k of random scores over the valid centers
+    scores = torch.rand(valid.shape, device=device, generator=generator)
+    scores.masked_fill_(~valid, -1.0)
+    index = scores.topk(num_patches, dim=1).indices
+    i, j = index // num_y, index % num_y
+    field_ids = torch.arange(num_fields, device=device).unsqueeze(1)
+    return torch.stack([rel_x[field_ids, i, 0], rel_y[field_ids, 0, j], rel_z[field_ids, i, j]], dim=-1)
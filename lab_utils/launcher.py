@@ -0,0 +1,168 @@
+"""Fast start-up of the entry-point scripts: validate first, boot the app last, import heavy modules lazily.
+
+The scripts used to construct :class:`isaaclab.app.AppLauncher` right after parsing the arguments, so a wrong
+argument or a broken scene file only surfaced after the full Omniverse boot. :class:`Launcher` splits the start-up
+into phases:
+
+1. parse the arguments (the launcher and app arguments are added to the parser),
+2. validate the arguments and the configurations that do not need the app, for instance scene files and recordings.
+   A validation error ends the script with a usage message before the boot,
+3. with ``--dry_run``, stop here,
+4. boot the app,
+5. import the modules that need the app, inside :meth:`Launcher.phase`.
+
+Every phase is timed, together with the modules it imported (new entries of :data:`sys.modules`), and
+``--startup_report`` prints the breakdown. For the import time of single modules, run the script with
+``python -X importtime``.
+
+The helpers of :mod:`lab_utils` that are imported before the boot load torch and numpy with :func:`lazy_import`,
+so these imports are paid on first use instead of before the arguments are parsed.
+
+.. code-block:: python
+
+    launcher = Launcher(parser)
+    args_cli = launcher.parse_args(validate=validate_args)
+    simulation_app = launcher.launch()
+    with launcher.phase("imports"):
+        import isaaclab.sim as sim_utils
+    launcher.report()
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib.util
+import sys
+import time
+import types
+from collections import Counter
+from collections.abc import Callable
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Returns a module that is only imported on its first attribute access.
+
+    Args:
+        name: The name of the module.
+
+    Raises:
+        ModuleNotFoundError: When the module cannot be found.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+class Launcher:
+    """Parses and validates the arguments of a script before booting the app, and times every start-up phase."""
+
+    def __init__(self, parser: argparse.ArgumentParser):
+        """Initializes the launcher and adds the launcher and app arguments to the parser.
+
+        Args:
+            parser: The parser of the script.
+        """
+        self.parser = parser
+        self.args: argparse.Namespace | None = None
+        self.app = None
+        self.app_launcher = None
+        # (name, duration in s, new modules) of every phase
+        self.phases: list[tuple[str, float, list[str]]] = []
+        group = parser.add_argument_group("launcher", description="Arguments for the start-up of the script.")
+        group.add_argument(
+            "--dry_run",
+            "--dry-run",
+            action="store_true",
+            default=False,
+            help="Parse and validate the arguments and configurations, then exit without starting the app.",
+        )
+        group.add_argument(
+            "--startup_report",
+            action="store_true",
+            default=False,
+            help="Print the time of every start-up phase and the modules it imported.",
+        )
+        with self.phase("import AppLauncher"):
+            from isaaclab.app import AppLauncher
+        self._app_launcher_cls = AppLauncher
+        AppLauncher.add_app_launcher_args(parser)
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """Times a start-up phase and records the modules imported in it.
+
+        Args:
+            name: The name of the phase.
+        """
+        modules = set(sys.modules)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self.phases.append((name, duration, [module for module in sys.modules if module not in modules]))
+
+    def parse_args(
+        self, args: list[str] | None = None, validate: Callable[[argparse.Namespace], None] | None = None
+    ) -> argparse.Namespace:
+        """Parses and validates the arguments. Exits after the validation with ``--dry_run``.
+
+        Args:
+            args: The arguments. Defaults to None (the arguments of the script).
+            validate: Checks the arguments and the configurations that do not need the app, and raises a
+                :class:`ValueError` or an :class:`OSError` when they are invalid. Defaults to None.
+
+        Returns:
+            The parsed arguments.
+        """
+        with self.phase("parse arguments"):
+            self.args = self.parser.parse_args(args)
+        if validate is not None:
+            with self.phase("validate"):
+                try:
+                    validate(self.args)
+                except (ValueError, OSError) as e:
+                    self.parser.error(str(e))
+        if self.args.dry_run:
+            print("[INFO]: Dry run: the arguments and configurations are valid. Exiting without starting the app.")
+            self.report(force=True)
+            sys.exit(0)
+        return self.args
+
+    def launch(self):
+        """Boots the app with the parsed arguments.
+
+        Returns:
+            The simulation app.
+        """
+        with self.phase("boot app"):
+            self.app_launcher = self._app_launcher_cls(self.args)
+            self.app = self.app_launcher.app
+        return self.app
+
+    def report(self, force: bool = False):
+        """Prints the start-up breakdown if ``--startup_report`` is set.
+
+        Args:
+            force: Print the breakdown regardless of the argument. Defaults to False.
+        """
+        if not force and (self.args is None or not self.args.startup_report):
+            return
+        total = sum(duration for _, duration, _ in self.phases)
+        print("[INFO]: Start-up report:")
+        print(f"\t{'phase':<20} | {'time [s]':>8} | {'modules':>7} | top packages (modules)")
+        for name, duration, modules in self.phases:
+            packages = Counter(module.partition(".")[0] for module in modules).most_common(4)
+            top = ", ".join(f"{package} ({count})" for package, count in packages)
+            print(f"\t{name:<20} | {duration:>8.3f} | {len(modules):>7} | {top}")
+        print(f"\t{'total':<20} | {total:>8.3f} |")
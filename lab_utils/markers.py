@@ -0,0 +1,116 @@
+"""Device-resident batching of marker locations for :class:`isaaclab.markers.VisualizationMarkers`.
+
+Visualizing many groups of points (for instance the flat patches of every sub-terrain) with a single instancer needs
+one flat tensor of translations and a matching list of prototype indices. Building these from Python lists costs one
+Python integer per marker on every refresh. :class:`MarkerBatch` builds both once on the device, updates changed
+groups in place and only pushes data to the instancer when something changed.
+"""
+
+from __future__ import annotations
+
+import torch
+
+
+class MarkerBatch:
+    """Flat, device-resident marker translations and prototype indices for several groups of points.
+
+    The prototype index of a group is its position in the dictionary passed at construction, which matches the
+    order of the ``markers`` dictionary of the visualizer configuration when both are built from the same keys.
+
+    A decimation factor keeps only every n-th marker of each group. It bounds the host work of every refresh
+    (the visualizer copies the data to the host) without touching the full-resolution data on the device.
+    """
+
+    def __init__(self, groups: dict[str, torch.Tensor], decimation: int = 1, device: str | None = None):
+        """Initializes the batch.
+
+        Args:
+            groups: The marker locations per group. Each tensor has shape (..., 3).
+            decimation: Show every n-th marker of each group. Defaults to 1 (all markers).
+            device: The device to hold the data on. Defaults to None, in which case the device of the first
+                group is used.
+
+        Raises:
+            ValueError: When the decimation factor is smaller than one.
+        """
+        if decimation < 1:
+            raise ValueError(f"Marker decimation must be at least 1. Received: {decimation}.")
+        if device is None:
+            device = next(iter(groups.values())).device if groups else "cpu"
+        self.device = device
+        self.decimation = decimation
+        self.names = list(groups.keys())
+
+        counts = torch.tensor([locations.numel() // 3 for locations in groups.values()], dtype=torch.long)
+        self._offsets = {
+            name: (int(start), int(count)) for name, start, count in zip(self.names, counts.cumsum(0) - counts, counts)
+        }
+        # a single allocation for all groups
+        self.translations = torch.empty((int(counts.sum()), 3), device=device)
+        for name, locations in groups.items():
+            self.update(name, locations)
+        self.marker_indices = torch.repeat_interleave(torch.arange(len(self.names), device=device), counts.to(device))
+
+        # indices of the shown markers: every n-th marker of each group
+        local_index = torch.arange(self.translations.shape[0], device=device) - torch.repeat_interleave(
+            (counts.cumsum(0) - counts).to(device), counts.to(device)
+        )
+        self._visible = torch.nonzero(local_index % decimation == 0).squeeze(-1) if decimation > 1 else None
+        if self._visible is None:
+            self._visible_translations = None
+            self._visible_marker_indices = self.marker_indices
+        else:
+            self._visible_translations = self.translations[self._visible]
+            self._visible_marker_indices = self.marker_indices[self._visible]
+        # the prototype indices only need to be sent once
+        self._indices_sent = False
+        self._dirty = True
+
+    def __len__(self) -> int:
+        """Number of shown markers."""
+        return self._visible_marker_indices.shape[0]
+
+    @property
+    def num_total(self) -> int:
+        """Number of markers before decimation."""
+        return self.translations.shape[0]
+
+    """
+    Operations.
+    """
+
+    def update(self, name: str, locations: torch.Tensor, ids: torch.Tensor | None = None):
+        """Writes new locations of a group in place.
+
+        Args:
+            name: The name of the group.
+            locations: The new locations. Shape is (..., 3), either for the whole group or for the selected ids.
+            ids: The indices of the changed markers within the group (after flattening). Defaults to None,
+                in which case the whole group is replaced.
+        """
+        start, count = self._offsets[name]
+        group = self.translations[start : start + count]
+        if ids is None:
+            group.copy_(locations.reshape(-1, 3))
+        else:
+            group[ids] = locations.reshape(-1, 3).to(self.device)
+        self._dirty = True
+
+    def visualize(self, visualizer, force: bool = False):
+        """Pushes the shown markers to the visualizer if anything changed since the last call.
+
+        Args:
+            visualizer: The visualization markers (:class:`isaaclab.markers.VisualizationMarkers`).
+            force: Whether to push the data even if nothing changed. Defaults to False.
+        """
+        if not (self._dirty or force):
+            return
+        translations = self.translations
+        if self._visible is not None:
+            torch.index_select(self.translations, 0, self._visible, out=self._visible_translations)
+            translations = self._visible_translations
+        # the visualizer keeps the previous prototype indices when none are given
+        marker_indices = None if self._indices_sent and not force else self._visible_marker_indices
+        visualizer.visualize(translations=translations, marker_indices=marker_indices)
+        self._indices_sent = True
+        self._dirty = False
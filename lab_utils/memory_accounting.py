@@ -0,0 +1,370 @@
+"""Memory accounting of the persistent buffers of an environment and prediction of the largest ``num_envs``.
+
+:func:`collect_buffers` walks the attributes of the scene, the assets, the managers and the terrain and lists every
+tensor they own. Views of the same storage are counted once. A buffer scales with the number of environments
+(per-env bytes) when its leading dimension is the number of environments, or the number of environments times a
+known per-env count such as the bodies or the joints of an articulation; all other buffers are fixed overhead. The
+:class:`MemoryReport` also records the memory the process uses on its device, which includes the buffers of the
+physics engine that are not tensors, so the accounted buffers are a lower bound of it.
+
+The footprint grows linearly with the number of environments. :func:`fit_scaling` fits the fixed and the per-env
+bytes to the reports of a few small probe runs, and :meth:`ScalingFit.max_num_envs` predicts the largest number of
+environments that fits a memory budget:
+
+.. code-block:: python
+
+    fit = fit_scaling([report_64, report_256, report_1024])
+    num_envs = fit.max_num_envs(budget_bytes=24 * 2**30, headroom=0.1)
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import resource
+import sys
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+
+from lab_utils.launcher import lazy_import
+
+# note: imported on first use, so that the script can parse its arguments before paying for the import
+np = lazy_import("numpy")
+torch = lazy_import("torch")
+
+TRAVERSED_PACKAGES = ("isaaclab", "omni.isaac.lab", "lab_utils")
+"""Packages whose objects :func:`collect_buffers` descends into. Other objects are leaves."""
+
+
+@dataclass
+class BufferRecord:
+    """A persistent tensor buffer."""
+
+    name: str
+    """The attribute path of the buffer, for instance ``scene.cartpole._data.joint_pos``."""
+
+    shape: tuple[int, ...]
+    """The shape of the tensor."""
+
+    dtype: str
+    """The data type of the tensor."""
+
+    device: str
+    """The device of the tensor."""
+
+    nbytes: int
+    """The size of the storage of the tensor in bytes."""
+
+    per_env: bool
+    """Whether the buffer scales with the number of environments."""
+
+
+@dataclass
+class MemoryReport:
+    """The persistent buffers of an environment and the memory its process uses."""
+
+    num_envs: int
+    """The number of environments."""
+
+    buffers: list[BufferRecord]
+    """The buffers, by decreasing size."""
+
+    device: str
+    """The simulation device."""
+
+    used_bytes: int
+    """The memory used on the device (or the peak resident memory of the process on the CPU) in bytes."""
+
+    total_bytes: int | None = None
+    """The memory of the device in bytes. None on the CPU."""
+
+    @property
+    def buffer_bytes(self) -> int:
+        """The bytes of all accounted buffers."""
+        return sum(buffer.nbytes for buffer in self.buffers)
+
+    @property
+    def per_env_bytes(self) -> float:
+        """The bytes of the buffers that scale with the number of environments, per environment."""
+        return sum(buffer.nbytes for buffer in self.buffers if buffer.per_env) / self.num_envs
+
+    @property
+    def fixed_bytes(self) -> int:
+        """The bytes of the buffers that do not scale with the number of environments."""
+        return sum(buffer.nbytes for buffer in self.buffers if not buffer.per_env)
+
+    def by_owner(self, depth: int = 2) -> dict[str, tuple[int, int]]:
+        """Sums the buffers by the first components of their names.
+
+        Args:
+            depth: The number of name components of an owner. Defaults to 2 (e.g. ``scene.cartpole``).
+
+        Returns:
+            The per-env and the fixed bytes by owner, by decreasing total size.
+        """
+        owners: dict[str, list[int]] = {}
+        for buffer in self.buffers:
+            owner = ".".join(buffer.name.split(".")[:depth])
+            owners.setdefault(owner, [0, 0])[0 if buffer.per_env else 1] += buffer.nbytes
+        return dict(sorted(((k, tuple(v)) for k, v in owners.items()), key=lambda item: -sum(item[1])))
+
+    def table(self, top: int = 20, depth: int = 2) -> str:
+        """Formats the report as a table of owners and of the largest buffers.
+
+        Args:
+            top: The number of buffers to list. Defaults to 20.
+            depth: The number of name components of an owner. Defaults to 2.
+        """
+        lines = [
+            f"[INFO]: Memory report for {self.num_envs} environments on {self.device}:",
+            f"\t{'owner':<48} | {'per env [B]':>11} | {'fixed [MB]':>10} | {'total [MB]':>10}",
+        ]
+        for owner, (per_env, fixed) in self.by_owner(depth).items():
+            lines.append(
+                f"\t{owner:<48} | {per_env / self.num_envs:>11.1f} | {fixed / 2**20:>10.3f} |"
+                f" {(per_env + fixed) / 2**20:>10.3f}"
+            )
+        lines.append(
+            f"\t{'buffers':<48} | {self.per_env_bytes:>11.1f} | {self.fixed_bytes / 2**20:>10.3f} |"
+            f" {self.buffer_bytes / 2**20:>10.3f}"
+        )
+        lines.append(f"\t{'used by the process':<48} | {'':>11} | {'':>10} | {self.used_bytes / 2**20:>10.3f}")
+        lines.append(f"\t{'buffer':<64} | {'shape':<18} | {'dtype':<8} | {'size [MB]':>9}")
+        for buffer in self.buffers[:top]:
+            shape = "x".join(str(size) for size in buffer.shape) or "scalar"
+            lines.append(f"\t{buffer.name[-64:]:<64} | {shape:<18} | {buffer.dtype:<8} | {buffer.nbytes / 2**20:>9.3f}")
+        if len(self.buffers) > top:
+            lines.append(f"\t... and {len(self.buffers) - top} smaller buffers")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        """Returns the report as a JSON-serializable dictionary."""
+        data = asdict(self)
+        data.update(buffer_bytes=self.buffer_bytes, per_env_bytes=self.per_env_bytes, fixed_bytes=self.fixed_bytes)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> MemoryReport:
+        """Creates a report from the output of :meth:`to_dict`."""
+        buffers = [BufferRecord(**{**buffer, "shape": tuple(buffer["shape"])}) for buffer in data["buffers"]]
+        return cls(data["num_envs"], buffers, data["device"], data["used_bytes"], data.get("total_bytes"))
+
+
+def collect_buffers(
+    roots: dict[str, object], num_envs: int, per_env_counts: Sequence[int] = (1,), max_depth: int = 6
+) -> list[BufferRecord]:
+    """Lists the tensors owned by objects and their attributes, dictionaries, lists and tuples.
+
+    The walk only descends into objects of :data:`TRAVERSED_PACKAGES`. Every storage is counted once, under the
+    first name it is found by, so the order of the roots decides which owner a shared buffer is attributed to.
+
+    Args:
+        roots: The objects to walk by name, for instance ``{"scene": env.scene}``.
+        num_envs: The number of environments.
+        per_env_counts: The numbers of items per environment of the flattened per-env buffers, for instance the
+            bodies of an articulation. A buffer is per-env when its leading dimension is the number of environments
+            times one of them. Defaults to (1,).
+        max_depth: The maximum number of attributes between a root and a buffer. Defaults to 6.
+
+    Returns:
+        The buffers, by decreasing size.
+    """
+    per_env_sizes = {num_envs * count for count in per_env_counts if count > 0}
+    records: list[BufferRecord] = []
+    storages: set[tuple[str, int]] = set()
+    visited: set[int] = set()
+
+    def visit(name: str, value, depth: int):
+        if isinstance(value, torch.Tensor):
+            storage = value.untyped_storage()
+            key = (str(value.device), storage.data_ptr())
+            if key in storages or storage.nbytes() == 0:
+                return
+            storages.add(key)
+            # note: any multiple of num_envs would also match fixed tables (e.g. 1024 rows at 16 environments), so
+            #   only the leading dimension and the known per-env counts are accepted.
+            per_env = value.dim() > 0 and value.shape[0] in per_env_sizes
+            dtype = str(value.dtype).removeprefix("torch.")
+            records.append(BufferRecord(name, tuple(value.shape), dtype, str(value.device), storage.nbytes(), per_env))
+            return
+        if depth == max_depth or id(value) in visited:
+            return
+        if isinstance(value, dict):
+            visited.add(id(value))
+            for key, item in value.items():
+                visit(f"{name}.{key}", item, depth + 1)
+        elif isinstance(value, (list, tuple)):
+            visited.add(id(value))
+            for index, item in enumerate(value):
+                visit(f"{name}.{index}", item, depth + 1)
+        elif type(value).__module__.startswith(TRAVERSED_PACKAGES) and hasattr(value, "__dict__"):
+            visited.add(id(value))
+            for key, item in vars(value).items():
+                # the configurations do not own buffers
+                if key != "cfg":
+                    visit(f"{name}.{key}", item, depth + 1)
+
+    for name, root in roots.items():
+        visit(name, root, 0)
+    records.sort(key=lambda record: -record.nbytes)
+    return records
+
+
+def used_bytes(device: str) -> tuple[int, int | None]:
+    """Returns the memory used on a device and the memory of the device in bytes.
+
+    On a GPU, the used memory is the memory of the device that is not free, which includes the buffers of the physics
+    engine. On the CPU, it is the peak resident memory of the process, and the memory of the device is None.
+
+    Args:
+        device: The device.
+    """
+    device = torch.device(device)
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+        free, total = torch.cuda.mem_get_info(device)
+        return total - free, total
+    # note: the peak resident size is reported in kilobytes on Linux and in bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024, None
+
+
+def memory_report(
+    roots: dict[str, object], num_envs: int, device: str, per_env_counts: Sequence[int] = (1,)
+) -> MemoryReport:
+    """Creates the memory report of the buffers owned by objects.
+
+    Args:
+        roots: The objects to walk by name, see :func:`collect_buffers`.
+        num_envs: The number of environments.
+        device: The simulation device.
+        per_env_counts: The numbers of items per environment of the flattened per-env buffers, see
+            :func:`collect_buffers`. Defaults to (1,).
+    """
+    used, total = used_bytes(device)
+    return MemoryReport(num_envs, collect_buffers(roots, num_envs, per_env_counts), str(device), used, total)
+
+
+def env_memory_report(env) -> MemoryReport:
+    """Creates the memory report of a manager-based environment.
+
+    The terrain, the assets and the sensors of the scene are listed first, then the managers and last the buffers of
+    the environment itself.
+
+    Args:
+        env: The environment (:class:`isaaclab.envs.ManagerBasedEnv`).
+    """
+    roots = {}
+    per_env_counts = {1}
+    if env.scene.terrain is not None:
+        roots["terrain"] = env.scene.terrain
+    for group in ("articulations", "rigid_objects", "sensors"):
+        for name, entity in getattr(env.scene, group, {}).items():
+            roots[f"scene.{name}"] = entity
+            # flattened buffers of the bodies, joints and objects of every environment
+            for count in ("num_bodies", "num_joints", "num_objects"):
+                if isinstance(getattr(entity, count, None), int):
+                    per_env_counts.add(getattr(entity, count))
+    for name in ("action_manager", "observation_manager", "event_manager", "recorder_manager"):
+        if hasattr(env, name):
+            roots[name] = getattr(env, name)
+    roots["env"] = env
+    return memory_report(roots, env.num_envs, env.device, sorted(per_env_counts))
+
+
+@dataclass
+class ScalingFit:
+    """The linear fit ``bytes = fixed_bytes + per_env_bytes * num_envs`` of the footprint of probe runs."""
+
+    fixed_bytes: float
+    """The fixed bytes, independent of the number of environments."""
+
+    per_env_bytes: float
+    """The bytes per environment."""
+
+    num_envs: list[int] = field(default_factory=list)
+    """The numbers of environments of the probe runs."""
+
+    measured_bytes: list[int] = field(default_factory=list)
+    """The measured bytes of the probe runs."""
+
+    @property
+    def max_relative_error(self) -> float:
+        """The largest deviation of the fit from a probe run, relative to its measured bytes."""
+        return max(
+            (abs(self.predict(n) - measured) / measured for n, measured in zip(self.num_envs, self.measured_bytes)),
+            default=0.0,
+        )
+
+    def predict(self, num_envs: int) -> float:
+        """Returns the predicted bytes for a number of environments."""
+        return self.fixed_bytes + self.per_env_bytes * num_envs
+
+    def max_num_envs(self, budget_bytes: float, headroom: float = 0.1) -> int:
+        """Predicts the largest number of environments that fits a memory budget.
+
+        Args:
+            budget_bytes: The memory budget in bytes.
+            headroom: The fraction of the budget kept free for the allocations that are not persistent (kernels
+                workspaces, fragmentation). Defaults to 0.1.
+
+        Returns:
+            The number of environments. 0 when not even the fixed bytes fit.
+        """
+        available = budget_bytes * (1.0 - headroom) - self.fixed_bytes
+        if self.per_env_bytes <= 0.0:
+            return 0 if available < 0 else sys.maxsize
+        return max(0, math.floor(available / self.per_env_bytes))
+
+
+def fit_scaling(reports: Sequence[MemoryReport], measure: str = "used") -> ScalingFit:
+    """Fits the fixed and the per-env bytes to the memory reports of probe runs by least squares.
+
+    Args:
+        reports: The reports of the probe runs, with at least two different numbers of environments.
+        measure: Which bytes to fit: "used" (the memory the process uses) or "buffers" (the accounted buffers).
+            Defaults to "used".
+
+    Returns:
+        The fit.
+
+    Raises:
+        ValueError: When the measure is unknown or there are fewer than two different numbers of environments.
+    """
+    if measure not in ("used", "buffers"):
+        raise ValueError(f"Unknown memory measure: '{measure}'. Expected one of: ('used', 'buffers').")
+    num_envs = [report.num_envs for report in reports]
+    if len(set(num_envs)) < 2:
+        raise ValueError(f"The fit needs probe runs with at least two numbers of environments. Received: {num_envs}.")
+    measured = [report.used_bytes if measure == "used" else report.buffer_bytes for report in reports]
+    per_env, fixed = np.polyfit(np.asarray(num_envs, dtype=np.float64), np.asarray(measured, dtype=np.float64), 1)
+    return ScalingFit(float(fixed), float(per_env), num_envs, measured)
+
+
+def add_memory_args(parser: argparse.ArgumentParser):
+    """Adds the memory accounting arguments to a parser.
+
+    Args:
+        parser: The parser to extend.
+    """
+    group = parser.add_argument_group("memory", description="Arguments for the memory accounting.")
+    group.add_argument(
+        "--memory_report", action="store_true", default=False, help="Print the persistent buffers after the setup."
+    )
+    group.add_argument("--memory_json", type=str, default=None, help="Write the memory report to this JSON file.")
+
+
+def write_report(args: argparse.Namespace, report: MemoryReport):
+    """Prints and writes a memory report as requested by the arguments added by :func:`add_memory_args`.
+
+    Args:
+        args: The parsed arguments.
+        report: The memory report.
+    """
+    if args.memory_report:
+        print(report.table())
+    if args.memory_json is not None:
+        with open(args.memory_json, "w") as f:
+            json.dump(report.to_dict(), f, indent=2)
@@ -0,0 +1,273 @@
+"""Preallocated observation buffer with in-place term writes and history stacking.
+
+An observation group with ``concatenate_terms = True`` computes every term into a new tensor and concatenates the
+terms into another new tensor on every step. :class:`ObservationPacker` computes the slice of every term in the
+observation vector once and keeps one preallocated buffer. Terms write into their slice through views, so assembling
+the observations allocates nothing:
+
+.. code-block:: python
+
+    packer = ObservationPacker({"joint_pos_rel": 1, "joint_vel_rel": 1}, num_envs, history_length=3, device=device)
+    torch.sub(joint_pos, default_joint_pos, out=packer.term("joint_pos_rel"))
+    torch.sub(joint_vel, default_joint_vel, out=packer.term("joint_vel_rel"))
+    obs = packer.advance()  # (num_envs, 3 * 2), oldest frame first
+
+With a history, the frames live in a circular buffer of shape (num_envs, history_length, obs_dim) and the terms
+write into the slot of the current frame. :meth:`ObservationPacker.advance` copies the frames into the stacked
+output in chronological order (two copies) and moves to the next slot. Without a history, the output is the buffer
+itself and no copy is made.
+
+:meth:`ObservationPacker.from_observation_group` builds a packer for an observation group of an Isaac Lab
+environment. The packer either takes the terms from the observation manager or evaluates them itself:
+
+* :meth:`ObservationPacker.pack` copies the terms of a group with ``concatenate_terms = False`` into their slices.
+  The manager computes every term once (with its noise and modifiers) and the packer replaces the concatenation.
+* :meth:`ObservationPacker.compute` evaluates the terms of a group that the manager does not compute. The terms in
+  :data:`IN_PLACE_TERMS` write into their slices directly; other terms are computed and then copied into their
+  slices. Terms with noise or modifiers are not supported.
+
+Do not combine :meth:`ObservationPacker.compute` with a group that the manager also computes, since every term would
+then be computed twice.
+"""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable, Mapping
+
+import torch
+
+
+def joint_pos_rel_(env, out: torch.Tensor, asset_cfg) -> torch.Tensor:
+    """Writes the joint positions relative to the default joint positions into ``out``."""
+    data = env.scene[asset_cfg.name].data
+    return torch.sub(data.joint_pos[:, asset_cfg.joint_ids], data.default_joint_pos[:, asset_cfg.joint_ids], out=out)
+
+
+def joint_vel_rel_(env, out: torch.Tensor, asset_cfg) -> torch.Tensor:
+    """Writes the joint velocities relative to the default joint velocities into ``out``."""
+    data = env.scene[asset_cfg.name].data
+    return torch.sub(data.joint_vel[:, asset_cfg.joint_ids], data.default_joint_vel[:, asset_cfg.joint_ids], out=out)
+
+
+IN_PLACE_TERMS: dict[str, Callable] = {
+    "joint_pos_rel": joint_pos_rel_,
+    "joint_vel_rel": joint_vel_rel_,
+}
+"""In-place writers of observation terms, by the name of the term function. A writer takes the environment, the
+output slice and the parameters of the term."""
+
+
+def _term_params(term_cfg) -> dict:
+    """Returns the parameters of a term, completed with the defaults of its function.
+
+    The observation manager only passes the parameters of the configuration, and the term functions supply their
+    defaults (for instance ``asset_cfg=SceneEntityCfg("robot")``). The in-place writers do not share these defaults,
+    so they are taken from the signature of the term function.
+    """
+    try:
+        signature = inspect.signature(term_cfg.func)
+    except (TypeError, ValueError):
+        return dict(term_cfg.params)
+    defaults = {
+        name: parameter.default
+        for name, parameter in signature.parameters.items()
+        if parameter.default is not inspect.Parameter.empty
+    }
+    return {**defaults, **term_cfg.params}
+
+
+class ObservationPacker:
+    """Packs observation terms into one preallocated buffer, optionally with a stacked history."""
+
+    def __init__(
+        self,
+        term_dims: Mapping[str, int],
+        num_envs: int,
+        history_length: int = 1,
+        device: str = "cpu",
+        dtype: torch.dtype = torch.float32,
+    ):
+        """Initializes the buffer and the slices of the terms.
+
+        Args:
+            term_dims: The number of observations of every term, in the order of the observation vector.
+            num_envs: The number of environments.
+            history_length: The number of stacked frames. Defaults to 1 (no history).
+            device: The device of the buffer. Defaults to "cpu".
+            dtype: The data type of the buffer. Defaults to torch.float32.
+
+        Raises:
+            ValueError: When the history length is smaller than one.
+        """
+        if history_length < 1:
+            raise ValueError(f"The history length must be at least 1. Received: {history_length}.")
+        self.num_envs = num_envs
+        self.history_length = history_length
+        self.device = torch.device(device)
+        # slices of the terms, computed once
+        self.slices: dict[str, slice] = {}
+        offset = 0
+        for name, dim in term_dims.items():
+            self.slices[name] = slice(offset, offset + dim)
+            offset += dim
+        self.obs_dim = offset
+        self.frames = torch.zeros(num_envs, history_length, offset, device=self.device, dtype=dtype)
+        """Circular buffer of the frames. Shape is (num_envs, history_length, obs_dim)."""
+        # views of the terms for every slot of the circular buffer
+        self._term_views = [
+            {name: self.frames[:, slot, term_slice] for name, term_slice in self.slices.items()}
+            for slot in range(history_length)
+        ]
+        self._frame_views = [self.frames[:, slot] for slot in range(history_length)]
+        if history_length == 1:
+            self._out = self.frames.view(num_envs, offset)
+        else:
+            self._out = torch.zeros(num_envs, history_length * offset, device=self.device, dtype=dtype)
+        self._out_frames = self._out.view(num_envs, history_length, offset)
+        self._slot = 0
+        self._filled = False
+        self._pending_resets: list[torch.Tensor] = []
+        # in-place writers of the terms, set by from_observation_group()
+        self._writers: list[tuple[str, Callable, dict, object]] = []
+        self._unsupported_terms: list[str] = []
+
+    @classmethod
+    def from_observation_group(cls, env, group_name: str = "policy", history_length: int = 1) -> ObservationPacker:
+        """Creates a packer for an observation group of an Isaac Lab environment.
+
+        Args:
+            env: The environment (:class:`isaaclab.envs.ManagerBasedEnv`).
+            group_name: The observation group. Defaults to "policy".
+            history_length: The number of stacked frames. Defaults to 1 (no history).
+        """
+        manager = env.observation_manager
+        names = manager.active_terms[group_name]
+        dims = manager.group_obs_term_dim[group_name]
+        packer = cls(
+            {name: int(torch.Size(dim).numel()) for name, dim in zip(names, dims)},
+            env.num_envs,
+            history_length=history_length,
+            device=env.device,
+        )
+        for name, term_cfg in zip(names, manager._group_obs_term_cfgs[group_name]):
+            # note: only compute() evaluates the terms; pack() takes them from the manager with noise and modifiers
+            if term_cfg.noise is not None or term_cfg.modifiers is not None:
+                packer._unsupported_terms.append(name)
+            writer = IN_PLACE_TERMS.get(getattr(term_cfg.func, "__name__", None))
+            packer._writers.append((name, writer, _term_params(term_cfg), term_cfg))
+        return packer
+
+    """
+    Properties.
+    """
+
+    @property
+    def stacked_dim(self) -> int:
+        """Number of observations of the stacked output."""
+        return self.history_length * self.obs_dim
+
+    @property
+    def frame(self) -> torch.Tensor:
+        """The current frame. Shape is (num_envs, obs_dim)."""
+        return self._frame_views[self._slot]
+
+    """
+    Operations.
+    """
+
+    def term(self, name: str) -> torch.Tensor:
+        """Returns the slice of a term in the current frame, for in-place writes. Shape is (num_envs, dim)."""
+        return self._term_views[self._slot][name]
+
+    def write(self, name: str, values: torch.Tensor):
+        """Copies the values of a term into its slice of the current frame.
+
+        Args:
+            name: The term.
+            values: The values of the term. Shape is (num_envs, dim).
+        """
+        self._term_views[self._slot][name].copy_(values.view(self.num_envs, -1))
+
+    def pack(self, terms: Mapping[str, torch.Tensor]) -> torch.Tensor:
+        """Copies the terms into the current frame and advances.
+
+        Args:
+            terms: The values of every term, for instance the observations of a group with
+                ``concatenate_terms = False``. Shapes are (num_envs, ...).
+
+        Returns:
+            The stacked observations (see :meth:`advance`).
+        """
+        views = self._term_views[self._slot]
+        for name, out in views.items():
+            out.copy_(terms[name].view(self.num_envs, -1))
+        return self.advance()
+
+    def compute(self, env) -> torch.Tensor:
+        """Evaluates the terms of the observation group into the current frame and advances.
+
+        Only available for packers created with :meth:`from_observation_group`.
+
+        Args:
+            env: The environment.
+
+        Returns:
+            The stacked observations (see :meth:`advance`).
+
+        Raises:
+            ValueError: When a term has noise or modifiers, which are not supported.
+        """
+        if self._unsupported_terms:
+            raise ValueError(f"Terms with noise or modifiers are not supported. Received: {self._unsupported_terms}.")
+        views = self._term_views[self._slot]
+        for name, writer, params, term_cfg in self._writers:
+            out = views[name]
+            if writer is not None:
+                writer(env, out, **params)
+            else:
+                out.copy_(term_cfg.func(env, **params).view(self.num_envs, -1))
+            if term_cfg.clip is not None:
+                out.clamp_(*term_cfg.clip)
+            if term_cfg.scale is not None:
+                out.mul_(term_cfg.scale)
+        return self.advance()
+
+    def advance(self) -> torch.Tensor:
+        """Completes the current frame and moves to the next slot of the circular buffer.
+
+        Environments reset since the last call have their whole history filled with the completed frame.
+
+        Returns:
+            The observations of the last ``history_length`` frames, oldest first. The output is preallocated and
+            overwritten by the next call. Shape is (num_envs, history_length * obs_dim).
+        """
+        frame = self._frame_views[self._slot]
+        if not self._filled:
+            # the first frame fills the whole history
+            self.frames[:] = frame.unsqueeze(1)
+            self._filled = True
+        for env_ids in self._pending_resets:
+            self.frames[env_ids] = frame[env_ids].unsqueeze(1)
+        self._pending_resets.clear()
+        if self.history_length == 1:
+            return self._out
+        # chronological order: the slots after the current one are older
+        newest = self._slot + 1
+        num_older = self.history_length - newest
+        self._out_frames[:, :num_older].copy_(self.frames[:, newest:])
+        self._out_frames[:, num_older:].copy_(self.frames[:, :newest])
+        self._slot = newest % self.history_length
+        return self._out
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        """Restarts the history of the selected environments with their next frame.
+
+        Args:
+            env_ids: The environments. Defaults to None (all environments).
+        """
+        if env_ids is None:
+            self._filled = False
+            self._pending_resets.clear()
+        else:
+            self._pending_resets.append(env_ids)
@@ -0,0 +1,174 @@
+"""Heterogeneous pool of rigid objects behind one flat state tensor.
+
+Spawning every shape as its own :class:`isaaclab.assets.RigidObject` means that resets, pose writes, buffer updates
+and state reads are issued once per shape, so the per-step overhead grows with the number of shapes.
+:class:`RigidObjectPool` wraps a single rigid object whose instances have different shapes, for instance one spawned
+with :func:`pool_spawn_cfg` (a :class:`isaaclab.sim.MultiAssetSpawnerCfg`). All instances share one root-state tensor
+of shape (num_instances, 13), and the shape of every instance is recorded in a type index. Per-shape access goes
+through index tensors and masks, while writes and updates stay single batched calls across all shapes.
+
+.. code-block:: python
+
+    cfg = RigidObjectCfg(
+        prim_path="/World/Origin.*/Object", spawn=pool_spawn_cfg([cone_cfg, sphere_cfg, cuboid_cfg])
+    )
+    asset = RigidObject(cfg)
+    sim.reset()
+    pool = RigidObjectPool(asset, ["cone", "sphere", "cuboid"])
+    cones = pool.root_state_w[pool.ids("cone")]
+
+The pool is created once the simulation has started, since a rigid object only knows its instances from then on.
+With ``random_choice=False``, the multi-asset spawner assigns the shapes in turn over the matching prims, so
+instance ``i`` has the type ``i % num_types``. This is the default type assignment of the pool.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+import torch
+
+
+def pool_spawn_cfg(shape_cfgs: Sequence, mass: float = 1.0, rigid_props=None, collision_props=None):
+    """Returns the spawner configuration of a pool that assigns the shapes in turn.
+
+    Args:
+        shape_cfgs: The shape configurations, for instance :class:`isaaclab.sim.ConeCfg` or
+            :class:`isaaclab.sim.CuboidCfg`.
+        mass: The mass of every instance (in kg). Defaults to 1.0.
+        rigid_props: The rigid-body properties of every instance. Defaults to None, in which case the default
+            properties are used.
+        collision_props: The collision properties of every instance. Defaults to None, in which case the default
+            properties are used.
+
+    Returns:
+        The multi-asset spawner configuration (:class:`isaaclab.sim.MultiAssetSpawnerCfg`).
+    """
+    import isaaclab.sim as sim_utils
+
+    return sim_utils.MultiAssetSpawnerCfg(
+        assets_cfg=list(shape_cfgs),
+        random_choice=False,
+        rigid_props=rigid_props or sim_utils.RigidBodyPropertiesCfg(),
+        mass_props=sim_utils.MassPropertiesCfg(mass=mass),
+        collision_props=collision_props or sim_utils.CollisionPropertiesCfg(),
+    )
+
+
+class RigidObjectPool:
+    """Differently shaped rigid objects with one flat state tensor and per-type indices."""
+
+    def __init__(self, asset, type_names: Sequence[str], type_ids: torch.Tensor | None = None):
+        """Initializes the type index of the pool.
+
+        Args:
+            asset: The rigid object (:class:`isaaclab.assets.RigidObject`) that holds all instances.
+            type_names: The name of every shape type.
+            type_ids: The type of every instance. Shape is (num_instances,). Defaults to None, in which case the
+                types are assigned in turn like the multi-asset spawner does.
+
+        Raises:
+            ValueError: When a type id is out of range.
+        """
+        self.asset = asset
+        self.type_names = list(type_names)
+        self.device = asset.device
+        num_instances = asset.num_instances
+        if type_ids is None:
+            type_ids = torch.arange(num_instances, device=self.device) % self.num_types
+        self.type_ids = torch.as_tensor(type_ids, dtype=torch.long, device=self.device)
+        if len(self.type_ids) > 0 and not (0 <= self.type_ids.min() and self.type_ids.max() < self.num_types):
+            raise ValueError(f"The type ids must be in [0, {self.num_types}). Received: {self.type_ids.unique()}.")
+        # masks and index tensors per type, built once
+        types = torch.arange(self.num_types, device=self.device)
+        self.type_masks = self.type_ids.unsqueeze(0) == types.unsqueeze(1)
+        """Mask of the instances of every type. Shape is (num_types, num_instances)."""
+        self._ids = {name: mask.nonzero().squeeze(-1) for name, mask in zip(self.type_names, self.type_masks)}
+        self.counts = self.type_masks.sum(dim=1)
+        """Number of instances of every type. Shape is (num_types,)."""
+
+    @property
+    def num_types(self) -> int:
+        """Number of shape types."""
+        return len(self.type_names)
+
+    @property
+    def num_instances(self) -> int:
+        """Number of instances over all types."""
+        return self.asset.num_instances
+
+    @property
+    def root_state_w(self) -> torch.Tensor:
+        """Root states ``[pos, quat, lin_vel, ang_vel]`` of all instances. Shape is (num_instances, 13)."""
+        return self.asset.data.root_state_w
+
+    def ids(self, type_name: str) -> torch.Tensor:
+        """Returns the instance indices of a type."""
+        return self._ids[type_name]
+
+    def mask(self, type_name: str) -> torch.Tensor:
+        """Returns the mask of the instances of a type. Shape is (num_instances,)."""
+        return self.type_masks[self.type_names.index(type_name)]
+
+    def per_type(self, values: Mapping[str, float | Sequence[float]] | Sequence) -> torch.Tensor:
+        """Expands per-type values to all instances.
+
+        Args:
+            values: The value of every type, by name or in the order of the types. Values can be vectors.
+
+        Returns:
+            The value of every instance. Shape is (num_instances,) or (num_instances, D).
+        """
+        if isinstance(values, Mapping):
+            values = [values[name] for name in self.type_names]
+        table = torch.as_tensor(values, dtype=torch.float, device=self.device)
+        return table[self.type_ids]
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        """Resets the internal buffers of the selected instances of all types."""
+        self.asset.reset(env_ids)
+
+    def write_data_to_sim(self):
+        """Writes the external wrenches of all types."""
+        self.asset.write_data_to_sim()
+
+    def update(self, dt: float):
+        """Updates the buffers of all types."""
+        self.asset.update(dt)
+
+    def write_root_state(self, root_state: torch.Tensor, env_ids: torch.Tensor | None = None):
+        """Writes the root states of the selected instances of any types in one call.
+
+        Args:
+            root_state: The root states. Shape is (len(env_ids), 13).
+            env_ids: The instances. Defaults to None (all instances).
+        """
+        self.asset.write_root_state_to_sim(root_state, env_ids=env_ids)
+
+    def write_root_pose(self, root_pose: torch.Tensor, env_ids: torch.Tensor | None = None):
+        """Writes the root poses ``[pos, quat]`` of the selected instances of any types in one call.
+
+        Args:
+            root_pose: The root poses. Shape is (len(env_ids), 7).
+            env_ids: The instances. Defaults to None (all instances).
+        """
+        self.asset.write_root_pose_to_sim(root_pose, env_ids=env_ids)
+
+    def write_root_state_masked(self, root_state: torch.Tensor, mask: torch.Tensor):
+        """Writes the root states of the instances selected by a mask, for instance a type mask.
+
+        Args:
+            root_state: The root states of all instances; only the masked rows are written. Shape is
+                (num_instances, 13).
+            mask: The instances to write. Shape is (num_instances,).
+        """
+        env_ids = mask.nonzero().squeeze(-1)
+        self.asset.write_root_state_to_sim(root_state[env_ids], env_ids=env_ids)
+
+    def type_root_state(self, type_name: str) -> torch.Tensor:
+        """Returns the root states of the instances of a type. Shape is (count, 13)."""
+        return self.root_state_w[self._ids[type_name]]
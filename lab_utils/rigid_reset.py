@@ -0,0 +1,179 @@
+"""Allocation-free reset of rigid-object root states.
+
+The tutorial loop resets all instances of a rigid object on a fixed schedule by cloning the default root state,
+adding the origins and a random offset, and writing pose and velocity with two calls. Every reset allocates several
+temporaries of size (num_instances, 13).
+
+:class:`RootStateResetter` owns preallocated buffers for the states and random offsets, tracks the episode length
+of every instance, and resets only the instances whose episode is over. All intermediate results are written into
+views of the preallocated buffers.
+
+With a :class:`~lab_utils.snapshot_pool.SnapshotPool`, the resetter also captures the states of instances that came
+to rest and, once the pool holds enough snapshots, resets instances to pre-settled snapshots instead of dropping
+them from a height.
+"""
+
+from __future__ import annotations
+
+import math
+
+import torch
+
+from lab_utils.snapshot_pool import SnapshotPool, settled_mask
+
+
+class RootStateResetter:
+    """Resets the root states of a rigid object to its default state plus a random offset around origins.
+
+    The random offset is sampled like :func:`isaaclab.utils.math.sample_cylinder`: the distance to the axis is
+    uniform in [0, radius] (so the offsets are denser near the axis than a uniform sample of the disk), the angle is
+    uniform and the height is uniform over the height range.
+    """
+
+    def __init__(
+        self,
+        asset,
+        origins: torch.Tensor,
+        radius: float = 0.1,
+        h_range: tuple[float, float] = (0.25, 0.5),
+        max_episode_length: int = 250,
+        snapshot_pool: SnapshotPool | None = None,
+        min_snapshots: int = 1,
+        capture_interval: int = 10,
+    ):
+        """Initializes the resetter.
+
+        Args:
+            asset: The rigid object (:class:`isaaclab.assets.RigidObject`) to reset.
+            origins: The origins of the instances. Shape is (num_instances, 3).
+            radius: The radius of the cylinder to sample the offsets in (in m). Defaults to 0.1.
+            h_range: The height range of the cylinder (in m). Defaults to (0.25, 0.5).
+            max_episode_length: The number of steps after which an instance is reset. Defaults to 250.
+            snapshot_pool: The pool of settled root states (field ``"root_state"``, relative to the origins).
+                Defaults to None, in which case the instances are always reset to the default state plus offset.
+            min_snapshots: The number of snapshots the pool needs before the resets sample from it. Defaults to 1.
+            capture_interval: Capture settled instances into the pool every n steps. Defaults to 10.
+        """
+        self.asset = asset
+        self.radius = radius
+        self.h_range = h_range
+        self.max_episode_length = max_episode_length
+        num_instances = asset.num_instances
+        device = asset.device
+        self.origins = origins.to(device)
+        self.all_ids = torch.arange(num_instances, device=device)
+
+        # episode bookkeeping
+        # note: the episode length starts at the maximum so that all instances are reset on the first step.
+        self.episode_length = torch.full((num_instances,), max_episode_length, dtype=torch.long, device=device)
+        self.reset_mask = torch.ones(num_instances, dtype=torch.bool, device=device)
+
+        # preallocated buffers, used through views of their first rows
+        self._root_state = torch.empty((num_instances, 13), device=device)
+        self._positions = torch.empty((num_instances, 3), device=device)
+        self._radius = torch.empty(num_instances, device=device)
+        self._angle = torch.empty(num_instances, device=device)
+        self._scratch = torch.empty(num_instances, device=device)
+
+        # snapshot capture and restore
+        self.snapshot_pool = snapshot_pool
+        self.min_snapshots = min_snapshots
+        self.capture_interval = capture_interval
+        self._num_pool_resets = torch.zeros((), dtype=torch.long, device=device)
+        self._captured = torch.zeros(num_instances, dtype=torch.bool, device=device)
+        self._num_steps = 0
+
+    @property
+    def num_pool_resets(self) -> int:
+        """The number of instance resets that restored a snapshot."""
+        # note: the count is kept on the device, so reading it waits for the device.
+        return int(self._num_pool_resets)
+
+    """
+    Operations.
+    """
+
+    def step(self) -> torch.Tensor:
+        """Advances the episode length of all instances and updates the reset mask.
+
+        Returns:
+            The reset mask. Shape is (num_instances,).
+        """
+        self.episode_length.add_(1)
+        torch.ge(self.episode_length, self.max_episode_length, out=self.reset_mask)
+        if self.snapshot_pool is not None:
+            self._num_steps += 1
+            if self._num_steps % self.capture_interval == 0:
+                self.capture()
+        return self.reset_mask
+
+    def capture(self) -> int:
+        """Adds the states of the instances that came to rest since their last reset to the snapshot pool.
+
+        Returns:
+            The number of captured snapshots that the pool stored.
+        """
+        root_state_w = self.asset.data.root_state_w
+        mask = settled_mask(root_state_w) & ~self._captured & ~self.reset_mask
+        states = root_state_w.clone()
+        states[:, :3] -= self.origins
+        num_captured = self.snapshot_pool.add({"root_state": states}, mask)
+        self._captured |= mask
+        return num_captured
+
+    def due_env_ids(self) -> torch.Tensor:
+        """Returns the indices of the instances whose episode is over."""
+        return self.reset_mask.nonzero().squeeze(-1)
+
+    def reset(self, env_ids: torch.Tensor | None = None):
+        """Resets the selected instances in the simulation.
+
+        Args:
+            env_ids: The indices of the instances to reset. Defaults to None (all instances).
+        """
+        if env_ids is None:
+            env_ids = self.all_ids
+        num_resets = env_ids.shape[0]
+        if num_resets == 0:
+            return
+        root_state = self._root_state[:num_resets]
+        from_pool = self._sample(root_state, env_ids)
+        self._captured.index_fill_(0, env_ids, from_pool)
+        if from_pool:
+            self._num_pool_resets.add_(num_resets)
+        # write pose and velocity of the selected instances only
+        self.asset.write_root_state_to_sim(root_state, env_ids=env_ids)
+        self.asset.reset(env_ids)
+        # restart the episodes
+        self.episode_length.index_fill_(0, env_ids, 0)
+        self.reset_mask.index_fill_(0, env_ids, False)
+
+    """
+    Internal helpers.
+    """
+
+    def _sample(self, root_state: torch.Tensor, env_ids: torch.Tensor) -> bool:
+        """Samples the new root states of the selected instances into ``root_state``.
+
+        Returns:
+            Whether the states are snapshots of the pool.
+        """
+        num_resets = env_ids.shape[0]
+        positions = self._positions[:num_resets]
+        if self.snapshot_pool is not None and len(self.snapshot_pool) >= self.min_snapshots:
+            # pre-settled snapshots, moved to the origins of the selected instances
+            self.snapshot_pool.sample(num_resets, out={"root_state": root_state})
+            root_state[:, :3].add_(torch.index_select(self.origins, 0, env_ids, out=positions))
+            return True
+        # default state plus origins
+        torch.index_select(self.asset.data.default_root_state, 0, env_ids, out=root_state)
+        torch.index_select(self.origins, 0, env_ids, out=positions)
+        # random offset in the cylinder around the origins
+        radius = self._radius[:num_resets].uniform_(0.0, self.radius)
+        angle = self._angle[:num_resets].uniform_(-math.pi, math.pi)
+        scratch = self._scratch[:num_resets]
+        positions[:, 0].addcmul_(radius, torch.cos(angle, out=scratch))
+        positions[:, 1].addcmul_(radius, torch.sin(angle, out=scratch))
+        positions[:, 2].add_(scratch.uniform_(*self.h_range))
+        root_state[:, :3].add_(positions)
+        return False
@@ -0,0 +1,145 @@
+"""Event terms that draw from the per-environment random streams of :mod:`lab_utils.env_rng`.
+
+The terms are class-based event terms (:class:`isaaclab.managers.ManagerTermBase`), so the event manager creates
+them once and they keep their random streams and their fused ranges:
+
+* :class:`reset_joints_by_offset_fused`: the offsets of several joints, which would otherwise be separate
+  ``reset_joints_by_offset`` terms, drawn with one batched draw and written with one call per reset,
+* :class:`randomize_rigid_body_mass_seeded`: ``randomize_rigid_body_mass`` drawn from the startup stream.
+
+Both terms take a ``seed`` and an ``env_offset`` (the global index of the first environment), so an environment
+receives the same values for any subset of resets and on any worker of a sharded environment.
+
+.. note::
+
+    The module imports Isaac Lab, so it can only be imported after the simulation app is launched.
+"""
+
+from __future__ import annotations
+
+import torch
+
+from isaaclab.managers import EventTermCfg, ManagerTermBase, SceneEntityCfg
+
+from lab_utils.env_rng import RESET_STREAM, STARTUP_STREAM, EnvRandom, UniformRanges
+
+
+class reset_joints_by_offset_fused(ManagerTermBase):
+    """Resets joints to their defaults plus uniform offsets, for several joints with one draw and one write.
+
+    The parameters of the term are:
+
+    * ``asset_cfg``: the articulation,
+    * ``joint_offsets``: the position range and the velocity range of the offset of every joint, by joint name,
+    * ``seed``: the seed of the random streams,
+    * ``env_offset``: the global index of the first environment. Defaults to 0.
+
+    The positions and velocities are clipped to the soft joint limits, like ``reset_joints_by_offset`` does. Joints
+    without an offset keep their state.
+    """
+
+    def __init__(self, cfg: EventTermCfg, env):
+        super().__init__(cfg, env)
+        self.asset = env.scene[cfg.params["asset_cfg"].name]
+        joint_offsets = cfg.params["joint_offsets"]
+        joint_ids, _ = self.asset.find_joints(list(joint_offsets.keys()), preserve_order=True)
+        self.joint_ids = torch.tensor(joint_ids, dtype=torch.long, device=env.device)
+        position_ranges = [position_range for position_range, _ in joint_offsets.values()]
+        velocity_ranges = [velocity_range for _, velocity_range in joint_offsets.values()]
+        self.ranges = UniformRanges(
+            {
+                "position": ([r[0] for r in position_ranges], [r[1] for r in position_ranges]),
+                "velocity": ([r[0] for r in velocity_ranges], [r[1] for r in velocity_ranges]),
+            },
+            device=env.device,
+        )
+        self.rng = EnvRandom(
+            env.num_envs, seed=cfg.params["seed"], device=env.device, env_offset=cfg.params.get("env_offset", 0)
+        )
+
+    def __call__(
+        self,
+        env,
+        env_ids: torch.Tensor | None,
+        asset_cfg: SceneEntityCfg,
+        joint_offsets: dict[str, tuple[tuple[float, float], tuple[float, float]]],
+        seed: int,
+        env_offset: int = 0,
+    ):
+        if env_ids is None:
+            env_ids = torch.arange(env.num_envs, device=env.device)
+        offsets = self.ranges.sample(self.rng, env_ids, stream=RESET_STREAM)
+        # only the listed joints are written, the other joints keep their state
+        data = self.asset.data
+        rows, cols = env_ids.unsqueeze(1), self.joint_ids.unsqueeze(0)
+        joint_pos = data.default_joint_pos[rows, cols] + offsets[:, self.ranges.slices["position"]]
+        joint_vel = data.default_joint_vel[rows, cols] + offsets[:, self.ranges.slices["velocity"]]
+        limits = data.soft_joint_pos_limits[rows, cols]
+        joint_pos = joint_pos.clamp_(limits[..., 0], limits[..., 1])
+        vel_limits = data.soft_joint_vel_limits[rows, cols]
+        joint_vel = joint_vel.clamp_(-vel_limits, vel_limits)
+        self.asset.write_joint_state_to_sim(joint_pos, joint_vel, joint_ids=self.joint_ids, env_ids=env_ids)
+
+
+class randomize_rigid_body_mass_seeded(ManagerTermBase):
+    """Randomizes the masses of bodies with values from the startup stream.
+
+    The parameters of the term are:
+
+    * ``asset_cfg``: the asset and its bodies,
+    * ``mass_distribution_params``: the range of the uniform distribution,
+    * ``operation``: ``"add"``, ``"scale"`` or ``"abs"``, applied to the default masses,
+    * ``seed``: the seed of the random streams,
+    * ``env_offset``: the global index of the first environment. Defaults to 0.
+
+    The inertia tensors are scaled with the masses.
+    """
+
+    def __init__(self, cfg: EventTermCfg, env):
+        super().__init__(cfg, env)
+        if cfg.params["operation"] not in ("add", "scale", "abs"):
+            raise ValueError(f"The operation must be 'add', 'scale' or 'abs'. Received: {cfg.params['operation']}.")
+        asset_cfg: SceneEntityCfg = cfg.params["asset_cfg"]
+        self.asset = env.scene[asset_cfg.name]
+        if isinstance(asset_cfg.body_ids, slice):
+            self.body_ids = torch.arange(self.asset.num_bodies)[asset_cfg.body_ids]
+        else:
+            self.body_ids = torch.tensor(asset_cfg.body_ids, dtype=torch.long)
+        low, high = cfg.params["mass_distribution_params"]
+        num_bodies = len(self.body_ids)
+        self.ranges = UniformRanges({"mass": ([low] * num_bodies, [high] * num_bodies)}, device=env.device)
+        self.rng = EnvRandom(
+            env.num_envs, seed=cfg.params["seed"], device=env.device, env_offset=cfg.params.get("env_offset", 0)
+        )
+
+    def __call__(
+        self,
+        env,
+        env_ids: torch.Tensor | None,
+        asset_cfg: SceneEntityCfg,
+        mass_distribution_params: tuple[float, float],
+        operation: str,
+        seed: int,
+        env_offset: int = 0,
+    ):
+        if env_ids is None:
+            env_ids = torch.arange(env.num_envs, device=env.device)
+        values = self.ranges.sample(self.rng, env_ids, stream=STARTUP_STREAM).cpu()
+        # note: the physics views hold the masses and inertias on the CPU
+        env_ids = env_ids.cpu()
+        rows, cols = env_ids.unsqueeze(1), self.body_ids.unsqueeze(0)
+        default_mass = self.asset.data.default_mass[rows, cols]
+        if operation == "add":
+            new_mass = default_mass + values
+        elif operation == "scale":
+            new_mass = default_mass * values
+        else:
+            new_mass = values
+        new_mass = new_mass.clamp_(min=1e-6)
+        masses = self.asset.root_physx_view.get_masses()
+        masses[rows, cols] = new_mass
+        self.asset.root_physx_view.set_masses(masses, env_ids)
+        inertias = self.asset.root_physx_view.get_inertias()
+        ratios = (new_mass / default_mass).unsqueeze(-1)
+        inertias[rows, cols] = self.asset.data.default_inertia[rows, cols] * ratios
+        self.asset.root_physx_view.set_inertias(inertias, env_ids)
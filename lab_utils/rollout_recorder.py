@@ -0,0 +1,282 @@
+"""Chunked rollout recording into memory-mapped columnar files.
+
+:class:`RolloutRecorder` records per-step tensors of all environments (observations, actions, reset flags, ...)
+without blocking the step loop on disk I/O. Every step is copied into a pinned host staging buffer. Once a chunk of
+steps is full, the chunk is handed to a background writer thread and the loop continues in the second staging
+buffer (double buffering). The writer appends the chunk to one raw file per column and rewrites the index.
+
+A recording is a directory:
+
+* ``index.json``: the number of environments, the columns with their data type and per-environment shape, the
+  written chunks and the total number of steps,
+* ``<column>.bin``: the raw values of the column in C order with shape (num_steps, num_envs, \\*shape).
+
+The index is replaced atomically after every chunk, so a recording that was interrupted stays readable up to the
+last complete chunk. :class:`RolloutReader` memory-maps the column files. Slices of a column are views of the
+mapping (zero-copy), and random minibatches only read the sampled rows from disk.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import queue
+import threading
+
+from lab_utils.launcher import lazy_import
+
+# note: imported on first use, so that the script can parse its arguments before paying for the import
+np = lazy_import("numpy")
+torch = lazy_import("torch")
+
+INDEX_FILE = "index.json"
+"""Name of the index file of a recording."""
+
+FORMAT_VERSION = 1
+"""Version of the recording format."""
+
+
+def _numpy_dtype(dtype: torch.dtype) -> np.dtype:
+    return torch.empty(0, dtype=dtype).numpy().dtype
+
+
+class RolloutRecorder:
+    """Records per-step tensors of all environments into a chunked, memory-mapped columnar recording."""
+
+    def __init__(
+        self,
+        path: str,
+        columns: dict[str, tuple[tuple[int, ...], torch.dtype]],
+        num_envs: int,
+        chunk_size: int = 256,
+        device: str = "cpu",
+    ):
+        """Initializes the recorder and starts the writer thread.
+
+        Args:
+            path: The directory of the recording. It is created if needed; an existing recording is overwritten.
+            columns: The shape per environment and the data type of every column, for instance
+                ``{"obs": ((4,), torch.float32), "reset": ((), torch.bool)}``.
+            num_envs: The number of environments.
+            chunk_size: The number of steps per chunk. Defaults to 256.
+            device: The device of the recorded tensors. Defaults to "cpu".
+
+        Raises:
+            ValueError: When the chunk size is smaller than one.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"The chunk size must be at least 1. Received: {chunk_size}.")
+        self.path = path
+        self.num_envs = num_envs
+        self.chunk_size = chunk_size
+        self.device = torch.device(device)
+        self.columns = {name: (tuple(shape), dtype) for name, (shape, dtype) in columns.items()}
+        self.num_steps = 0
+
+        os.makedirs(path, exist_ok=True)
+        self._files = {name: open(os.path.join(path, f"{name}.bin"), "wb") for name in self.columns}
+        self._chunks: list[dict] = []
+        # two staging buffers per column: the loop fills one while the writer drains the other
+        pin = self.device.type == "cuda"
+        self._staging = [
+            {
+                name: torch.empty((chunk_size, num_envs, *shape), dtype=dtype, pin_memory=pin)
+                for name, (shape, dtype) in self.columns.items()
+            }
+            for _ in range(2)
+        ]
+        self._buffer_id = 0
+        self._step_in_chunk = 0
+        self._free = [threading.Event(), threading.Event()]
+        for event in self._free:
+            event.set()
+        self._error: BaseException | None = None
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="rollout-writer", daemon=True)
+        self._thread.start()
+        self._write_index()
+
+    def __enter__(self) -> RolloutRecorder:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    """
+    Operations.
+    """
+
+    def record(self, **values: torch.Tensor):
+        """Records one step.
+
+        The values are copied to the pinned staging buffer without synchronizing the device. The call only blocks
+        when the writer has not yet drained the other staging buffer.
+
+        Args:
+            values: The value of every column. Shape is (num_envs, \\*shape).
+
+        Raises:
+            KeyError: When a column is missing.
+            RuntimeError: When the writer thread failed.
+        """
+        if self._error is not None:
+            raise RuntimeError("The rollout writer failed.") from self._error
+        staging = self._staging[self._buffer_id]
+        for name in self.columns:
+            staging[name][self._step_in_chunk].copy_(values[name], non_blocking=True)
+        self._step_in_chunk += 1
+        if self._step_in_chunk == self.chunk_size:
+            self._submit()
+
+    def close(self):
+        """Writes the incomplete chunk, stops the writer thread and closes the files."""
+        if not self._thread.is_alive():
+            return
+        if self._step_in_chunk > 0:
+            self._submit()
+        self._queue.put(None)
+        self._thread.join()
+        for file in self._files.values():
+            file.close()
+        if self._error is not None:
+            raise RuntimeError("The rollout writer failed.") from self._error
+
+    """
+    Internal helpers.
+    """
+
+    def _submit(self):
+        """Hands the current staging buffer to the writer and switches to the other one."""
+        event = None
+        if self.device.type == "cuda":
+            event = torch.cuda.Event()
+            event.record()
+        self._free[self._buffer_id].clear()
+        self._queue.put((self._buffer_id, self._step_in_chunk, event))
+        self._buffer_id = 1 - self._buffer_id
+        self._step_in_chunk = 0
+        # back-pressure: the recording must not lose steps, so wait for the writer to drain the next buffer
+        self._free[self._buffer_id].wait()
+
+    def _run(self):
+        """Appends the submitted chunks to the column files until the sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            buffer_id, num_steps, event = item
+            try:
+                if event is not None:
+                    event.synchronize()
+                for name, file in self._files.items():
+                    self._staging[buffer_id][name][:num_steps].numpy().tofile(file)
+                    file.flush()
+                self._chunks.append({"start": self.num_steps, "num_steps": num_steps})
+                self.num_steps += num_steps
+                self._write_index()
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._free[buffer_id].set()
+
+    def _write_index(self):
+        index = {
+            "version": FORMAT_VERSION,
+            "num_envs": self.num_envs,
+            "num_steps": self.num_steps,
+            "chunk_size": self.chunk_size,
+            "columns": {
+                name: {"shape": list(shape), "dtype": str(_numpy_dtype(dtype))}
+                for name, (shape, dtype) in self.columns.items()
+            },
+            "chunks": self._chunks,
+        }
+        tmp_path = os.path.join(self.path, f"{INDEX_FILE}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, os.path.join(self.path, INDEX_FILE))
+
+
+class RolloutReader:
+    """Memory-mapped access to a recording written by :class:`RolloutRecorder`."""
+
+    def __init__(self, path: str):
+        """Opens a recording.
+
+        Args:
+            path: The directory of the recording.
+
+        Raises:
+            ValueError: When the recording has an unsupported format version.
+        """
+        with open(os.path.join(path, INDEX_FILE)) as f:
+            self.index = json.load(f)
+        if self.index["version"] != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported recording format version: {self.index['version']}. Expected: {FORMAT_VERSION}."
+            )
+        self.path = path
+        self.num_envs = self.index["num_envs"]
+        self.num_steps = self.index["num_steps"]
+        self._arrays = {}
+        for name, column in self.index["columns"].items():
+            shape = (self.num_steps, self.num_envs, *column["shape"])
+            if self.num_steps == 0:
+                self._arrays[name] = np.empty(shape, dtype=column["dtype"])
+                continue
+            # note: copy-on-write mapping, so torch can wrap it without a read-only warning. The file is never written.
+            self._arrays[name] = np.memmap(
+                os.path.join(path, f"{name}.bin"), dtype=column["dtype"], mode="c", shape=shape
+            )
+
+    @property
+    def columns(self) -> list[str]:
+        """The names of the recorded columns."""
+        return list(self._arrays.keys())
+
+    def __len__(self) -> int:
+        """Number of recorded transitions (steps times environments)."""
+        return self.num_steps * self.num_envs
+
+    def __getitem__(self, name: str) -> torch.Tensor:
+        """Returns a column as a zero-copy tensor over the mapping. Shape is (num_steps, num_envs, \\*shape)."""
+        return torch.from_numpy(self._arrays[name])
+
+    def sample(
+        self, batch_size: int, columns: list[str] | None = None, generator: torch.Generator | None = None
+    ) -> dict[str, torch.Tensor]:
+        """Samples a minibatch of transitions uniformly over all steps and environments.
+
+        Only the sampled rows are read from the files.
+
+        Args:
+            batch_size: The number of transitions.
+            columns: The columns to return. Defaults to None (all columns).
+            generator: The random number generator. Defaults to None.
+
+        Returns:
+            The sampled values per column. Shape is (batch_size, \\*shape).
+        """
+        flat = torch.randint(len(self), (batch_size,), generator=generator)
+        # sorted indices turn the gathers into mostly forward reads of the files
+        flat = flat.sort().values.numpy()
+        steps, envs = flat // self.num_envs, flat % self.num_envs
+        names = self.columns if columns is None else columns
+        return {name: torch.from_numpy(self._arrays[name][steps, envs]) for name in names}
+
+    def iter_minibatches(self, batch_size: int, generator: torch.Generator | None = None):
+        """Iterates over all transitions once in random order, in minibatches.
+
+        Args:
+            batch_size: The number of transitions per minibatch. The last minibatch may be smaller.
+            generator: The random number generator. Defaults to None.
+
+        Yields:
+            The values per column of every minibatch. Shape is (batch_size, \\*shape).
+        """
+        order = torch.randperm(len(self), generator=generator).numpy()
+        for batch_id in range(math.ceil(len(self) / batch_size)):
+            flat = np.sort(order[batch_id * batch_size : (batch_id + 1) * batch_size])
+            steps, envs = flat // self.num_envs, flat % self.num_envs
+            yield {name: torch.from_numpy(array[steps, envs]) for name, array in self._arrays.items()}
@@ -0,0 +1,225 @@
+"""Fixed-length, throughput-reporting simulation loop for the entry-point scripts.
+
+By default, the scripts step the simulation until the app is closed and render on every step. With the arguments
+added by :func:`add_runner_args`, :class:`Runner` instead runs a fixed number of steps after a warm-up, renders only
+every n-th physics step and reports the setup time and the throughput:
+
+* physics steps/s: simulation steps per second of wall time,
+* env-steps/s: environment transitions per second, summed over all environments. An environment step spans
+  ``decimation`` physics steps (4 for the cartpole environment).
+
+.. code-block:: bash
+
+    ./isaaclab.sh -p interacting_with_a_rigid_object.py --headless --num_steps 2000 --warmup_steps 200
+    ./isaaclab.sh -p creating_a_manager_based_environment.py --headless --num_steps 500 --benchmark_json out.json
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+from lab_utils.launcher import lazy_import
+
+# note: imported on first use, so that the script can parse its arguments before paying for the import
+torch = lazy_import("torch")
+
+
+def add_runner_args(parser: argparse.ArgumentParser):
+    """Adds the runner arguments to a parser.
+
+    Args:
+        parser: The parser to extend.
+    """
+    group = parser.add_argument_group("runner", description="Arguments for the benchmark mode of the loop.")
+    group.add_argument(
+        "--num_steps",
+        type=int,
+        default=None,
+        help="Number of measured loop steps after the warm-up. Defaults to running until the app is closed.",
+    )
+    group.add_argument("--warmup_steps", type=int, default=0, help="Number of unmeasured loop steps at the start.")
+    group.add_argument("--render_interval", type=int, default=1, help="Render every n-th physics step.")
+    group.add_argument("--benchmark_json", type=str, default=None, help="Write the throughput report to this file.")
+
+
+def validate_runner_args(args: argparse.Namespace):
+    """Checks the arguments added by :func:`add_runner_args` without creating a runner.
+
+    Args:
+        args: The parsed arguments.
+
+    Raises:
+        ValueError: When a number of steps is negative or the render interval is smaller than one.
+    """
+    if (args.num_steps is not None and args.num_steps < 0) or args.warmup_steps < 0:
+        raise ValueError(f"The numbers of steps must not be negative. Received: {args.num_steps}, {args.warmup_steps}.")
+    if args.render_interval < 1:
+        raise ValueError(f"The render interval must be at least 1. Received: {args.render_interval}.")
+
+
+class Runner:
+    """Drives a simulation loop for a fixed number of steps and measures its throughput.
+
+    The loop calls :meth:`running` once per iteration:
+
+    .. code-block:: python
+
+        runner = Runner.from_args(args_cli, simulation_app, device=sim.device)
+        # ... setup ...
+        while runner.running():
+            sim.step(render=runner.render)
+        runner.report()
+
+    The setup time spans from the construction of the runner to the first call of :meth:`running`.
+    """
+
+    def __init__(
+        self,
+        simulation_app,
+        num_steps: int | None = None,
+        warmup_steps: int = 0,
+        render_interval: int = 1,
+        decimation: int = 1,
+        num_envs: int = 1,
+        device: str = "cpu",
+        json_path: str | None = None,
+    ):
+        """Initializes the runner and starts the setup timer.
+
+        Args:
+            simulation_app: The simulation app, whose ``is_running()`` ends the loop early.
+            num_steps: The number of measured loop iterations. Defaults to None (until the app is closed).
+            warmup_steps: The number of loop iterations before the measurement starts. Defaults to 0.
+            render_interval: Render every n-th physics step. Defaults to 1.
+            decimation: The number of physics steps per loop iteration. Defaults to 1.
+            num_envs: The number of environments (or instances) advanced per loop iteration. Defaults to 1.
+            device: The simulation device, synchronized at the measurement boundaries. Defaults to "cpu".
+            json_path: The file :meth:`report` writes the summary to. Defaults to None (print only).
+
+        Raises:
+            ValueError: When the render interval or the decimation is smaller than one.
+        """
+        if render_interval < 1 or decimation < 1:
+            raise ValueError(
+                f"Render interval and decimation must be at least 1. Received: {render_interval}, {decimation}."
+            )
+        self.simulation_app = simulation_app
+        self.num_steps = num_steps
+        self.warmup_steps = warmup_steps
+        self.render_interval = render_interval
+        self.decimation = decimation
+        self.num_envs = num_envs
+        self.device = torch.device(device)
+        self.json_path = json_path
+        # the loop iteration in progress, or the last one after the loop ended (-1 before the first iteration)
+        self.iteration = -1
+        self.setup_time: float | None = None
+        self._created = time.perf_counter()
+        self._start: float | None = None
+        self._end: float | None = None
+
+    @classmethod
+    def from_args(
+        cls, args: argparse.Namespace, simulation_app, decimation: int = 1, num_envs: int = 1, device: str = "cpu"
+    ) -> Runner:
+        """Creates a runner from the arguments added by :func:`add_runner_args`.
+
+        Args:
+            args: The parsed arguments.
+            simulation_app: The simulation app.
+            decimation: The number of physics steps per loop iteration. Defaults to 1.
+            num_envs: The number of environments advanced per loop iteration. Defaults to 1.
+            device: The simulation device. Defaults to "cpu".
+        """
+        return cls(
+            simulation_app,
+            num_steps=args.num_steps,
+            warmup_steps=args.warmup_steps,
+            render_interval=args.render_interval,
+            decimation=decimation,
+            num_envs=num_envs,
+            device=device,
+            json_path=args.benchmark_json,
+        )
+
+    """
+    Properties.
+    """
+
+    @property
+    def render(self) -> bool:
+        """Whether the physics step of the current iteration should render.
+
+        For loops with a decimation, the environment renders on its own according to ``sim.render_interval``.
+        """
+        return (self.iteration * self.decimation) % self.render_interval == 0
+
+    @property
+    def measured_steps(self) -> int:
+        """The number of measured loop iterations that were started so far."""
+        return max(self.iteration + 1 - self.warmup_steps, 0)
+
+    """
+    Operations.
+    """
+
+    def running(self) -> bool:
+        """Returns whether the next loop iteration should run, and advances to it if so.
+
+        The iteration only advances when the loop runs, so :attr:`iteration` is the last iteration that ran once the
+        loop has ended.
+        """
+        now = time.perf_counter()
+        if self.iteration < 0 and self.setup_time is None:
+            self.setup_time = now - self._created
+        done = self.num_steps is not None and self.iteration + 1 >= self.warmup_steps + self.num_steps
+        if done or not self.simulation_app.is_running():
+            if self._end is None and self._start is not None:
+                self._synchronize()
+                self._end = time.perf_counter()
+            return False
+        self.iteration += 1
+        if self.iteration == self.warmup_steps and self._start is None:
+            self._synchronize()
+            self._start = time.perf_counter()
+        return True
+
+    def summary(self) -> dict[str, float]:
+        """Returns the setup time and throughput of the measured iterations."""
+        result = {
+            "setup_time_s": self.setup_time if self.setup_time is not None else float("nan"),
+            "warmup_steps": self.warmup_steps,
+            "measured_steps": self.measured_steps,
+            "decimation": self.decimation,
+            "num_envs": self.num_envs,
+            "render_interval": self.render_interval,
+        }
+        end = self._end if self._end is not None else time.perf_counter()
+        elapsed = end - self._start if self._start is not None else 0.0
+        result["elapsed_s"] = elapsed
+        if elapsed > 0.0:
+            result["loop_steps_per_s"] = self.measured_steps / elapsed
+            result["physics_steps_per_s"] = self.measured_steps * self.decimation / elapsed
+            result["env_steps_per_s"] = self.measured_steps * self.num_envs / elapsed
+        return result
+
+    def report(self):
+        """Prints the summary and writes it to :attr:`json_path` if set."""
+        result = self.summary()
+        print("[INFO]: Runner summary:")
+        for key, value in result.items():
+            print(f"\t{key:<20}: {value:.3f}" if isinstance(value, float) else f"\t{key:<20}: {value}")
+        if self.json_path is not None:
+            with open(self.json_path, "w") as f:
+                json.dump(result, f, indent=2)
+
+    """
+    Internal helpers.
+    """
+
+    def _synchronize(self):
+        if self.device.type == "cuda":
+            torch.cuda.synchronize(self.device)
@@ -0,0 +1,402 @@
+"""Declarative scene files with batched spawning of identical objects.
+
+A scene file (TOML or JSON) describes the ground plane, the lights, reusable object templates and the objects:
+
+.. code-block:: toml
+
+    ground = true
+
+    [[lights]]
+    type = "distant"
+    intensity = 3000.0
+    color = [0.75, 0.75, 0.75]
+    translation = [1.0, 0.0, 10.0]
+
+    [templates.brick]
+    shape = "cuboid"
+    size = [0.4, 0.8, 0.2]
+    color = [0.0, 2.0, 0.0]
+
+    [[objects]]
+    name = "right_cube"
+    template = "brick"
+    pos = [0.0, 1.4, 1.9]
+
+    [[objects]]
+    name = "cubes"
+    template = "brick"
+    positions = [[1.0, 0.0, 1.0], [2.0, 0.0, 1.0]]
+
+:func:`load_scene` parses and validates a file once and compiles it into a :class:`SceneDescription` in which the
+object instances are grouped by template. The compiled scene is cached per file (path, size and modification time),
+so loading the same file again skips the parsing.
+
+:func:`spawn_scene` then creates one :class:`isaaclab.assets.RigidObject` per group instead of one per object: every
+instance gets a parent Xform ``{root}/{group}/inst_{i}`` at its pose, and the template is spawned once under the
+regex ``{root}/{group}/inst_.*/body`` of all bodies. The parents are authored in one batch of layer edits and the
+spawner clones the first body to the other parents, so a group of N instances costs one configuration and one spawn
+call, and it is simulated through a single physics view.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+
+SHAPES = {
+    "cone": ("radius", "height"),
+    "sphere": ("radius",),
+    "cuboid": ("size",),
+    "cylinder": ("radius", "height"),
+    "capsule": ("radius", "height"),
+}
+"""Supported template shapes and their required parameters."""
+
+TEMPLATE_DEFAULTS = {
+    "mass": 1.0,
+    "color": (0.5, 0.5, 0.5),
+    "metallic": 0.2,
+    "collision": True,
+}
+"""Optional template parameters and their default values. Every template is spawned as a rigid body."""
+
+LIGHT_TYPES = ("distant", "dome")
+"""Supported light types."""
+
+_cache: dict[str, tuple[tuple[int, int], SceneDescription]] = {}
+
+
+@dataclass
+class SpawnGroup:
+    """Object instances that share one template and are spawned together."""
+
+    template_name: str
+    """Name of the template."""
+
+    template: dict
+    """Validated template parameters, including the defaults."""
+
+    instance_names: list[str] = field(default_factory=list)
+    """Name of every instance. Objects with several positions have the instances ``<name>_<i>``."""
+
+    positions: list[tuple[float, float, float]] = field(default_factory=list)
+    """Position of every instance in the world frame."""
+
+    orientations: list[tuple[float, float, float, float]] = field(default_factory=list)
+    """Orientation (w, x, y, z) of every instance in the world frame."""
+
+    def __len__(self) -> int:
+        """Number of instances."""
+        return len(self.instance_names)
+
+
+@dataclass
+class SceneDescription:
+    """Validated scene file with the objects grouped by template."""
+
+    path: str
+    """Path of the scene file."""
+
+    ground: bool
+    """Whether to spawn a ground plane."""
+
+    lights: list[dict]
+    """Light parameters."""
+
+    groups: dict[str, SpawnGroup]
+    """Spawn groups by template name."""
+
+    @property
+    def num_objects(self) -> int:
+        """Number of object instances."""
+        return sum(len(group) for group in self.groups.values())
+
+
+def _read(path: str) -> dict:
+    """Reads a TOML or JSON file into a dictionary."""
+    if path.endswith(".json"):
+        with open(path) as f:
+            return json.load(f)
+    if not path.endswith(".toml"):
+        raise ValueError(f"Unsupported scene file extension: '{path}'. Expected '.toml' or '.json'.")
+    try:
+        import tomllib
+    except ModuleNotFoundError:
+        # note: the standard library only parses TOML from Python 3.11 on.
+        import tomli as tomllib
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def _check_keys(where: str, values: dict, allowed: set[str]):
+    unknown = set(values) - allowed
+    if unknown:
+        raise ValueError(f"Unknown keys in {where}: {sorted(unknown)}. Expected some of: {sorted(allowed)}.")
+
+
+def _is_number(value) -> bool:
+    # note: bool is a subclass of int, but true and false are not numbers in a scene file
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _vector(where: str, value, length: int, positive: bool = False) -> tuple[float, ...]:
+    if (
+        not isinstance(value, (list, tuple))
+        or len(value) != length
+        or not all(_is_number(v) and (v > 0 or not positive) for v in value)
+    ):
+        kind = "positive numbers" if positive else "numbers"
+        raise ValueError(f"Expected {length} {kind} in {where}. Received: {value}.")
+    return tuple(float(v) for v in value)
+
+
+def _number(where: str, value, low: float = 0.0, high: float = float("inf"), include_low: bool = False) -> float:
+    in_range = _is_number(value) and (value >= low if include_low else value > low) and value <= high
+    if not in_range:
+        if high == float("inf"):
+            kind = f"a number {'>=' if include_low else '>'} {low}"
+        else:
+            kind = f"a number in {'[' if include_low else '('}{low}, {high}]"
+        raise ValueError(f"Expected {kind} in {where}. Received: {value!r}.")
+    return float(value)
+
+
+def _flag(where: str, value) -> bool:
+    if not isinstance(value, bool):
+        raise ValueError(f"Expected true or false in {where}. Received: {value!r}.")
+    return value
+
+
+def compile_scene(data: dict, path: str = "<memory>") -> SceneDescription:
+    """Validates the contents of a scene file and groups the objects by template.
+
+    Args:
+        data: The parsed scene file.
+        path: The path of the scene file, for the error messages. Defaults to "<memory>".
+
+    Returns:
+        The compiled scene.
+
+    Raises:
+        ValueError: When the scene file is invalid.
+    """
+    _check_keys(path, data, {"ground", "lights", "templates", "objects"})
+
+    lights = []
+    for light_id, light in enumerate(data.get("lights", [])):
+        where = f"{path}: lights[{light_id}]"
+        _check_keys(where, light, {"type", "intensity", "color", "translation"})
+        if light.get("type") not in LIGHT_TYPES:
+            raise ValueError(f"Unknown light type in {where}: '{light.get('type')}'. Expected one of: {LIGHT_TYPES}.")
+        lights.append(
+            {
+                "type": light["type"],
+                "intensity": _number(f"{where}.intensity", light.get("intensity", 1000.0), include_low=True),
+                "color": _vector(f"{where}.color", light.get("color", (1.0, 1.0, 1.0)), 3),
+                "translation": _vector(f"{where}.translation", light.get("translation", (0.0, 0.0, 0.0)), 3),
+            }
+        )
+
+    templates = {}
+    for name, template in data.get("templates", {}).items():
+        where = f"{path}: templates.{name}"
+        # note: the template name becomes part of the prim paths
+        if not name.isidentifier():
+            raise ValueError(f"Template names must be valid identifiers. Received: '{name}' in {path}.")
+        shape = template.get("shape")
+        if shape not in SHAPES:
+            raise ValueError(f"Unknown shape in {where}: '{shape}'. Expected one of: {tuple(SHAPES)}.")
+        _check_keys(where, template, {"shape", *SHAPES[shape], *TEMPLATE_DEFAULTS})
+        missing = [key for key in SHAPES[shape] if key not in template]
+        if missing:
+            raise ValueError(f"Missing parameters of the {shape} in {where}: {missing}.")
+        resolved = {**TEMPLATE_DEFAULTS, **template}
+        for key in SHAPES[shape]:
+            if key == "size":
+                resolved[key] = _vector(f"{where}.size", resolved[key], 3, positive=True)
+            else:
+                resolved[key] = _number(f"{where}.{key}", resolved[key])
+        resolved["mass"] = _number(f"{where}.mass", resolved["mass"])
+        resolved["metallic"] = _number(f"{where}.metallic", resolved["metallic"], high=1.0, include_low=True)
+        resolved["collision"] = _flag(f"{where}.collision", resolved["collision"])
+        resolved["color"] = _vector(f"{where}.color", resolved["color"], 3)
+        templates[name] = resolved
+
+    groups: dict[str, SpawnGroup] = {}
+    names = set()
+    for object_id, obj in enumerate(data.get("objects", [])):
+        where = f"{path}: objects[{object_id}]"
+        _check_keys(where, obj, {"name", "template", "pos", "positions", "rot"})
+        name, template_name = obj.get("name"), obj.get("template")
+        if not name:
+            raise ValueError(f"Missing object name in {where}.")
+        if template_name not in templates:
+            raise ValueError(f"Unknown template in {where}: '{template_name}'. Expected one of: {list(templates)}.")
+        if ("pos" in obj) == ("positions" in obj):
+            raise ValueError(f"Expected either 'pos' or 'positions' in {where}.")
+        if "pos" in obj:
+            instances = [(name, _vector(f"{where}.pos", obj["pos"], 3))]
+        else:
+            if not isinstance(obj["positions"], list) or not obj["positions"]:
+                raise ValueError(f"Expected a non-empty list of positions in {where}. Received: {obj['positions']}.")
+            instances = [
+                (f"{name}_{i}", _vector(f"{where}.positions[{i}]", pos, 3)) for i, pos in enumerate(obj["positions"])
+            ]
+        rot = _vector(f"{where}.rot", obj.get("rot", (1.0, 0.0, 0.0, 0.0)), 4)
+        group = groups.setdefault(template_name, SpawnGroup(template_name, templates[template_name]))
+        for instance_name, pos in instances:
+            if instance_name in names:
+                raise ValueError(f"Duplicate object name in {where}: '{instance_name}'.")
+            names.add(instance_name)
+            group.instance_names.append(instance_name)
+            group.positions.append(pos)
+            group.orientations.append(rot)
+
+    ground = _flag(f"{path}: ground", data.get("ground", True))
+    return SceneDescription(path=path, ground=ground, lights=lights, groups=groups)
+
+
+def load_scene(path: str) -> SceneDescription:
+    """Loads a scene file, using the compiled scene of an earlier call when the file has not changed.
+
+    Args:
+        path: The path of the TOML or JSON scene file.
+
+    Returns:
+        The compiled scene. It is shared between calls and must not be modified.
+
+    Raises:
+        ValueError: When the scene file is invalid.
+    """
+    path = os.path.abspath(os.path.expanduser(path))
+    stat = os.stat(path)
+    stamp = (stat.st_size, stat.st_mtime_ns)
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    scene = compile_scene(_read(path), path)
+    _cache[path] = (stamp, scene)
+    return scene
+
+
+def template_spawn_cfg(template: dict):
+    """Builds the shape configuration of a template."""
+    import isaaclab.sim as sim_utils
+
+    shape_classes = {
+        "cone": sim_utils.ConeCfg,
+        "sphere": sim_utils.SphereCfg,
+        "cuboid": sim_utils.CuboidCfg,
+        "cylinder": sim_utils.CylinderCfg,
+        "capsule": sim_utils.CapsuleCfg,
+    }
+    shape = template["shape"]
+    return shape_classes[shape](
+        **{key: template[key] for key in SHAPES[shape]},
+        rigid_props=sim_utils.RigidBodyPropertiesCfg(),
+        mass_props=sim_utils.MassPropertiesCfg(mass=template["mass"]),
+        collision_props=sim_utils.CollisionPropertiesCfg() if template["collision"] else None,
+        visual_material=sim_utils.PreviewSurfaceCfg(diffuse_color=template["color"], metallic=template["metallic"]),
+    )
+
+
+def group_prim_paths(scene: SceneDescription, root: str = "/World/Scene") -> dict[str, list[str]]:
+    """Returns the prim paths of the bodies of every group, in the order of their instances.
+
+    Args:
+        scene: The compiled scene.
+        root: The prim path under which the objects are spawned. Defaults to "/World/Scene".
+    """
+    paths = {}
+    for name, group in scene.groups.items():
+        # note: zero-padded indices keep the sorted prim paths (and so the physics view) in instance order.
+        width = len(str(len(group) - 1))
+        paths[name] = [f"{root}/{name}/inst_{i:0{width}d}/body" for i in range(len(group))]
+    return paths
+
+
+def _create_parents(group_path: str, prim_paths: list[str], positions: list[tuple], orientations: list[tuple]):
+    """Authors the Xform of a group and the parent Xforms of its instances in one batch of layer edits."""
+    from pxr import Gf, Sdf, Vt
+
+    import isaacsim.core.utils.stage as stage_utils
+
+    layer = stage_utils.get_current_stage().GetEditTarget().GetLayer()
+    op_order = Vt.TokenArray(["xformOp:translate", "xformOp:orient"])
+    # note: the change block defers the change notifications until all prims are authored.
+    with Sdf.ChangeBlock():
+        group_spec = Sdf.CreatePrimInLayer(layer, group_path)
+        group_spec.specifier = Sdf.SpecifierDef
+        group_spec.typeName = "Xform"
+        for prim_path, pos, rot in zip(prim_paths, positions, orientations):
+            spec = Sdf.CreatePrimInLayer(layer, prim_path)
+            spec.specifier = Sdf.SpecifierDef
+            spec.typeName = "Xform"
+            Sdf.AttributeSpec(spec, "xformOp:translate", Sdf.ValueTypeNames.Double3).default = Gf.Vec3d(*pos)
+            Sdf.AttributeSpec(spec, "xformOp:orient", Sdf.ValueTypeNames.Quatd).default = Gf.Quatd(*rot)
+            order = Sdf.AttributeSpec(spec, "xformOpOrder", Sdf.ValueTypeNames.TokenArray, Sdf.VariabilityUniform)
+            order.default = op_order
+
+
+def spawn_scene(scene: SceneDescription, root: str = "/World/Scene") -> dict:
+    """Spawns a compiled scene with one rigid object per group.
+
+    Args:
+        scene: The compiled scene, see :func:`load_scene`.
+        root: The prim path under which the objects are spawned. Defaults to "/World/Scene".
+
+    Returns:
+        The rigid objects (:class:`isaaclab.assets.RigidObject`) by group (template) name. The instances of a group
+        are in the order of :attr:`SpawnGroup.instance_names`.
+    """
+    import isaaclab.sim as sim_utils
+    from isaaclab.assets import RigidObject, RigidObjectCfg
+
+    if scene.ground:
+        cfg_ground = sim_utils.GroundPlaneCfg()
+        cfg_ground.func("/World/defaultGroundPlane", cfg_ground)
+    light_classes = {"distant": sim_utils.DistantLightCfg, "dome": sim_utils.DomeLightCfg}
+    for light_id, light in enumerate(scene.lights):
+        cfg_light = light_classes[light["type"]](intensity=light["intensity"], color=light["color"])
+        cfg_light.func(f"{root}/Light{light_id}", cfg_light, translation=light["translation"])
+
+    entities = {}
+    for name, prim_paths in group_prim_paths(scene, root).items():
+        group = scene.groups[name]
+        # one parent Xform per instance carries its pose; the body is spawned once and cloned to all parents
+        parent_paths = [prim_path.rsplit("/", 1)[0] for prim_path in prim_paths]
+        _create_parents(f"{root}/{name}", parent_paths, group.positions, group.orientations)
+        cfg = RigidObjectCfg(
+            prim_path=f"{root}/{name}/inst_.*/body",
+            spawn=template_spawn_cfg(group.template),
+            init_state=RigidObjectCfg.InitialStateCfg(),
+        )
+        entities[name] = RigidObject(cfg=cfg)
+    return entities
+
+
+def instance_cfgs(scene: SceneDescription, entities: dict, root: str = "/World/Scene") -> dict:
+    """Returns one rigid-object configuration per instance with its own prim path and initial pose.
+
+    The configurations are not spawned. They describe the instances for tools that work per body, for instance
+    :func:`lab_utils.ccd_planner.plan_ccd`.
+
+    Args:
+        scene: The compiled scene.
+        entities: The rigid objects by group name, see :func:`spawn_scene`.
+        root: The prim path under which the objects were spawned. Defaults to "/World/Scene".
+
+    Returns:
+        The configurations (:class:`isaaclab.assets.RigidObjectCfg`) by instance name.
+    """
+    cfgs = {}
+    for name, prim_paths in group_prim_paths(scene, root).items():
+        group = scene.groups[name]
+        group_cfg = entities[name].cfg
+        for instance_name, prim_path, pos, rot in zip(
+            group.instance_names, prim_paths, group.positions, group.orientations
+        ):
+            init_state = group_cfg.init_state.replace(pos=pos, rot=rot)
+            cfgs[instance_name] = group_cfg.replace(prim_path=prim_path, init_state=init_state)
+    return cfgs
@@ -0,0 +1,285 @@
+"""Vectorized environment sharded across worker processes.
+
+A single :class:`isaaclab.envs.ManagerBasedEnv` runs its managers, event terms and action processing on one Python
+thread. :class:`ShardedVecEnv` splits a total number of environments into slices, one per worker process. Each
+worker owns one environment with its slice and, for Isaac Lab environments, its own simulation app.
+
+Actions and observations are exchanged through shared-memory tensors: the caller writes the actions of all
+environments into one shared tensor, every worker reads its rows, steps its environment and writes its rows of the
+shared observation tensor. The pipes to the workers only carry short commands, so no tensor data is pickled per step.
+
+.. code-block:: python
+
+    env = ShardedVecEnv(
+        "lab_utils.cartpole_env_cfg:make_cartpole_env", num_envs=4096, num_workers=4, app_kwargs={"headless": True}
+    )
+    obs = env.reset()
+    for _ in range(1000):
+        obs = env.step(torch.randn(env.num_envs, env.action_dim))
+    env.close()
+
+The workers are started with the ``spawn`` method, so the environment factory must be importable from a module.
+Factories of Isaac Lab environments are passed as ``"module:function"`` strings: they are only imported by the
+workers after their app is launched.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import traceback
+from collections.abc import Callable
+
+import torch
+import torch.multiprocessing as mp
+
+
+def shard_sizes(num_envs: int, num_workers: int) -> list[int]:
+    """Splits a number of environments into nearly equal slices.
+
+    Args:
+        num_envs: The total number of environments.
+        num_workers: The number of slices.
+
+    Returns:
+        The number of environments per slice. The first ``num_envs % num_workers`` slices hold one more.
+    """
+    return [num_envs // num_workers + (worker_id < num_envs % num_workers) for worker_id in range(num_workers)]
+
+
+def _observation(output, obs_group: str | None) -> torch.Tensor:
+    """Extracts the observation tensor from the output of ``reset()`` or ``step()``."""
+    # note: environments return a tuple whose first entry is the observation (dictionary of groups).
+    obs = output[0] if isinstance(output, tuple) else output
+    if isinstance(obs, dict):
+        obs = obs[obs_group]
+    return obs.reshape(obs.shape[0], -1)
+
+
+def _resolve(env_factory: Callable | str) -> Callable:
+    """Imports a factory given as ``"module:function"``."""
+    if not isinstance(env_factory, str):
+        return env_factory
+    module_name, _, function_name = env_factory.partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def _worker(
+    worker_id: int,
+    conn,
+    env_factory: Callable | str,
+    factory_kwargs: dict,
+    num_envs: int,
+    obs_group: str | None,
+    app_kwargs: dict | None,
+    num_threads: int | None,
+):
+    """Runs one environment slice and serves the commands of the parent process."""
+    try:
+        if num_threads is not None:
+            torch.set_num_threads(num_threads)
+        simulation_app = None
+        if app_kwargs is not None:
+            # every worker owns its simulation app; it must be launched before anything imports Isaac Lab modules
+            from isaaclab.app import AppLauncher
+
+            simulation_app = AppLauncher(**app_kwargs).app
+        env = _resolve(env_factory)(num_envs, worker_id, **factory_kwargs)
+        with torch.inference_mode():
+            obs = _observation(env.reset(), obs_group)
+        action_dim = env.action_manager.total_action_dim if hasattr(env, "action_manager") else env.action_dim
+        conn.send(("ready", obs.shape[1], action_dim))
+        # the shared buffers, restricted to the rows of this worker
+        _, actions, observations = conn.recv()
+    except Exception:
+        conn.send(("error", traceback.format_exc()))
+        return
+
+    while True:
+        command = conn.recv()
+        try:
+            if command == "close":
+                env.close()
+                if simulation_app is not None:
+                    simulation_app.close()
+                conn.send(("ok",))
+                return
+            with torch.inference_mode():
+                if command == "step":
+                    output = env.step(actions.to(env.device, non_blocking=True))
+                elif command == "reset":
+                    output = env.reset()
+                else:
+                    raise ValueError(f"Unknown command: '{command}'.")
+                observations.copy_(_observation(output, obs_group))
+            conn.send(("ok",))
+        except Exception:
+            conn.send(("error", traceback.format_exc()))
+
+
+class ShardedVecEnv:
+    """Batched ``reset()``/``step(actions)`` interface over environments sharded across worker processes."""
+
+    def __init__(
+        self,
+        env_factory: Callable | str,
+        num_envs: int,
+        num_workers: int,
+        factory_kwargs: dict | None = None,
+        obs_group: str | None = "policy",
+        app_kwargs: dict | None = None,
+        threads_per_worker: int | None = None,
+    ):
+        """Initializes the workers and the shared buffers.
+
+        Args:
+            env_factory: Called as ``env_factory(num_envs, worker_id, **factory_kwargs)`` in every worker, or its
+                ``"module:function"`` import path. Returns an environment with ``reset()``, ``step(actions)`` and
+                ``close()`` and either an ``action_manager`` or an ``action_dim``.
+            num_envs: The total number of environments.
+            num_workers: The number of worker processes.
+            factory_kwargs: Additional keyword arguments of the factory. Defaults to None.
+            obs_group: The observation group to share when the environment returns a dictionary. Defaults to
+                "policy".
+            app_kwargs: The keyword arguments of :class:`isaaclab.app.AppLauncher` in every worker. Defaults to None,
+                in which case no app is launched.
+            threads_per_worker: The number of torch threads per worker. Defaults to None, in which case the CPU
+                cores are divided evenly.
+
+        Raises:
+            ValueError: When there are fewer environments than workers.
+            RuntimeError: When a worker fails to create its environment.
+        """
+        if num_workers < 1 or num_envs < num_workers:
+            raise ValueError(
+                f"Expected at least one worker and one environment per worker. Received: {num_envs} environments"
+                f" for {num_workers} workers."
+            )
+        if threads_per_worker is None:
+            threads_per_worker = max(1, (os.cpu_count() or 1) // num_workers)
+        self.num_envs = num_envs
+        self.num_workers = num_workers
+        self.sizes = shard_sizes(num_envs, num_workers)
+
+        context = mp.get_context("spawn")
+        self._conns = []
+        self._processes = []
+        for worker_id, size in enumerate(self.sizes):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=_worker,
+                args=(
+                    worker_id,
+                    child_conn,
+                    env_factory,
+                    factory_kwargs or {},
+                    size,
+                    obs_group,
+                    app_kwargs,
+                    threads_per_worker,
+                ),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._conns.append(parent_conn)
+            self._processes.append(process)
+
+        # the workers report the sizes of their observations and actions once their environment exists
+        try:
+            replies = self._receive_all()
+        except RuntimeError:
+            self.close()
+            raise
+        dims = {reply[1:] for reply in replies}
+        if len(dims) != 1:
+            self.close()
+            raise RuntimeError(f"The workers report different observation and action sizes: {sorted(dims)}.")
+        self.obs_dim, self.action_dim = dims.pop()
+
+        # shared buffers; the tensors are sent once, afterwards only the commands travel through the pipes
+        self.actions = torch.zeros(num_envs, self.action_dim).share_memory_()
+        self._observations = torch.zeros(num_envs, self.obs_dim).share_memory_()
+        start = 0
+        for conn, size in zip(self._conns, self.sizes):
+            conn.send(("buffers", self.actions[start : start + size], self._observations[start : start + size]))
+            start += size
+
+    def __enter__(self) -> ShardedVecEnv:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    """
+    Operations.
+    """
+
+    def reset(self) -> torch.Tensor:
+        """Resets all environments.
+
+        Returns:
+            The observations. Shape is (num_envs, obs_dim). The tensor is overwritten by the next call.
+        """
+        return self._broadcast("reset")
+
+    def step(self, actions: torch.Tensor | None = None) -> torch.Tensor:
+        """Steps all environments.
+
+        Args:
+            actions: The actions of all environments. Shape is (num_envs, action_dim). Defaults to None, in which
+                case the caller has already written them into :attr:`actions`.
+
+        Returns:
+            The observations. Shape is (num_envs, obs_dim). The tensor is overwritten by the next call.
+        """
+        if actions is not None:
+            self.actions.copy_(actions)
+        return self._broadcast("step")
+
+    def close(self):
+        """Closes the environments and joins the workers."""
+        for conn, process in zip(self._conns, self._processes):
+            if process.is_alive():
+                try:
+                    conn.send("close")
+                    conn.recv()
+                except (BrokenPipeError, EOFError):
+                    pass
+            process.join(timeout=30)
+            if process.is_alive():
+                process.terminate()
+        self._conns.clear()
+        self._processes.clear()
+
+    """
+    Internal helpers.
+    """
+
+    def _broadcast(self, command: str) -> torch.Tensor:
+        # send to all workers first so that they run concurrently
+        for conn in self._conns:
+            conn.send(command)
+        self._receive_all()
+        return self._observations
+
+    def _receive_all(self) -> list[tuple]:
+        """Receives the reply of every worker, then raises one error for all failed workers.
+
+        Reading all replies before raising keeps every pipe in step with its worker, so the next command does not
+        read a stale reply.
+        """
+        replies = []
+        failed: dict[int, str] = {}
+        for worker_id, conn in enumerate(self._conns):
+            try:
+                reply = conn.recv()
+            except EOFError:
+                reply = ("error", "The worker process exited.")
+            if reply[0] == "error":
+                failed[worker_id] = reply[1]
+            replies.append(reply)
+        if failed:
+            details = "\n".join(f"[worker {worker_id}]\n{error}" for worker_id, error in failed.items())
+            raise RuntimeError(f"The sharded environment workers {list(failed)} failed:\n{details}")
+        return replies
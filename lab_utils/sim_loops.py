@@ -0,0 +1,181 @@
+"""Step loops of the tutorial scripts, shared with the pure-torch physics stand-in.
+
+The loops only use the interface that :class:`isaaclab.sim.SimulationContext` and
+:class:`isaaclab.assets.RigidObject` share with :class:`lab_utils.torch_physics.TorchSimulationContext` and
+:class:`lab_utils.torch_physics.TorchRigidObject`, so ``benchmarks/benchmark_torch_physics.py`` runs the same loops as
+the scripts without Isaac Sim:
+
+* :func:`run_rigid_object_loop`: the loop of ``interacting_with_a_rigid_object.py``, with the scheduled resets, the
+  optional snapshot pool, the telemetry and the state stream,
+* :func:`run_step_loop`: the loop of ``teter_toter2.py``, which only steps the simulation.
+
+.. code-block:: python
+
+    parser = argparse.ArgumentParser()
+    add_rigid_object_loop_args(parser)
+    ...
+    run_rigid_object_loop(sim, rigid_object, origins, runner, args_cli)
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+
+from lab_utils.profiling import profiler
+from lab_utils.runner import Runner
+from lab_utils.state_stream import add_state_stream_args, validate_state_stream_args
+from lab_utils.telemetry import add_telemetry_args, make_sink
+
+
+def add_rigid_object_loop_args(parser: argparse.ArgumentParser):
+    """Adds the arguments of :func:`run_rigid_object_loop` to a parser: the snapshot pool, the telemetry and the
+    state stream.
+
+    Args:
+        parser: The parser to extend.
+    """
+    group = parser.add_argument_group("resets", description="Arguments for the resets of the rigid objects.")
+    group.add_argument(
+        "--snapshot_pool", type=int, default=0, help="Capacity of the pool of settled states to reset from (0 off)."
+    )
+    group.add_argument(
+        "--snapshot_eviction",
+        type=str,
+        default="reservoir",
+        choices=["fifo", "random", "reservoir"],
+        help="Which snapshots a full pool replaces.",
+    )
+    add_telemetry_args(parser)
+    add_state_stream_args(parser)
+
+
+def validate_rigid_object_loop_args(args: argparse.Namespace):
+    """Checks the arguments added by :func:`add_rigid_object_loop_args`.
+
+    Args:
+        args: The parsed arguments.
+
+    Raises:
+        ValueError: When the snapshot pool capacity is negative or the stream arguments are invalid.
+    """
+    validate_state_stream_args(args)
+    if args.snapshot_pool < 0:
+        raise ValueError(f"The snapshot pool capacity must not be negative. Received: {args.snapshot_pool}.")
+
+
+def run_rigid_object_loop(sim, rigid_object, origins, runner: Runner, args: argparse.Namespace):
+    """Drops the instances of a rigid object around their origins and resets them every 250 steps.
+
+    Args:
+        sim: The simulation context, already reset.
+        rigid_object: The rigid object. One instance per origin.
+        origins: The origins of the instances. Shape is (num_instances, 3).
+        runner: The runner of the loop.
+        args: The arguments added by :func:`add_rigid_object_loop_args`.
+    """
+    # note: imported here, so that the scripts can add the arguments before paying for the torch import
+    import torch
+
+    from lab_utils.rigid_reset import RootStateResetter
+    from lab_utils.snapshot_pool import SnapshotPool
+    from lab_utils.state_stream import StateStream, write_frames
+
+    # Reset helper: owns preallocated root-state buffers and resets each instance after 250 steps
+    # optionally, settled states are captured and later resets restore them instead of dropping the cones again
+    snapshot_pool = None
+    if args.snapshot_pool > 0:
+        snapshot_pool = SnapshotPool(
+            {"root_state": (13,)}, args.snapshot_pool, eviction=args.snapshot_eviction, device=sim.device
+        )
+    resetter = RootStateResetter(
+        rigid_object,
+        origins,
+        radius=0.1,
+        h_range=(0.25, 0.5),
+        max_episode_length=250,
+        snapshot_pool=snapshot_pool,
+    )
+    # asynchronous telemetry: aggregates the root positions without syncing the device in the loop
+    telemetry = make_sink(args, {"root_pos_w": (rigid_object.num_instances, 3)}, device=sim.device)
+    # state streaming: full root states reach the host through pinned buffers, a thread writes them as JSON lines
+    stream = None
+    if args.stream_every > 0:
+        stream = StateStream(
+            {"root_state_w": ((rigid_object.num_instances, 13), torch.float32)},
+            num_buffers=args.stream_buffers,
+            backpressure=args.stream_backpressure,
+            device=sim.device,
+        )
+        stream_file = open(args.stream_path, "w") if args.stream_path is not None else sys.stdout
+        consumer = threading.Thread(target=write_frames, args=(stream, stream_file), name="state-writer", daemon=True)
+        consumer.start()
+    # Define simulation stepping
+    sim_dt = sim.get_physics_dt()
+    sim_time = 0.0
+    count = 0
+    total_steps = 0
+    # Simulate physics
+    while runner.running():
+        # reset
+        # note: all instances start together and are reset after the same number of steps, so the schedule is known
+        #   on the host, the reset mask is never read back from the device and all instances are due on a reset.
+        if total_steps % resetter.max_episode_length == 0:
+            # reset counters
+            sim_time = 0.0
+            count = 0
+            # sample a random position on a cylinder around the origins and write it for the due instances only
+            with profiler.phase("reset"):
+                resetter.reset()
+            print("----------------------------------------")
+            print("[INFO]: Resetting object state...")
+        # apply sim data
+        with profiler.phase("write_data_to_sim"):
+            rigid_object.write_data_to_sim()
+        # perform step
+        with profiler.phase("sim.step"):
+            sim.step(render=runner.render)
+        # update sim-time
+        sim_time += sim_dt
+        count += 1
+        # update buffers
+        with profiler.phase("update"):
+            rigid_object.update(sim_dt)
+        resetter.step()
+        total_steps += 1
+        # stream the root states without waiting for the host copy
+        if stream is not None and total_steps % args.stream_every == 0:
+            stream.publish(total_steps, root_state_w=rigid_object.data.root_state_w)
+        # record the root position
+        if telemetry is not None:
+            telemetry.push("root_pos_w", rigid_object.data.root_state_w[:, :3])
+            telemetry.step()
+    # flush the telemetry
+    if telemetry is not None:
+        telemetry.close()
+    # complete the pending copies and let the writer drain the stream
+    if stream is not None:
+        stream.close()
+        consumer.join()
+        if stream_file is not sys.stdout:
+            stream_file.close()
+        print(
+            f"[INFO]: Streamed {stream.num_published} states, dropped {stream.num_dropped} and coalesced"
+            f" {stream.num_coalesced}."
+        )
+    if snapshot_pool is not None:
+        print(f"[INFO]: {resetter.num_pool_resets} resets restored a snapshot of the pool.")
+
+
+def run_step_loop(sim, runner: Runner):
+    """Steps the simulation until the runner stops.
+
+    Args:
+        sim: The simulation context, already reset.
+        runner: The runner of the loop.
+    """
+    while runner.running():
+        with profiler.phase("sim.step"):
+            sim.step(render=runner.render)
@@ -0,0 +1,226 @@
+"""Device-resident pool of pre-settled state snapshots for fast resets.
+
+Resetting an object to its default state above the ground means that it first has to fall and settle before the
+simulation produces useful data, so the first steps of every episode are wasted. :class:`SnapshotPool` stores
+batches of states that were captured after settling, and a reset samples from the pool instead of re-simulating
+the settling phase.
+
+Root states are stored relative to the environment origins (see :func:`relative_root_states`), so a snapshot
+captured in one environment can be restored in any other.
+
+When the pool is full, new snapshots replace old ones according to the eviction policy:
+
+* ``"fifo"``: the oldest snapshots are replaced,
+* ``"random"``: random snapshots are replaced,
+* ``"reservoir"``: reservoir sampling, which keeps a uniform sample over all snapshots ever added.
+"""
+
+from __future__ import annotations
+
+import torch
+
+EVICTION_POLICIES = ("fifo", "random", "reservoir")
+"""The supported eviction policies."""
+
+
+class SnapshotPool:
+    """Fixed-capacity pool of state snapshots with one buffer per state field."""
+
+    def __init__(
+        self,
+        fields: dict[str, tuple[int, ...]],
+        capacity: int,
+        eviction: str = "fifo",
+        device: str = "cpu",
+        generator: torch.Generator | None = None,
+    ):
+        """Initializes the pool.
+
+        Args:
+            fields: The shape of every state field per snapshot, for instance ``{"root_state": (13,)}`` or
+                ``{"joint_pos": (2,), "joint_vel": (2,)}``.
+            capacity: The maximum number of snapshots.
+            eviction: The eviction policy, one of :data:`EVICTION_POLICIES`. Defaults to "fifo".
+            device: The device of the pool. Defaults to "cpu".
+            generator: The random number generator for sampling and eviction, on the device of the pool.
+                Defaults to None.
+
+        Raises:
+            ValueError: When the eviction policy is unknown or the capacity is smaller than one.
+        """
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: '{eviction}'. Expected one of: {EVICTION_POLICIES}.")
+        if capacity < 1:
+            raise ValueError(f"The capacity must be at least 1. Received: {capacity}.")
+        self.capacity = capacity
+        self.eviction = eviction
+        self.device = torch.device(device)
+        self.generator = generator
+        self.buffers = {name: torch.zeros((capacity, *shape), device=self.device) for name, shape in fields.items()}
+        self.num_added = 0
+        """The number of snapshots added since the creation of the pool, including evicted and rejected ones."""
+        self._size = 0
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        """Number of snapshots in the pool."""
+        return self._size
+
+    """
+    Operations.
+    """
+
+    def add(self, states: dict[str, torch.Tensor], mask: torch.Tensor | None = None) -> int:
+        """Adds snapshots to the pool.
+
+        Args:
+            states: The states of every field. Shape is (N, \\*shape).
+            mask: Which of the N states to add. Defaults to None (all).
+
+        Returns:
+            The number of snapshots stored in the pool. The reservoir policy rejects some of the new snapshots; they
+            count towards :attr:`num_added` but not towards the returned number.
+        """
+        if mask is not None:
+            ids = mask.nonzero().squeeze(-1)
+            states = {name: values[ids] for name, values in states.items()}
+        num_new = next(iter(states.values())).shape[0]
+        if num_new == 0:
+            return 0
+        slots = self._slots(num_new)
+        # note: the reservoir policy rejects some snapshots; those have a negative slot.
+        keep = slots >= 0
+        for name, buffer in self.buffers.items():
+            values = states[name].to(self.device)
+            if self.eviction == "reservoir":
+                buffer[slots[keep]] = values[keep]
+            else:
+                buffer[slots] = values
+        self.num_added += num_new
+        self._size = min(self._size + num_new, self.capacity)
+        return int(keep.sum()) if self.eviction == "reservoir" else num_new
+
+    def sample(self, num_samples: int, out: dict[str, torch.Tensor] | None = None) -> dict[str, torch.Tensor]:
+        """Samples snapshots uniformly with replacement.
+
+        Args:
+            num_samples: The number of snapshots.
+            out: Tensors to write the snapshots into. Shape is (num_samples, \\*shape). Defaults to None, in which
+                case new tensors are allocated.
+
+        Returns:
+            The sampled snapshots per field.
+
+        Raises:
+            RuntimeError: When the pool is empty.
+        """
+        if self._size == 0:
+            raise RuntimeError("Cannot sample from an empty snapshot pool.")
+        ids = torch.randint(self._size, (num_samples,), device=self.device, generator=self.generator)
+        if out is None:
+            return {name: buffer[ids] for name, buffer in self.buffers.items()}
+        for name, buffer in self.buffers.items():
+            torch.index_select(buffer, 0, ids, out=out[name])
+        return out
+
+    def clear(self):
+        """Removes all snapshots."""
+        self._size = 0
+        self._cursor = 0
+        self.num_added = 0
+
+    """
+    Internal helpers.
+    """
+
+    def _slots(self, num_new: int) -> torch.Tensor:
+        """Returns the pool slots of the new snapshots (negative for rejected ones)."""
+        if self.eviction == "fifo":
+            slots = (self._cursor + torch.arange(num_new, device=self.device)) % self.capacity
+            self._cursor = (self._cursor + num_new) % self.capacity
+            return slots
+        # the free slots are filled first
+        num_free = min(self.capacity - self._size, num_new)
+        slots = torch.empty(num_new, dtype=torch.long, device=self.device)
+        slots[:num_free] = self._size + torch.arange(num_free, device=self.device)
+        num_rest = num_new - num_free
+        if num_rest > 0:
+            if self.eviction == "random":
+                slots[num_free:] = torch.randint(
+                    self.capacity, (num_rest,), device=self.device, generator=self.generator
+                )
+            else:
+                # reservoir sampling: the i-th snapshot ever added replaces a random slot with probability capacity / i
+                seen = self.num_added + num_free + torch.arange(1, num_rest + 1, device=self.device)
+                draw = (torch.rand(num_rest, device=self.device, generator=self.generator) * seen).long()
+                slots[num_free:] = torch.where(draw < self.capacity, draw, torch.full_like(draw, -1))
+        return slots
+
+
+def relative_root_states(root_state_w: torch.Tensor, origins: torch.Tensor) -> torch.Tensor:
+    """Returns root states with the positions relative to the environment origins.
+
+    Args:
+        root_state_w: The root states in the world frame. Shape is (N, 13).
+        origins: The origins of the environments. Shape is (N, 3).
+    """
+    states = root_state_w.clone()
+    states[:, :3] -= origins
+    return states
+
+
+def settled_mask(root_state_w: torch.Tensor, max_lin_vel: float = 0.05, max_ang_vel: float = 0.1) -> torch.Tensor:
+    """Returns which objects are at rest.
+
+    Args:
+        root_state_w: The root states in the world frame. Shape is (N, 13).
+        max_lin_vel: The maximum linear speed of a settled object (in m/s). Defaults to 0.05.
+        max_ang_vel: The maximum angular speed of a settled object (in rad/s). Defaults to 0.1.
+    """
+    lin_speed = root_state_w[:, 7:10].norm(dim=-1)
+    ang_speed = root_state_w[:, 10:13].norm(dim=-1)
+    return (lin_speed <= max_lin_vel) & (ang_speed <= max_ang_vel)
+
+
+def capture_joints_to_pool(
+    env, env_ids: torch.Tensor | None, pool: SnapshotPool, asset_name: str = "robot", max_joint_vel: float = 0.1
+):
+    """Event term that adds the settled joint states of an articulation to a pool.
+
+    A joint state is settled when the speed of every joint is at most ``max_joint_vel``. The pool needs the fields
+    ``"joint_pos"`` and ``"joint_vel"``. It is meant for the ``"interval"`` mode, together with
+    :func:`reset_joints_from_pool` in the ``"reset"`` mode, see :func:`lab_utils.cartpole_env_cfg.add_snapshot_events`.
+
+    Args:
+        env: The environment.
+        env_ids: The environments to capture. None for all environments.
+        pool: The snapshot pool.
+        asset_name: The name of the articulation in the scene. Defaults to "robot".
+        max_joint_vel: The maximum joint speed of a settled state (in rad/s or m/s). Defaults to 0.1.
+    """
+    data = env.scene[asset_name].data
+    env_ids = slice(None) if env_ids is None else env_ids
+    joint_pos, joint_vel = data.joint_pos[env_ids], data.joint_vel[env_ids]
+    mask = joint_vel.abs().amax(dim=-1) <= max_joint_vel
+    pool.add({"joint_pos": joint_pos, "joint_vel": joint_vel}, mask)
+
+
+def reset_joints_from_pool(
+    env, env_ids: torch.Tensor, pool: SnapshotPool, asset_name: str = "robot", min_snapshots: int = 1
+):
+    """Event term that resets the joints of an articulation to snapshots from a pool.
+
+    The pool needs the fields ``"joint_pos"`` and ``"joint_vel"``. Until it holds ``min_snapshots`` snapshots, the
+    term does nothing, so the reset terms before it in the event configuration provide the states.
+
+    Args:
+        env: The environment.
+        env_ids: The environments to reset.
+        pool: The snapshot pool.
+        asset_name: The name of the articulation in the scene. Defaults to "robot".
+        min_snapshots: The number of snapshots the pool needs before the resets sample from it. Defaults to 1.
+    """
+    if len(pool) < max(min_snapshots, 1):
+        return
+    snapshots = pool.sample(len(env_ids))
+    env.scene[asset_name].write_joint_state_to_sim(snapshots["joint_pos"], snapshots["joint_vel"], env_ids=env_ids)
@@ -0,0 +1,204 @@
+"""Vectorized non-overlapping spawn positions with a uniform-grid spatial hash.
+
+Sampling spawn offsets independently per object (for instance with :func:`isaaclab.utils.math.sample_cylinder`)
+gives no guarantee that two objects do not interpenetrate, and the solver then pushes them apart with large
+velocities on the first steps. :class:`SpawnSampler` places objects of mixed footprints so that their footprint
+circles in the xy-plane do not overlap.
+
+The sampler throws darts for all pending objects of all environments in parallel rounds:
+
+1. Every object that is not yet placed draws a uniform candidate position inside the extent of its environment.
+2. The placed objects, the obstacles and the candidates are hashed into a uniform grid whose cells are as large as
+   the largest footprint diameter, so any two overlapping footprints lie in neighbouring cells.
+3. Every candidate checks the entries in its 3x3 cell neighbourhood (larger when obstacles are larger than the
+   objects). It is rejected when it overlaps a placed object, an obstacle or a candidate of higher priority (larger
+   footprints first), and accepted otherwise.
+
+The grid lookup is a sort of the cell keys followed by :func:`torch.searchsorted`, so the cost of a round grows with
+N log N in the number of objects instead of N^2. The accepted positions form a Poisson-disk-like distribution.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+
+import torch
+
+
+def footprint_radius(spawn_cfg) -> float:
+    """Returns the radius of the circle in the xy-plane that contains the footprint of a shape.
+
+    Args:
+        spawn_cfg: The shape configuration, for instance :class:`isaaclab.sim.ConeCfg`,
+            :class:`isaaclab.sim.SphereCfg` or :class:`isaaclab.sim.CuboidCfg`.
+
+    Raises:
+        ValueError: When the configuration has neither a radius nor a size.
+    """
+    if hasattr(spawn_cfg, "radius"):
+        return float(spawn_cfg.radius)
+    if hasattr(spawn_cfg, "size"):
+        return 0.5 * math.hypot(spawn_cfg.size[0], spawn_cfg.size[1])
+    raise ValueError(f"Cannot compute the footprint of the spawn configuration: {type(spawn_cfg).__name__}.")
+
+
+class SpawnSampler:
+    """Samples non-overlapping xy-positions of a set of objects in every environment."""
+
+    def __init__(
+        self,
+        radii: Sequence[float] | torch.Tensor,
+        half_extent: float | tuple[float, float],
+        margin: float = 0.0,
+        max_rounds: int = 64,
+        device: str = "cpu",
+        generator: torch.Generator | None = None,
+    ):
+        """Initializes the sampler.
+
+        Args:
+            radii: The footprint radius of every object (in m), see :func:`footprint_radius`. Shape is (N,).
+            half_extent: The half size of the square (or the rectangle along x and y) around the origin of an
+                environment that contains the footprints (in m).
+            margin: The minimum gap between two footprints (in m). Defaults to 0.0.
+            max_rounds: The maximum number of sampling rounds. Defaults to 64.
+            device: The device to sample on. Defaults to "cpu".
+            generator: The random number generator, on the device of the sampler. Defaults to None.
+
+        Raises:
+            ValueError: When a footprint does not fit into the extent.
+        """
+        if isinstance(half_extent, (int, float)):
+            half_extent = (half_extent, half_extent)
+        self.device = torch.device(device)
+        self.radii = torch.as_tensor(radii, dtype=torch.float, device=self.device)
+        max_radius = self.radii.max().item()
+        if max_radius > min(half_extent):
+            raise ValueError(
+                f"The largest footprint does not fit into the extent. Received: radius {max_radius} for the half"
+                f" extent {tuple(half_extent)}."
+            )
+        self.half_extent = torch.tensor(half_extent, dtype=torch.float, device=self.device)
+        self.margin = margin
+        self.max_rounds = max_rounds
+        self.generator = generator
+        self.num_rounds = 0
+        """The number of rounds of the last call to :meth:`sample`."""
+
+        # grid of the spatial hash: two footprints that overlap are at most one cell apart
+        self.cell_size = 2.0 * max_radius + margin
+        self.grid_shape = tuple(max(1, math.ceil(2.0 * h / self.cell_size)) for h in half_extent)
+        # priority of every object: the largest footprints are placed first
+        order = torch.argsort(self.radii, descending=True)
+        self._priority = torch.empty_like(order)
+        self._priority[order] = torch.arange(len(order), device=self.device)
+
+    @property
+    def num_objects(self) -> int:
+        """Number of objects per environment."""
+        return len(self.radii)
+
+    """
+    Operations.
+    """
+
+    def sample(
+        self,
+        num_envs: int,
+        obstacles: torch.Tensor | None = None,
+        obstacle_radii: torch.Tensor | None = None,
+    ) -> tuple[torch.Tensor, torch.Tensor]:
+        """Samples the positions of all objects in every environment.
+
+        Args:
+            num_envs: The number of environments.
+            obstacles: The xy-positions of fixed keep-out circles, relative to the origin of the environment. Shape
+                is (K, 2) for the same obstacles in every environment or (num_envs, K, 2). Defaults to None.
+            obstacle_radii: The radii of the obstacles (in m). Shape is (K,). Defaults to None.
+
+        Returns:
+            A tuple of the xy-positions relative to the origin of the environment with shape (num_envs, N, 2), and
+            a mask of the placed objects with shape (num_envs, N). Objects that found no free position within
+            ``max_rounds`` rounds are not placed; their positions are zero.
+        """
+        pos = torch.zeros(num_envs, self.num_objects, 2, device=self.device)
+        placed = torch.zeros(num_envs, self.num_objects, dtype=torch.bool, device=self.device)
+
+        # obstacles are permanent entries of the grid with the highest priority
+        reach = 1
+        if obstacles is not None:
+            obstacles = obstacles.to(self.device).expand(num_envs, -1, 2)
+            obstacle_env = torch.arange(num_envs, device=self.device).repeat_interleave(obstacles.shape[1])
+            obstacle_pos = obstacles.reshape(-1, 2)
+            obstacle_radii = torch.as_tensor(obstacle_radii, dtype=torch.float, device=self.device)
+            obstacle_r = obstacle_radii.repeat(num_envs)
+            # obstacles larger than the objects can overlap candidates more than one cell away
+            max_reach = obstacle_radii.max().item() + self.radii.max().item() + self.margin
+            reach = max(1, math.ceil(max_reach / self.cell_size))
+        else:
+            obstacle_env = torch.empty(0, dtype=torch.long, device=self.device)
+            obstacle_pos = torch.empty(0, 2, device=self.device)
+            obstacle_r = torch.empty(0, device=self.device)
+        offsets = torch.arange(-reach, reach + 1, device=self.device)
+        neighbours = torch.cartesian_prod(offsets, offsets)
+
+        self.num_rounds = 0
+        for _ in range(self.max_rounds):
+            pending_env, pending_obj = (~placed).nonzero(as_tuple=True)
+            if len(pending_env) == 0:
+                break
+            self.num_rounds += 1
+            # 1. candidates: uniform inside the extent, shrunk by the footprint radius
+            cand_r = self.radii[pending_obj]
+            cand_prio = self._priority[pending_obj]
+            rand = torch.rand(len(pending_env), 2, device=self.device, generator=self.generator)
+            cand = (2.0 * rand - 1.0) * (self.half_extent - cand_r.unsqueeze(1))
+
+            # 2. grid entries: obstacles and placed objects (priority -1) and the candidates
+            placed_env, placed_obj = placed.nonzero(as_tuple=True)
+            entry_env = torch.cat([obstacle_env, placed_env, pending_env])
+            entry_pos = torch.cat([obstacle_pos, pos[placed_env, placed_obj], cand])
+            entry_r = torch.cat([obstacle_r, self.radii[placed_obj], cand_r])
+            num_fixed = len(obstacle_env) + len(placed_env)
+            entry_prio = torch.cat([torch.full((num_fixed,), -1, device=self.device), cand_prio])
+            entry_keys = self._cell_keys(entry_env, self._cells(entry_pos))
+            sorted_keys, order = torch.sort(entry_keys)
+            # the largest number of entries in one cell bounds the lookups per neighbour cell
+            max_per_cell = torch.unique_consecutive(sorted_keys, return_counts=True)[1].max().item()
+
+            # 3. lookup of the cell neighbourhood of every candidate
+            cells = self._cells(cand).unsqueeze(1) + neighbours
+            grid_max = torch.tensor(self.grid_shape, device=self.device) - 1
+            # note: clamping at the border repeats a cell, which only checks its entries twice.
+            cells = torch.minimum(cells.clamp(min=0), grid_max)
+            keys = self._cell_keys(pending_env.unsqueeze(1), cells)
+            start = torch.searchsorted(sorted_keys, keys)
+            end = torch.searchsorted(sorted_keys, keys, right=True)
+            slots = start.unsqueeze(-1) + torch.arange(max_per_cell, device=self.device)
+            in_cell = slots < end.unsqueeze(-1)
+            other = order[slots.clamp(max=len(order) - 1)]
+            dist = torch.linalg.vector_norm(entry_pos[other] - cand[:, None, None], dim=-1)
+            overlap = (
+                in_cell
+                & (dist < entry_r[other] + cand_r[:, None, None] + self.margin)
+                & (entry_prio[other] < cand_prio[:, None, None])
+            )
+            accepted = ~overlap.flatten(1).any(dim=1)
+            pos[pending_env[accepted], pending_obj[accepted]] = cand[accepted]
+            placed[pending_env[accepted], pending_obj[accepted]] = True
+        return pos, placed
+
+    """
+    Internal helpers.
+    """
+
+    def _cells(self, xy: torch.Tensor) -> torch.Tensor:
+        """Returns the integer grid cells of positions relative to the environment origin."""
+        cells = torch.floor((xy + self.half_extent) / self.cell_size).long()
+        return torch.minimum(cells.clamp(min=0), torch.tensor(self.grid_shape, device=self.device) - 1)
+
+    def _cell_keys(self, env_ids: torch.Tensor, cells: torch.Tensor) -> torch.Tensor:
+        """Returns one hash key per environment and cell."""
+        num_x, num_y = self.grid_shape
+        return (env_ids * num_x + cells[..., 0]) * num_y + cells[..., 1]
@@ -0,0 +1,329 @@
+"""Streaming of per-step state tensors to the host without stalling the step loop.
+
+Reading a device tensor on the host (``.cpu()``, ``.numpy()``, printing) waits for the device to finish the step and
+then for the copy. :class:`StateStream` instead publishes the selected tensors into a pool of buffer slots. Every
+slot holds a device staging copy and a pinned host copy of all channels:
+
+1. :meth:`StateStream.publish` copies the values into the staging tensors of a free slot on the current stream. This
+   device-to-device copy is cheap, and the simulation may overwrite the published tensors right after it.
+2. The host copy of the slot is started on a side stream, so it overlaps with the next steps.
+3. A thread waits for the copy and hands the slot over to the consumers as a :class:`StateFrame`.
+4. The consumer releases the frame, and the slot is free again.
+
+On the CPU, the thread performs the copy from the staging to the host tensors itself, which keeps the same slot
+life cycle so the stream can be tested without a GPU.
+
+The publisher never waits for the consumers. Without a free slot, the ``"drop"`` backpressure policy drops the new
+frame. The ``"coalesce"`` policy instead takes back the newest frame that no consumer has taken yet and overwrites it
+with the new one, so the consumers always see the latest state and :attr:`StateFrame.num_coalesced` counts the frames
+it replaced.
+
+.. code-block:: python
+
+    stream = StateStream({"root_state_w": ((num_envs, 13), torch.float32)}, device=sim.device)
+    threading.Thread(target=write_frames, args=(stream, sys.stdout), daemon=True).start()
+    while simulation_app.is_running():
+        sim.step()
+        stream.publish(step, root_state_w=rigid_object.data.root_state_w)
+    stream.close()
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import json
+import queue
+import threading
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+
+from lab_utils.launcher import lazy_import
+
+# note: imported on first use, so that the script can parse its arguments before paying for the import
+torch = lazy_import("torch")
+
+BACKPRESSURE = ("drop", "coalesce")
+"""The supported backpressure policies."""
+
+
+@dataclass
+class StateFrame:
+    """The host copies of the channels of one published step.
+
+    The tensors are views of a pinned buffer of the stream. They are valid until the frame is released.
+    """
+
+    step: int
+    """The step that was published."""
+
+    values: dict[str, torch.Tensor] = field(repr=False)
+    """The host tensor of every channel."""
+
+    num_coalesced: int
+    """The number of earlier frames that this frame replaced under backpressure."""
+
+    slot: int
+    """The buffer slot of the frame."""
+
+    stream: StateStream = field(repr=False)
+    """The stream that owns the buffer slot."""
+
+    released: bool = False
+    """Whether the frame was released."""
+
+    def release(self):
+        """Returns the buffer slot of the frame to the stream. Calling it more than once has no effect."""
+        if not self.released:
+            self.released = True
+            self.stream._release(self.slot)
+
+
+class StateStream:
+    """Copies per-step state tensors to pinned host buffers in the background and hands them to consumers."""
+
+    def __init__(
+        self,
+        channels: dict[str, tuple[Sequence[int], torch.dtype]],
+        num_buffers: int = 4,
+        backpressure: str = "coalesce",
+        device: str = "cpu",
+    ):
+        """Initializes the buffer slots and starts the copy thread.
+
+        Args:
+            channels: The shape and the data type of every channel, for instance
+                ``{"root_state_w": ((num_envs, 13), torch.float32)}``.
+            num_buffers: The number of buffer slots (at least 2). Defaults to 4.
+            backpressure: What to do without a free slot: "drop" drops the new frame, "coalesce" overwrites the
+                newest frame that no consumer has taken yet. Defaults to "coalesce".
+            device: The device of the published tensors. Defaults to "cpu".
+
+        Raises:
+            ValueError: When the number of buffers is smaller than 2 or the backpressure policy is unknown.
+        """
+        if num_buffers < 2:
+            raise ValueError(f"The state stream needs at least 2 buffers. Received: {num_buffers}.")
+        if backpressure not in BACKPRESSURE:
+            raise ValueError(f"Unknown backpressure policy: '{backpressure}'. Expected one of: {BACKPRESSURE}.")
+        self.channels = {name: (tuple(shape), dtype) for name, (shape, dtype) in channels.items()}
+        self.num_buffers = num_buffers
+        self.backpressure = backpressure
+        self.device = torch.device(device)
+        # frames accepted by publish (including the coalesced ones), dropped and replaced under backpressure
+        self.num_published = 0
+        self.num_dropped = 0
+        self.num_coalesced = 0
+
+        pin = self.device.type == "cuda"
+        self._staging = [
+            {name: torch.empty(shape, dtype=dtype, device=device) for name, (shape, dtype) in self.channels.items()}
+            for _ in range(num_buffers)
+        ]
+        self._host = [
+            {name: torch.empty(shape, dtype=dtype, pin_memory=pin) for name, (shape, dtype) in self.channels.items()}
+            for _ in range(num_buffers)
+        ]
+        # note: the host copies run on their own stream, so they overlap with the kernels of the next steps.
+        self._copy_stream = torch.cuda.Stream(self.device) if pin else None
+
+        # slot life cycle: free -> copying -> ready -> taken -> free, guarded by the condition
+        self._condition = threading.Condition()
+        self._free = collections.deque(range(num_buffers))
+        self._ready: collections.deque[StateFrame] = collections.deque()
+        self._closed = False
+        self._error: BaseException | None = None
+        self._copies: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="state-stream", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> StateStream:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __iter__(self) -> Iterator[StateFrame]:
+        """Yields the frames in publication order until the stream is closed and drained.
+
+        Every frame is released when the next one is requested or the iteration ends.
+        """
+        frame = None
+        try:
+            while True:
+                if frame is not None:
+                    frame.release()
+                frame = self.get()
+                if frame is None:
+                    return
+                yield frame
+        finally:
+            if frame is not None:
+                frame.release()
+
+    """
+    Operations.
+    """
+
+    def publish(self, step: int, **values: torch.Tensor) -> bool:
+        """Publishes the values of one step without waiting for the copy or the consumers.
+
+        Args:
+            step: The step of the values.
+            values: The value of every channel. The shapes must match the channels.
+
+        Returns:
+            Whether the frame was published. It is dropped when no buffer slot is available.
+
+        Raises:
+            RuntimeError: When the stream is closed or the copy thread failed.
+        """
+        if self._error is not None:
+            raise RuntimeError("The state stream failed.") from self._error
+        if self._closed:
+            raise RuntimeError("The state stream is closed.")
+        with self._condition:
+            num_coalesced = 0
+            if self._free:
+                slot = self._free.popleft()
+            elif self.backpressure == "coalesce" and self._ready:
+                # take back the newest untaken frame: the new frame replaces it and the ones it replaced
+                replaced = self._ready.pop()
+                slot, num_coalesced = replaced.slot, replaced.num_coalesced + 1
+                self.num_coalesced += 1
+            else:
+                self.num_dropped += 1
+                return False
+        self.num_published += 1
+
+        staging = self._staging[slot]
+        for name in self.channels:
+            staging[name].copy_(values[name])
+        event = None
+        if self._copy_stream is not None:
+            # the host copy starts once the staging copy is done, without blocking the current stream
+            self._copy_stream.wait_stream(torch.cuda.current_stream(self.device))
+            with torch.cuda.stream(self._copy_stream):
+                for name, host in self._host[slot].items():
+                    host.copy_(staging[name], non_blocking=True)
+                event = torch.cuda.Event()
+                event.record(self._copy_stream)
+        self._copies.put((slot, step, num_coalesced, event))
+        return True
+
+    def get(self, timeout: float | None = None) -> StateFrame | None:
+        """Takes the oldest completed frame.
+
+        Args:
+            timeout: The time to wait for a frame in seconds. Defaults to None (wait until a frame is completed or
+                the stream is closed).
+
+        Returns:
+            The frame, or None when the time ran out or the stream is closed and drained. The caller releases it.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._ready or self._closed, timeout=timeout)
+            if not self._ready:
+                return None
+            return self._ready.popleft()
+
+    def close(self):
+        """Completes the pending copies, stops the thread and wakes up the waiting consumers.
+
+        The completed frames can still be taken after the stream is closed.
+        """
+        if not self._thread.is_alive():
+            return
+        self._copies.put(None)
+        self._thread.join()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._error is not None:
+            raise RuntimeError("The state stream failed.") from self._error
+
+    """
+    Internal helpers.
+    """
+
+    def _release(self, slot: int):
+        with self._condition:
+            self._free.append(slot)
+
+    def _run(self):
+        """Completes the host copies in publication order until the sentinel arrives."""
+        while True:
+            item = self._copies.get()
+            if item is None:
+                break
+            slot, step, num_coalesced, event = item
+            try:
+                if event is not None:
+                    event.synchronize()
+                else:
+                    for name, host in self._host[slot].items():
+                        host.copy_(self._staging[slot][name])
+            except BaseException as e:
+                self._error = e
+            frame = StateFrame(step, self._host[slot], num_coalesced, slot, self)
+            with self._condition:
+                self._ready.append(frame)
+                self._condition.notify()
+
+
+def write_frames(stream: StateStream, file, channels: Sequence[str] | None = None):
+    """Writes every frame of a stream as one JSON line until the stream is closed and drained.
+
+    It is meant to run in a consumer thread.
+
+    Args:
+        stream: The stream.
+        file: The text file to write to, for instance ``sys.stdout``.
+        channels: The channels to write. Defaults to None (all channels).
+    """
+    names = list(stream.channels) if channels is None else list(channels)
+    for frame in stream:
+        record = {"step": frame.step, "coalesced": frame.num_coalesced}
+        record.update({name: frame.values[name].tolist() for name in names})
+        file.write(json.dumps(record) + "\n")
+    file.flush()
+
+
+def add_state_stream_args(parser: argparse.ArgumentParser):
+    """Adds the state streaming arguments to a parser.
+
+    Args:
+        parser: The parser to extend.
+    """
+    group = parser.add_argument_group("state stream", description="Arguments for the asynchronous state streaming.")
+    group.add_argument(
+        "--stream_every", type=int, default=0, help="Stream the state to the host every n steps. 0 disables."
+    )
+    group.add_argument(
+        "--stream_path", type=str, default=None, help="Write the streamed frames to this JSONL file instead of stdout."
+    )
+    group.add_argument("--stream_buffers", type=int, default=4, help="Number of pinned buffers of the stream.")
+    group.add_argument(
+        "--stream_backpressure",
+        type=str,
+        default="coalesce",
+        choices=list(BACKPRESSURE),
+        help="What to do when the consumer falls behind.",
+    )
+
+
+def validate_state_stream_args(args: argparse.Namespace):
+    """Checks the arguments added by :func:`add_state_stream_args`.
+
+    Args:
+        args: The parsed arguments.
+
+    Raises:
+        ValueError: When the interval is negative or there are fewer than 2 buffers.
+    """
+    if args.stream_every < 0 or args.stream_buffers < 2:
+        raise ValueError(
+            "The stream interval must not be negative and the stream needs at least 2 buffers."
+            f" Received: {args.stream_every}, {args.stream_buffers}."
+        )
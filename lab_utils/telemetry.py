@@ -0,0 +1,358 @@
+"""Non-blocking telemetry for simulation loops.
+
+Printing a tensor or calling ``.item()`` inside the step loop synchronizes the device with the host and stalls the
+loop on console I/O. :class:`TelemetrySink` instead copies the pushed tensors into a preallocated ring buffer on
+their device. Whenever a window of samples is complete, the window is copied to pinned host memory without
+blocking and handed to a background thread. The thread waits for the copy, aggregates the window (mean, min and
+max per value) and passes the result to the writers.
+
+If the thread falls behind, windows are dropped and counted instead of stalling the loop.
+
+.. code-block:: python
+
+    sink = TelemetrySink({"pole_pos": ()}, window=50, writers=[ConsoleWriter()], device=env.device)
+    while simulation_app.is_running():
+        obs, _ = env.step(actions)
+        sink.push("pole_pos", obs["policy"][0, 1])
+        sink.step()
+    sink.close()
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import math
+import queue
+import threading
+from collections.abc import Sequence
+
+from lab_utils.launcher import lazy_import
+
+# note: imported on first use, so that the script can parse its arguments before paying for the import
+np = lazy_import("numpy")
+torch = lazy_import("torch")
+
+AGGREGATIONS = ("mean", "min", "max")
+"""The supported window aggregations."""
+
+
+"""
+Writers.
+"""
+
+
+class ConsoleWriter:
+    """Prints the aggregated windows to stdout."""
+
+    def __init__(self, precision: int = 4):
+        """Initializes the writer.
+
+        Args:
+            precision: The number of decimals to print. Defaults to 4.
+        """
+        self.precision = precision
+
+    def write(self, step: int, stats: dict[str, dict[str, np.ndarray]]):
+        """Prints one line per channel."""
+        for name, values in stats.items():
+            fields = " ".join(
+                f"{aggregation}={np.round(value, self.precision).tolist()}" for aggregation, value in values.items()
+            )
+            print(f"[TELEMETRY] step {step:>8} | {name}: {fields}")
+
+    def close(self):
+        pass
+
+
+class CsvWriter:
+    """Writes the aggregated windows to a CSV file with one column per channel, aggregation and value."""
+
+    def __init__(self, path: str):
+        """Initializes the writer.
+
+        Args:
+            path: The path of the CSV file. It is overwritten.
+        """
+        self._file = open(path, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._header_written = False
+
+    def write(self, step: int, stats: dict[str, dict[str, np.ndarray]]):
+        """Appends one row."""
+        if not self._header_written:
+            header = ["step"]
+            for name, values in stats.items():
+                for aggregation, value in values.items():
+                    if value.ndim == 0:
+                        header.append(f"{name}/{aggregation}")
+                    else:
+                        header += [f"{name}/{aggregation}/{i}" for i in range(value.size)]
+            self._writer.writerow(header)
+            self._header_written = True
+        row = [step]
+        for values in stats.values():
+            for value in values.values():
+                row += value.reshape(-1).tolist()
+        self._writer.writerow(row)
+
+    def close(self):
+        self._file.close()
+
+
+class JsonlWriter:
+    """Writes the aggregated windows to a JSON-lines file with one record per window."""
+
+    def __init__(self, path: str):
+        """Initializes the writer.
+
+        Args:
+            path: The path of the JSONL file. It is overwritten.
+        """
+        self._file = open(path, "w")
+
+    def write(self, step: int, stats: dict[str, dict[str, np.ndarray]]):
+        """Appends one record."""
+        record = {"step": step}
+        for name, values in stats.items():
+            record[name] = {aggregation: value.tolist() for aggregation, value in values.items()}
+        self._file.write(json.dumps(record) + "\n")
+
+    def close(self):
+        self._file.close()
+
+
+def make_writer(kind: str, path: str | None = None):
+    """Creates a writer from its name.
+
+    Args:
+        kind: The writer type: "console", "csv" or "jsonl".
+        path: The output file for the file writers. Defaults to None.
+
+    Raises:
+        ValueError: When the writer type is unknown or a file writer has no path.
+    """
+    if kind == "console":
+        return ConsoleWriter()
+    if kind in ("csv", "jsonl"):
+        if path is None:
+            raise ValueError(f"The '{kind}' telemetry writer requires an output path.")
+        return CsvWriter(path) if kind == "csv" else JsonlWriter(path)
+    raise ValueError(f"Unknown telemetry writer: '{kind}'. Expected one of: console, csv, jsonl.")
+
+
+def add_telemetry_args(parser: argparse.ArgumentParser):
+    """Adds the telemetry arguments to a parser.
+
+    Args:
+        parser: The parser to extend.
+    """
+    group = parser.add_argument_group("telemetry", description="Arguments for the asynchronous telemetry.")
+    group.add_argument(
+        "--telemetry",
+        type=str,
+        default="console",
+        choices=["console", "csv", "jsonl", "none"],
+        help="Where to write the telemetry aggregates.",
+    )
+    group.add_argument("--telemetry_path", type=str, default=None, help="Output file of the csv/jsonl writers.")
+    group.add_argument("--telemetry_window", type=int, default=50, help="Samples aggregated per telemetry record.")
+    group.add_argument("--telemetry_every", type=int, default=1, help="Record a telemetry sample every n steps.")
+
+
+"""
+Sink.
+"""
+
+
+class TelemetrySink:
+    """Collects tensors from the step loop into a device ring buffer and writes window aggregates in a thread.
+
+    Every channel has a fixed shape. The values of all channels are packed into one row per sample, so a window
+    is a single contiguous block that is moved to the host with one copy.
+    """
+
+    def __init__(
+        self,
+        channels: dict[str, Sequence[int]],
+        window: int = 50,
+        sample_every: int = 1,
+        aggregations: Sequence[str] = AGGREGATIONS,
+        writers: Sequence | None = None,
+        num_windows: int = 8,
+        device: str = "cpu",
+    ):
+        """Initializes the sink and starts the writer thread.
+
+        Args:
+            channels: The shape of every channel, for instance ``{"root_pos": (num_envs, 3)}``.
+            window: The number of samples aggregated into one output record. Defaults to 50.
+            sample_every: Record one sample every n calls to :meth:`step`. Defaults to 1.
+            aggregations: The aggregations to compute per window. Defaults to :data:`AGGREGATIONS`.
+            writers: The writers that receive the aggregates. Defaults to None, in which case a
+                :class:`ConsoleWriter` is used.
+            num_windows: The number of windows in the ring buffer (at least 2). Defaults to 8.
+            device: The device of the pushed tensors. Defaults to "cpu".
+
+        Raises:
+            ValueError: When an aggregation is unknown or a size parameter is out of range.
+        """
+        unknown = set(aggregations) - set(AGGREGATIONS)
+        if unknown:
+            raise ValueError(f"Unknown telemetry aggregations: {sorted(unknown)}. Expected a subset of {AGGREGATIONS}.")
+        if min(window, sample_every) < 1 or num_windows < 2:
+            raise ValueError(
+                "Telemetry window and sampling rate must be at least 1 and the number of windows at least 2."
+                f" Received: {window}, {sample_every}, {num_windows}."
+            )
+        self.window = window
+        self.sample_every = sample_every
+        self.aggregations = tuple(aggregations)
+        self.writers = list(writers) if writers is not None else [ConsoleWriter()]
+        self.num_windows = num_windows
+        self.device = torch.device(device)
+        self.num_dropped = 0
+
+        # packed layout: every channel owns a slice of a sample row
+        self._shapes = {name: tuple(shape) for name, shape in channels.items()}
+        self._slices = {}
+        offset = 0
+        for name, shape in self._shapes.items():
+            size = math.prod(shape)
+            self._slices[name] = slice(offset, offset + size)
+            offset += size
+        self._row_size = offset
+        self._ring = torch.zeros((num_windows, window, offset), device=self.device)
+        self._flat_ring = self._ring.view(-1)
+        pin = self.device.type == "cuda"
+        self._host = torch.zeros((num_windows, window, offset), pin_memory=pin)
+
+        # ring state, only touched by the step loop
+        self._count = 0
+        self._last_sample_step = 0
+        self._window_id = 0
+        self._sample_id = 0
+        # windows that are free for writing; the thread releases a window after aggregating it
+        # note: the window being written is not free, hence one less than the number of windows.
+        self._free = threading.Semaphore(num_windows - 1)
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> TelemetrySink:
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    """
+    Operations.
+    """
+
+    @property
+    def sampling(self) -> bool:
+        """Whether the current step records a sample."""
+        return self._count % self.sample_every == 0
+
+    def push(self, name: str, value: torch.Tensor):
+        """Records the value of a channel for the current step.
+
+        The value is copied into the ring buffer on its device; this does not synchronize with the host. Values
+        pushed on steps that are not sampled are ignored.
+
+        Args:
+            name: The name of the channel.
+            value: The value. Its number of elements must match the channel shape.
+        """
+        if not self.sampling:
+            return
+        # slicing the flat buffer is the cheapest way to get the destination view
+        channel = self._slices[name]
+        start = (self._window_id * self.window + self._sample_id) * self._row_size
+        self._flat_ring[start + channel.start : start + channel.stop].copy_(value.reshape(-1), non_blocking=True)
+
+    def step(self):
+        """Advances the sink by one step. Hands the window to the writer thread once it is full."""
+        if self.sampling:
+            self._last_sample_step = self._count
+            self._sample_id += 1
+            if self._sample_id == self.window:
+                # the thread releases the windows in submission order, so the free window is always the next one
+                if self._free.acquire(blocking=False):
+                    self._submit(self.window)
+                    self._window_id = (self._window_id + 1) % self.num_windows
+                else:
+                    # the thread is behind: drop the window instead of waiting for it
+                    self.num_dropped += 1
+                self._sample_id = 0
+        self._count += 1
+
+    def close(self):
+        """Writes the samples of the incomplete window, stops the thread and closes the writers."""
+        if self._thread.is_alive():
+            if self._sample_id > 0:
+                self._submit(self._sample_id)
+                self._sample_id = 0
+            self._queue.put(None)
+            self._thread.join()
+            for writer in self.writers:
+                writer.close()
+
+    """
+    Internal helpers.
+    """
+
+    def _submit(self, num_samples: int):
+        """Starts the host copy of the first samples of the current window and queues it for the thread."""
+        window_id = self._window_id
+        self._host[window_id, :num_samples].copy_(self._ring[window_id, :num_samples], non_blocking=True)
+        event = None
+        if self.device.type == "cuda":
+            event = torch.cuda.Event()
+            event.record()
+        self._queue.put((window_id, num_samples, self._last_sample_step, event))
+
+    def _run(self):
+        """Aggregates and writes windows until the sentinel arrives."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            window_id, num_samples, step, event = item
+            if event is not None:
+                event.synchronize()
+            samples = self._host[window_id, :num_samples].numpy()
+            stats = {}
+            for name, shape in self._shapes.items():
+                values = samples[:, self._slices[name]]
+                stats[name] = {
+                    aggregation: getattr(values, aggregation)(axis=0).reshape(shape)
+                    for aggregation in self.aggregations
+                }
+            for writer in self.writers:
+                writer.write(step, stats)
+            self._free.release()
+
+
+def make_sink(args: argparse.Namespace, channels: dict[str, Sequence[int]], device: str) -> TelemetrySink | None:
+    """Creates a sink from the arguments added by :func:`add_telemetry_args`.
+
+    Args:
+        args: The parsed arguments.
+        channels: The shape of every channel.
+        device: The device of the pushed tensors.
+
+    Returns:
+        The sink, or None when the telemetry is disabled.
+    """
+    if args.telemetry == "none":
+        return None
+    return TelemetrySink(
+        channels,
+        window=args.telemetry_window,
+        sample_every=args.telemetry_every,
+        writers=[make_writer(args.telemetry, args.telemetry_path)],
+        device=device,
+    )
@@ -0,0 +1,318 @@
+"""Content-addressed on-disk cache for generated terrain meshes and their flat patches.
+
+Generating the rough-terrain grid (and sampling flat patches on every sub-terrain) takes a noticeable part of the
+start-up time, even though the result only depends on the terrain generator configuration. The cache stores the
+generator outputs as raw ``.npy`` arrays that are memory-mapped on load, keyed by a stable hash of the resolved
+configuration. Warm starts then skip the generation entirely.
+
+The cache plugs into :class:`isaaclab.terrains.TerrainImporter` through the ``class_type`` of the terrain generator
+configuration:
+
+.. code-block:: python
+
+    cache = TerrainCache("~/.cache/isaaclab_experiments/terrains", max_size_mb=1024)
+    terrain_gen_cfg = terrain_gen_cfg.replace(class_type=CachedTerrainGenerator.bind(cache))
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+
+from lab_utils.launcher import lazy_import
+
+# note: imported on first use, so that the script can parse its arguments before paying for the import
+np = lazy_import("numpy")
+
+CACHE_FORMAT_VERSION = 1
+"""Version of the on-disk layout. Bumping it invalidates all existing entries."""
+
+CACHE_MODES = ("use", "rebuild", "bypass")
+"""Supported cache modes: read and write, regenerate and overwrite, or ignore the cache entirely."""
+
+
+def _normalize(value):
+    """Converts a configuration value into a JSON-serializable form with a stable representation."""
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, (bool, int, str)) or value is None:
+        return value
+    if isinstance(value, float):
+        # repr() is the shortest round-tripping representation
+        return repr(value)
+    if isinstance(value, np.generic):
+        return _normalize(value.item())
+    if callable(value):
+        return f"{getattr(value, '__module__', '')}:{getattr(value, '__qualname__', repr(value))}"
+    return repr(value)
+
+
+def terrain_config_hash(cfg, generator: str = "") -> str:
+    """Computes a stable hash of a resolved terrain generator configuration.
+
+    The hash covers everything that influences the generated mesh: the curriculum flag, the color scheme, the seed,
+    every sub-terrain parameter (including its generation function) and the flat-patch sampling settings. The
+    ``class_type`` field is excluded since it points to the cache itself. Generators that produce different
+    terrains for the same configuration are told apart by the ``generator`` name instead.
+
+    Args:
+        cfg: The terrain generator configuration (``TerrainGeneratorCfg``) or a dictionary of it.
+        generator: The qualified name of the generator that produces the terrain. Defaults to "".
+
+    Returns:
+        The hexadecimal SHA-256 digest of the configuration.
+    """
+    cfg_dict = cfg if isinstance(cfg, dict) else cfg.to_dict()
+    cfg_dict = {k: v for k, v in cfg_dict.items() if k not in ("class_type", "cache_dir", "use_cache")}
+    payload = {"version": CACHE_FORMAT_VERSION, "generator": generator, "cfg": _normalize(cfg_dict)}
+    payload = json.dumps(payload, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedTerrain:
+    """Memory-mapped view of a cached terrain."""
+
+    vertices: np.ndarray
+    """Mesh vertices. Shape is (num_vertices, 3)."""
+
+    faces: np.ndarray
+    """Mesh triangles as vertex indices. Shape is (num_faces, 3)."""
+
+    origins: np.ndarray
+    """Sub-terrain origins. Shape is (num_rows, num_cols, 3)."""
+
+    flat_patches: dict[str, np.ndarray]
+    """Flat patch locations per sampling key. Shape is (num_rows, num_cols, num_patches, 3)."""
+
+    vertex_colors: np.ndarray | None = None
+    """Per-vertex RGBA colors for the height and random color schemes. Shape is (num_vertices, 4)."""
+
+
+class TerrainCache:
+    """Size-bounded LRU cache of generated terrains on disk.
+
+    Each entry is a directory named after the configuration hash. It holds one ``.npy`` file per array and a
+    ``meta.json`` file whose modification time marks the last access. When the total size exceeds the budget, the
+    least recently used entries are removed.
+    """
+
+    def __init__(self, cache_dir: str, max_size_mb: float = 1024.0, mode: str = "use"):
+        """Initializes the cache.
+
+        Args:
+            cache_dir: The directory to store the entries in. It is created if it does not exist.
+            max_size_mb: The size budget of the cache in megabytes. Defaults to 1024.
+            mode: The cache mode, one of :data:`CACHE_MODES`. Defaults to "use".
+
+        Raises:
+            ValueError: When the mode is not supported.
+        """
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Invalid terrain cache mode '{mode}'. Expected one of: {CACHE_MODES}.")
+        self.cache_dir = os.path.abspath(os.path.expanduser(cache_dir))
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.mode = mode
+        if mode != "bypass":
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def __str__(self) -> str:
+        return f"TerrainCache(dir={self.cache_dir}, mode={self.mode}, max_size={self.max_size_bytes / 2**20:.0f} MB)"
+
+    """
+    Operations.
+    """
+
+    def load(self, key: str) -> CachedTerrain | None:
+        """Loads an entry as memory-mapped arrays.
+
+        Args:
+            key: The configuration hash.
+
+        Returns:
+            The cached terrain, or None on a miss (or when the mode is not "use").
+        """
+        entry_dir = os.path.join(self.cache_dir, key)
+        meta_path = os.path.join(entry_dir, "meta.json")
+        if self.mode != "use" or not os.path.isfile(meta_path):
+            return None
+        with open(meta_path) as f:
+            meta = json.load(f)
+        if meta.get("version") != CACHE_FORMAT_VERSION:
+            return None
+
+        def _load(name: str) -> np.ndarray:
+            return np.load(os.path.join(entry_dir, f"{name}.npy"), mmap_mode="r")
+
+        terrain = CachedTerrain(
+            vertices=_load("vertices"),
+            faces=_load("faces"),
+            origins=_load("origins"),
+            flat_patches={name: _load(f"flat_patches.{name}") for name in meta["flat_patches"]},
+            vertex_colors=_load("vertex_colors") if meta["has_vertex_colors"] else None,
+        )
+        # mark the entry as recently used
+        os.utime(meta_path)
+        return terrain
+
+    def store(self, key: str, terrain: CachedTerrain):
+        """Writes an entry and evicts least recently used entries beyond the size budget.
+
+        The entry is written into a temporary directory first and renamed into place, so concurrent readers never
+        observe a partially written entry.
+
+        Args:
+            key: The configuration hash.
+            terrain: The terrain arrays to store.
+        """
+        if self.mode == "bypass":
+            return
+        tmp_dir = tempfile.mkdtemp(prefix=f".{key}.", dir=self.cache_dir)
+        arrays = {
+            "vertices": np.ascontiguousarray(terrain.vertices, dtype=np.float32),
+            "faces": np.ascontiguousarray(terrain.faces, dtype=np.int32),
+            "origins": np.ascontiguousarray(terrain.origins, dtype=np.float32),
+        }
+        for name, patches in terrain.flat_patches.items():
+            arrays[f"flat_patches.{name}"] = np.ascontiguousarray(patches, dtype=np.float32)
+        if terrain.vertex_colors is not None:
+            arrays["vertex_colors"] = np.ascontiguousarray(terrain.vertex_colors, dtype=np.uint8)
+        for name, array in arrays.items():
+            np.save(os.path.join(tmp_dir, f"{name}.npy"), array)
+        meta = {
+            "version": CACHE_FORMAT_VERSION,
+            "flat_patches": list(terrain.flat_patches.keys()),
+            "has_vertex_colors": terrain.vertex_colors is not None,
+            "created": time.time(),
+        }
+        # the metadata is written last: its presence marks a complete entry
+        with open(os.path.join(tmp_dir, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        entry_dir = os.path.join(self.cache_dir, key)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        os.replace(tmp_dir, entry_dir)
+        self.evict()
+
+    def evict(self):
+        """Removes least recently used entries until the cache fits into its size budget."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            meta_path = os.path.join(self.cache_dir, name, "meta.json")
+            if not os.path.isfile(meta_path):
+                continue
+            entry_dir = os.path.join(self.cache_dir, name)
+            size = sum(entry.stat().st_size for entry in os.scandir(entry_dir) if entry.is_file())
+            entries.append((os.path.getmtime(meta_path), size, entry_dir))
+        total_size = sum(size for _, size, _ in entries)
+        # oldest access first
+        for _, size, entry_dir in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+
+class CachedTerrainGenerator:
+    """Terrain generator that serves terrains from a :class:`TerrainCache`.
+
+    It exposes the same outputs as :class:`isaaclab.terrains.TerrainGenerator` (``terrain_mesh``,
+    ``terrain_origins`` and ``flat_patches``), so it can be set as the ``class_type`` of the terrain generator
+    configuration. On a miss, the wrapped generator class runs and its outputs are written to the cache.
+
+    Use :meth:`bind` to create a generator class tied to a specific cache instance.
+    """
+
+    cache: TerrainCache | None = None
+    """The cache to read from and write to."""
+
+    generator_class: type | None = None
+    """The generator to run on a cache miss. Defaults to :class:`isaaclab.terrains.TerrainGenerator`."""
+
+    @classmethod
+    def bind(cls, cache: TerrainCache, generator_class: type | None = None) -> type[CachedTerrainGenerator]:
+        """Creates a generator class that uses the given cache.
+
+        Args:
+            cache: The terrain cache.
+            generator_class: The generator to run on a cache miss. Defaults to None, in which case
+                :class:`isaaclab.terrains.TerrainGenerator` is used.
+
+        Returns:
+            A subclass of :class:`CachedTerrainGenerator` bound to the cache.
+        """
+        return type(cls.__name__, (cls,), {"cache": cache, "generator_class": generator_class})
+
+    def __init__(self, cfg, device: str = "cpu"):
+        """Loads the terrain from the cache or generates it.
+
+        Args:
+            cfg: The terrain generator configuration.
+            device: The device for the flat patch tensors. Defaults to "cpu".
+        """
+        import torch
+        import trimesh
+
+        self.cfg = cfg
+        self.device = device
+
+        cache = self.cache
+        # without a fixed seed, the generator output is random and cannot be content-addressed
+        if cache is not None and cfg.seed is None:
+            print("[WARN]: Terrain generator has no seed. Skipping the terrain cache.")
+            cache = None
+
+        generator_name = ""
+        if self.generator_class is not None:
+            cache_tag = getattr(self.generator_class, "cache_tag", None)
+            generator_name = cache_tag() if cache_tag is not None else _normalize(self.generator_class)
+        key = terrain_config_hash(cfg, generator_name) if cache is not None else None
+        terrain = cache.load(key) if cache is not None else None
+        self.cache_hit = terrain is not None
+        if terrain is None:
+            start = time.perf_counter()
+            terrain, self.terrain_mesh = self._generate(cfg, device)
+            print(f"[INFO]: Generated terrain in {time.perf_counter() - start:.2f} s.")
+            if cache is not None:
+                cache.store(key, terrain)
+        else:
+            print(f"[INFO]: Loaded terrain from cache: {key[:12]}")
+            # the mesh keeps its own copy of the memory-mapped arrays
+            self.terrain_mesh = trimesh.Trimesh(
+                vertices=terrain.vertices, faces=terrain.faces, vertex_colors=terrain.vertex_colors, process=False
+            )
+        self.terrain_origins = np.array(terrain.origins)
+        self.flat_patches = {
+            name: torch.from_numpy(np.array(patches)).to(device) for name, patches in terrain.flat_patches.items()
+        }
+
+    def _generate(self, cfg, device: str) -> tuple[CachedTerrain, object]:
+        """Runs the wrapped generator and collects its outputs along with the generated mesh."""
+        generator_class = self.generator_class
+        if generator_class is None:
+            from isaaclab.terrains import TerrainGenerator
+
+            generator_class = TerrainGenerator
+        generator = generator_class(cfg=cfg, device=device)
+        mesh = generator.terrain_mesh
+        vertex_colors = mesh.visual.vertex_colors if mesh.visual.kind == "vertex" else None
+        terrain = CachedTerrain(
+            vertices=mesh.vertices,
+            faces=mesh.faces,
+            origins=generator.terrain_origins,
+            flat_patches={name: patches.cpu().numpy() for name, patches in generator.flat_patches.items()},
+            vertex_colors=vertex_colors,
+        )
+        return terrain, mesh
@@ -0,0 +1,185 @@
+"""Vectorized terrain curriculum: per-environment difficulty levels and origins.
+
+A generated terrain is a grid of sub-terrains. The rows are difficulty levels, the columns are sub-terrain types,
+and every environment is spawned at the origin of one tile. With a curriculum, environments move to harder rows
+when their agents succeed and to easier rows when they fail.
+
+:class:`TerrainCurriculum` keeps the level and the type of every environment in compact ``int16`` tensors and moves
+environments in bulk: a promotion or demotion is one masked update of the levels, followed by a gather of the new
+origins for the updated environments only. When the tiles have flat patches, the origins are drawn from the flat
+patches of the new tile instead of its center. There are no Python loops over environments, so the cost of an
+update stays small for 100k environments.
+
+Environments that pass the hardest level are sent to a random level, like
+:meth:`isaaclab.terrains.TerrainImporter.update_env_origins`, so that they do not all crowd the last row.
+"""
+
+from __future__ import annotations
+
+from lab_utils.launcher import lazy_import
+
+# note: imported on first use, so that the script can parse its arguments before paying for the import
+torch = lazy_import("torch")
+
+
+class TerrainCurriculum:
+    """Per-environment terrain levels and types with bulk promotion and demotion."""
+
+    def __init__(
+        self,
+        terrain_origins: torch.Tensor,
+        num_envs: int,
+        max_init_level: int | None = None,
+        flat_patches: torch.Tensor | None = None,
+        env_origins: torch.Tensor | None = None,
+        generator: torch.Generator | None = None,
+    ):
+        """Initializes the levels and types and computes the origins of all environments.
+
+        The types are distributed evenly over the environments, and the initial levels are uniform up to the
+        maximum initial level.
+
+        Args:
+            terrain_origins: The origins of the tiles. Shape is (num_levels, num_types, 3).
+            num_envs: The number of environments.
+            max_init_level: The highest initial level. Defaults to None, in which case all levels are used.
+            flat_patches: The flat-patch locations of the tiles. Shape is (num_levels, num_types, num_patches, 3).
+                Defaults to None, in which case the environments are placed at the tile origins.
+            env_origins: The tensor to write the origins into, for instance the one of a terrain importer. Shape is
+                (num_envs, 3). Defaults to None, in which case a new tensor is allocated.
+            generator: The random number generator, on the device of the terrain origins. Defaults to None.
+
+        Raises:
+            ValueError: When the flat patches do not match the grid of tiles.
+        """
+        self.terrain_origins = terrain_origins
+        self.num_levels, self.num_types = terrain_origins.shape[:2]
+        if flat_patches is not None and flat_patches.shape[:2] != terrain_origins.shape[:2]:
+            raise ValueError(
+                f"The flat patches do not match the grid of tiles. Received: {tuple(flat_patches.shape[:2])}."
+                f" Expected: {tuple(terrain_origins.shape[:2])}."
+            )
+        self.flat_patches = flat_patches
+        self.num_envs = num_envs
+        self.device = terrain_origins.device
+        self.generator = generator
+        if max_init_level is None:
+            max_init_level = self.num_levels - 1
+        self.max_init_level = min(max_init_level, self.num_levels - 1)
+
+        # compact per-environment state
+        self.levels = torch.randint(
+            0, self.max_init_level + 1, (num_envs,), device=self.device, generator=generator
+        ).to(torch.int16)
+        env_ids = torch.arange(num_envs, device=self.device)
+        self.types = torch.div(env_ids * self.num_types, num_envs, rounding_mode="floor").to(torch.int16)
+        self.env_origins = torch.empty(num_envs, 3, device=self.device) if env_origins is None else env_origins
+        self._ones = torch.ones(num_envs, dtype=torch.long, device=self.device)
+        self._update_origins(env_ids)
+
+    @classmethod
+    def from_importer(
+        cls, terrain_importer, flat_patch_name: str | None = None, generator: torch.Generator | None = None
+    ) -> TerrainCurriculum:
+        """Creates the curriculum of a terrain importer and shares its environment origins.
+
+        The levels and types are taken over from the importer, and later updates write into
+        :attr:`isaaclab.terrains.TerrainImporter.env_origins`.
+
+        Args:
+            terrain_importer: The terrain importer (:class:`isaaclab.terrains.TerrainImporter`) with a generated
+                terrain.
+            flat_patch_name: The name of the flat patches to place the environments on. Defaults to None, in which
+                case the tile origins are used.
+            generator: The random number generator. Defaults to None.
+        """
+        flat_patches = None if flat_patch_name is None else terrain_importer.flat_patches[flat_patch_name]
+        curriculum = cls(
+            terrain_importer.terrain_origins,
+            terrain_importer.cfg.num_envs,
+            max_init_level=terrain_importer.max_terrain_level - 1,
+            flat_patches=flat_patches,
+            env_origins=terrain_importer.env_origins,
+            generator=generator,
+        )
+        curriculum.levels.copy_(terrain_importer.terrain_levels)
+        curriculum.types.copy_(terrain_importer.terrain_types)
+        curriculum._update_origins(torch.arange(curriculum.num_envs, device=curriculum.device))
+        return curriculum
+
+    """
+    Operations.
+    """
+
+    def update(self, env_ids: torch.Tensor, move_up: torch.Tensor, move_down: torch.Tensor):
+        """Promotes and demotes environments and recomputes their origins.
+
+        Args:
+            env_ids: The environments to update. Shape is (N,).
+            move_up: Which of the environments move one level up. Shape is (N,).
+            move_down: Which of the environments move one level down. Shape is (N,).
+        """
+        levels = self.levels[env_ids] + move_up.to(torch.int16) - move_down.to(torch.int16)
+        # environments that solved the hardest level start over at a random level
+        random_levels = torch.randint(
+            0, self.num_levels, levels.shape, dtype=torch.int16, device=self.device, generator=self.generator
+        )
+        levels = torch.where(levels >= self.num_levels, random_levels, levels.clamp(min=0))
+        self.levels[env_ids] = levels
+        self._update_origins(env_ids)
+
+    def update_from_success(
+        self,
+        env_ids: torch.Tensor,
+        success: torch.Tensor,
+        promote_above: float = 0.8,
+        demote_below: float = 0.5,
+    ):
+        """Promotes and demotes environments by thresholding a success metric.
+
+        Args:
+            env_ids: The environments to update. Shape is (N,).
+            success: The success metric of the environments, for instance the fraction of the commanded distance
+                that was walked. Shape is (N,).
+            promote_above: The environments with a larger metric move one level up. Defaults to 0.8.
+            demote_below: The environments with a smaller metric move one level down. Defaults to 0.5.
+        """
+        self.update(env_ids, success > promote_above, success < demote_below)
+
+    def level_histogram(self, per_type: bool = False) -> torch.Tensor:
+        """Returns the number of environments per level, without synchronizing the device.
+
+        Args:
+            per_type: Whether to count the levels per sub-terrain type. Defaults to False.
+
+        Returns:
+            The counts. Shape is (num_levels,), or (num_types, num_levels) per type.
+        """
+        # note: a scatter into a fixed number of bins, since bincount reads the largest key back to the host.
+        keys = self.levels.long()
+        num_bins = self.num_levels
+        if per_type:
+            keys = keys + self.types.long() * self.num_levels
+            num_bins *= self.num_types
+        counts = torch.zeros(num_bins, dtype=torch.long, device=self.device).index_add_(0, keys, self._ones)
+        return counts.view(self.num_types, self.num_levels) if per_type else counts
+
+    def mean_level(self) -> torch.Tensor:
+        """Returns the mean level over all environments as a device scalar."""
+        return self.levels.float().mean()
+
+    """
+    Internal helpers.
+    """
+
+    def _update_origins(self, env_ids: torch.Tensor):
+        """Recomputes the origins of the given environments from their tiles."""
+        levels = self.levels[env_ids].long()
+        types = self.types[env_ids].long()
+        if self.flat_patches is None:
+            self.env_origins[env_ids] = self.terrain_origins[levels, types]
+            return
+        patch_ids = torch.randint(
+            0, self.flat_patches.shape[2], (len(levels),), device=self.device, generator=self.generator
+        )
+        self.env_origins[env_ids] = self.flat_patches[levels, types, patch_ids]
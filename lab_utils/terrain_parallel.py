@@ -0,0 +1,251 @@
+"""Terrain generator that builds the sub-terrain tiles of the grid in a process pool.
+
+The upstream :class:`isaaclab.terrains.TerrainGenerator` builds every tile of the (rows x cols) grid serially. The
+tiles are independent of each other, so :class:`ParallelTerrainGenerator` first plans the grid (sub-terrain type and
+difficulty per tile), then fans the mesh generation out to worker processes and finally stitches the tiles back
+together in plan order. The meshes come back through shared-memory blocks instead of pickled ``trimesh`` objects.
+
+Sub-terrain functions draw from NumPy's global random state. To make the result independent of how tiles are
+distributed over workers, the global state is re-seeded for every tile from ``(seed, row, col)``. The output is
+therefore identical for any number of workers, including the serial path with a single worker. It is *not* identical
+to the upstream generator, which threads a single random state through all tiles.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import torch
+import trimesh
+
+from isaaclab.terrains import TerrainGenerator
+
+from lab_utils.flat_patches import find_flat_patches_hf, rasterize_mesh
+
+
+class _TileContext:
+    """Minimal stand-in for the generator instance required by :meth:`TerrainGenerator._get_terrain_mesh`.
+
+    Only the generator configuration is read when building a tile, so the workers do not need to receive the full
+    generator (and its device buffers).
+    """
+
+    def __init__(self, cfg):
+        self.cfg = cfg
+
+
+def tile_seed(seed: int, sub_row: int, sub_col: int) -> int:
+    """Derives the random seed of a single tile from the terrain seed and the tile coordinates."""
+    return int(np.random.SeedSequence([seed, sub_row, sub_col]).generate_state(1)[0])
+
+
+def generate_tile(task: tuple) -> tuple[trimesh.Trimesh, np.ndarray]:
+    """Generates the mesh of a single tile.
+
+    Args:
+        task: The tuple (generator cfg, sub-terrain cfg, difficulty, tile seed).
+
+    Returns:
+        A tuple containing the tile mesh and its origin.
+    """
+    generator_cfg, sub_terrain_cfg, difficulty, seed = task
+    np.random.seed(seed)
+    return TerrainGenerator._get_terrain_mesh(_TileContext(generator_cfg), difficulty, sub_terrain_cfg)
+
+
+def _generate_tile_shared(task: tuple) -> tuple[str, list, np.ndarray]:
+    """Generates a tile in a worker and returns its arrays through a shared-memory block.
+
+    Returns:
+        A tuple containing the name of the shared-memory block, the (shape, dtype) layout of the packed arrays and
+        the tile origin.
+    """
+    mesh, origin = generate_tile(task)
+    arrays = [np.ascontiguousarray(mesh.vertices), np.ascontiguousarray(mesh.faces)]
+    if mesh.visual.kind == "vertex":
+        arrays.append(np.ascontiguousarray(mesh.visual.vertex_colors))
+    shm = shared_memory.SharedMemory(create=True, size=max(1, sum(array.nbytes for array in arrays)))
+    offset = 0
+    for array in arrays:
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf, offset=offset)[:] = array
+        offset += array.nbytes
+    layout = [(array.shape, array.dtype.str) for array in arrays]
+    # the parent process owns the block from here on and unlinks it
+    shm.close()
+    return shm.name, layout, origin
+
+
+def _receive_tile(name: str, layout: list) -> trimesh.Trimesh:
+    """Rebuilds a tile mesh from a shared-memory block and releases the block."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        arrays = []
+        offset = 0
+        for shape, dtype in layout:
+            array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+            arrays.append(array.copy())
+            offset += array.nbytes
+    finally:
+        shm.close()
+        shm.unlink()
+    vertex_colors = arrays[2] if len(arrays) > 2 else None
+    return trimesh.Trimesh(vertices=arrays[0], faces=arrays[1], vertex_colors=vertex_colors, process=False)
+
+
+class ParallelTerrainGenerator(TerrainGenerator):
+    """Terrain generator that builds the sub-terrain tiles in a process pool.
+
+    Use :meth:`bind` to set the number of workers, since the terrain importer constructs the generator from its
+    configuration alone.
+    """
+
+    num_workers: int = 1
+    """Number of worker processes. With a single worker, the tiles are generated in the calling process."""
+
+    flat_patch_backend: str = "raycast"
+    """Method to find flat patches on the tiles.
+
+    * ``"raycast"``: rejection sampling with ray-casts, as in :class:`isaaclab.terrains.TerrainGenerator`.
+    * ``"heightfield"``: vectorized search over a rasterized heightfield, see :mod:`lab_utils.flat_patches`.
+    """
+
+    @classmethod
+    def bind(cls, num_workers: int = 1, flat_patch_backend: str = "raycast") -> type[ParallelTerrainGenerator]:
+        """Creates a generator class with the given settings.
+
+        Args:
+            num_workers: Number of worker processes. Defaults to 1.
+            flat_patch_backend: Method to find flat patches. Defaults to "raycast".
+
+        Returns:
+            A subclass of :class:`ParallelTerrainGenerator` with the settings applied.
+
+        Raises:
+            ValueError: When the flat patch backend is not supported.
+        """
+        if flat_patch_backend not in ("raycast", "heightfield"):
+            raise ValueError(f"Invalid flat patch backend '{flat_patch_backend}'. Expected 'raycast' or 'heightfield'.")
+        attributes = {"num_workers": max(1, int(num_workers)), "flat_patch_backend": flat_patch_backend}
+        return type(cls.__name__, (cls,), attributes)
+
+    @classmethod
+    def cache_tag(cls) -> str:
+        """Identifies the generator output for the terrain cache.
+
+        The number of workers is left out since it does not change the generated terrain.
+        """
+        return f"{__name__}:{cls.__qualname__}(flat_patch_backend={cls.flat_patch_backend})"
+
+    """
+    Terrain generator overrides.
+    """
+
+    def _generate_random_terrains(self):
+        """Plans the grid with randomly sampled sub-terrains and difficulties, then generates it."""
+        rng = getattr(self, "np_rng", np.random)
+        proportions = np.array([sub_cfg.proportion for sub_cfg in self.cfg.sub_terrains.values()])
+        proportions /= np.sum(proportions)
+        sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
+        # note: the draws happen in the same order as in the serial generator
+        plan = []
+        for index in range(self.cfg.num_rows * self.cfg.num_cols):
+            sub_row, sub_col = np.unravel_index(index, (self.cfg.num_rows, self.cfg.num_cols))
+            sub_index = rng.choice(len(proportions), p=proportions)
+            difficulty = rng.uniform(*self.cfg.difficulty_range)
+            plan.append((int(sub_row), int(sub_col), difficulty, sub_terrains_cfgs[sub_index]))
+        self._generate_tiles(plan)
+
+    def _generate_curriculum_terrains(self):
+        """Plans the grid with difficulty increasing along the rows, then generates it."""
+        rng = getattr(self, "np_rng", np.random)
+        proportions = np.array([sub_cfg.proportion for sub_cfg in self.cfg.sub_terrains.values()])
+        proportions /= np.sum(proportions)
+        # the sub-terrain type of each column follows the proportions (not randomly sampled)
+        cumulative = np.cumsum(proportions)
+        sub_indices = [
+            np.min(np.where(index / self.cfg.num_cols + 0.001 < cumulative)[0]) for index in range(self.cfg.num_cols)
+        ]
+        sub_terrains_cfgs = list(self.cfg.sub_terrains.values())
+        lower, upper = self.cfg.difficulty_range
+        plan = []
+        for sub_col in range(self.cfg.num_cols):
+            for sub_row in range(self.cfg.num_rows):
+                # vary the difficulty linearly over the rows, with a small random offset for diversity
+                difficulty = (sub_row + rng.uniform()) / self.cfg.num_rows
+                difficulty = lower + (upper - lower) * difficulty
+                plan.append((sub_row, sub_col, difficulty, sub_terrains_cfgs[sub_indices[sub_col]]))
+        self._generate_tiles(plan)
+
+    def _add_sub_terrain(self, mesh: trimesh.Trimesh, origin: np.ndarray, row: int, col: int, sub_terrain_cfg):
+        """Adds a tile to the terrain, finding its flat patches on a heightfield if configured."""
+        if self.flat_patch_backend == "raycast" or sub_terrain_cfg.flat_patch_sampling is None:
+            super()._add_sub_terrain(mesh, origin, row, col, sub_terrain_cfg)
+            return
+        # find the patches in the local frame of the tile (centered at zero), before it is moved into place
+        horizontal_scale = self.cfg.horizontal_scale
+        size_x, size_y = self.cfg.size
+        shape = (int(round(size_x / horizontal_scale)) + 1, int(round(size_y / horizontal_scale)) + 1)
+        heights = rasterize_mesh(
+            torch.from_numpy(np.asarray(mesh.vertices, dtype=np.float32)).to(self.device),
+            torch.from_numpy(np.asarray(mesh.faces, dtype=np.int64)).to(self.device),
+            lower=(-0.5 * size_x, -0.5 * size_y),
+            shape=shape,
+            horizontal_scale=horizontal_scale,
+        )
+        seed = self.cfg.seed if self.cfg.seed is not None else 0
+        generator = torch.Generator(device=self.device).manual_seed(tile_seed(seed, row, col))
+        for name, patch_cfg in sub_terrain_cfg.flat_patch_sampling.items():
+            if name not in self.flat_patches:
+                self.flat_patches[name] = torch.zeros(
+                    (self.cfg.num_rows, self.cfg.num_cols, patch_cfg.num_patches, 3), device=self.device
+                )
+            self.flat_patches[name][row, col] = find_flat_patches_hf(
+                heights.unsqueeze(0),
+                horizontal_scale,
+                origins=torch.as_tensor(origin, dtype=torch.float, device=self.device).unsqueeze(0),
+                num_patches=patch_cfg.num_patches,
+                patch_radius=patch_cfg.patch_radius,
+                max_height_diff=patch_cfg.max_height_diff,
+                lower=(-0.5 * size_x, -0.5 * size_y),
+                x_range=patch_cfg.x_range,
+                y_range=patch_cfg.y_range,
+                z_range=patch_cfg.z_range,
+                generator=generator,
+            )[0]
+        super()._add_sub_terrain(mesh, origin, row, col, sub_terrain_cfg.replace(flat_patch_sampling=None))
+
+    """
+    Internal helpers.
+    """
+
+    def _generate_tiles(self, plan: list[tuple[int, int, float, object]]):
+        """Generates the planned tiles and adds them to the terrain in plan order.
+
+        Args:
+            plan: The tiles to generate as tuples (sub-row, sub-col, difficulty, sub-terrain cfg).
+        """
+        seed = self.cfg.seed if self.cfg.seed is not None else 0
+        tasks = [(self.cfg, sub_cfg, difficulty, tile_seed(seed, row, col)) for row, col, difficulty, sub_cfg in plan]
+        if self.num_workers == 1:
+            tiles = map(generate_tile, tasks)
+        else:
+            tiles = self._generate_tiles_in_pool(tasks)
+        # stitch the tiles in plan order, which keeps the output independent of the number of workers
+        for (sub_row, sub_col, _, sub_cfg), (mesh, origin) in zip(plan, tiles):
+            self._add_sub_terrain(mesh, origin, sub_row, sub_col, sub_cfg)
+
+    def _generate_tiles_in_pool(self, tasks: list[tuple]) -> list[tuple[trimesh.Trimesh, np.ndarray]]:
+        """Generates the tiles in worker processes.
+
+        The workers are forked: the entry scripts launch the simulation app at import time, so a spawned worker
+        that re-imports the main module would boot a second app.
+        """
+        # start the resource tracker before forking so that the workers share it with this process
+        resource_tracker.ensure_running()
+        chunksize = max(1, len(tasks) // (4 * self.num_workers))
+        with ProcessPoolExecutor(max_workers=self.num_workers, mp_context=mp.get_context("fork")) as pool:
+            results = list(pool.map(_generate_tile_shared, tasks, chunksize=chunksize))
+        return [(_receive_tile(name, layout), origin) for name, layout, origin in results]
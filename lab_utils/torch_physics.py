@@ -0,0 +1,373 @@
+"""Pure-torch stand-ins for :class:`isaaclab.sim.SimulationContext` and :class:`isaaclab.assets.RigidObject`.
+
+The stand-ins mirror the part of the Isaac Lab API the scripts use, so their loop logic can be run, tested and
+timed on CPU tensors without Isaac Sim or a GPU. Behind the API, :class:`TorchSimulationContext` advances every
+registered :class:`TorchRigidObject` with a batched semi-implicit Euler integrator:
+
+* the linear velocity is updated from gravity and the external forces, then the position from the new velocity,
+* the orientation is integrated from the angular velocity and renormalized,
+* contact with the ground plane at z = 0 projects the lowest point of the body onto the plane, reflects the
+  normal velocity with the restitution coefficient and applies Coulomb friction to the tangential velocity.
+
+The contact model has no contact torques and no collisions between bodies. It is meant for benchmarking the
+surrounding Python and tensor code, not for physical fidelity.
+
+.. code-block:: python
+
+    sim = TorchSimulationContext(dt=0.01)
+    cone = TorchRigidObject(sim, num_instances=10000, radius=0.1)
+    sim.reset()
+    while app.is_running():
+        cone.write_data_to_sim()
+        sim.step()
+        cone.update(sim.get_physics_dt())
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import torch
+
+
+class HeadlessApp:
+    """Stand-in for the simulation app that runs until :meth:`close` is called."""
+
+    def __init__(self):
+        self._running = True
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def close(self):
+        self._running = False
+
+
+class TorchSimulationContext:
+    """Steps the registered rigid objects with a batched semi-implicit Euler integrator."""
+
+    def __init__(
+        self, dt: float = 0.01, device: str = "cpu", gravity: tuple[float, float, float] = (0.0, 0.0, -9.81)
+    ):
+        """Initializes the simulation context.
+
+        Args:
+            dt: The physics time-step (in s). Defaults to 0.01.
+            device: The device of the simulation tensors. Defaults to "cpu".
+            gravity: The gravity vector (in m/s^2). Defaults to (0.0, 0.0, -9.81).
+        """
+        self.dt = dt
+        self.device = device
+        self.gravity = torch.tensor(gravity, device=device)
+        self.objects: list[TorchRigidObject] = []
+        self._is_playing = False
+
+    def get_physics_dt(self) -> float:
+        """Returns the physics time-step."""
+        return self.dt
+
+    def is_playing(self) -> bool:
+        """Whether the simulation was reset and is playing."""
+        return self._is_playing
+
+    def set_camera_view(self, eye: Sequence[float], target: Sequence[float]):
+        """Does nothing; there is no viewport."""
+        pass
+
+    def reset(self):
+        """Writes the default states of all objects and starts playing."""
+        for obj in self.objects:
+            obj.write_root_state_to_sim(obj.data.default_root_state)
+            obj.reset()
+        self._is_playing = True
+
+    def step(self, render: bool = True):
+        """Advances all objects by one time-step.
+
+        Args:
+            render: Ignored; there is no renderer. Defaults to True.
+        """
+        for obj in self.objects:
+            obj._integrate(self.dt, self.gravity)
+
+
+class TorchRigidObjectData:
+    """Data container mirroring :class:`isaaclab.assets.RigidObjectData`."""
+
+    def __init__(self, num_instances: int, default_root_state: torch.Tensor):
+        self.default_root_state = default_root_state
+        """Default root state ``[pos, quat, lin_vel, ang_vel]`` in the local environment frame.
+        Shape is (num_instances, 13)."""
+        self.root_state_w = default_root_state.clone()
+        """Root state ``[pos, quat, lin_vel, ang_vel]`` in the simulation world frame. Shape is (num_instances, 13)."""
+
+    @property
+    def root_pos_w(self) -> torch.Tensor:
+        """Root position in the world frame. Shape is (num_instances, 3)."""
+        return self.root_state_w[:, :3]
+
+    @property
+    def root_quat_w(self) -> torch.Tensor:
+        """Root orientation (w, x, y, z) in the world frame. Shape is (num_instances, 4)."""
+        return self.root_state_w[:, 3:7]
+
+    @property
+    def root_lin_vel_w(self) -> torch.Tensor:
+        """Root linear velocity in the world frame. Shape is (num_instances, 3)."""
+        return self.root_state_w[:, 7:10]
+
+    @property
+    def root_ang_vel_w(self) -> torch.Tensor:
+        """Root angular velocity in the world frame. Shape is (num_instances, 3)."""
+        return self.root_state_w[:, 10:13]
+
+
+class TorchRigidObject:
+    """Batch of rigid bodies mirroring the simulation API of :class:`isaaclab.assets.RigidObject`.
+
+    The ground contact uses a sphere of the given radius, an oriented box of the given half extents, or, when both
+    are given, the box swept by the sphere. Both can be set per body, so one batch can hold different shapes: spheres
+    have zero half extents and boxes have a zero radius.
+    """
+
+    def __init__(
+        self,
+        sim: TorchSimulationContext,
+        num_instances: int,
+        pos: Sequence[float] = (0.0, 0.0, 0.0),
+        rot: Sequence[float] = (1.0, 0.0, 0.0, 0.0),
+        mass: float = 1.0,
+        radius: float | torch.Tensor | None = None,
+        half_extents: Sequence[float] | torch.Tensor | None = None,
+        restitution: float = 0.0,
+        friction: float = 0.5,
+    ):
+        """Initializes the rigid objects and registers them with the simulation context.
+
+        Args:
+            sim: The simulation context.
+            num_instances: The number of bodies.
+            pos: The default position of the bodies. Defaults to (0.0, 0.0, 0.0).
+            rot: The default orientation (w, x, y, z) of the bodies. Defaults to (1.0, 0.0, 0.0, 0.0).
+            mass: The mass of every body (in kg). Defaults to 1.0.
+            radius: The radius of the contact sphere (in m), shared or per body with shape (num_instances,).
+                Defaults to None.
+            half_extents: The half extents of the contact box (in m), shared with shape (3,) or per body with shape
+                (num_instances, 3). Defaults to None, in which case the contact sphere is used.
+            restitution: The coefficient of restitution of the ground contact. Defaults to 0.0.
+            friction: The Coulomb friction coefficient of the ground contact. Defaults to 0.5.
+
+        Raises:
+            ValueError: When neither a radius nor half extents are given.
+        """
+        if radius is None and half_extents is None:
+            raise ValueError("The contact shape requires either a radius or half extents.")
+        self.device = sim.device
+        self.num_instances = num_instances
+        self.mass = mass
+        self.restitution = restitution
+        self.friction = friction
+        self.radius = torch.as_tensor(radius, dtype=torch.float, device=self.device) if radius is not None else None
+        self.half_extents = (
+            torch.as_tensor(half_extents, dtype=torch.float, device=self.device) if half_extents is not None else None
+        )
+
+        default_root_state = torch.zeros(num_instances, 13, device=self.device)
+        default_root_state[:, :3] = torch.tensor(pos, device=self.device)
+        default_root_state[:, 3:7] = torch.tensor(rot, device=self.device)
+        self.data = TorchRigidObjectData(num_instances, default_root_state)
+        self._external_force = torch.zeros(num_instances, 3, device=self.device)
+        self._all_ids = torch.arange(num_instances, device=self.device)
+        # integration scratch buffers
+        self._scratch = torch.empty(num_instances, 3, device=self.device)
+        self._quat_rate = torch.empty(num_instances, 4, device=self.device)
+        self._lowest = torch.empty(num_instances, device=self.device)
+        sim.objects.append(self)
+
+    """
+    Operations.
+    """
+
+    def reset(self, env_ids: Sequence[int] | torch.Tensor | None = None):
+        """Clears the external forces of the selected bodies."""
+        if env_ids is None:
+            self._external_force.zero_()
+        else:
+            self._external_force[env_ids] = 0.0
+
+    def write_data_to_sim(self):
+        """Does nothing; the external forces are read directly by the integrator."""
+        pass
+
+    def update(self, dt: float):
+        """Does nothing; the buffers are updated in place by the integrator."""
+        pass
+
+    def set_external_force_and_torque(
+        self, forces: torch.Tensor, torques: torch.Tensor, env_ids: torch.Tensor | None = None
+    ):
+        """Sets the external forces on the bodies. The torques are ignored.
+
+        Args:
+            forces: The external forces in the world frame. Shape is (len(env_ids), 3) or (len(env_ids), 1, 3).
+            torques: The external torques. Ignored.
+            env_ids: The bodies to set the forces for. Defaults to None (all bodies).
+        """
+        env_ids = self._all_ids if env_ids is None else env_ids
+        self._external_force[env_ids] = forces.reshape(-1, 3)
+
+    """
+    Operations - Write to simulation.
+    """
+
+    def write_root_state_to_sim(self, root_state: torch.Tensor, env_ids: Sequence[int] | torch.Tensor | None = None):
+        """Sets the root states ``[pos, quat, lin_vel, ang_vel]`` of the selected bodies.
+
+        Args:
+            root_state: The root states. Shape is (len(env_ids), 13).
+            env_ids: The bodies to write. Defaults to None (all bodies).
+        """
+        self._write(root_state, slice(0, 13), env_ids)
+
+    def write_root_pose_to_sim(self, root_pose: torch.Tensor, env_ids: Sequence[int] | torch.Tensor | None = None):
+        """Sets the root poses ``[pos, quat]`` of the selected bodies.
+
+        Args:
+            root_pose: The root poses. Shape is (len(env_ids), 7).
+            env_ids: The bodies to write. Defaults to None (all bodies).
+        """
+        self._write(root_pose, slice(0, 7), env_ids)
+
+    def write_root_velocity_to_sim(
+        self, root_velocity: torch.Tensor, env_ids: Sequence[int] | torch.Tensor | None = None
+    ):
+        """Sets the root velocities ``[lin_vel, ang_vel]`` of the selected bodies.
+
+        Args:
+            root_velocity: The root velocities. Shape is (len(env_ids), 6).
+            env_ids: The bodies to write. Defaults to None (all bodies).
+        """
+        self._write(root_velocity, slice(7, 13), env_ids)
+
+    """
+    Internal helpers.
+    """
+
+    def _write(self, values: torch.Tensor, columns: slice, env_ids: Sequence[int] | torch.Tensor | None):
+        if env_ids is None:
+            self.data.root_state_w[:, columns] = values
+        else:
+            env_ids = torch.as_tensor(env_ids, device=self.device)
+            self.data.root_state_w[env_ids, columns] = values
+
+    def _integrate(self, dt: float, gravity: torch.Tensor):
+        """Advances the bodies by one semi-implicit Euler step and resolves the ground contact."""
+        state = self.data.root_state_w
+        pos, quat, lin_vel, ang_vel = state[:, :3], state[:, 3:7], state[:, 7:10], state[:, 10:13]
+
+        # velocity first, then position from the new velocity
+        lin_vel.add_(gravity, alpha=dt)
+        # note: the force buffer is always applied; checking it for non-zero entries would wait for the device
+        lin_vel.add_(self._external_force, alpha=dt / self.mass)
+        pos.add_(lin_vel, alpha=dt)
+
+        # q <- normalize(q + dt / 2 * q * (0, w)) with w in the world frame: dq = 0.5 * (0, w) * q
+        w, x, y, z = quat.unbind(-1)
+        wx, wy, wz = ang_vel.unbind(-1)
+        rate = self._quat_rate
+        torch.stack(
+            [-wx * x - wy * y - wz * z, wx * w + wy * z - wz * y, wy * w + wz * x - wx * z, wz * w + wx * y - wy * x],
+            dim=-1,
+            out=rate,
+        )
+        quat.add_(rate, alpha=0.5 * dt)
+        quat.div_(quat.norm(dim=-1, keepdim=True))
+
+        # height of the lowest point of the body above its center
+        lowest = self._lowest
+        if self.half_extents is None:
+            lowest.copy_(self.radius)
+        else:
+            # third row of the rotation matrix: the world z-components of the body axes
+            w, x, y, z = quat.unbind(-1)
+            row = self._scratch
+            torch.stack([2.0 * (x * z - w * y), 2.0 * (y * z + w * x), 1.0 - 2.0 * (x * x + y * y)], dim=-1, out=row)
+            torch.sum(row.abs_().mul_(self.half_extents), dim=-1, out=lowest)
+            if self.radius is not None:
+                lowest.add_(self.radius)
+
+        # ground contact
+        penetration = lowest - pos[:, 2]
+        # note: the contact response is applied under the mask; skipping it without contacts would wait for the device
+        contact = penetration > 0.0
+        pos[:, 2].add_(penetration.clamp_(min=0.0))
+        v_n = lin_vel[:, 2]
+        # normal impulse: reflect the approaching velocity and remember its size for the friction impulse
+        approach = torch.where(contact, (-v_n).clamp(min=0.0), torch.zeros_like(v_n))
+        v_n.add_(approach, alpha=1.0 + self.restitution)
+        # Coulomb friction: the tangential impulse is bounded by mu times the normal impulse (plus resting support)
+        normal_impulse = approach * (1.0 + self.restitution) + contact * (-gravity[2] * dt)
+        tangential = lin_vel[:, :2]
+        speed = tangential.norm(dim=-1)
+        scale = (1.0 - self.friction * normal_impulse / speed.clamp(min=1e-9)).clamp(min=0.0)
+        tangential.mul_(torch.where(contact, scale, torch.ones_like(scale)).unsqueeze(-1))
+        # note: there are no contact torques. The angular velocity decays like the tangential velocity instead.
+        ang_vel.mul_(torch.where(contact, scale, torch.ones_like(scale)).unsqueeze(-1))
+
+
+class TorchRigidObjectEnv:
+    """Minimal environment around the stand-in: bodies pushed by force actions, observing their position and velocity.
+
+    It mirrors the ``reset()``/``step(actions)`` interface of :class:`isaaclab.envs.ManagerBasedEnv` with a
+    decimation, so environment runners can be exercised without Isaac Sim.
+    """
+
+    action_dim = 3
+    """The actions are the external forces (in N)."""
+
+    def __init__(self, num_envs: int, worker_id: int = 0, decimation: int = 4, device: str = "cpu"):
+        """Initializes the environment.
+
+        Args:
+            num_envs: The number of environments.
+            worker_id: The index of the environment slice, used as seed. Defaults to 0.
+            decimation: The number of physics steps per environment step. Defaults to 4.
+            device: The simulation device. Defaults to "cpu".
+        """
+        self.num_envs = num_envs
+        self.decimation = decimation
+        self.device = device
+        self.sim = TorchSimulationContext(dt=0.005, device=device)
+        self.body = TorchRigidObject(self.sim, num_envs, pos=(0.0, 0.0, 0.5), radius=0.1)
+        self._generator = torch.Generator(device=device).manual_seed(worker_id)
+        self._torques = torch.zeros(num_envs, 3, device=device)
+        self.sim.reset()
+
+    def reset(self) -> tuple[dict[str, torch.Tensor], dict]:
+        """Resets all bodies to random heights."""
+        root_state = self.body.data.default_root_state.clone()
+        root_state[:, 2] += torch.rand(self.num_envs, generator=self._generator, device=self.device)
+        self.body.write_root_state_to_sim(root_state)
+        self.body.reset()
+        return self._observations(), {}
+
+    def step(self, actions: torch.Tensor) -> tuple[dict[str, torch.Tensor], dict]:
+        """Applies the forces and advances the simulation by ``decimation`` physics steps."""
+        self.body.set_external_force_and_torque(actions, self._torques)
+        for _ in range(self.decimation):
+            self.body.write_data_to_sim()
+            self.sim.step(render=False)
+            self.body.update(self.sim.get_physics_dt())
+        return self._observations(), {}
+
+    def close(self):
+        pass
+
+    def _observations(self) -> dict[str, torch.Tensor]:
+        return {"policy": torch.cat([self.body.data.root_pos_w, self.body.data.root_lin_vel_w], dim=-1)}
+
+
+def make_torch_env(num_envs: int, worker_id: int = 0) -> TorchRigidObjectEnv:
+    """Creates a :class:`TorchRigidObjectEnv` on the CPU, for instance as factory of a sharded environment."""
+    return TorchRigidObjectEnv(num_envs, worker_id)
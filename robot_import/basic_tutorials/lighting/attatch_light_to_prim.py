@@ -1,23 +1,48 @@
 import argparse
+import os
+import sys
 
-from isaaclab.app import AppLauncher
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
+
+from lab_utils.launcher import Launcher  # noqa: E402
+from lab_utils.profiling import add_profiling_args, configure_from_args, profiler  # noqa: E402
 
 # create argparser
 parser = argparse.ArgumentParser(description="Tutorial on spawning prims into the scene.")
-# append AppLauncher cli args
-AppLauncher.add_app_launcher_args(parser)
-# parse the arguments
-args_cli = parser.parse_args()
+parser.add_argument(
+    "--light_rig", type=str, default=None, help="Also spawn the lights of this rig file, e.g. attached to the cones."
+)
+add_profiling_args(parser)
+
+
+def validate_args(args):
+    """Checks the rig file before the app is started."""
+    if args.light_rig is not None:
+        from utils.light_rig import load_light_rig
+
+        load_light_rig(args.light_rig)
+
+
+# append the launcher and AppLauncher cli args
+launcher = Launcher(parser)
+# parse and validate the arguments before starting the app (exits here with --dry_run)
+args_cli = launcher.parse_args(validate=validate_args)
+configure_from_args(args_cli)
 # launch omniverse app
-app_launcher = AppLauncher(args_cli)
-simulation_app = app_launcher.app
+simulation_app = launcher.launch()
 
-import isaacsim.core.utils.prims as prim_utils
+with launcher.phase("imports"):
+    import isaacsim.core.utils.prims as prim_utils
 
-import isaaclab.sim as sim_utils
-from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
+    import isaaclab.sim as sim_utils
+    from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
 
+    from utils.light_rig import load_light_rig, spawn_light_rig
+launcher.report()
 
+
+@profiler.profiled("design_scene")
 def design_scene():
     # Ground-plane
     cfg_ground = sim_utils.GroundPlaneCfg()
@@ -44,6 +69,11 @@ def design_scene():
 
     print(f"[INFO] Light attached to {cone_path}")
 
+    # rig lights, placed or attached to the prims that match their rules
+    if args_cli.light_rig is not None:
+        rig = spawn_light_rig(load_light_rig(args_cli.light_rig))
+        print(f"[INFO] Spawned {len(rig)} lights of the rig: {args_cli.light_rig}")
+
 
 
 
@@ -60,14 +90,17 @@ def main():
     design_scene()
 
     # Play the simulator
-    sim.reset()
+    with profiler.phase("sim.reset"):
+        sim.reset()
     # Now we are ready!
     print("[INFO]: Setup complete...")
 
     # Simulate physics
     while simulation_app.is_running():
         # perform step
-        sim.step()
+        with profiler.phase("sim.step"):
+            sim.step()
+    profiler.finish()
 
 
 if __name__ == "__main__":
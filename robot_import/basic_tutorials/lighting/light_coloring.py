@@ -10,41 +10,90 @@
     # Usage
     ./isaaclab.sh -p scripts/tutorials/00_sim/spawn_prims.py
 
+    # Spawn the lights of a rig file and re-draw their colors and intensities every 300 steps
+    ./isaaclab.sh -p robot_import/basic_tutorials/lighting/light_coloring.py --light_rig scenes/light_rig.toml \\
+        --randomize_interval 300
+
 """
 
 """Launch Isaac Sim Simulator first."""
 
 
 import argparse
+import os
+import sys
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
 
-from isaaclab.app import AppLauncher
+from lab_utils.launcher import Launcher  # noqa: E402
+from lab_utils.profiling import add_profiling_args, configure_from_args, profiler  # noqa: E402
 
 # create argparser
 parser = argparse.ArgumentParser(description="Tutorial on spawning prims into the scene.")
-# append AppLauncher cli args
-AppLauncher.add_app_launcher_args(parser)
-# parse the arguments
-args_cli = parser.parse_args()
+parser.add_argument(
+    "--light_rig", type=str, default=None, help="Spawn the lights of this rig file instead of the three lights."
+)
+parser.add_argument(
+    "--randomize_interval",
+    type=int,
+    default=0,
+    help="Re-draw the colors and intensities of the rig lights every n steps. 0 disables.",
+)
+parser.add_argument("--light_seed", type=int, default=0, help="Seed of the light randomization.")
+add_profiling_args(parser)
+
+
+def validate_args(args):
+    """Checks the arguments and the rig file before the app is started."""
+    if args.randomize_interval < 0:
+        raise ValueError(f"The randomization interval must not be negative. Received: {args.randomize_interval}.")
+    if args.light_rig is not None:
+        from utils.light_rig import load_light_rig
+
+        load_light_rig(args.light_rig)
+
+
+# append the launcher and AppLauncher cli args
+launcher = Launcher(parser)
+# parse and validate the arguments before starting the app (exits here with --dry_run)
+args_cli = launcher.parse_args(validate=validate_args)
+configure_from_args(args_cli)
 # launch omniverse app
-app_launcher = AppLauncher(args_cli)
-simulation_app = app_launcher.app
+simulation_app = launcher.launch()
 
 """Rest everything follows."""
 
-import isaacsim.core.utils.prims as prim_utils
+with launcher.phase("imports"):
+    import numpy as np
+
+    import isaacsim.core.utils.prims as prim_utils
 
-import isaaclab.sim as sim_utils
-from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
+    import isaaclab.sim as sim_utils
+    from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
 
-from utils.quat import quaternion_from_degrees
+    from utils.light_rig import load_light_rig, spawn_light_rig
+    from utils.quat import quaternion_from_degrees
+launcher.report()
 
+@profiler.profiled("design_scene")
 def design_scene():
-    """Designs the scene by spawning ground plane, light, objects and meshes from usd files."""
+    """Designs the scene by spawning ground plane, light, objects and meshes from usd files.
+
+    Returns:
+        The spawned light rig, or None without ``--light_rig``.
+    """
 
     #Ground-plane
     cfg_ground = sim_utils.GroundPlaneCfg()
     cfg_ground.func("/World/defaultGroundPlane", cfg_ground)
 
+    # procedural lights: one spawner call per light template
+    if args_cli.light_rig is not None:
+        rig = spawn_light_rig(load_light_rig(args_cli.light_rig))
+        print(f"[INFO]: Spawned {len(rig)} lights of the rig: {args_cli.light_rig}")
+        return rig
+
     # translation (x,y,z)
     # orientation (w, x, y, z) (each float in x, y, z is 0 to 180, where w is a scalar component)
     # scale :    isaaclab.sim.spawners.lights.spawn_light has no attribute scale, but it does in isaac_sim, how do I access it or why can I not?
@@ -61,6 +110,7 @@ def design_scene():
     #add blue light
     cfg_light3 = sim_utils.CylinderLightCfg(intensity=8000.0, color=(0.0, 0.0, 1.0), length=5,)
     cfg_light3.func("/World/Blue_Light3", cfg_light3, translation=(-3.0, 3.0, 1.5), orientation=(quaternion_from_degrees( 90, 0, 0)  ))
+    return None
 
 
 def main():
@@ -73,17 +123,27 @@ def main():
     sim.set_camera_view([2.0, 0.0, 2.5], [-0.5, 0.0, 0.5])
 
     # Design scene by adding assets to it
-    design_scene()
+    rig = design_scene()
+    generator = np.random.default_rng(args_cli.light_seed)
 
     # Play the simulator
-    sim.reset()
+    with profiler.phase("sim.reset"):
+        sim.reset()
     # Now we are ready!
     print("[INFO]: Setup complete...")
 
     # Simulate physics
+    count = 0
     while simulation_app.is_running():
+        # re-draw the rig lights in place, without respawning them
+        if rig is not None and args_cli.randomize_interval > 0 and count % args_cli.randomize_interval == 0:
+            with profiler.phase("lights.randomize"):
+                rig.randomize(generator)
+        count += 1
         # perform step
-        sim.step()
+        with profiler.phase("sim.step"):
+            sim.step()
+    profiler.finish()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,483 @@
+"""Procedural light rigs: compact layout specs, vectorized placement and batched spawning.
+
+A rig file (TOML or JSON) describes light templates and the layouts that place them:
+
+.. code-block:: toml
+
+    [templates.bar]
+    type = "cylinder"
+    intensity = 4000.0
+    color = [1.0, 1.0, 1.0]
+    length = 1.0
+    # re-drawn by LightRig.randomize()
+    intensity_range = [1000.0, 8000.0]
+    color_range = [[0.2, 0.2, 0.2], [1.0, 1.0, 1.0]]
+
+    [[rings]]
+    template = "bar"
+    count = 64
+    radius = 4.0
+    center = [0.0, 0.0, 2.0]
+    euler = [90.0, 0.0, 0.0]
+
+    [[grids]]
+    template = "bar"
+    counts = [10, 10]
+    spacing = [0.5, 0.5]
+    center = [0.0, 0.0, 4.0]
+
+    [[lights]]
+    template = "bar"
+    pos = [-1.0, 1.0, 1.5]
+    euler = [0.0, 0.0, 90.0]
+
+    [[attach]]
+    template = "bar"
+    prims = "/World/Objects/Cone.*"
+    offset = [0.0, 0.0, 0.5]
+
+Angles are extrinsic xyz Euler angles in degrees, see :func:`utils.quat.quaternion_from_degrees`. The ``euler`` of a
+ring is applied in the frame of each light, which is then turned about the z-axis to its angle on the ring, so all
+lights of a ring face the center alike. Attachment rules place one light under every prim that matches the regex,
+at a pose relative to that prim.
+
+:func:`compile_light_rig` validates a rig and computes the poses of all rings, grids and single lights in one
+vectorized pass, grouped by template. :func:`spawn_light_rig` spawns the first light of a template with the Isaac
+Lab spawner and copies its prim spec to the other lights in one batch of layer edits. The returned
+:class:`LightRig` re-draws the color and intensity of the lights in place, without respawning them.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from lab_utils.scene_file import _check_keys, _read, _vector
+from utils.quat import quat_from_euler_xyz, quat_mul
+
+LIGHT_TYPES = {
+    "cylinder": ("CylinderLightCfg", ("length", "radius", "treat_as_line")),
+    "disk": ("DiskLightCfg", ("radius",)),
+    "sphere": ("SphereLightCfg", ("radius", "treat_as_point")),
+    "distant": ("DistantLightCfg", ("angle",)),
+}
+"""Supported light types: the name of the Isaac Lab configuration and its optional shape parameters."""
+
+TEMPLATE_DEFAULTS = {
+    "intensity": 1000.0,
+    "color": (1.0, 1.0, 1.0),
+    "intensity_range": None,
+    "color_range": None,
+}
+"""Optional template parameters and their default values."""
+
+LAYOUT_KEYS = {
+    "rings": {"template", "count", "radius", "center", "phase", "euler"},
+    "grids": {"template", "counts", "spacing", "center", "euler"},
+    "lights": {"template", "pos", "euler"},
+    "attach": {"template", "prims", "name", "offset", "euler"},
+}
+"""Layout kinds and their keys."""
+
+
+@dataclass
+class AttachRule:
+    """One light under every prim that matches a regex, at a pose relative to that prim."""
+
+    pattern: str
+    """Regex of the prim paths."""
+
+    name: str
+    """Name of the light prim under every matched prim."""
+
+    position: tuple[float, float, float]
+    """Position relative to the matched prim."""
+
+    orientation: tuple[float, float, float, float]
+    """Orientation (w, x, y, z) relative to the matched prim."""
+
+
+@dataclass
+class LightGroup:
+    """Lights that share one template and are spawned together."""
+
+    template_name: str
+    """Name of the template."""
+
+    template: dict
+    """Validated template parameters, including the defaults."""
+
+    positions: np.ndarray
+    """Position of every placed light in the world frame. Shape is (N, 3)."""
+
+    orientations: np.ndarray
+    """Orientation (w, x, y, z) of every placed light in the world frame. Shape is (N, 4)."""
+
+    attachments: list[AttachRule] = field(default_factory=list)
+    """Attachment rules, resolved against the stage when the rig is spawned."""
+
+    def __len__(self) -> int:
+        """Number of placed lights, without the attached ones."""
+        return len(self.positions)
+
+
+@dataclass
+class LightRigDescription:
+    """Validated rig file with the lights grouped by template."""
+
+    path: str
+    """Path of the rig file."""
+
+    groups: dict[str, LightGroup]
+    """Light groups by template name."""
+
+    @property
+    def num_placed(self) -> int:
+        """Number of placed lights, without the attached ones."""
+        return sum(len(group) for group in self.groups.values())
+
+
+def _template(where: str, template: dict) -> dict:
+    light_type = template.get("type")
+    if light_type not in LIGHT_TYPES:
+        raise ValueError(f"Unknown light type in {where}: '{light_type}'. Expected one of: {tuple(LIGHT_TYPES)}.")
+    _check_keys(where, template, {"type", *LIGHT_TYPES[light_type][1], *TEMPLATE_DEFAULTS})
+    resolved = {**TEMPLATE_DEFAULTS, **template}
+    resolved["intensity"] = float(resolved["intensity"])
+    resolved["color"] = _vector(f"{where}.color", resolved["color"], 3)
+    if resolved["intensity_range"] is not None:
+        resolved["intensity_range"] = _vector(f"{where}.intensity_range", resolved["intensity_range"], 2)
+    if resolved["color_range"] is not None:
+        color_range = resolved["color_range"]
+        if not isinstance(color_range, (list, tuple)) or len(color_range) != 2:
+            raise ValueError(f"Expected the lower and upper color in {where}.color_range. Received: {color_range}.")
+        resolved["color_range"] = tuple(_vector(f"{where}.color_range", color, 3) for color in color_range)
+    return resolved
+
+
+def _count(where: str, value) -> int:
+    if not isinstance(value, int) or value < 1:
+        raise ValueError(f"Expected a positive integer in {where}. Received: {value}.")
+    return value
+
+
+def compile_light_rig(data: dict, path: str = "<memory>") -> LightRigDescription:
+    """Validates the contents of a rig file and computes the poses of the placed lights.
+
+    The layouts only collect their parameters per light. The positions and orientations of all rings, grids and
+    single lights are then computed together, so the cost does not grow with the number of layouts.
+
+    Args:
+        data: The parsed rig file.
+        path: The path of the rig file, for the error messages. Defaults to "<memory>".
+
+    Returns:
+        The compiled rig.
+
+    Raises:
+        ValueError: When the rig file is invalid.
+    """
+    _check_keys(path, data, {"templates", *LAYOUT_KEYS})
+
+    templates = {}
+    for name, template in data.get("templates", {}).items():
+        # note: the template name becomes part of the prim paths
+        if not name.isidentifier():
+            raise ValueError(f"Template names must be valid identifiers. Received: '{name}' in {path}.")
+        templates[name] = _template(f"{path}: templates.{name}", template)
+    template_ids = {name: template_id for template_id, name in enumerate(templates)}
+
+    # per layout: (kind, template id, number of lights, center, local euler, parameters of the kind)
+    layouts = []
+    attachments: dict[str, list[AttachRule]] = {}
+    for kind, keys in LAYOUT_KEYS.items():
+        for layout_id, layout in enumerate(data.get(kind, [])):
+            where = f"{path}: {kind}[{layout_id}]"
+            _check_keys(where, layout, keys)
+            template_name = layout.get("template")
+            if template_name not in templates:
+                raise ValueError(
+                    f"Unknown template in {where}: '{template_name}'. Expected one of: {list(templates)}."
+                )
+            euler = _vector(f"{where}.euler", layout.get("euler", (0.0, 0.0, 0.0)), 3)
+            if kind == "attach":
+                if not isinstance(layout.get("prims"), str):
+                    raise ValueError(f"Expected the regex of the prim paths in {where}.prims.")
+                try:
+                    re.compile(layout["prims"])
+                except re.error as e:
+                    raise ValueError(f"Invalid regex in {where}.prims: {e}. Received: '{layout['prims']}'.") from e
+                name = layout.get("name", template_name)
+                if not name.isidentifier():
+                    raise ValueError(f"Light names must be valid identifiers. Received: '{name}' in {where}.")
+                rule = AttachRule(
+                    pattern=layout["prims"],
+                    name=name,
+                    position=_vector(f"{where}.offset", layout.get("offset", (0.0, 0.0, 0.0)), 3),
+                    orientation=tuple(float(v) for v in quat_from_euler_xyz(np.array(euler), degrees=True)),
+                )
+                attachments.setdefault(template_name, []).append(rule)
+                continue
+            if kind == "rings":
+                count = _count(f"{where}.count", layout.get("count"))
+                params = (float(layout.get("radius", 1.0)), float(layout.get("phase", 0.0)), count)
+                center = layout.get("center", (0.0, 0.0, 0.0))
+            elif kind == "grids":
+                counts = layout.get("counts")
+                if not isinstance(counts, (list, tuple)) or len(counts) != 2:
+                    raise ValueError(f"Expected 2 integers in {where}.counts. Received: {counts}.")
+                counts = tuple(_count(f"{where}.counts", value) for value in counts)
+                count = counts[0] * counts[1]
+                params = (*_vector(f"{where}.spacing", layout.get("spacing", (1.0, 1.0)), 2), *counts)
+                center = layout.get("center", (0.0, 0.0, 0.0))
+            else:
+                count, params = 1, ()
+                center = layout.get("pos")
+            center = _vector(f"{where}.{'pos' if kind == 'lights' else 'center'}", center, 3)
+            layouts.append((kind, template_ids[template_name], count, center, euler, params))
+
+    positions, orientations, light_template_ids = _place(layouts)
+    groups = {}
+    for name, template_id in template_ids.items():
+        mask = light_template_ids == template_id
+        if not mask.any() and name not in attachments:
+            continue
+        groups[name] = LightGroup(
+            template_name=name,
+            template=templates[name],
+            positions=positions[mask],
+            orientations=orientations[mask],
+            attachments=attachments.get(name, []),
+        )
+    return LightRigDescription(path=path, groups=groups)
+
+
+def _place(layouts: list[tuple]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Computes the world poses of the lights of all layouts in one pass.
+
+    Returns:
+        The positions (N, 3), the orientations (N, 4) and the template id (N,) of every light.
+    """
+    counts = np.array([layout[2] for layout in layouts], dtype=np.int64)
+    num_lights = int(counts.sum())
+    if num_lights == 0:
+        return np.zeros((0, 3)), np.zeros((0, 4)), np.zeros(0, dtype=np.int64)
+    layout_ids = np.repeat(np.arange(len(layouts)), counts)
+    # index of every light inside its layout
+    index = np.arange(num_lights) - np.repeat(np.cumsum(counts) - counts, counts)
+    template_ids = np.array([layout[1] for layout in layouts])[layout_ids]
+    positions = np.array([layout[3] for layout in layouts])[layout_ids]
+    euler = np.array([layout[4] for layout in layouts])[layout_ids]
+    # per light: ring (radius, phase, count) or grid (spacing x, spacing y, nx, ny), zero-padded
+    params = np.zeros((len(layouts), 4))
+    for layout_id, layout in enumerate(layouts):
+        params[layout_id, : len(layout[5])] = layout[5]
+    params = params[layout_ids]
+    kinds = np.array([layout[0] for layout in layouts])[layout_ids]
+
+    # rings: evenly spaced on a horizontal circle, turned about z to face the center alike
+    yaw = np.zeros(num_lights)
+    ring = kinds == "rings"
+    angle = np.deg2rad(params[ring, 1]) + 2.0 * np.pi * index[ring] / params[ring, 2]
+    positions[ring, 0] += params[ring, 0] * np.cos(angle)
+    positions[ring, 1] += params[ring, 0] * np.sin(angle)
+    yaw[ring] = np.rad2deg(angle)
+    # grids: row-major cells centered on the layout center
+    grid = kinds == "grids"
+    nx, ny = params[grid, 2], params[grid, 3]
+    positions[grid, 0] += (index[grid] // ny - 0.5 * (nx - 1)) * params[grid, 0]
+    positions[grid, 1] += (index[grid] % ny - 0.5 * (ny - 1)) * params[grid, 1]
+
+    zeros = np.zeros(num_lights)
+    turn = quat_from_euler_xyz(np.stack([zeros, zeros, yaw], axis=-1), degrees=True)
+    orientations = quat_mul(turn, quat_from_euler_xyz(euler, degrees=True))
+    return positions, orientations, template_ids
+
+
+def load_light_rig(path: str) -> LightRigDescription:
+    """Loads and compiles a rig file.
+
+    Args:
+        path: The path of the TOML or JSON rig file.
+
+    Returns:
+        The compiled rig.
+
+    Raises:
+        ValueError: When the rig file is invalid.
+    """
+    path = os.path.abspath(os.path.expanduser(path))
+    return compile_light_rig(_read(path), path)
+
+
+def template_light_cfg(template: dict):
+    """Builds the light configuration of a template."""
+    import isaaclab.sim as sim_utils
+
+    cfg_class = getattr(sim_utils, LIGHT_TYPES[template["type"]][0])
+    shape = {key: template[key] for key in LIGHT_TYPES[template["type"]][1] if key in template}
+    return cfg_class(intensity=template["intensity"], color=template["color"], **shape)
+
+
+class LightRig:
+    """The spawned lights of a rig, with in-place re-randomization of their color and intensity."""
+
+    def __init__(self, prim_paths: list[str], templates: list[dict]):
+        """Initializes the rig from the spawned lights and looks up their color and intensity attributes.
+
+        Args:
+            prim_paths: The prim path of every light.
+            templates: The template of every light.
+        """
+        from pxr import Sdf
+
+        import isaacsim.core.utils.stage as stage_utils
+
+        self.prim_paths = prim_paths
+        self._layer = stage_utils.get_current_stage().GetEditTarget().GetLayer()
+        # (N, 4) lower and upper color and intensity: lights without ranges keep their template values
+        base = np.array([[*template["color"], template["intensity"]] for template in templates]).reshape(-1, 4)
+        self.lower, self.upper = base.copy(), base.copy()
+        for light_id, template in enumerate(templates):
+            if template["color_range"] is not None:
+                self.lower[light_id, :3], self.upper[light_id, :3] = template["color_range"]
+            if template["intensity_range"] is not None:
+                self.lower[light_id, 3], self.upper[light_id, 3] = template["intensity_range"]
+        self.randomized = np.flatnonzero((self.upper != self.lower).any(axis=1))
+        # note: the attribute specs are looked up once, so a write is one assignment per value.
+        self._color_specs = [
+            self._attribute_spec(prim_path, "inputs:color", Sdf.ValueTypeNames.Color3f) for prim_path in prim_paths
+        ]
+        self._intensity_specs = [
+            self._attribute_spec(prim_path, "inputs:intensity", Sdf.ValueTypeNames.Float) for prim_path in prim_paths
+        ]
+
+    def __len__(self) -> int:
+        """Number of lights."""
+        return len(self.prim_paths)
+
+    """
+    Operations.
+    """
+
+    def randomize(self, generator: np.random.Generator) -> np.ndarray:
+        """Draws the color and intensity of the lights with ranges and writes them in place.
+
+        All values are drawn in one call, and all writes are authored in one batch of layer edits.
+
+        Args:
+            generator: The random number generator.
+
+        Returns:
+            The colors and intensities of the randomized lights. Shape is (len(randomized), 4).
+        """
+        lower, upper = self.lower[self.randomized], self.upper[self.randomized]
+        values = lower + generator.random(lower.shape) * (upper - lower)
+        self.write(values[:, :3], values[:, 3], self.randomized)
+        return values
+
+    def write(self, colors: np.ndarray, intensities: np.ndarray, light_ids: np.ndarray | None = None):
+        """Writes the color and intensity of lights in one batch of layer edits.
+
+        Args:
+            colors: The linear RGB colors. Shape is (M, 3).
+            intensities: The intensities. Shape is (M,).
+            light_ids: The lights to write. Defaults to None (all lights).
+        """
+        from pxr import Gf, Sdf
+
+        light_ids = range(len(self)) if light_ids is None else light_ids
+        # note: plain floats, Gf does not take numpy scalars of every type
+        colors, intensities = np.asarray(colors, dtype=np.float64).tolist(), np.asarray(intensities).tolist()
+        with Sdf.ChangeBlock():
+            for light_id, color, intensity in zip(light_ids, colors, intensities):
+                self._color_specs[light_id].default = Gf.Vec3f(*color)
+                self._intensity_specs[light_id].default = intensity
+
+    """
+    Internal helpers.
+    """
+
+    def _attribute_spec(self, prim_path: str, name: str, type_name):
+        from pxr import Sdf
+
+        prim_spec = self._layer.GetPrimAtPath(prim_path)
+        spec = prim_spec.attributes.get(name)
+        if spec is None:
+            # the spawner only authors the attributes it sets; author the missing one in the same layer
+            spec = Sdf.AttributeSpec(prim_spec, name, type_name)
+        return spec
+
+
+def _copy_lights(source: str, prim_paths: list[str], positions: np.ndarray, orientations: np.ndarray):
+    """Copies the prim spec of a spawned light to the other lights in one batch of layer edits."""
+    from pxr import Gf, Sdf
+
+    import isaacsim.core.utils.stage as stage_utils
+
+    layer = stage_utils.get_current_stage().GetEditTarget().GetLayer()
+    # the copies keep the precision of the transform of the spawned light
+    translate = layer.GetAttributeAtPath(f"{source}.xformOp:translate")
+    orient = layer.GetAttributeAtPath(f"{source}.xformOp:orient")
+    vec_class = Gf.Vec3f if translate.typeName == Sdf.ValueTypeNames.Float3 else Gf.Vec3d
+    quat_class = Gf.Quatf if orient.typeName == Sdf.ValueTypeNames.Quatf else Gf.Quatd
+    # note: the change block defers the change notifications until all prims are authored.
+    with Sdf.ChangeBlock():
+        for prim_path, pos, rot in zip(prim_paths, positions.tolist(), orientations.tolist()):
+            Sdf.CreatePrimInLayer(layer, prim_path)
+            Sdf.CopySpec(layer, source, layer, prim_path)
+            layer.GetAttributeAtPath(f"{prim_path}.xformOp:translate").default = vec_class(*pos)
+            layer.GetAttributeAtPath(f"{prim_path}.xformOp:orient").default = quat_class(rot[0], *rot[1:])
+
+
+def spawn_light_rig(rig: LightRigDescription, root: str = "/World/LightRig") -> LightRig:
+    """Spawns a compiled rig with one spawner call per template.
+
+    The placed lights of a template are named ``<root>/<template>_<i>``. The attached lights are named
+    ``<prim>/<name>`` for every prim that matches their rule.
+
+    Args:
+        rig: The compiled rig, see :func:`compile_light_rig`.
+        root: The prim path under which the placed lights are spawned. Defaults to "/World/LightRig".
+
+    Returns:
+        The spawned lights, in the order of the groups and, per group, of the placed lights followed by the
+        attached ones.
+
+    Raises:
+        ValueError: When an attachment rule matches no prim or two lights have the same prim path.
+    """
+    import isaacsim.core.utils.prims as prim_utils
+
+    import isaaclab.sim as sim_utils
+
+    prim_utils.create_prim(root, "Xform")
+    prim_paths, templates = [], []
+    for name, group in rig.groups.items():
+        # note: zero-padded indices keep the sorted prim paths in placement order.
+        width = len(str(max(len(group) - 1, 0)))
+        paths = [f"{root}/{name}_{i:0{width}d}" for i in range(len(group))]
+        positions, orientations = [group.positions], [group.orientations]
+        for rule in group.attachments:
+            matches = sim_utils.find_matching_prim_paths(rule.pattern)
+            if not matches:
+                raise ValueError(
+                    f"The attachment rule of the template '{name}' matches no prim. Received: '{rule.pattern}'."
+                )
+            paths += [f"{prim_path}/{rule.name}" for prim_path in matches]
+            positions.append(np.tile(rule.position, (len(matches), 1)))
+            orientations.append(np.tile(rule.orientation, (len(matches), 1)))
+        if len(set(paths)) != len(paths) or not set(paths).isdisjoint(prim_paths):
+            raise ValueError(f"Two lights of the template '{name}' have the same prim path. Received: {paths}.")
+        positions, orientations = np.concatenate(positions), np.concatenate(orientations)
+
+        # the first light goes through the spawner, the others are copies of its prim spec
+        cfg = template_light_cfg(group.template)
+        cfg.func(paths[0], cfg, translation=tuple(positions[0].tolist()), orientation=tuple(orientations[0].tolist()))
+        _copy_lights(paths[0], paths[1:], positions[1:], orientations[1:])
+        prim_paths += paths
+        templates += [group.template] * len(paths)
+    return LightRig(prim_paths, templates)
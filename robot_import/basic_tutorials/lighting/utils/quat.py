@@ -1,36 +1,211 @@
+"""Batched SO(3) helpers in the (w, x, y, z) quaternion convention used by Isaac Lab.
+
+Every function accepts either NumPy arrays or torch tensors and returns the same type. Inputs are batched over the
+leading dimensions, so converting thousands of poses is a single vectorized call instead of a Python loop.
+
+Euler angles follow the extrinsic ``"xyz"`` convention of :meth:`scipy.spatial.transform.Rotation.from_euler`,
+i.e. roll about x, then pitch about y, then yaw about z, all measured in the fixed world frame.
+"""
+
+from __future__ import annotations
+
+import math
+
 import numpy as np
-from scipy.spatial.transform import Rotation as R
 
-np.set_printoptions(precision=17, threshold=10, suppress=True, )
+
+def _is_torch(x) -> bool:
+    """Checks whether the input is a torch tensor without importing torch."""
+    return type(x).__module__.startswith("torch")
+
+
+def _backend(x):
+    """Returns the array module (``torch`` or ``numpy``) matching the input."""
+    if _is_torch(x):
+        import torch
+
+        return torch
+    return np
+
+
+def _stack(arrays: list, like, dim: int = -1):
+    """Stacks arrays along a new dimension using the backend of ``like``."""
+    if _is_torch(like):
+        import torch
+
+        return torch.stack(arrays, dim=dim)
+    return np.stack(arrays, axis=dim)
+
+
+def _as_float(x):
+    """Converts the input into a floating-point array (or tensor), keeping torch tensors on their device."""
+    if _is_torch(x):
+        return x if x.is_floating_point() else x.float()
+    x = np.asarray(x)
+    return x if np.issubdtype(x.dtype, np.floating) else x.astype(np.float64)
+
+
+def quat_from_euler_xyz(euler, degrees: bool = False):
+    """Converts extrinsic xyz Euler angles to quaternions.
+
+    Args:
+        euler: Euler angles (roll, pitch, yaw). Shape is (..., 3).
+        degrees: Whether the angles are given in degrees. Defaults to False (radians).
+
+    Returns:
+        The quaternions in (w, x, y, z). Shape is (..., 4).
+    """
+    euler = _as_float(euler)
+    half = euler * (math.pi / 360.0 if degrees else 0.5)
+    xp = _backend(half)
+    cos, sin = xp.cos(half), xp.sin(half)
+    cr, cp, cy = cos[..., 0], cos[..., 1], cos[..., 2]
+    sr, sp, sy = sin[..., 0], sin[..., 1], sin[..., 2]
+    # q = q_z * q_y * q_x, expanded
+    w = cr * cp * cy + sr * sp * sy
+    x = sr * cp * cy - cr * sp * sy
+    y = cr * sp * cy + sr * cp * sy
+    z = cr * cp * sy - sr * sp * cy
+    return _stack([w, x, y, z], half)
+
 
 def quaternion_from_degrees(roll, pitch, yaw):
-  """
-  Converts Euler angles (roll, pitch, yaw) in degrees to a quaternion.
+    """Converts Euler angles (roll, pitch, yaw) in degrees to a quaternion.
+
+    Scalars return a tuple that can be passed directly as the ``orientation`` of a spawner. Arrays of shape (N,)
+    return an array of shape (N, 4) computed in one vectorized pass.
+
+    Args:
+        roll: Rotation around the x-axis in degrees.
+        pitch: Rotation around the y-axis in degrees.
+        yaw: Rotation around the z-axis in degrees.
+
+    Returns:
+        The quaternion (w, x, y, z), rounded to 10 decimals.
+    """
+    tensors = [angle for angle in (roll, pitch, yaw) if _is_torch(angle)]
+    if tensors:
+        import torch
+
+        dtype = tensors[0].dtype if tensors[0].is_floating_point() else torch.float
+        angles = [torch.as_tensor(angle, dtype=dtype, device=tensors[0].device) for angle in (roll, pitch, yaw)]
+        quat = quat_from_euler_xyz(torch.stack(torch.broadcast_tensors(*angles), dim=-1), degrees=True)
+        return torch.round(quat, decimals=10)
+    quat = np.around(quat_from_euler_xyz(np.stack(np.broadcast_arrays(roll, pitch, yaw), axis=-1), degrees=True), 10)
+    # spawners expect a plain tuple for a single orientation
+    if quat.ndim == 1:
+        return tuple(float(v) for v in quat)
+    return quat
+
+
+def quat_mul(q1, q2):
+    """Composes two rotations, returning ``q1 * q2`` (apply ``q2`` first, then ``q1``).
+
+    Args:
+        q1: The first quaternions in (w, x, y, z). Shape is (..., 4).
+        q2: The second quaternions in (w, x, y, z). Shape is (..., 4).
+
+    Returns:
+        The product quaternions in (w, x, y, z). Shape is (..., 4).
+    """
+    w1, x1, y1, z1 = q1[..., 0], q1[..., 1], q1[..., 2], q1[..., 3]
+    w2, x2, y2, z2 = q2[..., 0], q2[..., 1], q2[..., 2], q2[..., 3]
+    w = w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2
+    x = w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2
+    y = w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2
+    z = w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
+    return _stack([w, x, y, z], w)
+
+
+def quat_conjugate(q):
+    """Computes the conjugate (inverse for unit quaternions) of quaternions in (w, x, y, z). Shape is (..., 4)."""
+    return _stack([q[..., 0], -q[..., 1], -q[..., 2], -q[..., 3]], q)
+
+
+def quat_to_matrix(q):
+    """Converts quaternions to rotation matrices.
+
+    Args:
+        q: The quaternions in (w, x, y, z). Shape is (..., 4). They are normalized internally.
+
+    Returns:
+        The rotation matrices. Shape is (..., 3, 3).
+    """
+    q = _as_float(q)
+    xp = _backend(q)
+    q = q / xp.sqrt((q * q).sum(-1))[..., None]
+    w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    rows = [
+        _stack([1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)], w),
+        _stack([2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)], w),
+        _stack([2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)], w),
+    ]
+    return _stack(rows, w, dim=-2)
+
 
-  Args:
-    roll: Rotation around the x-axis in degrees.
-    pitch: Rotation around the y-axis in degrees.
-    yaw: Rotation around the z-axis in degrees.
+def matrix_to_quat(matrix):
+    """Converts rotation matrices to quaternions with a non-negative real part.
 
-  Returns:
-    A NumPy array representing the quaternion (w, x, y, z).
-  """
-  print("Roll, pitch, yaw", roll, pitch, yaw)
-  # Create a rotation object from Euler angles
-  rotation = R.from_euler('xyz', [roll, pitch, yaw], degrees=True)
+    The branch-free formulation takes the largest of the four candidate denominators per element, which keeps the
+    conversion numerically stable for all rotations.
 
-  # Get the quaternion representation
-  quaternion = rotation.as_quat()
+    Args:
+        matrix: The rotation matrices. Shape is (..., 3, 3).
 
-  #change the last element "w" to be first so we have "wxyz" 
-  quaternion_wxyz = np.concatenate(([quaternion[-1]], quaternion[:-1]))
+    Returns:
+        The quaternions in (w, x, y, z). Shape is (..., 4).
+    """
+    matrix = _as_float(matrix)
+    xp = _backend(matrix)
+    m00, m01, m02 = matrix[..., 0, 0], matrix[..., 0, 1], matrix[..., 0, 2]
+    m10, m11, m12 = matrix[..., 1, 0], matrix[..., 1, 1], matrix[..., 1, 2]
+    m20, m21, m22 = matrix[..., 2, 0], matrix[..., 2, 1], matrix[..., 2, 2]
+    # candidate quaternions scaled by 4 * (w, x, y, z) respectively
+    candidates = _stack(
+        [
+            _stack([1 + m00 + m11 + m22, m21 - m12, m02 - m20, m10 - m01], m00),
+            _stack([m21 - m12, 1 + m00 - m11 - m22, m10 + m01, m02 + m20], m00),
+            _stack([m02 - m20, m10 + m01, 1 - m00 + m11 - m22, m21 + m12], m00),
+            _stack([m10 - m01, m02 + m20, m21 + m12, 1 - m00 - m11 + m22], m00),
+        ],
+        m00,
+        dim=-2,
+    )
+    diagonal = _stack([1 + m00 + m11 + m22, 1 + m00 - m11 - m22, 1 - m00 + m11 - m22, 1 - m00 - m11 + m22], m00)
+    best = diagonal.argmax(-1)
+    if _is_torch(matrix):
+        quat = candidates.gather(-2, best[..., None, None].expand(*best.shape, 1, 4)).squeeze(-2)
+    else:
+        quat = np.take_along_axis(candidates, best[..., None, None], axis=-2)[..., 0, :]
+    quat = quat / xp.sqrt((quat * quat).sum(-1))[..., None]
+    # canonical form: w >= 0
+    return xp.where(quat[..., :1] < 0, -quat, quat)
 
-  # format needs to be a tuple 
-  quat_as_tup = tuple(quaternion_wxyz)
 
-  #original_cordinate = R.from_quat(np.around(quaternion, decimals=10)).as_euler('xyz', degrees=True)
-  print("original, original_cordinate", original_cordinate)
+def quat_slerp(q0, q1, t):
+    """Spherically interpolates between two sets of quaternions along the shortest arc.
 
-  return tuple( np.around(quat_as_tup , decimals=10))
+    Args:
+        q0: The start quaternions in (w, x, y, z). Shape is (..., 4).
+        q1: The end quaternions in (w, x, y, z). Shape is (..., 4).
+        t: The interpolation factor in [0, 1]. Either a scalar or broadcastable to shape (...,).
 
-#quaternion_from_degrees(-163, -35, -153)
+    Returns:
+        The interpolated unit quaternions in (w, x, y, z). Shape is (..., 4).
+    """
+    q0, q1 = _as_float(q0), _as_float(q1)
+    xp = _backend(q0)
+    t = xp.asarray(t, dtype=q0.dtype) if xp is np else xp.as_tensor(t, dtype=q0.dtype, device=q0.device)
+    dot = (q0 * q1).sum(-1)
+    # take the shortest path
+    q1 = xp.where(dot[..., None] < 0, -q1, q1)
+    dot = xp.abs(dot).clip(max=1.0)
+    theta = xp.arccos(dot)
+    sin_theta = xp.sin(theta)
+    # fall back to linear interpolation for nearly parallel quaternions
+    nearly_parallel = sin_theta < 1e-6
+    safe_sin = xp.where(nearly_parallel, xp.ones_like(sin_theta), sin_theta)
+    w0 = xp.where(nearly_parallel, 1.0 - t, xp.sin((1.0 - t) * theta) / safe_sin)
+    w1 = xp.where(nearly_parallel, t * xp.ones_like(theta), xp.sin(t * theta) / safe_sin)
+    quat = w0[..., None] * q0 + w1[..., None] * q1
+    return quat / xp.sqrt((quat * quat).sum(-1))[..., None]
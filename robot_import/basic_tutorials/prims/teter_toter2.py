@@ -1,28 +1,67 @@
 import argparse
+import os
+import sys
 
-from isaaclab.app import AppLauncher
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
+
+from lab_utils.ccd_planner import CCD_MODES, apply_ccd, format_report, plan_ccd  # noqa: E402
+from lab_utils.launcher import Launcher  # noqa: E402
+from lab_utils.profiling import add_profiling_args, configure_from_args, profiler  # noqa: E402
+from lab_utils.runner import Runner, add_runner_args, validate_runner_args  # noqa: E402
+from lab_utils.scene_file import instance_cfgs, load_scene, spawn_scene  # noqa: E402
+from lab_utils.sim_loops import run_step_loop  # noqa: E402
 
 # create argparser
 parser = argparse.ArgumentParser(description="Tutorial on spawning prims into the scene.")
-# append AppLauncher cli args
-AppLauncher.add_app_launcher_args(parser)
-# parse the arguments
-args_cli = parser.parse_args()
+parser.add_argument(
+    "--ccd",
+    type=str,
+    default="selective",
+    choices=CCD_MODES,
+    help="Whether CCD is enabled for the bodies that can tunnel, for every body or for none.",
+)
+parser.add_argument(
+    "--scene_file",
+    type=str,
+    default=None,
+    help="TOML or JSON scene file to spawn instead of the built-in scene, for instance scenes/teter_toter.toml.",
+)
+add_profiling_args(parser)
+add_runner_args(parser)
+
+
+def validate_args(args):
+    """Checks the arguments and loads the scene file, before the app is started."""
+    validate_runner_args(args)
+    if args.scene_file is not None:
+        # note: the scene is cached, so the load after the boot is free.
+        load_scene(args.scene_file)
+
+
+# append the launcher and AppLauncher cli args
+launcher = Launcher(parser)
+# parse and validate the arguments before starting the app (exits here with --dry_run)
+args_cli = launcher.parse_args(validate=validate_args)
+configure_from_args(args_cli)
 # launch omniverse app
-app_launcher = AppLauncher(args_cli)
-simulation_app = app_launcher.app
+simulation_app = launcher.launch()
 
 """Rest everything follows."""
 
-import isaaclab.sim as sim_utils
-from isaaclab.sim import SimulationContext
+with launcher.phase("imports"):
+    import isaaclab.sim as sim_utils
+    from isaaclab.sim import SimulationContext
+
+    import isaacsim.core.utils.prims as prim_utils
+    from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
+    import isaaclab.utils.math as math_utils
+    from isaaclab.assets import RigidObject, RigidObjectCfg
+    import torch
+launcher.report()
 
-import isaacsim.core.utils.prims as prim_utils
-from isaaclab.utils.assets import ISAAC_NUCLEUS_DIR
-import isaaclab.utils.math as math_utils
-from isaaclab.assets import RigidObject, RigidObjectCfg
-import torch
 
+@profiler.profiled("design_scene")
 def design_scene():
     """Designs the scene by spawning ground plane, light, objects and meshes from usd files."""
     # Ground-plane
@@ -99,29 +138,52 @@ def design_scene():
 
     #set up the scene
     scene_entities = {"base": base_object, "seat": seat_object, "right_cube": right_cube_object, "left_cube": left_cube_object}
-    return scene_entities
+    object_cfgs = {
+        "base": cube_Base_cfg, "seat": cube_Seat_cfg, "right_cube": cube_right_cfg, "left_cube": cube_left_cfg
+    }
+    return scene_entities, object_cfgs
 
 
-    
-def run_simulator(sim: sim_utils.SimulationContext, entities: dict[str, RigidObject], origins: torch.Tensor):
-    """Runs the simulation loop."""
-    sim_dt = sim.get_physics_dt() 
+@profiler.profiled("design_scene")
+def design_scene_from_file(path: str):
+    """Spawns a scene file, with one rigid object per group of identical objects."""
+    scene = load_scene(path)
+    scene_entities = spawn_scene(scene)
+    print(f"[INFO]: Spawned {scene.num_objects} objects in {len(scene.groups)} groups from: {scene.path}")
+    return scene_entities, instance_cfgs(scene, scene_entities)
 
+
+def configure_ccd(object_cfgs: dict[str, RigidObjectCfg], sim_dt: float):
+    """Enables CCD only for the bodies that move further per step than the thinnest collider they can hit."""
+    ccd_plans = plan_ccd(object_cfgs, sim_dt)
+    print(format_report(ccd_plans, sim_dt))
+    for plan in ccd_plans.values():
+        if args_cli.ccd == "global" or (args_cli.ccd == "selective" and plan.enable_ccd):
+            apply_ccd(plan.prim_path)
+
+
+def run_simulator(
+    sim: sim_utils.SimulationContext, entities: dict[str, RigidObject], origins: torch.Tensor, runner: Runner
+):
+    """Runs the simulation loop."""
     ## Simulate physics
-    while simulation_app.is_running():
-        sim.step()
+    # note: the loop is shared with the torch physics stand-in of benchmarks/benchmark_torch_physics.py
+    run_step_loop(sim, runner)
 
 
 def main():
     """Main function."""
+    # Fixed-length loop with throughput report (runs until the app is closed by default)
+    runner = Runner.from_args(args_cli, simulation_app, device=args_cli.device)
     # Load kit helper
     
     # if the brick is above a value of 30, the collisions do not occur
     # we can either slow down the simulation by changing the dt in the SimulationCfg
     # or by passing in the enable_ccd=True to the PhysxCfg, (CCD stands for 
     # continuous collision detection
+    # note: the scene flag only enables the CCD pass; configure_ccd() flags the bodies that need it (see --ccd).
 
-    physx = sim_utils.PhysxCfg(enable_ccd=True)
+    physx = sim_utils.PhysxCfg(enable_ccd=args_cli.ccd != "none")
     sim_cfg = sim_utils.SimulationCfg(device=args_cli.device, physx=physx)
     #sim_cfg = sim_utils.SimulationCfg(dt=0.005, device=args_cli.device, physx=physx)
     sim = SimulationContext(sim_cfg)
@@ -135,13 +197,20 @@ def main():
 
     sim.set_camera_view(eye=[-35.0, .0, 30.0], target=[0.0, 0.0, 0.0])
     # Design scene
-    scene_entities = design_scene()
+    if args_cli.scene_file is not None:
+        scene_entities, object_cfgs = design_scene_from_file(args_cli.scene_file)
+    else:
+        scene_entities, object_cfgs = design_scene()
+    configure_ccd(object_cfgs, sim.get_physics_dt())
     # Play the simulator
-    sim.reset()
+    with profiler.phase("sim.reset"):
+        sim.reset()
     # Now we are ready!
     print("[INFO]: Setup complete...")
     # Run the simulator
-    run_simulator(sim, scene_entities, {})
+    run_simulator(sim, scene_entities, {}, runner)
+    runner.report()
+    profiler.finish()
 
 
 if __name__ == "__main__":
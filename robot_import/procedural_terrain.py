@@ -25,13 +25,33 @@ Example usage:
     # Generate terrain with curriculum along with flat patches
     ./isaaclab.sh -p scripts/demos/procedural_terrain.py --use_curriculum --show_flat_patches
 
+    # Regenerate the terrain and overwrite its cache entry
+    ./isaaclab.sh -p scripts/demos/procedural_terrain.py --terrain_cache rebuild
+
+    # Check the arguments without starting the app, and report the start-up time
+    ./isaaclab.sh -p scripts/demos/procedural_terrain.py --dry_run
+    ./isaaclab.sh -p scripts/demos/procedural_terrain.py --startup_report
+
+    # Print the persistent buffers of the terrain for 4096 environment origins
+    ./isaaclab.sh -p scripts/demos/procedural_terrain.py --num_envs 4096 --num_steps 1 --memory_report
+
 """
 
 """Launch Isaac Sim Simulator first."""
 
 import argparse
+import os
+import sys
+
+# make the shared helpers at the repository root importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from isaaclab.app import AppLauncher
+from lab_utils.launcher import Launcher  # noqa: E402
+from lab_utils.memory_accounting import add_memory_args  # noqa: E402
+from lab_utils.profiling import add_profiling_args, configure_from_args, profiler  # noqa: E402
+from lab_utils.runner import Runner, add_runner_args, validate_runner_args  # noqa: E402
+from lab_utils.terrain_cache import CACHE_MODES, CachedTerrainGenerator, TerrainCache  # noqa: E402
+from lab_utils.terrain_curriculum import TerrainCurriculum  # noqa: E402
 
 # add argparse arguments
 parser = argparse.ArgumentParser(description="This script demonstrates procedural terrain generation.")
@@ -48,37 +68,102 @@ parser.add_argument(
     default=False,
     help="Whether to use the curriculum for the terrain generation.",
 )
+parser.add_argument(
+    "--curriculum_interval",
+    type=int,
+    default=500,
+    help="Steps between curriculum updates with a synthetic success metric (with --use_curriculum, 0 disables).",
+)
 parser.add_argument(
     "--show_flat_patches",
     action="store_true",
     default=False,
     help="Whether to show the flat patches computed during the terrain generation.",
 )
-# append AppLauncher cli args
-AppLauncher.add_app_launcher_args(parser)
-# parse the arguments
-args_cli = parser.parse_args()
+parser.add_argument("--seed", type=int, default=0, help="Seed for the terrain generation.")
+parser.add_argument("--num_envs", type=int, default=2048, help="Number of environment origins on the terrain.")
+parser.add_argument(
+    "--terrain_cache",
+    type=str,
+    default="use",
+    choices=CACHE_MODES,
+    help="Whether to use, rebuild or bypass the on-disk cache of generated terrains.",
+)
+parser.add_argument(
+    "--terrain_cache_dir",
+    type=str,
+    default="~/.cache/isaaclab_experiments/terrains",
+    help="Directory of the terrain cache.",
+)
+parser.add_argument(
+    "--terrain_cache_max_mb", type=float, default=1024.0, help="Size budget of the terrain cache in megabytes."
+)
+parser.add_argument(
+    "--terrain_workers", type=int, default=1, help="Number of worker processes generating the sub-terrain tiles."
+)
+parser.add_argument(
+    "--flat_patch_backend",
+    type=str,
+    default="heightfield",
+    choices=["raycast", "heightfield"],
+    help="Whether to find flat patches by ray-cast rejection sampling or by a vectorized heightfield search.",
+)
+parser.add_argument(
+    "--marker_decimation", type=int, default=1, help="Show every n-th flat patch of each sub-terrain type."
+)
+add_profiling_args(parser)
+add_runner_args(parser)
+add_memory_args(parser)
+
+
+def validate_args(args):
+    """Checks the arguments before the app is started."""
+    validate_runner_args(args)
+    if args.num_envs < 1:
+        raise ValueError(f"The number of environments must be at least 1. Received: {args.num_envs}.")
+    if args.curriculum_interval < 0:
+        raise ValueError(f"The curriculum interval must not be negative. Received: {args.curriculum_interval}.")
+    if args.terrain_workers < 1 or args.marker_decimation < 1:
+        raise ValueError(
+            "The number of terrain workers and the marker decimation must be at least 1."
+            f" Received: {args.terrain_workers}, {args.marker_decimation}."
+        )
+    if args.terrain_cache_max_mb <= 0.0:
+        raise ValueError(f"The terrain cache budget must be positive. Received: {args.terrain_cache_max_mb}.")
+
+
+# append the launcher and AppLauncher cli args
+launcher = Launcher(parser)
+# parse and validate the arguments before starting the app (exits here with --dry_run)
+args_cli = launcher.parse_args(validate=validate_args)
+configure_from_args(args_cli)
 
 # launch omniverse app
-app_launcher = AppLauncher(args_cli)
-simulation_app = app_launcher.app
+simulation_app = launcher.launch()
 
 """Rest everything follows."""
 
-import random
-import torch
+with launcher.phase("imports"):
+    import random
+    import torch
+
+    import isaaclab.sim as sim_utils
+    from isaaclab.assets import AssetBase
+    from isaaclab.markers import VisualizationMarkers, VisualizationMarkersCfg
+    from isaaclab.terrains import FlatPatchSamplingCfg, TerrainImporter, TerrainImporterCfg
 
-import isaaclab.sim as sim_utils
-from isaaclab.assets import AssetBase
-from isaaclab.markers import VisualizationMarkers, VisualizationMarkersCfg
-from isaaclab.terrains import FlatPatchSamplingCfg, TerrainImporter, TerrainImporterCfg
+    from lab_utils.markers import MarkerBatch
+    from lab_utils.memory_accounting import memory_report, write_report
+    from lab_utils.terrain_parallel import ParallelTerrainGenerator
 
-##
-# Pre-defined configs
-##
-from isaaclab.terrains.config.rough import ROUGH_TERRAINS_CFG  # isort:skip
+    ##
+    # Pre-defined configs
+    ##
+    from isaaclab.terrains.config.rough import ROUGH_TERRAINS_CFG  # isort:skip
+launcher.report()
 
 
+@profiler.profiled("design_scene")
 def design_scene() -> tuple[dict, torch.Tensor]:
     """Designs the scene."""
     # Lights
@@ -86,7 +171,9 @@ def design_scene() -> tuple[dict, torch.Tensor]:
     cfg.func("/World/Light", cfg)
 
     # Parse terrain generation
-    terrain_gen_cfg = ROUGH_TERRAINS_CFG.replace(curriculum=args_cli.use_curriculum, color_scheme=args_cli.color_scheme)
+    terrain_gen_cfg = ROUGH_TERRAINS_CFG.replace(
+        curriculum=args_cli.use_curriculum, color_scheme=args_cli.color_scheme, seed=args_cli.seed
+    )
 
     # Add flat patch configuration
     # Note: To have separate colors for each sub-terrain type, we set the flat patch sampling configuration name
@@ -98,9 +185,21 @@ def design_scene() -> tuple[dict, torch.Tensor]:
                 sub_terrain_name: FlatPatchSamplingCfg(num_patches=10, patch_radius=0.5, max_height_diff=0.05)
             }
 
+    # Serve the generated terrain from the on-disk cache
+    # note: the cache key is computed from the resolved configuration when the terrain importer builds the terrain.
+    terrain_cache = TerrainCache(
+        args_cli.terrain_cache_dir, max_size_mb=args_cli.terrain_cache_max_mb, mode=args_cli.terrain_cache
+    )
+    # note: the tiles are generated in a process pool on a cache miss. The output does not depend on the number of
+    #   workers, so all worker counts share the same cache entry.
+    generator_class = ParallelTerrainGenerator.bind(
+        num_workers=args_cli.terrain_workers, flat_patch_backend=args_cli.flat_patch_backend
+    )
+    terrain_gen_cfg.class_type = CachedTerrainGenerator.bind(terrain_cache, generator_class=generator_class)
+
     # Handler for terrains importing
     terrain_importer_cfg = TerrainImporterCfg(
-        num_envs=2048,
+        num_envs=args_cli.num_envs,
         env_spacing=3.0,
         prim_path="/World/ground",
         max_init_terrain_level=None,
@@ -112,7 +211,8 @@ def design_scene() -> tuple[dict, torch.Tensor]:
     if args_cli.color_scheme in ["height", "random"]:
         terrain_importer_cfg.visual_material = None
     # Create terrain importer
-    terrain_importer = TerrainImporter(terrain_importer_cfg)
+    with profiler.phase("terrain_importer"):
+        terrain_importer = TerrainImporter(terrain_importer_cfg)
 
     # Show the flat patches computed
     if args_cli.show_flat_patches:
@@ -127,31 +227,47 @@ def design_scene() -> tuple[dict, torch.Tensor]:
         flat_patches_visualizer = VisualizationMarkers(vis_cfg)
 
         # Visualize the flat patches
-        all_patch_locations = []
-        all_patch_indices = []
-        for i, patch_locations in enumerate(terrain_importer.flat_patches.values()):
-            num_patch_locations = patch_locations.view(-1, 3).shape[0]
-            # store the patch locations and indices
-            all_patch_locations.append(patch_locations.view(-1, 3))
-            all_patch_indices += [i] * num_patch_locations
-        # combine the patch locations and indices
-        flat_patches_visualizer.visualize(torch.cat(all_patch_locations), marker_indices=all_patch_indices)
+        # note: the locations and marker indices are built once as device tensors, in the same order as the markers.
+        flat_patch_markers = MarkerBatch(terrain_importer.flat_patches, decimation=args_cli.marker_decimation)
+        flat_patch_markers.visualize(flat_patches_visualizer)
+        print(f"[INFO]: Showing {len(flat_patch_markers)} of {flat_patch_markers.num_total} flat patches.")
 
     # return the scene information
     scene_entities = {"terrain": terrain_importer}
+    if args_cli.use_curriculum:
+        # note: the curriculum writes into the origins of the importer, so both always agree.
+        scene_entities["curriculum"] = TerrainCurriculum.from_importer(terrain_importer)
     return scene_entities, terrain_importer.env_origins
 
 
-def run_simulator(sim: sim_utils.SimulationContext, entities: dict[str, AssetBase], origins: torch.Tensor):
+def run_simulator(
+    sim: sim_utils.SimulationContext, entities: dict[str, AssetBase], origins: torch.Tensor, runner: Runner
+):
     """Runs the simulation loop."""
+    curriculum: TerrainCurriculum | None = entities.get("curriculum")
+    all_env_ids = torch.arange(len(origins), device=origins.device)
     # Simulate physics
-    while simulation_app.is_running():
+    while runner.running():
         # perform step
-        sim.step()
+        with profiler.phase("sim.step"):
+            sim.step(render=runner.render)
+        # move the environments between difficulty levels
+        # note: there are no agents in this demo, so a random success metric stands in for their performance.
+        if curriculum is not None and args_cli.curriculum_interval > 0:
+            if runner.iteration > 0 and runner.iteration % args_cli.curriculum_interval == 0:
+                with profiler.phase("curriculum"):
+                    success = torch.rand(len(all_env_ids), device=origins.device)
+                    curriculum.update_from_success(all_env_ids, success)
+                terrain = entities["terrain"]
+                if getattr(terrain, "origin_visualizer", None) is not None:
+                    terrain.origin_visualizer.visualize(origins)
+                print(f"[INFO]: Environments per terrain level: {curriculum.level_histogram().tolist()}")
 
 
 def main():
     """Main function."""
+    # Fixed-length loop with throughput report (runs until the app is closed by default)
+    runner = Runner.from_args(args_cli, simulation_app, device=args_cli.device)
     # Initialize the simulation context
     sim_cfg = sim_utils.SimulationCfg(dt=0.01, device=args_cli.device)
     sim = sim_utils.SimulationContext(sim_cfg)
@@ -160,11 +276,17 @@ def main():
     # design scene
     scene_entities, scene_origins = design_scene()
     # Play the simulator
-    sim.reset()
+    with profiler.phase("sim.reset"):
+        sim.reset()
     # Now we are ready!
     print("[INFO]: Setup complete...")
+    # persistent buffers of the terrain and the curriculum, and the memory used on the device
+    if args_cli.memory_report or args_cli.memory_json is not None:
+        write_report(args_cli, memory_report(scene_entities, args_cli.num_envs, args_cli.device))
     # Run the simulator
-    run_simulator(sim, scene_entities, scene_origins)
+    run_simulator(sim, scene_entities, scene_origins, runner)
+    runner.report()
+    profiler.finish()
 
 
 if __name__ == "__main__":